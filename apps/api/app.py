@@ -1,6 +1,8 @@
 from typing import Final
 
 import logging
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 
 from dishka.integrations.fastapi import setup_dishka
 from fastapi import FastAPI, Request, status
@@ -8,6 +10,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 
+from modules.chat.infrastructure.fastapi import connection_manager
+from modules.iam.infrastructure.fastapi import authenticator
 from modules.shared_kernel.domain import AppError, ErrorType
 
 from .container import container
@@ -16,8 +20,26 @@ from .v1.routers import router
 logger = logging.getLogger(__name__)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
+    # Клиент и `modules.iam.application` импортируют друг друга: импорт здесь не замыкает цикл
+    from modules.iam.infrastructure.oauth import vk_oauth_client  # noqa: PLC0415
+
+    try:
+        yield
+    finally:
+        # Закрытие долгоживущих сессий внешних API
+        await vk_oauth_client.close()
+        # Остановка подписки на канал отзыва токенов
+        await authenticator.close()
+        # Закрытие сокетов и подписки на каналы рассылки событий
+        await connection_manager.close()
+        # Финализация зависимостей уровня приложения (подписки кешей)
+        await app.state.dishka_container.close()
+
+
 def create_fastapi_app() -> FastAPI:
-    app = FastAPI(title="Alyosha AI API")
+    app = FastAPI(title="Alyosha AI API", lifespan=lifespan)
     app.include_router(router)
     app.add_middleware(
         CORSMiddleware,
@@ -3,9 +3,17 @@ from typing import Final
 from dishka import AsyncContainer, make_async_container
 
 from modules.admin.infrastructure.container import AdminProvider
+from modules.audio.infrastructure.container import AudioProvider
+from modules.chat.infrastructure.container import ChatProvider
 from modules.iam.infrastructure.container import IAMProvider
+from modules.notifications.infrastructure.container import NotificationsProvider
 from modules.shared_kernel.insrastructure.container import SharedKernelProvider
 
 container: Final[AsyncContainer] = make_async_container(
-    SharedKernelProvider(), IAMProvider(), AdminProvider(),
+    SharedKernelProvider(),
+    IAMProvider(),
+    AdminProvider(),
+    AudioProvider(),
+    ChatProvider(),
+    NotificationsProvider(),
 )
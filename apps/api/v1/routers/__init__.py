@@ -2,8 +2,10 @@ __all__ = ("router",)
 
 from fastapi import APIRouter
 
+from ..sockets import router as sockets_router
 from .auth import router as auth_router
 from .chat import router as chat_router
+from .tasks import router as tasks_router
 from .users import router as users_router
 from .workspaces import router as workspaces_router
 
@@ -11,5 +13,7 @@ router = APIRouter(prefix="/api/v1")
 
 router.include_router(auth_router)
 router.include_router(chat_router)
+router.include_router(tasks_router)
 router.include_router(users_router)
 router.include_router(workspaces_router)
+router.include_router(sockets_router)
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Body, status
 
 from modules.iam.application import CredentialsAuthService, verify_token
 from modules.iam.domain import TokenPair, User, UserClaims, UserCredentials
+from modules.iam.infrastructure.fastapi import AccessTokenDep, authenticator
 
 router = APIRouter(prefix="", tags=["Credentials Auth 🔐"], route_class=DishkaRoute)
 
@@ -38,7 +39,8 @@ async def login(
     status_code=status.HTTP_200_OK,
     summary="Отзыв токенов"
 )
-async def logout() -> None: ...
+async def logout(token: AccessTokenDep) -> None:
+    await authenticator.revoke(token)
 
 
 @router.post(
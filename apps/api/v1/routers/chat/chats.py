@@ -3,11 +3,16 @@ from typing import Annotated
 from uuid import UUID
 
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter, Body, status
+from fastapi import APIRouter, Body, Query, status
 
-from modules.chat.application import ChatRepository
-from modules.chat.domain import Chat
+from modules.chat.application import ChatRepository, SendMessageUseCase
+from modules.chat.domain import Chat, Message
+from modules.chat.domain.commands import SendMessageCommand
 from modules.iam.infrastructure.fastapi import CurrentUserDep
+from modules.shared_kernel.application import Page, Pagination
+from modules.shared_kernel.application.exceptions import NotFoundError
+
+from ...schemas import CursorToken
 
 router = APIRouter(prefix="/chats", tags=["Chat"], route_class=DishkaRoute)
 
@@ -15,13 +20,18 @@ router = APIRouter(prefix="/chats", tags=["Chat"], route_class=DishkaRoute)
 @router.get(
     path="",
     status_code=status.HTTP_200_OK,
-    response_model=list[Chat],
+    response_model=Page[Chat],
     summary="Мои чаты",
 )
 async def get_my_chats(
-        current_user: CurrentUserDep, repository: FromDishka[ChatRepository]
-) -> list[Chat]:
-    return await repository.get_by_user(current_user.user_id)
+        current_user: CurrentUserDep,
+        repository: FromDishka[ChatRepository],
+        cursor: CursorToken,
+        limit: Annotated[int, Query(ge=1, le=100, description="Размер страницы")] = 20,
+) -> Page[Chat]:
+    pagination = Pagination(limit=limit, cursor=cursor)
+    chats = await repository.get_by_user(current_user.user_id, pagination)
+    return Page.from_items(chats, limit)
 
 
 @router.post(
@@ -44,7 +54,31 @@ async def create_chat(
     summary="Получить чат"
 )
 async def get_chat(chat_id: UUID, repository: FromDishka[ChatRepository]) -> Chat:
-    return await repository.read(chat_id)
+    chat = await repository.read(chat_id)
+    if chat is None:
+        raise NotFoundError(f"Chat {chat_id} not found", entity_name=Chat.__name__)
+    return chat
+
+
+@router.post(
+    path="/{chat_id}/messages",
+    status_code=status.HTTP_201_CREATED,
+    response_model=Message,
+    summary="Отправить сообщение в чат",
+)
+async def send_message(
+        chat_id: UUID,
+        current_user: CurrentUserDep,
+        usecase: FromDishka[SendMessageUseCase],
+        text: Annotated[str, Body(..., embed=True, description="Текст сообщения")],
+        attachments: Annotated[list[UUID], Body(
+            default_factory=list, embed=True, description="Идентификаторы медиа вложений"
+        )],
+) -> Message:
+    """Сообщение доставляется WebSocket подписчикам чата на всех репликах API"""
+
+    command = SendMessageCommand(chat_id=chat_id, text=text, attachments=attachments)
+    return await usecase.execute(current_user.user_id, command)
 
 
 @router.delete(
@@ -0,0 +1,38 @@
+from collections.abc import AsyncIterator
+from uuid import UUID
+
+from dishka.integrations.fastapi import DishkaRoute, FromDishka
+from fastapi import APIRouter, status
+from fastapi.responses import StreamingResponse
+
+from modules.audio.application import ProgressStore
+from modules.iam.infrastructure.fastapi import CurrentUserDep
+from modules.shared_kernel.application.exceptions import NotFoundError
+
+router = APIRouter(prefix="/tasks", tags=["Tasks ⏳"], route_class=DishkaRoute)
+
+
+@router.get(
+    path="/{task_id}/progress",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    summary="Прогресс обработки задачи (Server-Sent Events)",
+)
+async def stream_task_progress(
+        task_id: UUID, current_user: CurrentUserDep, store: FromDishka[ProgressStore]
+) -> StreamingResponse:
+    progress = await store.get(task_id)
+    if progress is None or progress.user_id != current_user.user_id:
+        raise NotFoundError(
+            f"Task {task_id} not found", entity_name="Task", details={"task_id": task_id}
+        )
+
+    async def generate_events() -> AsyncIterator[str]:
+        async for data in store.updates(task_id):
+            yield f"event: progress\ndata: {data}\n\n"
+
+    return StreamingResponse(
+        generate_events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,11 +1,32 @@
 from typing import Annotated, Self
 
-from fastapi import Query, Request
+from fastapi import Depends, Query, Request
+from fastapi.exceptions import RequestValidationError
 from pydantic import BaseModel, ConfigDict, PositiveFloat, PositiveInt
 
+from modules.shared_kernel.application import Cursor
+
+
+def _decode_cursor(
+        cursor: Annotated[
+            str | None,
+            Query(description="Курсор следующей страницы (`next_cursor` из предыдущего ответа)"),
+        ] = None,
+) -> Cursor | None:
+    if cursor is None:
+        return None
+    try:
+        return Cursor.decode(cursor)
+    except ValueError as e:
+        raise RequestValidationError([{
+            "type": "value_error", "loc": ("query", "cursor"), "msg": f"{e}", "input": cursor,
+        }]) from e
+
+
 ChunkSize = Annotated[PositiveInt, Query(...)]
 Page = Annotated[PositiveInt, Query(...)]
 Limit = Annotated[PositiveInt, Query(...)]
+CursorToken = Annotated[Cursor | None, Depends(_decode_cursor)]
 
 
 class AudioMetadataHeaders(BaseModel):
@@ -0,0 +1,63 @@
+from typing import Annotated
+
+from uuid import UUID
+
+from dishka import AsyncContainer
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect, status
+
+from modules.chat.application import ChatRepository
+from modules.chat.infrastructure.fastapi import connection_manager
+from modules.chat.infrastructure.fastapi.connection_managers import chat_topic
+from modules.iam.application.exceptions import UnauthorizedError
+from modules.iam.infrastructure.fastapi import authenticator
+from modules.shared_kernel.application import Cursor, Pagination
+
+router = APIRouter(prefix="/ws", tags=["Sockets 🔌"])
+
+CHATS_PAGE_SIZE = 100  # Чатов пользователя, читаемых за один запрос при подключении
+
+
+async def get_chat_topics(container: AsyncContainer, user_id: UUID) -> list[str]:
+    """Топики всех чатов пользователя"""
+
+    topics: list[str] = []
+    async with container() as request_container:
+        repository = await request_container.get(ChatRepository)
+        pagination = Pagination(limit=CHATS_PAGE_SIZE)
+        while chats := await repository.get_by_user(user_id, pagination):
+            topics.extend(chat_topic(chat.id) for chat in chats)
+            if len(chats) < CHATS_PAGE_SIZE:
+                break
+            last = chats[-1]
+            pagination = Pagination(
+                limit=CHATS_PAGE_SIZE, cursor=Cursor(timestamp=last.created_at, id=last.id)
+            )
+    return topics
+
+
+@router.websocket("/chats")
+async def chat_socket(
+        websocket: WebSocket,
+        token: Annotated[str, Query(..., description="Access токен пользователя")],
+) -> None:
+    """События чатов и прогресса обработки текущего пользователя.
+    Каждый кадр - JSON массив событий, накопленных с предыдущей отправки.
+    Сокет подписывается на сообщения чатов пользователя, существующих на момент подключения.
+    """
+
+    try:
+        current_user = await authenticator.authenticate(token)
+    except UnauthorizedError:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    topics = await get_chat_topics(websocket.state.dishka_container, current_user.user_id)
+    # При ошибке подписки сокет закрывается менеджером и не регистрируется
+    connection = await connection_manager.connect(websocket, current_user.user_id, topics)
+    try:
+        while True:
+            # Входящие кадры используются только как keep-alive
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        await connection_manager.disconnect(connection)
@@ -0,0 +1,96 @@
+"""Сравнение преобразования ORM строк в сущности: валидация Pydantic против быстрого пути.
+
+Строки создаются в памяти (без БД), поэтому замер отражает только стоимость маппинга.
+
+Запуск:
+    python -m benchmarks.data_mapper --rows 10000 --repeat 5
+"""
+
+import argparse
+import logging
+import statistics
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from uuid import uuid4
+
+from modules.admin.infrastructure.database.models import MemberModel
+from modules.admin.infrastructure.database.repositories import MemberDataMapper
+from modules.shared_kernel.insrastructure.database import DataMapper
+from modules.shared_kernel.insrastructure.database.outbox import (
+    OutboxDataMapper,
+    OutboxMessageModel,
+)
+from modules.shared_kernel.utils import current_datetime
+
+logger = logging.getLogger(__name__)
+
+
+def make_outbox_rows(count: int) -> list[OutboxMessageModel]:
+    now = current_datetime()
+    return [
+        OutboxMessageModel(
+            id=uuid4(),
+            message_type="user_registered",
+            entity_id=uuid4(),
+            entity_type="User",
+            payload={"user_id": f"{uuid4()}", "email": f"user{i}@example.com"},
+            status="pending",
+            attempts=0,
+            max_attempts=3,
+            last_error=None,
+            occurred_on=now - timedelta(seconds=i),
+            processed_at=None,
+            created_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def make_member_rows(count: int) -> list[MemberModel]:
+    now = current_datetime()
+    workspace_id = uuid4()
+    return [
+        MemberModel(
+            id=uuid4(),
+            workspace_id=workspace_id,
+            user_id=uuid4(),
+            role="member",
+            status="active",
+            invited_by=f"{uuid4()}",
+            created_at=now,
+        )
+        for _ in range(count)
+    ]
+
+
+def measure(func: Callable[[], object], repeat: int) -> float:
+    timings: list[float] = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started_at)
+    return statistics.median(timings)
+
+
+def compare(name: str, data_mapper: type[DataMapper], rows: list, repeat: int) -> None:
+    validated = measure(lambda: [data_mapper.model_to_entity(row) for row in rows], repeat)
+    trusted = measure(lambda: data_mapper.models_to_entities(rows), repeat)
+    logger.info(
+        "%-10s %s rows: validated %.1f ms, trusted %.1f ms (x%.1f)",
+        name, len(rows), validated * 1000, trusted * 1000, validated / trusted,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000, help="Количество строк")
+    parser.add_argument("--repeat", type=int, default=5, help="Количество повторов")
+    args = parser.parse_args()
+    compare("Outbox", OutboxDataMapper, make_outbox_rows(args.rows), args.repeat)
+    compare("Member", MemberDataMapper, make_member_rows(args.rows), args.repeat)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main()
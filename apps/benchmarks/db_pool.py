@@ -0,0 +1,114 @@
+"""Нагрузочный тест пула соединений PostgreSQL.
+
+Запускает N конкурентных "запросов" (сессия + `SELECT pg_sleep`) на движке,
+созданном из настроек `POSTGRES_*`, и выводит пропускную способность,
+задержку запросов и время ожидания свободного соединения в пуле.
+
+Запуск:
+    python -m benchmarks.db_pool --concurrency 200 --requests 2000 --query-ms 10
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from config.dev import settings
+from modules.shared_kernel.insrastructure.database import (
+    create_engine,
+    get_instrumented_pool,
+    get_pool_metrics,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+async def run(engine: AsyncEngine, concurrency: int, requests: int, query_ms: float) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    failures = 0
+
+    async def request() -> None:
+        nonlocal failures
+        async with semaphore:
+            started_at = time.perf_counter()
+            try:
+                async with engine.connect() as connection:
+                    await connection.execute(
+                        text("SELECT pg_sleep(:seconds)"), {"seconds": query_ms / 1000}
+                    )
+            except PoolTimeoutError:
+                failures += 1
+                return
+            latencies.append(time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(request() for _ in range(requests)))
+    elapsed = time.perf_counter() - started_at
+
+    metrics = get_pool_metrics(engine)
+    wait_times = list(get_instrumented_pool(engine).metrics.wait_times)
+    logger.info("Requests: %s (failed: %s) in %.2f sec", requests, failures, elapsed)
+    logger.info("Throughput: %.1f req/sec", len(latencies) / elapsed)
+    logger.info(
+        "Latency: p50 %.1f ms, p99 %.1f ms, mean %.1f ms",
+        percentile(latencies, 0.5) * 1000,
+        percentile(latencies, 0.99) * 1000,
+        statistics.fmean(latencies) * 1000 if latencies else 0,
+    )
+    logger.info(
+        "Pool wait: p50 %.1f ms, p99 %.1f ms, max %.1f ms",
+        percentile(wait_times, 0.5) * 1000,
+        percentile(wait_times, 0.99) * 1000,
+        metrics["wait_time_max_ms"],
+    )
+    logger.info(
+        "Pool connect: mean %.1f ms, max %.1f ms",
+        metrics["connect_time_avg_ms"],
+        metrics["connect_time_max_ms"],
+    )
+    logger.info(
+        "Pool: size %s, connects %s, checkouts %s, timeouts %s, slow queries %s",
+        metrics["size"], metrics["connects"], metrics["checkouts"],
+        metrics["timeouts"], metrics["slow_queries"],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=100, help="Конкурентных запросов")
+    parser.add_argument("--requests", type=int, default=1000, help="Всего запросов")
+    parser.add_argument("--query-ms", type=float, default=10, help="Длительность запроса (мс)")
+    parser.add_argument("--pool-size", type=int, default=settings.postgres.pool_size)
+    parser.add_argument("--max-overflow", type=int, default=settings.postgres.max_overflow)
+    args = parser.parse_args()
+
+    postgres_settings = settings.postgres.model_copy(
+        update={"pool_size": args.pool_size, "max_overflow": args.max_overflow}
+    )
+    engine = create_engine(postgres_settings)
+
+    async def bench() -> None:
+        try:
+            await run(engine, args.concurrency, args.requests, args.query_ms)
+        finally:
+            await engine.dispose()
+
+    asyncio.run(bench())
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main()
@@ -0,0 +1,148 @@
+"""Нагрузочный стенд сборки писем: шаблоны и кодирование вложений.
+
+Сравниваются режимы:
+ - `compile-per-call` - шаблон разбирается и компилируется на каждое письмо;
+ - `precompiled` - `JinjaEmailTemplateRenderer.render_many`, шаблоны
+   скомпилированы один раз при создании;
+ - `inline` / `offload` - отправка писем с вложением `--attachment-mb` через
+   SMTP сервер-заглушку (`benchmarks.smtp_sender`, в отдельном потоке):
+   кодирование вложения в event loop или в отдельном потоке. Во время отправки "лёгкий" запрос
+   (`asyncio.sleep` на 1 мс) измеряет задержку event loop.
+
+Запуск:
+    python -m benchmarks.email_rendering --letters 2000 --attachment-mb 20
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import threading
+import time
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+from benchmarks.foundation_model_client import percentile, probe
+from benchmarks.smtp_sender import StubSMTPServer
+from modules.notifications.domain import EmailLetter, LetterAttachment
+from modules.notifications.infrastructure.email import (
+    JinjaEmailTemplateRenderer,
+    SMTPEmailSender,
+)
+from modules.notifications.infrastructure.email.templates import TEMPLATES_DIR
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_NAME = "summary_ready"
+SUMMARY = "**Основная тема:** планирование релиза.\n - Ключевые моменты и поручения\n" * 20
+
+
+def build_contexts(count: int) -> list[dict[str, object]]:
+    return [
+        {
+            "username": f"member{i}",
+            "record_name": f"Совещание №{i}",
+            "summary": SUMMARY,
+            "attachments": ["transcript.txt", "report.pdf"],
+        }
+        for i in range(count)
+    ]
+
+
+def bench_rendering(letters: int) -> None:
+    contexts = build_contexts(letters)
+
+    started_at = time.perf_counter()
+    for context in contexts:
+        environment = Environment(
+            loader=FileSystemLoader(TEMPLATES_DIR), autoescape=select_autoescape(default=True)
+        )
+        module = environment.get_template(f"{TEMPLATE_NAME}.html").make_module(context)
+        _ = str(getattr(module, "subject", "")), str(module)
+    elapsed = time.perf_counter() - started_at
+    logger.info(
+        "compile-per-call: %s letters in %.2f s (%.0f/s)", letters, elapsed, letters / elapsed
+    )
+
+    started_at = time.perf_counter()
+    renderer = JinjaEmailTemplateRenderer()
+    startup = time.perf_counter() - started_at
+    started_at = time.perf_counter()
+    renderer.render_many(TEMPLATE_NAME, contexts)
+    elapsed = time.perf_counter() - started_at
+    logger.info(
+        "precompiled: %s letters in %.2f s (%.0f/s), startup compilation %.1f ms",
+        letters, elapsed, letters / elapsed, startup * 1000,
+    )
+
+
+async def bench_attachments(args: argparse.Namespace) -> None:
+    server = StubSMTPServer(handshake_delay=0.05, delivery_delay=0.005, idle_timeout=30)
+    # Сервер в отдельном потоке: разбор принятых писем не должен влиять на замер
+    ready = threading.Event()
+
+    async def serve() -> None:
+        await server.start()
+        ready.set()
+        await asyncio.Event().wait()
+
+    threading.Thread(target=asyncio.run, args=(serve(),), daemon=True).start()
+    ready.wait()
+    renderer = JinjaEmailTemplateRenderer()
+    attachment = LetterAttachment(
+        content=os.urandom(int(args.attachment_mb * 1024 * 1024)),
+        filename="transcript.bin",
+        content_type="application/octet-stream",
+    )
+    letters = [
+        EmailLetter(
+            subject=email.subject,
+            sender_email="noreply@example.com",
+            recipient_emails=[f"member{i}@example.com"],
+            body_markup=email.body_markup,
+            attachments=[attachment],
+        )
+        for i, email in enumerate(
+            renderer.render_many(TEMPLATE_NAME, build_contexts(args.attachment_letters))
+        )
+    ]
+    for mode, threshold in (("inline", 2**63), ("offload", 0)):
+        sender = SMTPEmailSender(
+            host="127.0.0.1",
+            port=server.port,
+            username="u",
+            password="p",  # noqa: S106
+            use_tls=False,
+            offload_threshold=threshold,
+        )
+        stop = asyncio.Event()
+        lags: list[float] = []
+        probe_task = asyncio.create_task(probe(stop, lags))
+        started_at = time.perf_counter()
+        errors = await sender.send_many(letters)
+        elapsed = time.perf_counter() - started_at
+        stop.set()
+        await probe_task
+        await sender.close()
+        logger.info(
+            "%-7s %s letters x %.0f MB in %.2f s, failed %s, loop lag p99 %.1f ms, max %.1f ms",
+            mode, len(letters), args.attachment_mb, elapsed,
+            sum(error is not None for error in errors),
+            percentile(lags, 0.99) * 1000, max(lags) * 1000,
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--letters", type=int, default=2000, help="Писем для отрисовки")
+    parser.add_argument("--attachment-letters", type=int, default=8, help="Писем с вложением")
+    parser.add_argument("--attachment-mb", type=float, default=20, help="Размер вложения (МБ)")
+    args = parser.parse_args()
+    bench_rendering(args.letters)
+    asyncio.run(bench_attachments(args))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("modules").setLevel(logging.WARNING)
+    main()
@@ -0,0 +1,150 @@
+"""Нагрузочный стенд клиентов Foundation Models API на локальном сервере-заглушке.
+
+Сервер-заглушка (`benchmarks.foundation_models_stub`) работает в отдельном потоке
+с задержкой ответа `--latency-ms` и долей ответов 429/503 `--error-rate`.
+Во время нагрузки "лёгкий" запрос (`asyncio.sleep` на 1 мс) измеряет задержку
+event loop. Сравниваются режимы:
+ - `sync` - блокирующий `FoundationModelClient` прямо в корутинах;
+ - `async` - `AsyncFoundationModelClient` (пул соединений, лимиты, повторы);
+ - `stream` - потоковая генерация, время до первого фрагмента ответа.
+
+Запуск:
+    python -m benchmarks.foundation_model_client --requests 500 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import threading
+import time
+from collections.abc import Awaitable, Callable
+
+from foundation_models.client.asyncio import AsyncFoundationModelClient
+from foundation_models.client.client import FoundationModelClient
+from foundation_models.client.models import Message
+
+from .foundation_models_stub import StubFoundationModelServer
+
+logger = logging.getLogger(__name__)
+
+PROBE_INTERVAL = 0.001  # Интервал "лёгких" запросов (в секундах)
+PROMPT = "Кратко изложи содержание фрагмента транскрипции совещания " * 20
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def start_server(server: StubFoundationModelServer) -> None:
+    """Запуск сервера в отдельном потоке, чтобы блокирующий клиент не останавливал его"""
+
+    ready = threading.Event()
+
+    async def serve() -> None:
+        await server.start()
+        ready.set()
+        await asyncio.Event().wait()
+
+    threading.Thread(target=asyncio.run, args=(serve(),), daemon=True).start()
+    ready.wait()
+
+
+async def probe(stop: asyncio.Event, latencies: list[float]) -> None:
+    """Лёгкий запрос: лишняя задержка сверх `PROBE_INTERVAL` - время блокировки event loop"""
+
+    while not stop.is_set():
+        started_at = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        latencies.append(time.perf_counter() - started_at - PROBE_INTERVAL)
+
+
+async def run(mode: str, requests: int, call: Callable[[], Awaitable[float]]) -> None:
+    stop = asyncio.Event()
+    lags: list[float] = []
+    probe_task = asyncio.create_task(probe(stop, lags))
+    await asyncio.sleep(PROBE_INTERVAL * 10)
+    started_at = time.perf_counter()
+    latencies = await asyncio.gather(*(call() for _ in range(requests)))
+    elapsed = time.perf_counter() - started_at
+    stop.set()
+    await probe_task
+    logger.info(
+        "%-6s %s requests in %.2f s (%.0f/s), latency median %.0f ms, p99 %.0f ms, "
+        "loop lag p99 %.1f ms, max %.1f ms",
+        mode, requests, elapsed, requests / elapsed,
+        statistics.median(latencies) * 1000, percentile(latencies, 0.99) * 1000,
+        percentile(lags, 0.99) * 1000, max(lags) * 1000,
+    )
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    server = StubFoundationModelServer(
+        latency=args.latency_ms / 1000, error_rate=args.error_rate
+    )
+    start_server(server)
+    messages = [Message(role="user", text=PROMPT)]
+
+    sync_client = FoundationModelClient(
+        api_key="stub", iam_token="", folder_id="stub", model_name="stub", base_url=server.url
+    )
+
+    async def sync_completion() -> float:  # noqa: RUF029
+        started_at = time.perf_counter()
+        try:
+            sync_client.completion(messages)
+        except Exception:  # noqa: BLE001
+            logger.debug("Sync completion failed")
+        return time.perf_counter() - started_at
+
+    await run("sync", args.sync_requests, sync_completion)
+
+    async with AsyncFoundationModelClient(
+        api_key="stub",
+        iam_token="",
+        folder_id="stub",
+        model_name="stub",
+        base_url=server.url,
+        max_concurrency=args.concurrency,
+        requests_per_second=args.rps,
+        backoff_factor=0.05,
+    ) as client:
+
+        async def async_completion() -> float:
+            started_at = time.perf_counter()
+            await client.completion(messages)
+            return time.perf_counter() - started_at
+
+        async def first_chunk() -> float:
+            started_at = time.perf_counter()
+            latency = None
+            async for _ in client.stream(messages):
+                if latency is None:
+                    latency = time.perf_counter() - started_at
+            return latency or 0
+
+        server.stats.max_in_flight = 0
+        await run("async", args.requests, async_completion)
+        logger.info(
+            "server max in flight %s (limit %s)", server.stats.max_in_flight, args.concurrency
+        )
+        await run("stream", args.requests, first_chunk)
+        logger.info("client %s, server %s", client.stats, server.stats)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500, help="Запросов в режиме async")
+    parser.add_argument("--sync-requests", type=int, default=20, help="Запросов в режиме sync")
+    parser.add_argument("--concurrency", type=int, default=32, help="Одновременных запросов")
+    parser.add_argument("--rps", type=float, default=None, help="Ограничение запросов в секунду")
+    parser.add_argument("--latency-ms", type=float, default=200, help="Длительность ответа")
+    parser.add_argument("--error-rate", type=float, default=0.05, help="Доля ответов 429/503")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main()
@@ -0,0 +1,175 @@
+"""Локальный сервер-заглушка Foundation Models API для тестов и нагрузочных стендов.
+
+Отвечает на `POST /foundationModels/v1/completion` эхом последнего сообщения
+с задержкой `latency`, долю запросов `error_rate` (и первые `fail_first` запросов)
+отклоняет ответами 429 и 503 поочерёдно с заголовком `Retry-After`,
+при `completionOptions.stream` отдаёт ответ по частям (JSON строками
+с накопленным текстом, как настоящий API).
+
+Запуск:
+    python -m benchmarks.foundation_models_stub --port 8900 --latency-ms 200 --error-rate 0.05
+"""
+
+from typing import Self
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+from dataclasses import dataclass
+
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+COMPLETION_PATH = "/foundationModels/v1/completion"
+
+
+@dataclass(slots=True)
+class StubServerStats:
+    """Статистика сервера-заглушки.
+
+    Attributes:
+        requests: Принятые запросы.
+        rejected: Запросы, отклонённые ответом 429/503.
+        in_flight: Запросы в обработке.
+        max_in_flight: Максимум одновременно обрабатываемых запросов.
+    """
+
+    requests: int = 0
+    rejected: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+
+def _result(text: str, status: str, input_tokens: int) -> dict[str, object]:
+    completion_tokens = len(text.split())
+    return {
+        "result": {
+            "alternatives": [{"message": {"role": "assistant", "text": text}, "status": status}],
+            "usage": {
+                "inputTextTokens": str(input_tokens),
+                "completionTokens": str(completion_tokens),
+                "totalTokens": str(input_tokens + completion_tokens),
+            },
+            "modelVersion": "stub",
+        }
+    }
+
+
+class StubFoundationModelServer:
+    """Сервер-заглушка, запускаемый в текущем event loop"""
+
+    def __init__(
+            self,
+            host: str = "127.0.0.1",
+            port: int = 0,
+            latency: float = 0.05,
+            error_rate: float = 0,
+            stream_chunks: int = 5,
+            fail_first: int = 0,
+            retry_after: float = 0,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.error_rate = error_rate
+        self.fail_first = fail_first
+        self.retry_after = retry_after
+        self.stream_chunks = stream_chunks
+        self.stats = StubServerStats()
+        self._runner: web.AppRunner | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def _completion(self, request: web.Request) -> web.StreamResponse:
+        self.stats.requests += 1
+        if (
+                self.stats.requests <= self.fail_first
+                or random.random() < self.error_rate  # noqa: S311
+        ):
+            status = (429, 503)[self.stats.rejected % 2]
+            self.stats.rejected += 1
+            return web.json_response(
+                {"error": "stub overload"},
+                status=status,
+                headers={"Retry-After": f"{self.retry_after}"},
+            )
+        payload = await request.json()
+        text = payload["messages"][-1].get("text") or ""
+        input_tokens = sum(len((m.get("text") or "").split()) for m in payload["messages"])
+        self.stats.in_flight += 1
+        self.stats.max_in_flight = max(self.stats.max_in_flight, self.stats.in_flight)
+        try:
+            if not payload["completionOptions"].get("stream"):
+                await asyncio.sleep(self.latency)
+                return web.json_response(_result(text, "ALTERNATIVE_STATUS_FINAL", input_tokens))
+            response = web.StreamResponse(headers={"Content-Type": "application/json"})
+            await response.prepare(request)
+            words = text.split(" ")
+            step = max(1, -(-len(words) // self.stream_chunks))
+            for end in range(step, len(words) + step, step):
+                await asyncio.sleep(self.latency / self.stream_chunks)
+                is_final = end >= len(words)
+                chunk = _result(
+                    " ".join(words[:end]),
+                    "ALTERNATIVE_STATUS_FINAL" if is_final else "ALTERNATIVE_STATUS_PARTIAL",
+                    input_tokens,
+                )
+                await response.write(f"{json.dumps(chunk, ensure_ascii=False)}\n".encode())
+            await response.write_eof()
+            return response
+        finally:
+            self.stats.in_flight -= 1
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_post(COMPLETION_PATH, self._completion)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        # При port=0 порт выбирается системой
+        self.port = self._runner.addresses[0][1]
+        logger.info("Stub Foundation Models server started on %s", self.url)
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.stop()
+
+
+async def serve(args: argparse.Namespace) -> None:
+    server = StubFoundationModelServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency_ms / 1000,
+        error_rate=args.error_rate,
+    )
+    async with server:
+        await asyncio.Event().wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency-ms", type=float, default=200, help="Длительность ответа")
+    parser.add_argument("--error-rate", type=float, default=0, help="Доля ответов 429/503")
+    args = parser.parse_args()
+    asyncio.run(serve(args))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main()
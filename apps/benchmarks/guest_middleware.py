@@ -0,0 +1,126 @@
+"""Задержка запроса с `GuestMiddleware` и без него.
+
+Запросы отправляются напрямую в ASGI приложение (без сети и БД), поэтому замер
+отражает только накладные расходы middleware на горячем пути:
+ - `bearer` - запрос с действующим гостевым access токеном;
+ - `guest-id` - запрос только с `X-Guest-ID`, токен гостя уже в кеше процесса.
+
+Запуск:
+    python -m benchmarks.guest_middleware --requests 20000
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from datetime import timedelta
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message
+
+from modules.iam.application.dto import GuestToken
+from modules.iam.application.services import generate_access_token
+from modules.iam.domain import Guest
+from modules.iam.infrastructure.fastapi import GuestMiddleware
+from modules.shared_kernel.utils import current_datetime
+
+logger = logging.getLogger(__name__)
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/v1/ping")
+    async def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    return app
+
+
+async def call(app: ASGIApp, headers: list[tuple[bytes, bytes]]) -> None:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/v1/ping",
+        "raw_path": b"/api/v1/ping",
+        "query_string": b"",
+        "root_path": "",
+        "headers": headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+
+    async def receive() -> Message:  # noqa: RUF029
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:  # noqa: RUF029
+        if message["type"] == "http.response.start" and message["status"] != 200:  # noqa: PLR2004
+            raise RuntimeError(f"Unexpected status {message['status']}")
+
+    await app(scope, receive, send)
+
+
+async def measure(app: ASGIApp, headers: list[tuple[bytes, bytes]], requests: int) -> list[float]:
+    await call(app, headers)  # Прогрев
+    latencies: list[float] = []
+    for _ in range(requests):
+        started_at = time.perf_counter()
+        await call(app, headers)
+        latencies.append(time.perf_counter() - started_at)
+    return latencies
+
+
+def report(name: str, latencies: list[float], baseline: float | None = None) -> None:
+    median = statistics.median(latencies)
+    overhead = "" if baseline is None else f", overhead {(median - baseline) * 1e6:+.1f} us"
+    logger.info(
+        "%-22s median %.1f us, p95 %.1f us, p99 %.1f us%s",
+        name,
+        median * 1e6,
+        percentile(latencies, 0.95) * 1e6,
+        percentile(latencies, 0.99) * 1e6,
+        overhead,
+    )
+
+
+async def run(requests: int) -> None:
+    guest = Guest(expires_at=current_datetime() + timedelta(days=10))
+    token = generate_access_token(guest.to_jwt_payload())
+    guest_token = GuestToken(
+        guest_id=guest.id,
+        access_token=token.access_token,
+        token_type=token.token_type,
+        expires_at=token.expires_at,
+    )
+    app = create_app()
+    middleware = GuestMiddleware(app)
+    middleware.cache_token(guest_token)
+
+    without = await measure(app, [], requests)
+    report("without middleware", without)
+    baseline = statistics.median(without)
+    bearer = [(b"authorization", f"Bearer {guest_token.access_token}".encode())]
+    report("with, bearer", await measure(middleware, bearer, requests), baseline)
+    guest_id = [(b"x-guest-id", str(guest.id).encode())]
+    report("with, guest-id", await measure(middleware, guest_id, requests), baseline)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20_000, help="Количество запросов")
+    args = parser.parse_args()
+    asyncio.run(run(args.requests))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main()
@@ -0,0 +1,78 @@
+"""Замер времени импорта точек входа API и воркеров.
+
+Каждый модуль импортируется в отдельном "холодном" процессе интерпретатора,
+поэтому результат отражает реальное время старта процесса.
+
+Запуск:
+    python -m benchmarks.import_time --repeat 5
+"""
+
+import argparse
+import logging
+import statistics
+import subprocess  # noqa: S404
+import sys
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+APPS_DIR = Path(__file__).resolve().parent.parent
+
+ENTRYPOINTS: tuple[str, ...] = (
+    "api.app",
+    "modules.ai.utils.nlp",
+    "modules.ai.infrastructure.text_splitters.semantic",
+    "workers.audio_splitter.main",
+    "workers.sound_enhancer.main",
+    "workers.transcriber.main",
+    "workers.summarizer.main",
+)
+
+
+def measure_import(module: str) -> float:
+    """Время импорта модуля в новом процессе (в секундах)
+
+    :exception RuntimeError: Модуль не удалось импортировать.
+    """
+
+    started_at = time.perf_counter()
+    process = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", f"import {module}"],
+        cwd=APPS_DIR,
+        capture_output=True,
+        check=False,
+    )
+    elapsed = time.perf_counter() - started_at
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr.decode().strip().splitlines()[-1])
+    return elapsed
+
+
+def run(modules: tuple[str, ...], repeat: int) -> None:
+    baseline = statistics.median(measure_import("sys") for _ in range(repeat))
+    logger.info("Interpreter startup: %.3f sec", baseline)
+    for module in modules:
+        try:
+            timings = [measure_import(module) for _ in range(repeat)]
+        except RuntimeError as e:
+            logger.warning("%-55s FAILED: %s", module, e)
+            continue
+        logger.info(
+            "%-55s median %.3f sec, min %.3f sec (startup excluded: %.3f sec)",
+            module, statistics.median(timings), min(timings),
+            statistics.median(timings) - baseline,
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5, help="Количество запусков на модуль")
+    parser.add_argument("modules", nargs="*", help="Модули для замера (по умолчанию все)")
+    args = parser.parse_args()
+    run(tuple(args.modules) or ENTRYPOINTS, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main()
@@ -0,0 +1,90 @@
+"""Нагрузочный тест хеширования паролей: влияние всплеска входов на прочие запросы.
+
+Во время всплеска из N конкурентных проверок пароля "лёгкий" запрос
+(`asyncio.sleep` на 1 мс) измеряет задержку event loop. Сравниваются режимы:
+ - `inline` - `verify_secret` прямо в корутине (как в обработчике до переноса в пул);
+ - `executor` - `PasswordHasher.verify` в ограниченном пуле потоков.
+
+Запуск:
+    python -m benchmarks.password_hashing --logins 200 --workers 4
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+
+from modules.iam.utils.security import PasswordHasher, hash_secret, verify_secret
+
+logger = logging.getLogger(__name__)
+
+PROBE_INTERVAL = 0.001  # Интервал "лёгких" запросов (в секундах)
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+async def probe(stop: asyncio.Event, latencies: list[float]) -> None:
+    """Лёгкий запрос: лишняя задержка сверх `PROBE_INTERVAL` - время блокировки event loop"""
+
+    while not stop.is_set():
+        started_at = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        latencies.append(time.perf_counter() - started_at - PROBE_INTERVAL)
+
+
+async def inline_login(password: str, password_hash: str) -> None:  # noqa: RUF029
+    verify_secret(password, password_hash)
+
+
+async def run(mode: str, logins: int, hasher: PasswordHasher, password_hash: str) -> None:
+    stop = asyncio.Event()
+    latencies: list[float] = []
+    probe_task = asyncio.create_task(probe(stop, latencies))
+    await asyncio.sleep(PROBE_INTERVAL * 10)
+    started_at = time.perf_counter()
+    if mode == "inline":
+        await asyncio.gather(*(inline_login("password", password_hash) for _ in range(logins)))
+    else:
+        await asyncio.gather(*(hasher.verify("password", password_hash) for _ in range(logins)))
+    elapsed = time.perf_counter() - started_at
+    stop.set()
+    await probe_task
+    logger.info(
+        "%-8s %s logins in %.2f s (%.0f/s), probe lag: median %.1f ms, p99 %.1f ms, "
+        "max %.1f ms, probes %s",
+        mode, logins, elapsed, logins / elapsed,
+        statistics.median(latencies) * 1000,
+        percentile(latencies, 0.99) * 1000,
+        max(latencies) * 1000,
+        len(latencies),
+    )
+
+
+async def main_async(logins: int, workers: int) -> None:
+    hasher = PasswordHasher(max_workers=workers, max_pending=logins)
+    password_hash = hash_secret("password")
+    await run("inline", logins, hasher, password_hash)
+    await run("executor", logins, hasher, password_hash)
+    metrics = hasher.metrics
+    logger.info(
+        "executor metrics: max queue depth %s, avg wait %.1f ms, completed %s, rejected %s",
+        metrics.max_queue_depth, metrics.avg_wait_time * 1000, metrics.completed, metrics.rejected,
+    )
+    hasher.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=200, help="Количество входов во всплеске")
+    parser.add_argument("--workers", type=int, default=4, help="Размер пула хеширования")
+    args = parser.parse_args()
+    asyncio.run(main_async(args.logins, args.workers))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main()
@@ -0,0 +1,565 @@
+"""Нагрузочный стенд конвейера обработки аудио записи целиком.
+
+upload (fake S3) → `FFMpegAudioSplitter` → sound_enhancer → transcriber → summarizer
+
+Этапы связаны брокером в памяти (очередь asyncio на топик, несколько обработчиков
+на этап), обработчики повторяют логику воркеров. Внешние сервисы заменены
+локальными заглушками:
+ - S3 - хранилище объектов во временной директории (части файла пишутся на диск);
+ - SaluteSpeech - `benchmarks.salute_speech_stub`: задача распознавания длится
+   `--stt-latency-ms` + `--stt-rtf` секунд на секунду аудио;
+ - модель суммаризации - заглушка с задержкой `--llm-latency-ms`.
+
+Для каждой синтетической записи (`--durations`, в минутах; речь с паузами)
+стенд запускается в отдельном процессе и выводит по этапам: число сообщений,
+объём входных данных, пропускную способность (секунд аудио в секунду работы
+этапа), p50/p99 обработки сообщения и ожидания в очереди, а также время
+конвейера и пиковый RSS процесса (и дочернего FFmpeg). Требуется FFmpeg в PATH.
+
+Запуск:
+    python -m benchmarks.pipeline --durations 10 60 240
+"""
+
+from typing import Any
+
+import argparse
+import asyncio
+import hashlib
+import logging
+import resource
+import shutil
+import statistics
+import tempfile
+import time
+from collections import defaultdict
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from pathlib import Path
+from uuid import uuid4
+
+import numpy as np
+import soundfile as sf
+
+from modules.audio.application import (
+    IncrementalSummarizationService,
+    InMemoryPartialSummaryStore,
+    InMemorySummaryCache,
+    MapReduceSummarizationEngine,
+    RecognitionOptions,
+    SegmentTranscriptionService,
+    TranscriptionCache,
+)
+from modules.audio.domain import (
+    AudioFormat,
+    AudioSegment,
+    AudioSplitEvent,
+    AudioTranscribedEvent,
+    TranscriptionSummarizedEvent,
+)
+from modules.audio.infrastructure.ffmpeg import FFMpegAudioSplitter
+from modules.audio.utils.audio import enhance_sound_quality
+from modules.audio.utils.resampling import ENHANCEMENT_PROFILE, RECOGNITION_PROFILE
+from modules.audio.utils.segmentation import SegmentationPlanner, balanced_segment_duration
+from modules.media.application import Storage
+from modules.media.application.services import hash_stream
+from modules.media.domain import (
+    File,
+    FileMetadata,
+    Filename,
+    FilePart,
+    Filepath,
+    MimeType,
+    UploadFileCommand,
+)
+from salute_speech.asyncio import AsyncSaluteSpeechClient
+from salute_speech.models import RecognizedSpeechList
+
+from .salute_speech_stub import StubSaluteSpeechServer
+from .summarization_engine import StubSummarizer
+
+logger = logging.getLogger(__name__)
+
+READ_CHUNK_SIZE = 1024 * 1024  # Чанк чтения записи при загрузке и скачивании
+GENERATION_BLOCK = 60  # Секунд синтетической записи на блок генерации
+STAGES = ("upload", "split", "enhance", "transcribe", "summarize")
+
+
+def generate_recording(path: Path, duration: int, samplerate: int, seed: int = 0) -> None:
+    """Синтетическая запись: фразы 1.5-12 сек (модулированный шум) и паузы 0.2-1.5 сек"""
+
+    rng = np.random.default_rng(seed)
+    frame = samplerate // 100  # Разметка речи с шагом 10 мс
+    with sf.SoundFile(
+            str(path), mode="w", samplerate=samplerate, channels=1, subtype="PCM_16"
+    ) as file:
+        remaining, speaking, left = duration * 100, True, 0
+        while remaining > 0:
+            frames = min(remaining, GENERATION_BLOCK * 100)
+            mask = np.empty(frames, dtype=bool)
+            position = 0
+            while position < frames:
+                if left == 0:
+                    speaking = not speaking
+                    left = int(rng.integers(150, 1200) if speaking else rng.integers(20, 150))
+                step = min(left, frames - position)
+                mask[position:position + step] = speaking
+                position += step
+                left -= step
+            envelope = np.repeat(np.where(mask, 0.2, 0.003), frame).astype(np.float32)
+            noise = rng.standard_normal(len(envelope), dtype=np.float32)
+            file.write(np.clip(noise * envelope, -1, 1))
+            remaining -= frames
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))] if ordered else 0
+
+
+@dataclass(slots=True)
+class StageStats:
+    """Статистика этапа конвейера.
+
+    Attributes:
+        messages: Обработанные сообщения.
+        input_bytes: Объём входных данных этапа.
+        audio_seconds: Продолжительность обработанного аудио.
+        handler_times: Время обработки сообщений (в секундах).
+        queue_times: Время ожидания сообщений в очереди (в секундах).
+        started_at: Начало работы этапа (первое сообщение).
+        finished_at: Окончание работы этапа (последнее сообщение).
+    """
+
+    messages: int = 0
+    input_bytes: int = 0
+    audio_seconds: float = 0
+    handler_times: list[float] = field(default_factory=list)
+    queue_times: list[float] = field(default_factory=list)
+    started_at: float | None = None
+    finished_at: float = 0
+
+    def record(self, started_at: float, finished_at: float, size: int, duration: float) -> None:
+        if self.started_at is None:
+            self.started_at = started_at
+        self.finished_at = max(self.finished_at, finished_at)
+        self.handler_times.append(finished_at - started_at)
+        self.messages += 1
+        self.input_bytes += size
+        self.audio_seconds += duration
+
+    @property
+    def throughput(self) -> float:
+        """Секунд аудио в секунду работы этапа"""
+
+        elapsed = self.finished_at - (self.started_at or self.finished_at)
+        return self.audio_seconds / elapsed if elapsed > 0 else 0
+
+
+@dataclass(slots=True)
+class _Envelope:
+    message: Any
+    enqueued_at: float
+
+
+class InMemoryBroker:
+    """Брокер в памяти: очередь на топик, `concurrency` обработчиков на подписку"""
+
+    def __init__(self) -> None:
+        self._queues: dict[str, asyncio.Queue[_Envelope]] = defaultdict(asyncio.Queue)
+        self._consumers: list[asyncio.Task[None]] = []
+
+    async def publish(self, message: Any, queue: str) -> None:
+        await self._queues[queue].put(_Envelope(message=message, enqueued_at=time.perf_counter()))
+
+    async def _consume(
+            self, queue: str, handler: Callable[[Any], Awaitable[None]], stats: StageStats
+    ) -> None:
+        while True:
+            envelope = await self._queues[queue].get()
+            stats.queue_times.append(time.perf_counter() - envelope.enqueued_at)
+            try:
+                await handler(envelope.message)
+            except Exception:
+                logger.exception("Handler of queue %s failed", queue)
+            finally:
+                self._queues[queue].task_done()
+
+    def subscribe(
+            self,
+            queue: str,
+            handler: Callable[[Any], Awaitable[None]],
+            stats: StageStats,
+            concurrency: int = 1,
+    ) -> None:
+        self._consumers.extend(
+            asyncio.create_task(self._consume(queue, handler, stats)) for _ in range(concurrency)
+        )
+
+    async def close(self) -> None:
+        for consumer in self._consumers:
+            consumer.cancel()
+        await asyncio.gather(*self._consumers, return_exceptions=True)
+
+
+class FakeS3Storage(Storage):
+    """Объектное хранилище во временной директории (вместо S3/MinIO)"""
+
+    def __init__(self, root: Path) -> None:
+        self._root = root
+
+    def _path(self, filepath: Filepath) -> Path:
+        return self._root / hashlib.sha256(filepath.encode()).hexdigest()
+
+    async def upload(self, file: File) -> None:
+        await asyncio.to_thread(self._path(file.path).write_bytes, file.content)
+
+    async def upload_multipart(self, file_parts: AsyncIterable[FilePart]) -> None:
+        target = None
+        try:
+            async for part in file_parts:
+                if target is None:
+                    target = self._path(part.path).open("wb")
+                await asyncio.to_thread(target.write, part.content)
+        finally:
+            if target is not None:
+                target.close()
+
+    async def download(self, filepath: Filepath) -> File | None:
+        path = self._path(filepath)
+        if not path.exists():
+            return None
+        content = await asyncio.to_thread(path.read_bytes)
+        return File(
+            path=filepath, size=len(content), mime_type=MimeType("audio/wav"), content=content
+        )
+
+    async def download_multipart(
+            self, filepath: Filepath, part_size: int
+    ) -> AsyncIterator[FilePart]:
+        path = self._path(filepath)
+        total_size = path.stat().st_size
+        total_parts = -(-total_size // part_size)
+        file = path.open("rb")
+        try:
+            for number in range(1, total_parts + 1):
+                content = await asyncio.to_thread(file.read, part_size)
+                yield FilePart(
+                    number=number,
+                    total_size=total_size,
+                    total_parts=total_parts,
+                    path=filepath,
+                    size=len(content),
+                    mime_type=MimeType("audio/wav"),
+                    content=content,
+                )
+        finally:
+            file.close()
+
+    async def remove(self, filepath: Filepath) -> bool:
+        path = self._path(filepath)
+        existed = path.exists()
+        path.unlink(missing_ok=True)
+        return existed
+
+    async def exists(self, filepath: Filepath) -> bool:
+        return self._path(filepath).exists()
+
+
+class NullTranscriptionCache(TranscriptionCache):
+    """Без кэша: каждый сегмент распознаётся сервером-заглушкой"""
+
+    async def get(self, fingerprint: str) -> RecognizedSpeechList | None:  # noqa: ARG002, PLR6301
+        return None
+
+    async def set(self, fingerprint: str, speech: RecognizedSpeechList) -> None:
+        pass
+
+
+async def read_file(path: Path) -> AsyncIterator[bytes]:
+    file = path.open("rb")
+    try:
+        while chunk := await asyncio.to_thread(file.read, READ_CHUNK_SIZE):
+            yield chunk
+    finally:
+        file.close()
+
+
+class Pipeline:
+    """Этапы конвейера для одной записи, обработчики повторяют воркеры"""
+
+    def __init__(
+            self,
+            broker: InMemoryBroker,
+            storage: Storage,
+            transcription: SegmentTranscriptionService,
+            summarization: IncrementalSummarizationService,
+    ) -> None:
+        self._broker = broker
+        self._storage = storage
+        self._transcription = transcription
+        self._summarization = summarization
+        self.ids = {
+            "task_id": uuid4(), "user_id": uuid4(), "collection_id": uuid4(), "record_id": uuid4()
+        }
+        self.stats = {stage: StageStats() for stage in STAGES}
+        self.done: asyncio.Future[TranscriptionSummarizedEvent] = (
+            asyncio.get_running_loop().create_future()
+        )
+
+    def subscribe(self, enhancers: int, transcribers: int, summarizers: int) -> None:
+        for queue, handler, stage, consumers in (
+            ("sound_enhancement", self.enhance, "enhance", enhancers),
+            ("transcribing", self.transcribe, "transcribe", transcribers),
+            ("summarizing", self.summarize, "summarize", summarizers),
+        ):
+            self._broker.subscribe(queue, self._guard(handler), self.stats[stage], consumers)
+
+    def _guard(
+            self, handler: Callable[[Any], Awaitable[None]]
+    ) -> Callable[[Any], Awaitable[None]]:
+        """Ошибка обработчика завершает прогон, а не ожидание саммари до `--timeout`"""
+
+        async def guarded(message: Any) -> None:
+            try:
+                await handler(message)
+            except Exception as e:
+                if not self.done.done():
+                    self.done.set_exception(e)
+                raise
+
+        return guarded
+
+    async def upload(self, recording: Path, duration: int) -> FileMetadata:
+        """Загрузка как в `MediaService.upload_file` (без записи метаданных в БД)"""
+
+        started_at = time.perf_counter()
+        filesize = (await asyncio.to_thread(recording.stat)).st_size
+        file_metadata = FileMetadata.create(
+            UploadFileCommand(
+                filename=Filename(recording.name),
+                mime_type=MimeType("audio/wav"),
+                filesize=filesize,
+                tenant="benchmark",
+                entity_type="collection",
+                entity_id=str(self.ids["collection_id"]),
+            )
+        )
+        hasher = hashlib.sha256()
+        await self._storage.upload_multipart(
+            file_metadata.generate_file_parts(hash_stream(read_file(recording), hasher))
+        )
+        file_metadata.content_hash = hasher.hexdigest()
+        self.stats["upload"].record(
+            started_at, time.perf_counter(), file_metadata.filesize, duration
+        )
+        return file_metadata
+
+    async def split(self, file_metadata: FileMetadata, splitter: FFMpegAudioSplitter) -> None:
+        parts = self._storage.download_multipart(file_metadata.filepath, READ_CHUNK_SIZE)
+        stream = (part.content async for part in parts)
+        stats = self.stats["split"]
+        started_at = time.perf_counter()
+        segments_count = 0
+        async for segment in splitter.split_stream(stream, metadata=self.ids):
+            # Первый сегмент ждёт загрузки, декодирования и анализа всей записи
+            stats.record(started_at, time.perf_counter(), 0, segment.duration)
+            await self._broker.publish(segment, "sound_enhancement")
+            segments_count += 1
+            started_at = time.perf_counter()
+        stats.input_bytes = file_metadata.filesize
+        await self._broker.publish(
+            AudioSplitEvent(
+                task_id=self.ids["task_id"],
+                user_id=self.ids["user_id"],
+                collection_id=self.ids["collection_id"],
+                segments_count=segments_count,
+                record_ids=[self.ids["record_id"]],
+            ),
+            "summarizing",
+        )
+
+    async def enhance(self, segment: AudioSegment) -> None:
+        started_at = time.perf_counter()
+        effected, profile = await asyncio.to_thread(
+            enhance_sound_quality, segment.content, profile=RECOGNITION_PROFILE
+        )
+        self.stats["enhance"].record(
+            started_at, time.perf_counter(), segment.size, segment.duration
+        )
+        await self._broker.publish(
+            segment.model_copy(update={
+                "content": effected,
+                "size": len(effected),
+                "format": AudioFormat.WAV,
+                "samplerate": profile.samplerate,
+                "channels": profile.channels,
+            }),
+            "transcribing",
+        )
+
+    async def transcribe(self, segment: AudioSegment) -> None:
+        started_at = time.perf_counter()
+        text = await self._transcription.transcribe(segment)
+        self.stats["transcribe"].record(
+            started_at, time.perf_counter(), segment.size, segment.duration
+        )
+        await self._broker.publish(
+            AudioTranscribedEvent(
+                task_id=self.ids["task_id"],
+                user_id=self.ids["user_id"],
+                collection_id=self.ids["collection_id"],
+                record_id=self.ids["record_id"],
+                segment_id=segment.number,
+                segment_duration=segment.duration,
+                segments_count=segment.total_count,
+                is_last=segment.is_last,
+                text=text,
+            ),
+            "summarizing",
+        )
+
+    async def summarize(self, event: AudioSplitEvent | AudioTranscribedEvent) -> None:
+        started_at = time.perf_counter()
+        summarized_event = await self._summarization.handle(event)
+        if isinstance(event, AudioTranscribedEvent):
+            self.stats["summarize"].record(
+                started_at, time.perf_counter(), len(event.text.encode()), event.segment_duration
+            )
+        if summarized_event is not None:
+            self.done.set_result(summarized_event)
+
+
+async def run_pipeline(args: argparse.Namespace, duration: int, workdir: Path) -> dict[str, Any]:
+    recording = workdir / "recording.wav"
+    generate_recording(recording, duration, args.input_samplerate)
+    (workdir / "s3").mkdir()
+    broker = InMemoryBroker()
+    segment_duration = args.segment_duration or balanced_segment_duration(
+        duration, 1,
+        min_duration=args.min_segment,
+        max_duration=args.max_segment,
+        parallelism=args.parallelism,
+    )
+    async with StubSaluteSpeechServer(
+        latency=args.stt_latency_ms / 1000, realtime_factor=args.stt_rtf
+    ) as stt_server:
+        pipeline = Pipeline(
+            broker=broker,
+            storage=FakeS3Storage(workdir / "s3"),
+            transcription=SegmentTranscriptionService(
+                client=AsyncSaluteSpeechClient(
+                    apikey="stub",
+                    scope="stub",
+                    base_url=stt_server.url,
+                    oauth_base_url=stt_server.url,
+                ),
+                cache=NullTranscriptionCache(),
+                options=RecognitionOptions(),
+                poll_interval=args.poll_interval,
+            ),
+            summarization=IncrementalSummarizationService(
+                engine=MapReduceSummarizationEngine(
+                    summarizer=StubSummarizer(args.llm_latency_ms / 1000, compression=4),
+                    cache=InMemorySummaryCache(),
+                ),
+                store=InMemoryPartialSummaryStore(),
+            ),
+        )
+        pipeline.subscribe(args.enhancers, args.transcribers, args.summarizers)
+        started_at = time.perf_counter()
+        file_metadata = await pipeline.upload(recording, duration)
+        splitter = FFMpegAudioSplitter(
+            segment_duration=segment_duration,
+            segment_overlap=0,
+            temp_dir=workdir,
+            prefix="benchmark",
+            segment_planner=SegmentationPlanner(),
+            profile=ENHANCEMENT_PROFILE,
+        )
+        await pipeline.split(file_metadata, splitter)
+        await asyncio.wait_for(pipeline.done, timeout=args.timeout)
+        elapsed = time.perf_counter() - started_at
+        await broker.close()
+    return {
+        "duration": duration,
+        "segment_duration": segment_duration,
+        "elapsed": elapsed,
+        # ru_maxrss в Linux - в килобайтах
+        "peak_rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+        "peak_children_rss": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * 1024,
+        "stt": stt_server.stats,
+        "stages": pipeline.stats,
+    }
+
+
+def run_isolated(args: argparse.Namespace, duration: int) -> dict[str, Any]:
+    """Прогон в отдельном процессе: пиковый RSS относится только к одной записи"""
+
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    workdir = Path(tempfile.mkdtemp(prefix="pipeline-benchmark-", dir=args.temp_dir))
+    try:
+        return asyncio.run(run_pipeline(args, duration, workdir))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def report(result: dict[str, Any]) -> None:
+    duration = result["duration"]
+    logger.info(
+        "\n%s min recording, segments up to %s s: pipeline %.1f s (%.0fx realtime), "
+        "peak RSS %.0f MB, ffmpeg %.0f MB",
+        duration // 60, result["segment_duration"], result["elapsed"],
+        duration / result["elapsed"], result["peak_rss"] / 2 ** 20,
+        result["peak_children_rss"] / 2 ** 20,
+    )
+    logger.info(
+        "%-10s %5s %9s %9s %9s %9s %9s %9s",
+        "stage", "msgs", "in MB", "audio x", "p50 ms", "p99 ms", "wait p50", "wait p99",
+    )
+    for name, stage in result["stages"].items():
+        logger.info(
+            "%-10s %5s %9.1f %9.1f %9.0f %9.0f %9.0f %9.0f",
+            name, stage.messages, stage.input_bytes / 2 ** 20, stage.throughput,
+            statistics.median(stage.handler_times or [0]) * 1000,
+            percentile(stage.handler_times, 0.99) * 1000,
+            statistics.median(stage.queue_times or [0]) * 1000,
+            percentile(stage.queue_times, 0.99) * 1000,
+        )
+    logger.info("stt server: %s", result["stt"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--durations", type=int, nargs="+", default=[10, 60, 240], help="Записи (минуты)"
+    )
+    parser.add_argument("--input-samplerate", type=int, default=16000, help="Частота записи")
+    parser.add_argument("--segment-duration", type=int, default=None, help="Сегмент (сек)")
+    # Значения по умолчанию - как у воркера audio_splitter
+    parser.add_argument("--min-segment", type=int, default=5 * 60, help="Минимум сегмента")
+    parser.add_argument("--max-segment", type=int, default=20 * 60, help="Максимум сегмента")
+    parser.add_argument("--parallelism", type=int, default=8, help="Сегментов на коллекцию")
+    parser.add_argument("--enhancers", type=int, default=2, help="Обработчиков sound_enhancer")
+    parser.add_argument("--transcribers", type=int, default=8, help="Обработчиков transcriber")
+    parser.add_argument("--summarizers", type=int, default=4, help="Обработчиков summarizer")
+    parser.add_argument("--stt-latency-ms", type=float, default=300, help="Задержка задачи STT")
+    parser.add_argument("--stt-rtf", type=float, default=0.05, help="Секунд STT на секунду")
+    parser.add_argument("--poll-interval", type=float, default=0.2, help="Опрос статуса STT")
+    parser.add_argument("--llm-latency-ms", type=float, default=500, help="Вызов модели")
+    parser.add_argument("--timeout", type=float, default=3600, help="Ожидание саммари (сек)")
+    parser.add_argument("--temp-dir", type=Path, default=None, help="Временные файлы")
+    args = parser.parse_args()
+    if shutil.which("ffmpeg") is None:
+        parser.error("FFmpeg is required in PATH")
+    with ProcessPoolExecutor(
+            max_workers=1, mp_context=get_context("spawn"), max_tasks_per_child=1
+    ) as executor:
+        for minutes in args.durations:
+            report(executor.submit(run_isolated, args, minutes * 60).result())
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main()
@@ -0,0 +1,230 @@
+"""Локальный сервер-заглушка SaluteSpeech (и OAuth SberDevices) для нагрузочных стендов.
+
+Реализует асинхронное распознавание: `POST /oauth`, `POST /data:upload`,
+`POST /speech/async_recognize`, `GET /task:get`, `GET /data:download`.
+Задача распознавания завершается через `latency + duration * realtime_factor`
+секунд, где `duration` - продолжительность загруженного аудио (по WAV заголовку
+или по `rate` из Content-Type для PCM без заголовка). Результат - по одной
+фразе на `phrase_duration` секунд аудио.
+
+Запуск:
+    python -m benchmarks.salute_speech_stub --port 8901 --latency-ms 300 --realtime-factor 0.05
+"""
+
+from typing import Any, Self
+
+import argparse
+import asyncio
+import io
+import logging
+import time
+from dataclasses import dataclass
+from uuid import UUID, uuid4
+
+import soundfile as sf
+from aiohttp import web
+
+from salute_speech.models import Emotion
+
+logger = logging.getLogger(__name__)
+
+WORDS = ("бюджет", "релиз", "сроки", "задача", "клиент", "договор", "отчёт", "команда")
+EMOTIONS: tuple[Emotion, ...] = ("positive", "neutral", "negative")
+
+
+@dataclass(slots=True)
+class StubSaluteSpeechStats:
+    """Статистика сервера-заглушки.
+
+    Attributes:
+        tokens: Выданные access токены.
+        uploads: Загруженные файлы.
+        uploaded_bytes: Объём загруженных файлов.
+        uploaded_seconds: Продолжительность загруженного аудио.
+        tasks: Созданные задачи распознавания.
+        polls: Запросы статуса задач.
+        downloads: Скачанные результаты.
+    """
+
+    tokens: int = 0
+    uploads: int = 0
+    uploaded_bytes: int = 0
+    uploaded_seconds: float = 0
+    tasks: int = 0
+    polls: int = 0
+    downloads: int = 0
+
+
+@dataclass(slots=True)
+class _Task:
+    id: UUID
+    ready_at: float
+    response_file_id: UUID
+
+
+def _audio_duration(content: bytes, content_type: str) -> float:
+    try:
+        return sf.info(io.BytesIO(content)).duration
+    except sf.LibsndfileError:
+        # PCM без заголовка: `audio/x-pcm;bit=16;rate=16000`
+        options = dict(
+            item.split("=", 1) for item in content_type.split(";")[1:] if "=" in item
+        )
+        return len(content) / 2 / int(options.get("rate", 16000))
+
+
+class StubSaluteSpeechServer:
+    """Сервер-заглушка, запускаемый в текущем event loop"""
+
+    def __init__(
+            self,
+            host: str = "127.0.0.1",
+            port: int = 0,
+            latency: float = 0.3,
+            realtime_factor: float = 0.05,
+            phrase_duration: float = 5,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.realtime_factor = realtime_factor
+        self.phrase_duration = phrase_duration
+        self.stats = StubSaluteSpeechStats()
+        self._files: dict[UUID, float] = {}
+        self._tasks: dict[UUID, _Task] = {}
+        self._results: dict[UUID, float] = {}
+        self._runner: web.AppRunner | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def _oauth(self, _: web.Request) -> web.Response:
+        self.stats.tokens += 1
+        return web.json_response(
+            {"access_token": uuid4().hex, "expires_at": int((time.time() + 1800) * 1000)}
+        )
+
+    async def _upload(self, request: web.Request) -> web.Response:
+        content = await request.read()
+        duration = _audio_duration(content, request.headers.get("Content-Type", ""))
+        file_id = uuid4()
+        self._files[file_id] = duration
+        self.stats.uploads += 1
+        self.stats.uploaded_bytes += len(content)
+        self.stats.uploaded_seconds += duration
+        return web.json_response({"status": 200, "result": {"request_file_id": str(file_id)}})
+
+    @staticmethod
+    def _task_result(task: _Task) -> dict[str, Any]:
+        now = time.monotonic()
+        status = "DONE" if now >= task.ready_at else "RUNNING"
+        result: dict[str, Any] = {
+            "id": str(task.id),
+            "status": status,
+            "created_at": "2025-01-01T00:00:00Z",
+            "updated_at": "2025-01-01T00:00:00Z",
+        }
+        if status == "DONE":
+            result["response_file_id"] = str(task.response_file_id)
+        return {"status": 200, "result": result}
+
+    async def _recognize(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        duration = self._files.pop(UUID(payload["request_file_id"]), 0)
+        now = time.monotonic()
+        task = _Task(
+            id=uuid4(),
+            ready_at=now + self.latency + duration * self.realtime_factor,
+            response_file_id=uuid4(),
+        )
+        self._tasks[task.id] = task
+        self._results[task.response_file_id] = duration
+        self.stats.tasks += 1
+        return web.json_response(self._task_result(task))
+
+    async def _task(self, request: web.Request) -> web.Response:
+        self.stats.polls += 1
+        task = self._tasks.get(UUID(request.query["id"]))
+        if task is None:
+            return web.json_response({"status": 404, "error": "task not found"}, status=404)
+        response = self._task_result(task)
+        if response["result"]["status"] == "DONE":
+            self._tasks.pop(task.id)
+        return web.json_response(response)
+
+    async def _download(self, request: web.Request) -> web.Response:
+        duration = self._results.pop(UUID(request.query["response_file_id"]), None)
+        if duration is None:
+            return web.json_response({"status": 404, "error": "file not found"}, status=404)
+        self.stats.downloads += 1
+        phrases = max(1, round(duration / self.phrase_duration))
+        results = [
+            {
+                "results": [{"normalized_text": " ".join(
+                    WORDS[(index + offset) % len(WORDS)] for offset in range(12)
+                )}],
+                "speaker_info": {"speaker_id": index % 3},
+                "emotions_result": {
+                    emotion: float(position == index % 3)
+                    for position, emotion in enumerate(EMOTIONS)
+                },
+            }
+            for index in range(phrases)
+        ]
+        return web.json_response(results)
+
+    async def start(self) -> None:
+        app = web.Application(client_max_size=1024 ** 3)
+        app.router.add_post("/oauth", self._oauth)
+        app.router.add_post("/data:upload", self._upload)
+        app.router.add_post("/speech/async_recognize", self._recognize)
+        app.router.add_get("/task:get", self._task)
+        app.router.add_get("/data:download", self._download)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        # При port=0 порт выбирается системой
+        self.port = self._runner.addresses[0][1]
+        logger.info("Stub SaluteSpeech server started on %s", self.url)
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.stop()
+
+
+async def serve(args: argparse.Namespace) -> None:
+    server = StubSaluteSpeechServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency_ms / 1000,
+        realtime_factor=args.realtime_factor,
+    )
+    async with server:
+        await asyncio.Event().wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8901)
+    parser.add_argument("--latency-ms", type=float, default=300, help="Задержка задачи")
+    parser.add_argument(
+        "--realtime-factor", type=float, default=0.05, help="Секунд распознавания на секунду"
+    )
+    args = parser.parse_args()
+    asyncio.run(serve(args))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main()
@@ -0,0 +1,105 @@
+"""Нагрузочный стенд отправки писем через SMTP.
+
+Поднимает локальный SMTP сервер-заглушку (`benchmarks.smtp_stub`): приветствие
+и аутентификация длятся `--handshake-ms`, приём письма - `--delivery-ms`,
+простаивающие соединения сервер закрывает через `--server-idle-ms`. Сравниваются режимы:
+ - `per-letter` - соединение на каждое письмо (поведение до пула соединений);
+ - `pooled` - `send_many` через пул из `--pool-size` соединений.
+
+Запуск:
+    python -m benchmarks.smtp_sender --letters 500 --pool-size 8
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from modules.notifications.domain import EmailLetter
+from modules.notifications.infrastructure.email import SMTPEmailSender
+
+from .smtp_stub import StubSMTPServer
+
+logger = logging.getLogger(__name__)
+
+
+def build_letters(count: int) -> list[EmailLetter]:
+    return [
+        EmailLetter(
+            subject="Приглашение в рабочее пространство",
+            sender_email="noreply@example.com",
+            recipient_emails=[f"member{i}@example.com"],
+            body_markup=f"<p>Вас пригласили в рабочее пространство, приглашение №{i}</p>",
+        )
+        for i in range(count)
+    ]
+
+
+async def run(args: argparse.Namespace) -> None:
+    server = StubSMTPServer(
+        handshake_delay=args.handshake_ms / 1000,
+        delivery_delay=args.delivery_ms / 1000,
+        idle_timeout=args.server_idle_ms / 1000,
+    )
+    await server.start()
+
+    def create_sender(pool_size: int, idle_timeout: float) -> SMTPEmailSender:
+        return SMTPEmailSender(
+            host="127.0.0.1",
+            port=server.port,
+            username="u",
+            password="p",  # noqa: S106
+            use_tls=False,
+            pool_size=pool_size,
+            idle_timeout=idle_timeout,
+        )
+
+    letters = build_letters(args.per_letter_count)
+    sender = create_sender(pool_size=1, idle_timeout=0)
+    started_at = time.perf_counter()
+    for letter in letters:
+        await sender.send(letter)
+    elapsed = time.perf_counter() - started_at
+    logger.info(
+        "per-letter: %s letters in %.2f s (%.0f/s), %s", len(letters), elapsed,
+        len(letters) / elapsed, sender.stats,
+    )
+    await sender.close()
+
+    letters = build_letters(args.letters)
+    sender = create_sender(pool_size=args.pool_size, idle_timeout=args.idle_timeout)
+    for wave in range(2):
+        started_at = time.perf_counter()
+        errors = await sender.send_many(letters)
+        elapsed = time.perf_counter() - started_at
+        logger.info(
+            "pooled (wave %s): %s letters in %.2f s (%.0f/s), failed %s, %s",
+            wave + 1, len(letters), elapsed, len(letters) / elapsed,
+            sum(error is not None for error in errors), sender.stats,
+        )
+        # Пауза дольше таймаута простоя сервера: соединения будут переоткрыты
+        await asyncio.sleep(args.server_idle_ms / 1000 * 1.5)
+    await sender.close()
+    await server.stop()
+    logger.info(
+        "server: %s connections, %s letters delivered", server.connections, server.delivered
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--letters", type=int, default=500, help="Писем в режиме pooled")
+    parser.add_argument("--per-letter-count", type=int, default=50, help="Писем в per-letter")
+    parser.add_argument("--pool-size", type=int, default=8, help="Соединений в пуле")
+    parser.add_argument("--idle-timeout", type=float, default=30, help="Простой соединения (сек)")
+    parser.add_argument("--handshake-ms", type=float, default=150, help="Рукопожатие + login")
+    parser.add_argument("--delivery-ms", type=float, default=5, help="Приём письма сервером")
+    parser.add_argument("--server-idle-ms", type=float, default=1000, help="Таймаут сервера")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("modules").setLevel(logging.WARNING)
+    main()
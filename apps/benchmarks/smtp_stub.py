@@ -0,0 +1,103 @@
+"""Локальный SMTP сервер-заглушка для тестов и нагрузочных стендов.
+
+Принимает и отбрасывает письма. Приветствие и аутентификация длятся
+`handshake_delay` (имитация TLS рукопожатия и `login` реального сервера),
+приём письма - `delivery_delay`, простаивающие соединения сервер закрывает
+через `idle_timeout`. Получателей из `refused_recipients` сервер отклоняет
+ответом 550, а соединение `disconnect_next` раз обрывает без ответа на `MAIL`.
+"""
+
+from typing import Self
+
+import asyncio
+
+
+class StubSMTPServer:
+    """Минимальный SMTP сервер, запускаемый в текущем event loop"""
+
+    def __init__(
+            self,
+            handshake_delay: float = 0,
+            delivery_delay: float = 0,
+            idle_timeout: float = 60,
+            refused_recipients: frozenset[str] = frozenset(),
+    ) -> None:
+        self.handshake_delay = handshake_delay
+        self.delivery_delay = delivery_delay
+        self.idle_timeout = idle_timeout
+        self.refused_recipients = refused_recipients
+        self.disconnect_next = 0
+        self.connections = 0
+        self.delivered = 0
+        self.port = 0
+        self._server: asyncio.Server | None = None
+
+    @staticmethod
+    async def _reply(writer: asyncio.StreamWriter, line: str) -> None:
+        writer.write(f"{line}\r\n".encode())
+        await writer.drain()
+
+    async def _command(
+            self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, command: str
+    ) -> bool:
+        """Ответ на команду клиента; `False` - соединение закрывается"""
+
+        verb = command.upper()
+        if verb.startswith(("EHLO", "HELO")):
+            await self._reply(writer, "250-stub\r\n250-AUTH PLAIN LOGIN\r\n250 8BITMIME")
+        elif verb.startswith("AUTH"):
+            await asyncio.sleep(self.handshake_delay / 2)
+            await self._reply(writer, "235 authenticated")
+        elif verb.startswith("MAIL") and self.disconnect_next > 0:
+            self.disconnect_next -= 1
+            return False
+        elif verb.startswith("RCPT"):
+            recipient = command.split(":", 1)[1].split(maxsplit=1)[0].strip("<>")
+            refused = recipient in self.refused_recipients
+            await self._reply(writer, "550 mailbox unavailable" if refused else "250 ok")
+        elif verb == "DATA":
+            await self._reply(writer, "354 end with <CRLF>.<CRLF>")
+            while (await reader.readline()) not in {b".\r\n", b""}:
+                pass
+            await asyncio.sleep(self.delivery_delay)
+            self.delivered += 1
+            await self._reply(writer, "250 queued")
+        elif verb == "QUIT":
+            await self._reply(writer, "221 bye")
+            return False
+        else:
+            await self._reply(writer, "250 ok")
+        return True
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        await asyncio.sleep(self.handshake_delay / 2)
+        await self._reply(writer, "220 stub ESMTP")
+        try:
+            while True:
+                try:
+                    async with asyncio.timeout(self.idle_timeout):
+                        line = await reader.readline()
+                except TimeoutError:
+                    await self._reply(writer, "421 idle timeout")
+                    break
+                if not line or not await self._command(reader, writer, line.decode().strip()):
+                    break
+        finally:
+            writer.close()
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.stop()
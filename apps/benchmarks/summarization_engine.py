@@ -0,0 +1,108 @@
+"""Нагрузочный стенд иерархической map-reduce суммаризации.
+
+Суммаризирует транскрипцию из `--segments` сегментов по `--segment-chars` символов
+моделью-заглушкой: каждый вызов длится `--latency-ms`, ответ короче входа
+в `--compression` раз. Выводятся число вызовов модели, число последовательных
+уровней вызовов и время работы в сравнении с последовательной обработкой.
+Повторный запуск той же транскрипции показывает эффект кэша результатов.
+
+Запуск:
+    python -m benchmarks.summarization_engine --segments 360 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import time
+
+from modules.audio.application import (
+    InMemorySummaryCache,
+    MapReduceSummarizationEngine,
+    Summarizer,
+)
+from modules.audio.domain import TranscriptionSegment
+
+logger = logging.getLogger(__name__)
+
+WORDS = (
+    "бюджет", "релиз", "сроки", "задача", "клиент", "договор", "отчёт", "команда",
+    "инфраструктура", "тестирование", "согласовать", "перенести", "ответственный",
+)
+
+
+class StubSummarizer(Summarizer):
+    """Модель-заглушка с фиксированной задержкой и коэффициентом сжатия"""
+
+    def __init__(self, latency: float, compression: float) -> None:
+        self.latency = latency
+        self.compression = compression
+
+    async def _respond(self, text: str) -> str:
+        await asyncio.sleep(self.latency)
+        return text[:max(1, int(len(text) / self.compression))]
+
+    async def summarize(self, text: str) -> str:
+        return await self._respond(text)
+
+    async def combine(self, summaries: list[str]) -> str:
+        return await self._respond("\n".join(summaries))
+
+
+def generate_segments(count: int, chars: int) -> list[TranscriptionSegment]:
+    segments = []
+    for number in range(1, count + 1):
+        lines, length = [], 0
+        while length < chars:
+            line = f"Спикер {random.randint(1, 5)}: " + " ".join(  # noqa: S311
+                random.choices(WORDS, k=12)  # noqa: S311
+            )
+            lines.append(line)
+            length += len(line) + 1
+        segments.append(
+            TranscriptionSegment(number=number, total_count=count, text="\n".join(lines))
+        )
+    # Сегменты транскрибируются параллельно и приходят в произвольном порядке
+    random.shuffle(segments)
+    return segments
+
+
+async def run(args: argparse.Namespace) -> None:
+    segments = generate_segments(args.segments, args.segment_chars)
+    engine = MapReduceSummarizationEngine(
+        summarizer=StubSummarizer(args.latency_ms / 1000, args.compression),
+        cache=InMemorySummaryCache(),
+        context_window=args.context_window,
+        reserved_tokens=args.reserved_tokens,
+        max_concurrency=args.concurrency,
+    )
+    for attempt in ("first run", "retry"):
+        calls_before, hits_before = engine.stats.llm_calls, engine.stats.cache_hits
+        started_at = time.perf_counter()
+        summary = await engine.summarize(segments)
+        elapsed = time.perf_counter() - started_at
+        calls = engine.stats.llm_calls - calls_before
+        logger.info(
+            "%s: %s LLM calls, %s cache hits, %s sequential round trips, "
+            "%.2f s (sequential: %.2f s), summary %s chars",
+            attempt, calls, engine.stats.cache_hits - hits_before, engine.stats.round_trips,
+            elapsed, calls * args.latency_ms / 1000, len(summary),
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--segments", type=int, default=360, help="Количество сегментов")
+    parser.add_argument("--segment-chars", type=int, default=6000, help="Символов в сегменте")
+    parser.add_argument("--context-window", type=int, default=8000, help="Окно модели (токены)")
+    parser.add_argument("--reserved-tokens", type=int, default=2000, help="Резерв окна")
+    parser.add_argument("--concurrency", type=int, default=16, help="Одновременных вызовов")
+    parser.add_argument("--latency-ms", type=float, default=200, help="Длительность вызова")
+    parser.add_argument("--compression", type=float, default=6, help="Коэффициент сжатия")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main()
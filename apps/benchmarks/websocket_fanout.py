@@ -0,0 +1,143 @@
+"""Нагрузочный стенд менеджера WebSocket соединений.
+
+Поднимает `--nodes` менеджеров (реплик API) в одном процессе и подключает к ним
+`--sockets` сокетов-заглушек, распределённых по пользователям. Часть сокетов
+(`--slow-ratio`) отправляет кадры с задержкой `--slow-ms` и должна быть отключена
+механизмом backpressure. События публикуются со случайных узлов случайным пользователям,
+выводятся задержка доставки, число кадров (эффект пакетной отправки) и статистика узлов.
+
+С `--backend redis` узлы обмениваются событиями через Redis (`--redis-url`).
+
+Запуск:
+    python -m benchmarks.websocket_fanout --sockets 10000 --nodes 3 --backend redis
+"""
+
+from typing import cast
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import statistics
+import time
+from datetime import timedelta
+from uuid import UUID, uuid4
+
+from fastapi import WebSocket
+
+from modules.chat.infrastructure.fastapi.connection_managers import (
+    InMemoryConnectionManager,
+    RedisConnectionManager,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class StubWebSocket:
+    """Сокет-заглушка: фиксирует задержку доставки событий"""
+
+    def __init__(self, latencies: list[float], send_delay: float) -> None:
+        self.latencies = latencies
+        self.send_delay = send_delay
+        self.frames = 0
+        self.close_code: int | None = None
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, data: str) -> None:
+        if self.send_delay:
+            await asyncio.sleep(self.send_delay)
+        received_at = time.perf_counter()
+        self.frames += 1
+        self.latencies.extend(received_at - event["sent_at"] for event in json.loads(data))
+
+    async def close(self, code: int) -> None:
+        self.close_code = code
+
+
+def create_managers(args: argparse.Namespace) -> list[InMemoryConnectionManager]:
+    options = {"queue_size": args.queue_size, "send_timeout": timedelta(seconds=5)}
+    if args.backend == "redis":
+        return [
+            RedisConnectionManager(url=args.redis_url, prefix="ws-bench", **options)
+            for _ in range(args.nodes)
+        ]
+    return [InMemoryConnectionManager(**options)]
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+async def run(args: argparse.Namespace) -> None:
+    managers = create_managers(args)
+    latencies: list[float] = []
+    users: list[UUID] = [uuid4() for _ in range(max(1, args.sockets // args.sockets_per_user))]
+    sockets: list[StubWebSocket] = []
+    started_at = time.perf_counter()
+    for i in range(args.sockets):
+        slow = random.random() < args.slow_ratio  # noqa: S311
+        websocket = StubWebSocket(latencies, args.slow_ms / 1000 if slow else 0)
+        sockets.append(websocket)
+        await managers[i % len(managers)].connect(
+            cast(WebSocket, websocket), users[i % len(users)]
+        )
+    logger.info(
+        "Connected %s sockets (%s users) to %s node(s) in %.2f s",
+        args.sockets, len(users), len(managers), time.perf_counter() - started_at,
+    )
+
+    started_at = time.perf_counter()
+    for i in range(args.messages):
+        manager = random.choice(managers)  # noqa: S311
+        await manager.send_to_user(
+            random.choice(users),  # noqa: S311
+            {"type": "progress", "seq": i, "sent_at": time.perf_counter()},
+        )
+        if i % args.burst == 0:
+            await asyncio.sleep(0)
+    publish_time = time.perf_counter() - started_at
+    await asyncio.sleep(args.drain)
+
+    frames = sum(websocket.frames for websocket in sockets)
+    logger.info(
+        "Published %s events in %.2f s (%.0f/s), delivered %s events in %s frames",
+        args.messages, publish_time, args.messages / publish_time, len(latencies), frames,
+    )
+    if latencies:
+        logger.info(
+            "Delivery latency: median %.1f ms, p99 %.1f ms, max %.1f ms",
+            statistics.median(latencies) * 1000,
+            percentile(latencies, 0.99) * 1000,
+            max(latencies) * 1000,
+        )
+    closed = sum(websocket.close_code is not None for websocket in sockets)
+    logger.info("Sockets closed by backpressure: %s", closed)
+    for number, manager in enumerate(managers):
+        logger.info("node %s: %s", number, manager.stats)
+        await manager.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sockets", type=int, default=10_000, help="Количество сокетов")
+    parser.add_argument("--sockets-per-user", type=int, default=2, help="Сокетов на пользователя")
+    parser.add_argument("--nodes", type=int, default=3, help="Количество узлов (для redis)")
+    parser.add_argument("--backend", choices=["memory", "redis"], default="memory")
+    parser.add_argument("--redis-url", default="redis://localhost:6379/0")
+    parser.add_argument("--messages", type=int, default=50_000, help="Количество событий")
+    parser.add_argument("--burst", type=int, default=100, help="Событий между уступками loop")
+    parser.add_argument("--queue-size", type=int, default=256, help="Очередь сокета")
+    parser.add_argument("--slow-ratio", type=float, default=0.01, help="Доля медленных сокетов")
+    parser.add_argument("--slow-ms", type=float, default=200, help="Задержка медленного сокета")
+    parser.add_argument("--drain", type=float, default=2, help="Ожидание доставки (сек)")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main()
@@ -17,6 +17,7 @@ class Metadata(BaseModel):
     channels: int | None = None
     samplerate: float | None = None
     bitrate: int | None = None
+    content_hash: str | None = None  # SHA-256 содержимого файла записи
 
 
 class Record(BaseModel):
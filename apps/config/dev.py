@@ -1,9 +1,11 @@
 from typing import Final, Literal
 
+from pathlib import Path
+
 from dotenv import load_dotenv
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from .base import ENV_PATH
+from .base import BASE_DIR, ENV_PATH
 
 load_dotenv(ENV_PATH)
 
@@ -15,6 +17,14 @@ class PostgresSettings(BaseSettings):
     port: int = 5432
     db: str = "postgres"
     driver: Literal["asyncpg"] = "asyncpg"
+    echo: bool = False
+    pool_size: int = 10
+    max_overflow: int = 20
+    pool_timeout: float = 30  # Максимальное ожидание свободного соединения (сек)
+    pool_recycle: int = 1800  # Пересоздание соединений старше N секунд
+    pool_pre_ping: bool = True
+    statement_cache_size: int = 100  # 0 для работы через PgBouncer в transaction mode
+    slow_query_threshold_ms: float = 500
 
     model_config = SettingsConfigDict(env_prefix="POSTGRES_")
 
@@ -56,6 +66,87 @@ class RedisSettings(BaseSettings):
         return f"redis://{self.host}:{self.port}/0"
 
 
+class WebSocketSettings(BaseSettings):
+    # `memory` - только для одной реплики API без воркера прогресса
+    backend: Literal["memory", "redis"] = "redis"
+    send_queue_size: int = 256  # Исходящих событий на сокет, при переполнении сокет закрывается
+    batch_size: int = 64  # Максимум событий в одном кадре
+    send_timeout: float = 5  # Максимальное время отправки кадра (сек)
+
+    model_config = SettingsConfigDict(env_prefix="WEBSOCKET_")
+
+
+class ProgressSettings(BaseSettings):
+    max_updates_per_second: float = 2  # Частота обновлений прогресса на задачу
+    ttl_hours: int = 24  # Время хранения счётчиков прогресса
+
+    model_config = SettingsConfigDict(env_prefix="PROGRESS_")
+
+
+class SummarizationSettings(BaseSettings):
+    backend: Literal["langchain", "foundation_models"] = "foundation_models"
+    model: str = "openai:gpt-4o-mini"  # Модель в формате `<провайдер>:<название>`
+    base_url: str | None = None  # Адрес OpenAI-совместимого API
+    temperature: float = 0.3
+    context_window: int = 8000  # Размер контекстного окна модели (в токенах)
+    reserved_tokens: int = 2000  # Токены окна под промпт и ответ модели
+    max_concurrency: int = 8  # Одновременных вызовов модели на воркер
+    ttl_hours: int = 24  # Время хранения промежуточных саммари сегментов и кэша вызовов
+    reduce_timeout: int = 300  # Время захвата reduce шага воркером (сек)
+
+    model_config = SettingsConfigDict(env_prefix="SUMMARIZATION_")
+
+
+class AudioProfileSettings(BaseSettings):
+    enhancement_samplerate: int = 44100  # Сегменты после разбиения, на входе улучшения звука
+    enhancement_channels: int = 2
+    recognition_samplerate: int = 16000  # Сегменты после улучшения звука, на входе распознавания
+    recognition_channels: int = 1
+
+    model_config = SettingsConfigDict(env_prefix="AUDIO_PROFILE_")
+
+
+class AudioSplittingSettings(BaseSettings):
+    trim_silence: bool = True  # Сжатие длинных пауз записи перед разбиением на сегменты
+    max_silence_ms: int = 300  # Длительность, до которой сжимаются паузы
+
+    model_config = SettingsConfigDict(env_prefix="AUDIO_SPLITTING_")
+
+
+class TranscriptionSettings(BaseSettings):
+    reuse_ttl_days: int = 30  # Время хранения транскрипций записей для повторных загрузок
+    cache_ttl_days: int = 7  # Время хранения результатов распознавания сегментов
+    language: Literal["ru-RU", "en-US", "kk-KZ", "ky-KG", "uz-UZ"] = "ru-RU"
+    diarization: bool = True
+    max_speakers_count: int = 10
+    poll_interval: float = 1  # Интервал опроса статуса задачи распознавания (сек)
+
+    model_config = SettingsConfigDict(env_prefix="TRANSCRIPTION_")
+
+
+class TelemetrySettings(BaseSettings):
+    spans_path: Path | None = None  # Файл JSON Lines для спанов, без него - в лог (DEBUG)
+    # Эндпоинт `/metrics` для Prometheus (доступен снаружи контейнера) включается явно,
+    # каждому воркеру задаётся свой `TELEMETRY_METRICS_PORT`, None - не публиковать
+    metrics_host: str = "0.0.0.0"  # noqa: S104
+    metrics_port: int | None = None
+
+    model_config = SettingsConfigDict(env_prefix="TELEMETRY_")
+
+
+class FoundationModelsSettings(BaseSettings):
+    api_key: str = "<APIKEY>"
+    iam_token: str = ""
+    folder_id: str = "<FOLDER_ID>"
+    model_name: str = "yandexgpt-lite/latest"
+    base_url: str = "https://llm.api.cloud.yandex.net"
+    max_concurrency: int = 16  # Одновременных запросов на процесс
+    requests_per_second: float | None = None  # Ограничение частоты запросов на процесс
+    max_retries: int = 3  # Повторы при ответах 429/5xx и сетевых ошибках
+
+    model_config = SettingsConfigDict(env_prefix="FOUNDATION_MODELS_")
+
+
 class SaluteSpeechSettings(BaseSettings):
     apikey: str = "<APIKEY>"
     scope: str = "<SCOPE>"
@@ -71,15 +162,27 @@ class JWTSettings(BaseSettings):
     user_access_token_expires_in_minutes: int = 15
     user_refresh_token_expires_in_days: int = 7
     guest_access_token_expires_in_days: int = 10
+    claims_cache_size: int = 10_000  # Количество проверенных токенов в кеше процесса
+    revocation_backend: Literal["memory", "redis"] = "memory"
 
     model_config = SettingsConfigDict(env_prefix="JWT_")
 
 
+class PasswordHashingSettings(BaseSettings):
+    max_workers: int = 4  # Потоки для хеширования паролей
+    max_pending: int = 256  # Максимум задач в очереди и в работе, сверх - отказ (429)
+
+    model_config = SettingsConfigDict(env_prefix="PASSWORD_HASHING_")
+
+
 class VKSettings(BaseSettings):
     client_id: str = "<CLIENT_ID>"
     client_secret: str = "<CLIENT_SECRET>"
     base_url: str = "https://id.vk.ru"
     redirect_uri: str = "http://localhost:8000/api/v1/auth/vk/callback"
+    pool_size: int = 100
+    timeout: float = 10
+    userinfo_ttl: float = 60
 
     model_config = SettingsConfigDict(env_prefix="VK_")
 
@@ -96,8 +199,20 @@ class EmbeddingsSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="EMBEDDINGS_")
 
 
+class NLPSettings(BaseSettings):
+    data_dir: Path = BASE_DIR / "nltk_data"
+    language: str = "russian"
+    allow_download: bool = False
+
+    model_config = SettingsConfigDict(env_prefix="NLP_")
+
+
 class MailRuSettings(BaseSettings):
+    host: str = "smtp.mail.ru"
+    port: int = 465
+    username: str = "<USERNAME>"  # Почтовый ящик, он же адрес отправителя
     password: str = "<PASSWORD>"
+    pool_size: int = 4  # Открытых SMTP соединений на процесс
 
     model_config = SettingsConfigDict(env_prefix="MAILRU_")
 
@@ -120,11 +235,21 @@ class Settings(BaseSettings):
     minio: MinioSettings = MinioSettings()
     rabbitmq: RabbitMQSettings = RabbitMQSettings()
     redis: RedisSettings = RedisSettings()
+    websocket: WebSocketSettings = WebSocketSettings()
+    progress: ProgressSettings = ProgressSettings()
+    summarization: SummarizationSettings = SummarizationSettings()
+    audio_profile: AudioProfileSettings = AudioProfileSettings()
+    audio_splitting: AudioSplittingSettings = AudioSplittingSettings()
+    transcription: TranscriptionSettings = TranscriptionSettings()
+    telemetry: TelemetrySettings = TelemetrySettings()
+    foundation_models: FoundationModelsSettings = FoundationModelsSettings()
     salute_speech: SaluteSpeechSettings = SaluteSpeechSettings()
     jwt: JWTSettings = JWTSettings()
+    password_hashing: PasswordHashingSettings = PasswordHashingSettings()
     vk: VKSettings = VKSettings()
     oauth: OAuthSettings = OAuthSettings()
     embeddings: EmbeddingsSettings = EmbeddingsSettings()
+    nlp: NLPSettings = NLPSettings()
     mailru: MailRuSettings = MailRuSettings()
 
 
@@ -0,0 +1,4 @@
+__all__ = ("AsyncFoundationModelClient", "ClientStats", "RateLimiter")
+
+from .client import AsyncFoundationModelClient, ClientStats
+from .limiter import RateLimiter
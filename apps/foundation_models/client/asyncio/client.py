@@ -0,0 +1,178 @@
+from typing import Any, Final, Self
+
+import asyncio
+import json
+import logging
+import random
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field
+
+import aiohttp
+
+from ..base import BaseFoundationModel
+from ..exceptions import CompletionError
+from ..models import CompletionResponse, CompletionResult, Message, Tool
+from .limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Статусы ответа, при которых запрос повторяется
+RETRY_STATUSES: Final[frozenset[int]] = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass(slots=True)
+class ClientStats:
+    """Статистика клиента.
+
+    Attributes:
+        requests: Отправленные HTTP запросы (включая повторные).
+        retries: Повторные попытки.
+        rate_limited: Ответы 429 от сервера.
+        failed: Запросы, завершившиеся ошибкой после всех попыток.
+    """
+
+    requests: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    failed: int = 0
+
+
+@dataclass
+class AsyncFoundationModelClient(BaseFoundationModel):
+    """Асинхронный клиент Foundation Models API.
+
+    Все запросы идут через одну сессию с пулом соединений (`pool_size`),
+    одновременно выполняется не более `max_concurrency` запросов,
+    частота запросов ограничивается `requests_per_second` на стороне клиента.
+    Ответы 429/5xx и сетевые ошибки повторяются с экспоненциальной задержкой
+    (заголовок `Retry-After` учитывается).
+    """
+
+    max_retries: int = 3
+    backoff_factor: float = 0.5  # Задержка перед n-й повторной попыткой: factor * 2^(n-1)
+    max_backoff: float = 30
+    max_concurrency: int = 16
+    requests_per_second: float | None = None
+    pool_size: int = 100
+    stats: ClientStats = field(default_factory=ClientStats, init=False)
+    _session: aiohttp.ClientSession | None = field(default=None, init=False, repr=False)
+    _semaphore: asyncio.Semaphore = field(init=False, repr=False)
+    _rate_limiter: RateLimiter | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        if self.requests_per_second is not None:
+            self._rate_limiter = RateLimiter(self.requests_per_second)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size, ttl_dns_cache=300),
+                # Общий таймаут не ограничивается: потоковый ответ может идти долго
+                timeout=aiohttp.ClientTimeout(
+                    total=None, sock_connect=self.timeout, sock_read=self.timeout
+                ),
+                headers=self._headers,
+            )
+        return self._session
+
+    def _backoff(self, attempt: int, retry_after: str | None = None) -> float:
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                pass
+        delay = min(self.backoff_factor * 2 ** attempt, self.max_backoff)
+        return delay * random.uniform(0.5, 1)  # noqa: S311
+
+    async def _send(self, payload: dict[str, Any]) -> aiohttp.ClientResponse:
+        """Успешный ответ на запрос генерации с учётом частоты запросов и повторных попыток.
+        Вызывается под семафором, ответ освобождает вызывающий код.
+        """
+
+        session = self._get_session()
+        attempt = 0
+        while True:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
+            self.stats.requests += 1
+            retry_after = None
+            try:
+                response = await session.post(self._completion_url, json=payload)
+            except (aiohttp.ClientConnectionError, TimeoutError) as e:
+                error = CompletionError(f"Completion request failed: {e!r}")
+            else:
+                if response.status < 400:  # noqa: PLR2004
+                    return response
+                body = await response.text()
+                response.release()
+                error = CompletionError(
+                    f"Completion failed with {response.status} status: {body}",
+                    status=response.status,
+                )
+                if response.status not in RETRY_STATUSES:
+                    self.stats.failed += 1
+                    raise error
+                if response.status == 429:  # noqa: PLR2004
+                    self.stats.rate_limited += 1
+                retry_after = response.headers.get("Retry-After")
+            if attempt == self.max_retries:
+                self.stats.failed += 1
+                raise error
+            delay = self._backoff(attempt, retry_after)
+            logger.warning(
+                "%s, retrying in %.2f s (%s/%s)", error, delay, attempt + 1, self.max_retries
+            )
+            self.stats.retries += 1
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def completion(
+            self, messages: list[Message], tools: list[Tool] | None = None
+    ) -> CompletionResult:
+        async with self._semaphore:
+            response = await self._send(self._build_payload(messages, tools))
+            try:
+                data = await response.json()
+            finally:
+                response.release()
+        return CompletionResponse.model_validate(data).result
+
+    async def stream(self, messages: list[Message]) -> AsyncGenerator[str]:
+        """Потоковая генерация: фрагменты текста ответа по мере их появления.
+        Сервер присылает накопленный текст, клиент отдаёт только новую часть.
+        При досрочном прерывании чтения генератор следует закрыть (`contextlib.aclosing`),
+        чтобы сразу вернуть соединение и слот параллельности.
+        """
+
+        text = ""
+        # Слот и соединение удерживаются между `yield`, поэтому освобождаются в `finally`
+        await self._semaphore.acquire()
+        try:
+            response = await self._send(self._build_payload(messages, stream=True))
+            try:
+                async for line in response.content:
+                    if not line.strip():
+                        continue
+                    result = CompletionResponse.model_validate(json.loads(line)).result
+                    if result.text.startswith(text):
+                        delta, text = result.text[len(text):], result.text
+                    else:
+                        delta, text = result.text, text + result.text
+                    if delta:
+                        yield delta
+            finally:
+                response.release()
+        finally:
+            self._semaphore.release()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.close()
@@ -0,0 +1,34 @@
+import asyncio
+import math
+import time
+
+
+class RateLimiter:
+    """Ограничение частоты запросов (token bucket).
+    Допускает всплеск до `burst` запросов, далее не чаще `rate` запросов в секунду.
+    """
+
+    def __init__(self, rate: float, burst: int | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1, math.ceil(rate))
+        self.waits = 0
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        # Ожидающие получают разрешения по очереди (блокировка справедлива)
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                self.waits += 1
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
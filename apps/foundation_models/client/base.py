@@ -1,10 +1,15 @@
+from typing import Any
+
 from dataclasses import dataclass
 
 from .models import (
     DEFAULT_TEMPERATURE,
     CompletionOptions,
+    CompletionRequest,
+    Message,
     ReasoningMode,
     ReasoningOptions,
+    Tool,
     ToolChoiceMode,
 )
 
@@ -27,11 +32,16 @@ class BaseFoundationModel:
 
     @property
     def _headers(self) -> dict[str, str]:
-        return {"Authorization": f"Bearer {self.iam_token}"}
+        authorization = f"Api-Key {self.api_key}" if self.api_key else f"Bearer {self.iam_token}"
+        return {"Authorization": authorization, "x-folder-id": self.folder_id}
 
     @property
     def _model_uri(self) -> str:
-        return f"gpt://{self.base_url}/{self.model_name}"
+        return f"gpt://{self.folder_id}/{self.model_name}"
+
+    @property
+    def _completion_url(self) -> str:
+        return f"{self.base_url}/foundationModels/v1/completion"
 
     @property
     def _completion_options(self) -> CompletionOptions:
@@ -41,3 +51,16 @@ class BaseFoundationModel:
             maxTokens=self.max_tokens,
             reasoningOptions=ReasoningOptions(mode=self.reasoning_mode),
         )
+
+    def _build_payload(
+            self, messages: list[Message], tools: list[Tool] | None = None, stream: bool = False
+    ) -> dict[str, Any]:
+        options = self._completion_options
+        options.stream = stream
+        payload = CompletionRequest(
+            modelUri=self._model_uri,
+            completionOptions=options,
+            messages=messages,
+            tools=tools,
+        )
+        return payload.model_dump(by_alias=True, exclude_none=True)
@@ -1,26 +1,29 @@
 import requests
 
 from .base import BaseFoundationModel
-from .models import CompletionRequest, Message, Tool
+from .exceptions import CompletionError
+from .models import CompletionResponse, CompletionResult, Message, Tool
 
 
 class FoundationModelClient(BaseFoundationModel):
+    """Синхронный клиент (блокирует поток, для asyncio используйте `AsyncFoundationModelClient`)"""
+
     def completion(
             self, messages: list[Message], tools: list[Tool] | None = None
-    ) -> ...:
-        payload = CompletionRequest(
-            modelUri=self._model_uri,
-            completionOptions=self._completion_options,
-            messages=messages,
-            tools=tools,
-        )
+    ) -> CompletionResult:
         try:
             with requests.Session() as session:
                 response = session.post(
-                    url=f"{self.base_url}/foundationModels/v1/completion",
+                    url=self._completion_url,
                     headers=self._headers,
-                    json=payload.model_dump(by_alias=True, exclude_none=True),
+                    json=self._build_payload(messages, tools),
+                    timeout=self.timeout,
                 )
-                response.raise_for_status()
-        except requests.exceptions.RequestException:
-            ...
+        except requests.exceptions.RequestException as e:
+            raise CompletionError(f"Completion request failed: {e}") from e
+        if not response.ok:
+            raise CompletionError(
+                f"Completion failed with {response.status_code} status: {response.text}",
+                status=response.status_code,
+            )
+        return CompletionResponse.model_validate(response.json()).result
@@ -0,0 +1,8 @@
+class FoundationModelError(Exception):
+    pass
+
+
+class CompletionError(FoundationModelError):
+    def __init__(self, message: str, status: int | None = None) -> None:
+        super().__init__(message)
+        self.status = status
@@ -1,6 +1,6 @@
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, NonNegativeFloat, PositiveInt, field_validator
+from pydantic import BaseModel, Field, NonNegativeFloat, PositiveInt, field_serializer
 
 DEFAULT_TEMPERATURE = 0.3
 ReasoningMode = Literal[
@@ -107,9 +107,10 @@ class CompletionOptions(BaseModel):
     max_tokens: PositiveInt | None = Field(default=None, alias="maxTokens")
     reasoning_options: ReasoningOptions = Field(alias="reasoningOptions")
 
-    @field_validator("max_tokens", mode="after")
-    def convert_max_tokens_to_str(cls, value: PositiveInt) -> str:
-        return str(value)
+    @field_serializer("max_tokens")
+    def convert_max_tokens_to_str(self, value: PositiveInt | None) -> str | None:  # noqa: PLR6301
+        # API принимает int64 значения строкой
+        return str(value) if value is not None else None
 
 
 class CompletionRequest(BaseModel):
@@ -119,10 +120,57 @@ class CompletionRequest(BaseModel):
     completion_options: CompletionOptions = Field(alias="completionOptions")
     messages: list[Message]
     tools: list[Tool] | None = None
-    json_object: bool | None = Field(None, alias="jsonObject")
-    json_schema: JsonSchema | None = Field(None, alias="jsonSchema")
-    parallel_tool_calls: bool | None = Field(None, alias="parallelToolCalls")
-    tool_choice: ToolChoice | None = Field(None, alias="toolChoice")
+    json_object: bool | None = Field(default=None, alias="jsonObject")
+    json_schema: JsonSchema | None = Field(default=None, alias="jsonSchema")
+    parallel_tool_calls: bool | None = Field(default=None, alias="parallelToolCalls")
+    tool_choice: ToolChoice | None = Field(default=None, alias="toolChoice")
+
+
+AlternativeStatus = Literal[
+    "ALTERNATIVE_STATUS_UNSPECIFIED",
+    "ALTERNATIVE_STATUS_PARTIAL",
+    "ALTERNATIVE_STATUS_TRUNCATED_FINAL",
+    "ALTERNATIVE_STATUS_FINAL",
+    "ALTERNATIVE_STATUS_CONTENT_FILTER",
+    "ALTERNATIVE_STATUS_TOOL_CALLS",
+]
+
+
+class Alternative(BaseModel):
+    """Вариант ответа модели"""
+
+    message: Message
+    status: AlternativeStatus = "ALTERNATIVE_STATUS_UNSPECIFIED"
+
+
+class Usage(BaseModel):
+    """Использованные токены"""
+
+    input_text_tokens: int = Field(default=0, alias="inputTextTokens")
+    completion_tokens: int = Field(default=0, alias="completionTokens")
+    total_tokens: int = Field(default=0, alias="totalTokens")
+
+
+class CompletionResult(BaseModel):
+    """Ответ модели (при потоковой генерации - накопленный к текущему моменту)"""
+
+    alternatives: list[Alternative]
+    usage: Usage = Field(default_factory=Usage)
+    model_version: str | None = Field(default=None, alias="modelVersion")
+
+    @property
+    def text(self) -> str:
+        """Текст первого варианта ответа"""
+
+        if not self.alternatives:
+            return ""
+        return self.alternatives[0].message.text or ""
+
+
+class CompletionResponse(BaseModel):
+    """Тело ответа модели"""
+
+    result: CompletionResult
 
 
 msg = Message(
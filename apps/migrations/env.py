@@ -10,12 +10,14 @@ from alembic import context
 from config.dev import settings
 from modules.shared_kernel.insrastructure.database import Base
 from modules.admin.infrastructure.database import MemberModel, WorkspaceModel
+from modules.chat.infrastructure.database import ChatModel, MessageModel
 from modules.iam.infrastructure.database import (
     BaseUserModel,
     GuestModel,
     UserModel,
     SocialAccountModel,
 )
+from modules.media.infrastructure.database import FileMetadataModel
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,31 @@
+"""Add keyset pagination indexes
+
+Revision ID: 3f7a9c2d1e4b
+Revises: 85d8923c842b
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f7a9c2d1e4b'
+down_revision: Union[str, Sequence[str], None] = '85d8923c842b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('users', 'social_accounts', 'workspaces', 'members')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.create_index(f'ix_{table}_created_at_id', table, ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.drop_index(f'ix_{table}_created_at_id', table_name=table)
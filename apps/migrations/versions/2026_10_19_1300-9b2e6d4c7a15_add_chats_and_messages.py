@@ -0,0 +1,57 @@
+"""Add chats and messages
+
+Revision ID: 9b2e6d4c7a15
+Revises: 3f7a9c2d1e4b
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b2e6d4c7a15'
+down_revision: Union[str, Sequence[str], None] = '3f7a9c2d1e4b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('chats',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('id', sa.Uuid(), server_default=sa.text('gen_random_uuid()'), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_chats_created_at_id', 'chats', ['created_at', 'id'], unique=False)
+    op.create_index('ix_chats_user_id_created_at_id', 'chats', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_table('messages',
+    sa.Column('chat_id', sa.Uuid(), nullable=False),
+    sa.Column('role', sa.String(), nullable=False),
+    sa.Column('text', sa.Text(), nullable=True),
+    sa.Column('attachments', postgresql.ARRAY(sa.UUID()), nullable=False),
+    sa.Column('metadata', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('id', sa.Uuid(), server_default=sa.text('gen_random_uuid()'), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['chat_id'], ['chats.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_messages_created_at_id', 'messages', ['created_at', 'id'], unique=False)
+    op.create_index('ix_messages_chat_id_created_at_id', 'messages', ['chat_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_messages_chat_id_created_at_id', table_name='messages')
+    op.drop_index('ix_messages_created_at_id', table_name='messages')
+    op.drop_table('messages')
+    op.drop_index('ix_chats_user_id_created_at_id', table_name='chats')
+    op.drop_index('ix_chats_created_at_id', table_name='chats')
+    op.drop_table('chats')
@@ -0,0 +1,49 @@
+"""Add file metadata
+
+Revision ID: 5c1d8e3a7b29
+Revises: 9b2e6d4c7a15
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1d8e3a7b29'
+down_revision: Union[str, Sequence[str], None] = '9b2e6d4c7a15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('file_metadata',
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('filename', sa.String(), nullable=False),
+    sa.Column('filepath', sa.String(), nullable=False),
+    sa.Column('filesize', sa.Integer(), nullable=False),
+    sa.Column('mime_type', sa.String(), nullable=False),
+    sa.Column('extension', sa.String(), nullable=False),
+    sa.Column('type', sa.String(), nullable=False),
+    sa.Column('uploaded_at', sa.DateTime(), nullable=False),
+    sa.Column('context', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=True),
+    sa.Column('id', sa.Uuid(), server_default=sa.text('gen_random_uuid()'), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('filepath')
+    )
+    op.create_index('ix_file_metadata_content_hash', 'file_metadata', ['content_hash'], unique=False)
+    op.create_index('ix_file_metadata_created_at_id', 'file_metadata', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_file_metadata_created_at_id', table_name='file_metadata')
+    op.drop_index('ix_file_metadata_content_hash', table_name='file_metadata')
+    op.drop_table('file_metadata')
@@ -5,7 +5,7 @@ from pydantic import EmailStr, Field
 
 from modules.shared_kernel.application import DTO
 
-from ..domain import InvitationStatus, MemberRole, OrganizationType, WorkspaceType
+from ..domain import InvitationStatus, MemberRole, OrganizationType, Workspace, WorkspaceType
 
 
 class WorkspaceCreate(DTO):
@@ -30,3 +30,10 @@ class SentInvitation(DTO):
     member_role: MemberRole
     expires_at: datetime
     status: InvitationStatus
+
+
+class OwnedWorkspaces(DTO):
+    """Рабочие области владельца (значение кеша списка областей)"""
+
+    owner_id: UUID
+    workspaces: list[Workspace]
@@ -0,0 +1,111 @@
+from collections.abc import Iterable, Sequence
+from uuid import UUID
+
+from modules.shared_kernel.application import Pagination, UnitOfWork
+from modules.shared_kernel.insrastructure.cache import NearKeyValueCache, RedisKeyValueCache
+
+from ..application import WorkspaceRepository
+from ..application.dto import OwnedWorkspaces
+from ..domain import Invitation, Member, Workspace
+
+
+class OwnedWorkspacesCache(RedisKeyValueCache[OwnedWorkspaces]):
+    model = OwnedWorkspaces
+
+
+class CachedWorkspaceRepository(WorkspaceRepository):
+    """Репозиторий рабочих областей, читающий списки областей владельцев через near-кеш.
+
+    Список областей запрашивается при каждой загрузке интерфейса и почти не меняется,
+    поэтому обслуживается из памяти процесса. Изменения областей и их участников
+    сбрасывают список владельца на всех репликах после фиксации транзакции `uow`:
+    сброс до фиксации позволил бы параллельному чтению снова закешировать старый список.
+    """
+
+    def __init__(
+            self,
+            repository: WorkspaceRepository,
+            cache: NearKeyValueCache[OwnedWorkspaces],
+            uow: UnitOfWork,
+    ) -> None:
+        self._repository = repository
+        self._cache = cache
+        self._uow = uow
+
+    def _invalidate(self, owner_ids: Iterable[UUID]) -> None:
+        keys = {f"{owner_id}" for owner_id in owner_ids}
+
+        async def invalidate() -> None:
+            for key in keys:
+                await self._cache.invalidate(key)
+
+        if keys:
+            self._uow.on_commit(invalidate)
+
+    async def _load_owned(self, owner_id: UUID) -> OwnedWorkspaces:
+        workspaces = await self._repository.get_by_owner(owner_id)
+        return OwnedWorkspaces(owner_id=owner_id, workspaces=workspaces)
+
+    async def get_by_owner(self, owner_id: UUID) -> list[Workspace]:
+        owned = await self._cache.get_or_load(
+            f"{owner_id}", loader=lambda: self._load_owned(owner_id)
+        )
+        if owned is None:
+            return []
+        # Экземпляры из локального кеша разделяются между запросами
+        return [workspace.model_copy(deep=True) for workspace in owned.workspaces]
+
+    async def read(self, id: UUID, **kwargs) -> Workspace | None:  # noqa: A002
+        return await self._repository.read(id, **kwargs)
+
+    async def read_all(self, pagination: Pagination) -> list[Workspace]:
+        return await self._repository.read_all(pagination)
+
+    async def get_member(self, workspace_id: UUID, user_id: UUID) -> Member | None:
+        return await self._repository.get_member(workspace_id, user_id)
+
+    async def create(self, entity: Workspace) -> Workspace:
+        created = await self._repository.create(entity)
+        self._invalidate((created.owner_id,))
+        return created
+
+    async def create_many(self, entities: Sequence[Workspace]) -> list[Workspace]:
+        created = await self._repository.create_many(entities)
+        self._invalidate(workspace.owner_id for workspace in created)
+        return created
+
+    async def update(self, id: UUID, **kwargs) -> Workspace | None:  # noqa: A002
+        updated = await self._repository.update(id, **kwargs)
+        if updated is not None:
+            self._invalidate((updated.owner_id,))
+        return updated
+
+    async def update_many(self, ids: Sequence[UUID], **kwargs) -> list[Workspace]:
+        updated = await self._repository.update_many(ids, **kwargs)
+        self._invalidate(workspace.owner_id for workspace in updated)
+        return updated
+
+    async def upsert_many(
+            self, entities: Sequence[Workspace], conflict_keys: Sequence[str] = ("id",)
+    ) -> list[Workspace]:
+        upserted = await self._repository.upsert_many(entities, conflict_keys)
+        self._invalidate(workspace.owner_id for workspace in upserted)
+        return upserted
+
+    async def delete(self, id: UUID) -> bool:  # noqa: A002
+        workspace = await self._repository.read(id)
+        deleted = await self._repository.delete(id)
+        if workspace is not None:
+            self._invalidate((workspace.owner_id,))
+        return deleted
+
+    async def add_member(self, member: Member) -> Member:
+        added = await self._repository.add_member(member)
+        # Меняется количество участников в списке областей владельца
+        workspace = await self._repository.read(member.workspace_id)
+        if workspace is not None:
+            self._invalidate((workspace.owner_id,))
+        return added
+
+    async def add_invitation(self, invitation: Invitation) -> Invitation:
+        return await self._repository.add_invitation(invitation)
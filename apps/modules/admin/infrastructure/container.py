@@ -1,17 +1,42 @@
+from collections.abc import AsyncIterator
+from datetime import timedelta
+
 from dishka import Provider, Scope, provide
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from config.dev import settings
 from modules.shared_kernel.application import UnitOfWork
 from modules.shared_kernel.application.message_bus import LogMessageBus
+from modules.shared_kernel.insrastructure.cache import NearKeyValueCache
 
 from ..application import CreateWorkspaceUseCase, WorkspaceRepository
+from ..application.dto import OwnedWorkspaces
+from .cache import CachedWorkspaceRepository, OwnedWorkspacesCache
 from .database import SQLAlchemyWorkspaceRepository
 
 
 class AdminProvider(Provider):
+    @provide(scope=Scope.APP)
+    async def provide_owned_workspaces_cache(  # noqa: PLR6301
+            self
+    ) -> AsyncIterator[NearKeyValueCache[OwnedWorkspaces]]:
+        cache = NearKeyValueCache(
+            remote=OwnedWorkspacesCache(
+                url=settings.redis.url, prefix="owned-workspaces", ttl=timedelta(minutes=10)
+            ),
+            max_size=10_000,
+        )
+        yield cache
+        await cache.close()
+
     @provide(scope=Scope.REQUEST)
-    def provide_workspace_repo(self, session: AsyncSession) -> WorkspaceRepository:  # noqa: PLR6301
-        return SQLAlchemyWorkspaceRepository(session)
+    def provide_workspace_repo(  # noqa: PLR6301
+            self,
+            session: AsyncSession,
+            uow: UnitOfWork,
+            cache: NearKeyValueCache[OwnedWorkspaces],
+    ) -> WorkspaceRepository:
+        return CachedWorkspaceRepository(SQLAlchemyWorkspaceRepository(session), cache, uow)
 
     @provide(scope=Scope.REQUEST)
     def provide_workspace_creation_usecase(  # noqa: PLR6301
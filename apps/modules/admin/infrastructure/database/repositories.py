@@ -45,23 +45,29 @@ class WorkspaceDataMapper(DataMapper[Workspace, WorkspaceModel]):
 
 
 class MemberDataMapper(DataMapper[Member, MemberModel]):
+    entity_class = Member
+    model_class = MemberModel
+
     @classmethod
     def model_to_entity(cls, model: MemberModel) -> Member:
         return Member.model_validate(model)
 
     @classmethod
     def entity_to_model(cls, entity: Member) -> MemberModel:
-        return MemberModel(**entity.model_dump())
+        return MemberModel(**cls.entity_to_values(entity))
 
 
 class InvitationDataMapper(DataMapper[Invitation, InvitationModel]):
+    entity_class = Invitation
+    model_class = InvitationModel
+
     @classmethod
     def model_to_entity(cls, model: InvitationModel) -> Invitation:
         return Invitation.model_validate(model)
 
     @classmethod
     def entity_to_model(cls, entity: Invitation) -> InvitationModel:
-        return InvitationModel(**entity.model_dump())
+        return InvitationModel(**cls.entity_to_values(entity))
 
 
 class SQLAlchemyWorkspaceRepository(
@@ -75,8 +81,7 @@ class SQLAlchemyWorkspaceRepository(
         try:
             stmt = select(self.model).where(self.model.owner_id == owner_id)
             results = await self.session.execute(stmt)
-            models = results.scalars().all()
-            return [self.data_mapper.model_to_entity(model) for model in models]
+            return self.data_mapper.models_to_entities(results.scalars().all())
         except SQLAlchemyError as e:
             raise ReadingError(
                 entity_name=self.entity.__class__.__name__,
@@ -96,7 +101,7 @@ class SQLAlchemyWorkspaceRepository(
             )
             result = await self.session.execute(stmt)
             model = result.scalar_one_or_none()
-            return MemberDataMapper.model_to_entity(model) if model is not None else None
+            return MemberDataMapper.model_to_entity_trusted(model) if model is not None else None
         except SQLAlchemyError as e:
             raise ReadingError(
                 entity_name="Member",
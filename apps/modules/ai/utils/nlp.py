@@ -1,15 +1,79 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mawo_pymorphy3 import MorphAnalyzer
+
+import logging
 import re
+from functools import cache
+
+from config.dev import settings
+
+logger = logging.getLogger(__name__)
+
+# Ресурсы NLTK, необходимые для предобработки текста: (путь внутри data_dir, имя пакета)
+NLTK_RESOURCES: tuple[tuple[str, str], ...] = (
+    ("tokenizers/punkt_tab", "punkt_tab"),
+    ("corpora/stopwords", "stopwords"),
+)
+
+
+@cache
+def _ensure_nltk_resource(resource_path: str, package: str) -> None:
+    """Проверяет наличие ресурса NLTK в локальной директории.
+    Скачивание происходит только если оно явно разрешено в настройках (`NLP_ALLOW_DOWNLOAD`).
+
+    :param resource_path: Путь до ресурса, например: 'corpora/stopwords'.
+    :param package: Имя пакета NLTK для скачивания.
+    :exception LookupError: Ресурс не найден, а скачивание запрещено.
+    """
+
+    import nltk  # noqa: PLC0415
+
+    data_dir = f"{settings.nlp.data_dir}"
+    if data_dir not in nltk.data.path:
+        nltk.data.path.insert(0, data_dir)
+    try:
+        nltk.data.find(resource_path)
+    except LookupError:
+        if not settings.nlp.allow_download:
+            logger.exception(
+                "NLTK resource %s not found in %s and downloading is disabled",
+                resource_path, data_dir
+            )
+            raise
+        logger.info("Downloading NLTK resource %s to %s", package, data_dir)
+        nltk.download(package, download_dir=data_dir, quiet=True)
 
-import nltk
-from mawo_pymorphy3 import create_analyzer
-from nltk.tokenize import word_tokenize
 
-nltk.download("punkt")
+def download_nlp_resources() -> None:
+    """Скачивание всех NLP ресурсов в локальную директорию (для сборки образа)"""
 
-nltk.download("stopwords")
-stopwords = nltk.corpus.stopwords.words("russian")
+    import nltk  # noqa: PLC0415
 
-analyzer = create_analyzer()
+    settings.nlp.data_dir.mkdir(parents=True, exist_ok=True)
+    for _, package in NLTK_RESOURCES:
+        nltk.download(package, download_dir=f"{settings.nlp.data_dir}", quiet=True)
+    logger.info("NLP resources downloaded to %s", settings.nlp.data_dir)
+
+
+@cache
+def get_stopwords() -> frozenset[str]:
+    """Стоп-слова, загружаются один раз при первом обращении"""
+
+    _ensure_nltk_resource("corpora/stopwords", "stopwords")
+    from nltk.corpus import stopwords  # noqa: PLC0415
+
+    return frozenset(stopwords.words(settings.nlp.language))
+
+
+@cache
+def get_analyzer() -> "MorphAnalyzer":
+    """Морфологический анализатор, создаётся один раз при первом обращении"""
+
+    from mawo_pymorphy3 import create_analyzer  # noqa: PLC0415
+
+    return create_analyzer()
 
 
 def remove_extra_chars(text: str) -> str:
@@ -24,6 +88,7 @@ def remove_extra_chars(text: str) -> str:
 def remove_stopwords(text: str) -> str:
     """Удаление стоп-слов"""
 
+    stopwords = get_stopwords()
     return " ".join([word for word in text.split() if word not in stopwords])
 
 
@@ -47,12 +112,16 @@ def remove_emoji(text: str) -> str:
 def tokenize_text(text: str) -> list[str]:
     """Токенизация текста"""
 
-    return word_tokenize(text, language="russian")
+    _ensure_nltk_resource("tokenizers/punkt_tab", "punkt_tab")
+    from nltk.tokenize import word_tokenize  # noqa: PLC0415
+
+    return word_tokenize(text, language=settings.nlp.language)
 
 
 def lemmatize(words: list[str]) -> list[str]:
     """Лемматизация русских слов"""
 
+    analyzer = get_analyzer()
     return [analyzer.parse(word)[0].normal_form for word in words]
 
 
@@ -67,3 +136,8 @@ def preprocess_text(text: str) -> str:
     tokens = tokenize_text(cleaned_text)
     lemmas = lemmatize(tokens)
     return " ".join(lemmas)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    download_nlp_resources()
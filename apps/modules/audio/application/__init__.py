@@ -1,5 +1,51 @@
 __all__ = (
     "AudioSplitter",
+    "InMemoryPartialSummaryStore",
+    "InMemorySummaryCache",
+    "IncrementalSummarizationService",
+    "MapReduceSummarizationEngine",
+    "PartialSummaryStore",
+    "PipelineStage",
+    "ProgressAggregationService",
+    "ProgressCoalescer",
+    "ProgressNotifier",
+    "ProgressStore",
+    "RecognitionOptions",
+    "RecordTranscriptStore",
+    "SegmentTranscriptionService",
+    "SummarizationStats",
+    "Summarizer",
+    "SummaryCache",
+    "TaskProgress",
+    "TranscribedSegment",
+    "TranscriptReuseService",
+    "TranscriptionCache",
+    "TranscriptionStats",
 )
 
+from .deduplication import RecordTranscriptStore, TranscribedSegment, TranscriptReuseService
+from .progress import (
+    PipelineStage,
+    ProgressAggregationService,
+    ProgressCoalescer,
+    ProgressNotifier,
+    ProgressStore,
+    TaskProgress,
+)
+from .summarization import (
+    IncrementalSummarizationService,
+    InMemoryPartialSummaryStore,
+    InMemorySummaryCache,
+    MapReduceSummarizationEngine,
+    PartialSummaryStore,
+    SummarizationStats,
+    Summarizer,
+    SummaryCache,
+)
+from .transcription import (
+    RecognitionOptions,
+    SegmentTranscriptionService,
+    TranscriptionCache,
+    TranscriptionStats,
+)
 from .workers import AudioSplitter
@@ -0,0 +1,120 @@
+import logging
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from pydantic import PositiveInt
+
+from modules.shared_kernel.application import DTO
+
+from ..domain import AudioTranscribedEvent, SoundEnhancedEvent
+
+logger = logging.getLogger(__name__)
+
+
+class TranscribedSegment(DTO):
+    """Транскрипция сегмента аудио записи.
+
+    Attributes:
+        segment_id: Номер сегмента в записи.
+        duration: Продолжительность сегмента в секундах.
+        text: Транскрипция сегмента.
+    """
+
+    segment_id: PositiveInt
+    duration: PositiveInt
+    text: str
+
+
+class RecordTranscriptStore(ABC):
+    """Транскрипции аудио записей по хэшу содержимого (SHA-256 файла записи).
+    Повторно загруженная запись не разбивается и не транскрибируется заново.
+    """
+
+    @abstractmethod
+    async def get(self, content_hash: str) -> list[TranscribedSegment] | None:
+        """Транскрипция записи по сегментам одного разбиения (в порядке номеров),
+        `None` - если транскрибированы не все сегменты.
+        """
+
+    @abstractmethod
+    async def save(
+            self,
+            content_hash: str,
+            chunk_duration: int,
+            segments_count: int,
+            segment: TranscribedSegment,
+    ) -> None:
+        """Сохранение транскрипции сегмента записи.
+        Разбиение записи определяется плановой длительностью и числом сегментов.
+        """
+
+
+class TranscriptReuseService:
+    """Переиспользование результатов конвейера для ранее обработанных записей"""
+
+    def __init__(self, store: RecordTranscriptStore) -> None:
+        self._store = store
+
+    async def find(self, content_hash: str | None) -> list[TranscribedSegment] | None:
+        if content_hash is None:
+            return None
+        return await self._store.get(content_hash)
+
+    async def remember(
+            self,
+            content_hash: str | None,
+            chunk_duration: int | None,
+            segments_count: int,
+            segment_id: int,
+            duration: int,
+            text: str,
+    ) -> None:
+        if content_hash is None or chunk_duration is None:
+            return
+        await self._store.save(
+            content_hash,
+            chunk_duration,
+            segments_count,
+            TranscribedSegment(segment_id=segment_id, duration=duration, text=text),
+        )
+
+    @staticmethod
+    def replay(
+            segments: list[TranscribedSegment],
+            task_id: UUID,
+            user_id: UUID,
+            collection_id: UUID,
+            record_id: UUID,
+    ) -> list[tuple[SoundEnhancedEvent, AudioTranscribedEvent]]:
+        """События конвейера для записи с готовой транскрипцией:
+        прогресс и суммаризация обрабатывают их как результат обычной обработки.
+        """
+
+        segments_count = len(segments)
+        logger.info(
+            "Record %s: reusing transcript of %s segments", record_id, segments_count
+        )
+        return [
+            (
+                SoundEnhancedEvent(
+                    task_id=task_id,
+                    user_id=user_id,
+                    collection_id=collection_id,
+                    record_id=record_id,
+                    segment_id=segment.segment_id,
+                    segments_count=segments_count,
+                ),
+                AudioTranscribedEvent(
+                    task_id=task_id,
+                    user_id=user_id,
+                    collection_id=collection_id,
+                    record_id=record_id,
+                    segment_id=segment.segment_id,
+                    segment_duration=segment.duration,
+                    segments_count=segments_count,
+                    is_last=position == segments_count,
+                    text=segment.text,
+                ),
+            )
+            for position, segment in enumerate(segments, start=1)
+        ]
@@ -13,3 +13,15 @@ class AudioSplittingError(AppError):
             code="AUDIO_SPLITTING_FAILED",
             details=details
         )
+
+
+class SummarizationError(AppError):
+    """Ошибка суммаризации транскрипции (модель не сокращает текст и т.п.)"""
+
+    def __init__(self, message: str, details: dict[str, Any] | None = None) -> None:
+        super().__init__(
+            message=message,
+            type=ErrorType.EXTERNAL_DEPENDENCY_ERROR,
+            code="SUMMARIZATION_FAILED",
+            details=details
+        )
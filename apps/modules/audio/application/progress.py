@@ -0,0 +1,176 @@
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime
+from enum import StrEnum
+from uuid import UUID
+
+from pydantic import NonNegativeInt, PositiveInt
+
+from modules.shared_kernel.application import DTO
+
+from ..domain import PipelineEvent
+
+logger = logging.getLogger(__name__)
+
+
+class PipelineStage(StrEnum):
+    """Этап обработки аудио коллекции"""
+
+    SPLITTING = "splitting"
+    ENHANCING = "enhancing"
+    TRANSCRIBING = "transcribing"
+    COMPLETED = "completed"
+
+
+class TaskProgress(DTO):
+    """Агрегированный прогресс задачи суммаризации.
+
+    Attributes:
+        task_id: Идентификатор задачи.
+        user_id: Владелец задачи.
+        segments_total: Количество сегментов (известно после разбиения).
+        segments_enhanced: Сегменты с улучшенным звуком.
+        segments_transcribed: Транскрибированные сегменты.
+        updated_at: Время последнего обновления.
+    """
+
+    task_id: UUID
+    user_id: UUID
+    segments_total: PositiveInt | None = None
+    segments_enhanced: NonNegativeInt = 0
+    segments_transcribed: NonNegativeInt = 0
+    updated_at: datetime
+
+    @property
+    def stage(self) -> PipelineStage:
+        if self.segments_total is None:
+            return PipelineStage.SPLITTING
+        if self.segments_transcribed >= self.segments_total:
+            return PipelineStage.COMPLETED
+        if self.segments_enhanced < self.segments_total:
+            return PipelineStage.ENHANCING
+        return PipelineStage.TRANSCRIBING
+
+    @property
+    def percent(self) -> float:
+        """Процент выполнения: улучшение звука и транскрибация - по половине"""
+
+        if self.segments_total is None:
+            return 0.0
+        done = min(self.segments_enhanced, self.segments_total) + min(
+            self.segments_transcribed, self.segments_total
+        )
+        return round(done / (2 * self.segments_total) * 100, 1)
+
+    def to_event(self) -> dict[str, object]:
+        """Представление для отправки клиенту"""
+
+        return {
+            "type": "task_progress",
+            "task_id": self.task_id,
+            "stage": self.stage,
+            "percent": self.percent,
+            "segments_total": self.segments_total,
+            "segments_enhanced": self.segments_enhanced,
+            "segments_transcribed": self.segments_transcribed,
+            "updated_at": self.updated_at,
+        }
+
+
+class ProgressStore(ABC):
+    """Счётчики прогресса задач"""
+
+    @abstractmethod
+    async def apply(self, event: PipelineEvent) -> TaskProgress:
+        """Учёт события конвейера (повторная доставка события не меняет счётчики)"""
+
+    @abstractmethod
+    async def get(self, task_id: UUID) -> TaskProgress | None: ...
+
+    @abstractmethod
+    def updates(self, task_id: UUID) -> AsyncIterator[str]:
+        """Текущее состояние и последующие обновления задачи (JSON) до её завершения"""
+
+
+class ProgressNotifier(ABC):
+    """Доставка обновлений прогресса клиентам (WebSocket/SSE)"""
+
+    @abstractmethod
+    async def notify(self, progress: TaskProgress) -> None: ...
+
+
+class ProgressCoalescer:
+    """Схлопывание обновлений прогресса: не чаще `max_rate` в секунду на задачу.
+    Промежуточные обновления заменяются последним, финальное отправляется сразу.
+    """
+
+    def __init__(self, notifier: ProgressNotifier, max_rate: float) -> None:
+        self.notifier = notifier
+        self.interval = 1 / max_rate
+        self.sent = 0
+        self.coalesced = 0
+        self._last_sent_at: dict[UUID, float] = {}
+        self._pending: dict[UUID, TaskProgress] = {}
+        self._flushers: dict[UUID, asyncio.Task[None]] = {}
+
+    async def _send(self, progress: TaskProgress) -> None:
+        self._last_sent_at[progress.task_id] = time.monotonic()
+        self.sent += 1
+        try:
+            await self.notifier.notify(progress)
+        except Exception:
+            logger.exception("Failed to notify progress of task %s", progress.task_id)
+
+    async def _flush_later(self, task_id: UUID, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._flushers.pop(task_id, None)
+        progress = self._pending.pop(task_id, None)
+        if progress is not None:
+            await self._send(progress)
+
+    async def submit(self, progress: TaskProgress) -> None:
+        task_id = progress.task_id
+        if progress.stage == PipelineStage.COMPLETED:
+            flusher = self._flushers.pop(task_id, None)
+            if flusher is not None:
+                flusher.cancel()
+            self._pending.pop(task_id, None)
+            await self._send(progress)
+            self._last_sent_at.pop(task_id, None)
+            return
+        elapsed = time.monotonic() - self._last_sent_at.get(task_id, float("-inf"))
+        if elapsed >= self.interval and task_id not in self._flushers:
+            await self._send(progress)
+            return
+        if task_id in self._pending:
+            self.coalesced += 1
+        self._pending[task_id] = progress
+        if task_id not in self._flushers:
+            self._flushers[task_id] = asyncio.create_task(
+                self._flush_later(task_id, self.interval - elapsed)
+            )
+
+    async def close(self) -> None:
+        """Отправка отложенных обновлений"""
+
+        for flusher in self._flushers.values():
+            flusher.cancel()
+        self._flushers.clear()
+        pending, self._pending = self._pending, {}
+        for progress in pending.values():
+            await self._send(progress)
+
+
+class ProgressAggregationService:
+    """Агрегация событий конвейера в прогресс задач и доставка клиентам"""
+
+    def __init__(self, store: ProgressStore, coalescer: ProgressCoalescer) -> None:
+        self._store = store
+        self._coalescer = coalescer
+
+    async def handle(self, event: PipelineEvent) -> None:
+        progress = await self._store.apply(event)
+        await self._coalescer.submit(progress)
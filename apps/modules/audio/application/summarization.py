@@ -0,0 +1,430 @@
+from typing import Final
+
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from uuid import UUID
+
+from ..domain import (
+    AudioSplitEvent,
+    AudioTranscribedEvent,
+    TranscriptionSegment,
+    TranscriptionSummarizedEvent,
+)
+from .exceptions import SummarizationError
+
+logger = logging.getLogger(__name__)
+
+# Среднее количество символов русского текста в одном токене
+CHARS_PER_TOKEN: Final[float] = 3.6
+TEXTS_SEPARATOR: Final[str] = "\n\n"
+
+
+def approximate_tokens(text: str) -> int:
+    """Приблизительное количество токенов в тексте (без обращения к токенизатору модели)"""
+
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def split_text(text: str, budget: int, count_tokens: Callable[[str], int]) -> list[str]:
+    """Разбиение текста на части не длиннее `budget` токенов.
+    Текст режется по строкам (реплики спикеров), слишком длинная строка - по символам.
+    """
+
+    parts: list[str] = []
+    lines: list[str] = []
+    tokens = 0
+    for line in text.splitlines():
+        line_tokens = count_tokens(line)
+        if line_tokens > budget:
+            step = max(1, len(line) * budget // line_tokens)
+            pieces = [line[i:i + step] for i in range(0, len(line), step)]
+        else:
+            pieces = [line]
+        for piece in pieces:
+            piece_tokens = count_tokens(piece) + 1
+            if lines and tokens + piece_tokens > budget:
+                parts.append("\n".join(lines))
+                lines, tokens = [], 0
+            lines.append(piece)
+            tokens += piece_tokens
+    if lines:
+        parts.append("\n".join(lines))
+    return parts
+
+
+def pack_batches(
+        texts: Sequence[str], budget: int, count_tokens: Callable[[str], int]
+) -> list[list[str]]:
+    """Упаковка последовательных текстов в пачки не длиннее `budget` токенов.
+    Порядок текстов сохраняется, текст длиннее бюджета разбивается на части.
+    """
+
+    batches: list[list[str]] = []
+    batch: list[str] = []
+    tokens = 0
+    for text in texts:
+        for part in split_text(text, budget, count_tokens):
+            part_tokens = count_tokens(part) + count_tokens(TEXTS_SEPARATOR)
+            if batch and tokens + part_tokens > budget:
+                batches.append(batch)
+                batch, tokens = [], 0
+            batch.append(part)
+            tokens += part_tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+class Summarizer(ABC):
+    """Языковая модель, выполняющая суммаризацию транскрипций"""
+
+    @abstractmethod
+    async def summarize(self, text: str) -> str:
+        """Map: краткое содержание фрагмента транскрипции"""
+
+    @abstractmethod
+    async def combine(self, summaries: list[str]) -> str:
+        """Reduce: итоговое саммари по кратким содержаниям фрагментов (в порядке следования)"""
+
+
+class SummaryCache(ABC):
+    """Кэш результатов вызовов модели по хэшу входного текста"""
+
+    @abstractmethod
+    async def get(self, key: str) -> str | None: ...
+
+    @abstractmethod
+    async def set(self, key: str, summary: str) -> None: ...
+
+
+class InMemorySummaryCache(SummaryCache):
+    """LRU кэш результатов в памяти процесса"""
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        self.max_size = max_size
+        self._summaries: OrderedDict[str, str] = OrderedDict()
+
+    async def get(self, key: str) -> str | None:
+        summary = self._summaries.get(key)
+        if summary is not None:
+            self._summaries.move_to_end(key)
+        return summary
+
+    async def set(self, key: str, summary: str) -> None:
+        self._summaries[key] = summary
+        self._summaries.move_to_end(key)
+        while len(self._summaries) > self.max_size:
+            self._summaries.popitem(last=False)
+
+
+@dataclass(slots=True)
+class SummarizationStats:
+    """Статистика движка суммаризации.
+
+    Attributes:
+        llm_calls: Выполненные вызовы модели.
+        cache_hits: Вызовы, результат которых взят из кэша.
+        round_trips: Последовательные уровни вызовов модели последней суммаризации.
+    """
+
+    llm_calls: int = 0
+    cache_hits: int = 0
+    round_trips: int = 0
+
+
+class MapReduceSummarizationEngine:
+    """Иерархическая map-reduce суммаризация длинных транскрипций.
+
+    Тексты сегментов упаковываются в пачки по бюджету токенов контекстного окна,
+    map вызовы выполняются параллельно (не более `max_concurrency` одновременно).
+    Краткие содержания сворачиваются деревом: на каждом уровне группы, помещающиеся
+    в контекстное окно, объединяются параллельно, пока не останется одна группа.
+    Число последовательных обращений к модели растёт как O(log n) от длины записи.
+    Результаты вызовов кэшируются по хэшу входа, повторная попытка пропускает готовое.
+    """
+
+    def __init__(
+            self,
+            summarizer: Summarizer,
+            cache: SummaryCache,
+            context_window: int = 8000,
+            reserved_tokens: int = 2000,
+            max_concurrency: int = 8,
+            count_tokens: Callable[[str], int] = approximate_tokens,
+            max_reduce_rounds: int = 10,
+    ) -> None:
+        """
+        :param summarizer: Языковая модель.
+        :param cache: Кэш результатов вызовов модели.
+        :param context_window: Размер контекстного окна модели (в токенах).
+        :param reserved_tokens: Токены окна под промпт и ответ модели.
+        :param max_concurrency: Максимум одновременных вызовов модели.
+        :param count_tokens: Подсчёт токенов текста.
+        :param max_reduce_rounds: Максимум уровней дерева свёртки.
+        """
+
+        self._summarizer = summarizer
+        self._cache = cache
+        self.budget = context_window - reserved_tokens
+        if self.budget <= 0:
+            raise ValueError("Context window must be larger than reserved tokens")
+        self._count_tokens = count_tokens
+        self.max_reduce_rounds = max_reduce_rounds
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.stats = SummarizationStats()
+
+    @staticmethod
+    def _build_key(stage: str, texts: Sequence[str]) -> str:
+        digest = hashlib.sha256(stage.encode())
+        for text in texts:
+            digest.update(b"\0")
+            digest.update(text.encode())
+        return f"{stage}:{digest.hexdigest()}"
+
+    async def _call(
+            self, stage: str, texts: list[str], call: Callable[[], Awaitable[str]]
+    ) -> str:
+        key = self._build_key(stage, texts)
+        summary = await self._cache.get(key)
+        if summary is not None:
+            self.stats.cache_hits += 1
+            return summary
+        async with self._semaphore:
+            summary = await call()
+        self.stats.llm_calls += 1
+        await self._cache.set(key, summary)
+        return summary
+
+    async def _map_batch(self, batch: list[str]) -> str:
+        text = TEXTS_SEPARATOR.join(batch)
+        return await self._call("map", batch, lambda: self._summarizer.summarize(text))
+
+    async def _combine(self, summaries: list[str]) -> str:
+        return await self._call("reduce", summaries, lambda: self._summarizer.combine(summaries))
+
+    async def map(self, texts: Sequence[str]) -> list[str]:
+        """Map шаг: краткие содержания последовательных текстов (в том же порядке)"""
+
+        batches = pack_batches(texts, self.budget, self._count_tokens)
+        return list(await asyncio.gather(*map(self._map_batch, batches)))
+
+    def _split(self, summaries: Sequence[str]) -> list[str]:
+        # Части не длиннее половины бюджета: любые две помещаются в одну группу,
+        # поэтому каждый уровень дерева сокращает число частей примерно вдвое
+        return [
+            part
+            for summary in summaries
+            for part in split_text(summary, self.budget // 2, self._count_tokens)
+        ]
+
+    async def reduce(self, summaries: Sequence[str]) -> str:
+        """Reduce шаг: свёртка кратких содержаний деревом до итогового саммари
+
+        :exception SummarizationError: Модель не сокращает тексты и свёртка не сходится.
+        """
+
+        groups = pack_batches(self._split(summaries), self.budget, self._count_tokens)
+        round_trips = 1
+        while len(groups) > 1:
+            if round_trips > self.max_reduce_rounds:
+                raise SummarizationError(
+                    "Reduce did not converge",
+                    details={"rounds": round_trips, "groups": len(groups)},
+                )
+            merged = await asyncio.gather(*map(self._combine, groups))
+            merged_groups = pack_batches(self._split(merged), self.budget, self._count_tokens)
+            if len(merged_groups) >= len(groups):
+                # Без сокращения каждый уровень повторял бы вызовы модели бесконечно
+                raise SummarizationError(
+                    "Model summaries do not shrink, reduce can't converge",
+                    details={"rounds": round_trips, "groups": len(groups)},
+                )
+            groups = merged_groups
+            round_trips += 1
+        summary = await self._combine(groups[0] if groups else [])
+        self.stats.round_trips = round_trips
+        return summary
+
+    async def summarize(self, segments: Sequence[TranscriptionSegment]) -> str:
+        """Итоговое саммари транскрипции по сегментам (в порядке их номеров)"""
+
+        ordered = sorted(segments, key=lambda segment: segment.number)
+        summaries = await self.map([segment.text for segment in ordered])
+        summary = await self.reduce(summaries)
+        self.stats.round_trips += 1
+        return summary
+
+
+class PartialSummaryStore(ABC):
+    """Промежуточные (map) саммари сегментов задачи.
+    Нумерация сегментов своя у каждой записи коллекции,
+    поэтому сегмент определяется парой (`record_id`, `segment_id`).
+    """
+
+    @abstractmethod
+    async def contains(self, task_id: UUID, record_id: UUID, segment_id: int) -> bool: ...
+
+    @abstractmethod
+    async def save(self, task_id: UUID, record_id: UUID, segment_id: int, summary: str) -> int:
+        """Сохранение саммари сегмента (повторное сохранение не перезаписывает результат).
+
+        :returns: Количество сегментов задачи с готовым саммари.
+        """
+
+    @abstractmethod
+    async def count(self, task_id: UUID) -> int:
+        """Количество сегментов задачи с готовым саммари"""
+
+    @abstractmethod
+    async def get_all(self, task_id: UUID, record_ids: Sequence[UUID]) -> list[str]:
+        """Саммари сегментов задачи в порядке записей `record_ids` и номеров сегментов"""
+
+    @abstractmethod
+    async def save_split(self, event: AudioSplitEvent) -> None:
+        """Запоминание разбиения коллекции (общее количество сегментов и порядок записей)"""
+
+    @abstractmethod
+    async def get_split(self, task_id: UUID) -> AudioSplitEvent | None: ...
+
+    @abstractmethod
+    async def claim(self, task_id: UUID) -> bool:
+        """Захват reduce шага задачи: `True` получает только один из конкурирующих воркеров"""
+
+    @abstractmethod
+    async def release(self, task_id: UUID) -> None:
+        """Освобождение reduce шага после неудачной попытки"""
+
+    @abstractmethod
+    async def clear(self, task_id: UUID) -> None: ...
+
+
+class InMemoryPartialSummaryStore(PartialSummaryStore):
+    """Саммари сегментов в памяти процесса (один воркер, тесты и стенды)"""
+
+    def __init__(self) -> None:
+        self._summaries: dict[UUID, dict[tuple[UUID, int], str]] = {}
+        self._splits: dict[UUID, AudioSplitEvent] = {}
+        self._claimed: set[UUID] = set()
+
+    async def contains(self, task_id: UUID, record_id: UUID, segment_id: int) -> bool:
+        return (record_id, segment_id) in self._summaries.get(task_id, {})
+
+    async def save(self, task_id: UUID, record_id: UUID, segment_id: int, summary: str) -> int:
+        summaries = self._summaries.setdefault(task_id, {})
+        summaries.setdefault((record_id, segment_id), summary)
+        return len(summaries)
+
+    async def count(self, task_id: UUID) -> int:
+        return len(self._summaries.get(task_id, {}))
+
+    async def get_all(self, task_id: UUID, record_ids: Sequence[UUID]) -> list[str]:
+        summaries = self._summaries.get(task_id, {})
+        positions = {record_id: position for position, record_id in enumerate(record_ids)}
+        return [
+            summaries[key]
+            for key in sorted(
+                summaries, key=lambda key: (positions.get(key[0], len(positions)), key[1])
+            )
+        ]
+
+    async def save_split(self, event: AudioSplitEvent) -> None:
+        self._splits[event.task_id] = event
+
+    async def get_split(self, task_id: UUID) -> AudioSplitEvent | None:
+        return self._splits.get(task_id)
+
+    async def claim(self, task_id: UUID) -> bool:
+        if task_id in self._claimed:
+            return False
+        self._claimed.add(task_id)
+        return True
+
+    async def release(self, task_id: UUID) -> None:
+        self._claimed.discard(task_id)
+
+    async def clear(self, task_id: UUID) -> None:
+        self._summaries.pop(task_id, None)
+        self._splits.pop(task_id, None)
+
+
+class IncrementalSummarizationService:
+    """Инкрементальная map-reduce суммаризация транскрипции.
+
+    Map шаг выполняется для каждого сегмента сразу после его транскрибации,
+    поэтому после последнего сегмента остаётся только reduce шаг.
+    Сегменты транскрибируются параллельно и могут приходить в любом порядке,
+    reduce запускается, когда готовы саммари всех сегментов коллекции. Общее
+    количество сегментов известно только из `AudioSplitEvent`, которое может прийти
+    как до, так и после последнего сегмента.
+    """
+
+    def __init__(self, engine: MapReduceSummarizationEngine, store: PartialSummaryStore) -> None:
+        self._engine = engine
+        self._store = store
+
+    async def _map_segment(self, event: AudioTranscribedEvent) -> int:
+        """Map шаг сегмента, возвращает количество сегментов задачи с готовым саммари"""
+
+        task_id = event.task_id
+        # Повторная доставка сегмента не должна оплачиваться ещё одним вызовом модели
+        if await self._store.contains(task_id, event.record_id, event.segment_id):
+            return await self._store.count(task_id)
+        summaries = await self._engine.map([event.text])
+        mapped = await self._store.save(
+            task_id, event.record_id, event.segment_id, TEXTS_SEPARATOR.join(summaries)
+        )
+        logger.info(
+            "Task %s: segment %s of record %s summarized (%s segments ready)",
+            task_id, event.segment_id, event.record_id, mapped,
+        )
+        return mapped
+
+    async def handle(
+            self, event: AudioSplitEvent | AudioTranscribedEvent
+    ) -> TranscriptionSummarizedEvent | None:
+        """Учёт разбиения коллекции или транскрибированного сегмента.
+
+        :returns: Событие с итоговым саммари, если событие завершило коллекцию.
+        """
+
+        task_id = event.task_id
+        split: AudioSplitEvent | None
+        if isinstance(event, AudioSplitEvent):
+            await self._store.save_split(event)
+            split, mapped = event, await self._store.count(task_id)
+        else:
+            mapped = await self._map_segment(event)
+            split = await self._store.get_split(task_id)
+        if (
+            split is None
+            or mapped < split.segments_count
+            or not await self._store.claim(task_id)
+        ):
+            return None
+
+        started_at = time.perf_counter()
+        try:
+            summaries = await self._store.get_all(task_id, split.record_ids)
+            summary = await self._engine.reduce(summaries)
+        except Exception:
+            await self._store.release(task_id)
+            raise
+        await self._store.clear(task_id)
+        logger.info(
+            "Task %s: final summary of %s segments reduced in %.2f s",
+            task_id, len(summaries), time.perf_counter() - started_at,
+        )
+        return TranscriptionSummarizedEvent(
+            task_id=task_id,
+            user_id=event.user_id,
+            collection_id=event.collection_id,
+            segments_count=split.segments_count,
+            summary=summary,
+        )
@@ -0,0 +1,150 @@
+from typing import Final
+
+import asyncio
+import hashlib
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from modules.shared_kernel.application import DTO
+from salute_speech.asyncio import AsyncSaluteSpeechClient
+from salute_speech.constants import AudioEncoding, Language
+from salute_speech.exceptions import TaskFailedError
+from salute_speech.models import RecognizedSpeechList
+
+from ..domain import AudioSegment
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAMPLERATE: Final[int] = 16000  # Частота SaluteSpeech, если сегмент её не указал
+
+
+class RecognitionOptions(DTO):
+    """Параметры распознавания, влияющие на результат (входят в ключ кэша).
+
+    Attributes:
+        audio_encoding: Кодировка аудио, передаваемая в SaluteSpeech.
+        language: Язык распознавания.
+        diarization: Разделение речи по спикерам.
+        max_speakers_count: Максимальное количество спикеров.
+        model: Модель распознавания.
+    """
+
+    audio_encoding: AudioEncoding = "PCM_S16LE"
+    language: Language = "ru-RU"
+    diarization: bool = True
+    max_speakers_count: int = 10
+    model: str = "general"
+
+    def fingerprint(self, content: bytes, channels: int, samplerate: int) -> str:
+        """SHA-256 содержимого сегмента, его формата и параметров распознавания.
+        Формат передаётся SaluteSpeech отдельно от байтов (PCM без заголовка),
+        поэтому одни и те же байты с другой частотой дают другой результат.
+        """
+
+        digest = hashlib.sha256(content)
+        digest.update(f"{channels}:{samplerate}".encode())
+        digest.update(self.model_dump_json().encode())
+        return digest.hexdigest()
+
+
+class TranscriptionCache(ABC):
+    """Кэш результатов распознавания по отпечатку сегмента"""
+
+    @abstractmethod
+    async def get(self, fingerprint: str) -> RecognizedSpeechList | None: ...
+
+    @abstractmethod
+    async def set(self, fingerprint: str, speech: RecognizedSpeechList) -> None: ...
+
+
+@dataclass(slots=True)
+class TranscriptionStats:
+    """Статистика распознавания сегментов.
+
+    Attributes:
+        cache_hits: Сегменты, результат для которых взят из кэша.
+        cache_misses: Сегменты, отправленные на распознавание.
+        recognition_time: Суммарная длительность распознавания (в секундах).
+    """
+
+    cache_hits: int = 0
+    cache_misses: int = 0
+    recognition_time: float = 0
+
+
+class SegmentTranscriptionService:
+    """Распознавание аудио сегментов через SaluteSpeech с кэшированием результатов.
+
+    Повторная попытка конвейера разбивает запись на побайтово те же сегменты,
+    поэтому их распознавание берётся из кэша без обращения к SaluteSpeech.
+    """
+
+    def __init__(
+            self,
+            client: AsyncSaluteSpeechClient,
+            cache: TranscriptionCache,
+            options: RecognitionOptions,
+            poll_interval: float = 1,
+    ) -> None:
+        self._client = client
+        self._cache = cache
+        self._options = options
+        self._poll_interval = poll_interval
+        self.stats = TranscriptionStats()
+
+    async def _recognize(
+            self, audio_segment: AudioSegment, channels: int, samplerate: int
+    ) -> RecognizedSpeechList:
+        options = self._options
+        request_file_id = await self._client.upload_file(
+            file=audio_segment.content,
+            audio_encoding=options.audio_encoding,
+            channels=channels,
+            samplerate=samplerate,
+        )
+        task = await self._client.async_recognize(
+            request_file_id,
+            audio_encoding=options.audio_encoding,
+            diarization=options.diarization,
+            max_speakers_count=options.max_speakers_count,
+            language=options.language,
+            channels=channels,
+            samplerate=samplerate,
+        )
+        while task.status in {"NEW", "RUNNING"}:
+            await asyncio.sleep(self._poll_interval)
+            task = await self._client.get_task_status(task.id)
+        if task.status != "DONE" or task.response_file_id is None:
+            raise TaskFailedError(
+                f"Recognition task {task.id} finished with status {task.status} "
+                "without a response file"
+            )
+        return await self._client.download_file(task.response_file_id)
+
+    async def recognize(self, audio_segment: AudioSegment) -> RecognizedSpeechList:
+        # Фактический формат сегмента (после приведения к профилю распознавания)
+        channels = audio_segment.channels or 1
+        samplerate = audio_segment.samplerate or DEFAULT_SAMPLERATE
+        fingerprint = self._options.fingerprint(audio_segment.content, channels, samplerate)
+        speech = await self._cache.get(fingerprint)
+        if speech is not None:
+            self.stats.cache_hits += 1
+            logger.info(
+                "Segment %s/%s recognized from cache",
+                audio_segment.number, audio_segment.total_count,
+            )
+            return speech
+        self.stats.cache_misses += 1
+        started_at = time.perf_counter()
+        speech = await self._recognize(audio_segment, channels, samplerate)
+        self.stats.recognition_time += time.perf_counter() - started_at
+        await self._cache.set(fingerprint, speech)
+        return speech
+
+    async def transcribe(self, audio_segment: AudioSegment) -> str:
+        """Трансрибация + диаризация сегмента в формате Markdown"""
+
+        speech = await self.recognize(audio_segment)
+        return speech.to_markdown()
@@ -1,11 +1,25 @@
 __all__ = (
     "AudioFormat",
     "AudioSegment",
+    "AudioSplitEvent",
+    "AudioTranscribedEvent",
+    "PipelineEvent",
+    "SoundEnhancedEvent",
+    "SummarizationTaskCreatedEvent",
     "SummarizeMeetingCommand",
     "TranscriptionSegment",
+    "TranscriptionSummarizedEvent",
     "UnsupportedAudioError",
 )
 
 from .commands import SummarizeMeetingCommand
+from .events import (
+    AudioSplitEvent,
+    AudioTranscribedEvent,
+    PipelineEvent,
+    SoundEnhancedEvent,
+    SummarizationTaskCreatedEvent,
+    TranscriptionSummarizedEvent,
+)
 from .exceptions import UnsupportedAudioError
 from .value_objects import AudioFormat, AudioSegment, TranscriptionSegment
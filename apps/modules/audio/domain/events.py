@@ -0,0 +1,76 @@
+from typing import ClassVar
+
+from uuid import UUID
+
+from pydantic import PositiveInt
+
+from modules.shared_kernel.domain import Event
+
+
+class SummarizationTaskCreatedEvent(Event):
+    """Создана задача суммаризации аудио коллекции"""
+
+    event_type: ClassVar[str] = "summarization_task_created"
+
+    task_id: UUID
+    user_id: UUID
+    collection_id: UUID
+
+
+class AudioSplitEvent(Event):
+    """Аудио коллекция разбита на сегменты.
+    `segments_count` - количество сегментов всех записей коллекции,
+    `record_ids` - записи в порядке следования (нумерация сегментов своя у каждой записи).
+    """
+
+    event_type: ClassVar[str] = "audio_split"
+
+    task_id: UUID
+    user_id: UUID
+    collection_id: UUID
+    segments_count: PositiveInt
+    record_ids: list[UUID]
+
+
+class SoundEnhancedEvent(Event):
+    """Улучшено качество звука аудио сегмента"""
+
+    event_type: ClassVar[str] = "sound_enhanced"
+
+    task_id: UUID
+    user_id: UUID
+    collection_id: UUID
+    record_id: UUID
+    segment_id: PositiveInt
+    segments_count: PositiveInt
+
+
+class AudioTranscribedEvent(Event):
+    """Аудио сегмент транскрибирован"""
+
+    event_type: ClassVar[str] = "audio_transcribed"
+
+    task_id: UUID
+    user_id: UUID
+    collection_id: UUID
+    record_id: UUID
+    segment_id: PositiveInt
+    segment_duration: PositiveInt
+    segments_count: PositiveInt
+    is_last: bool
+    text: str
+
+
+class TranscriptionSummarizedEvent(Event):
+    """Готово итоговое саммари транскрипции аудио коллекции"""
+
+    event_type: ClassVar[str] = "transcription_summarized"
+
+    task_id: UUID
+    user_id: UUID
+    collection_id: UUID
+    segments_count: PositiveInt
+    summary: str
+
+
+type PipelineEvent = AudioSplitEvent | SoundEnhancedEvent | AudioTranscribedEvent
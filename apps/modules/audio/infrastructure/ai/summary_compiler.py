@@ -0,0 +1,106 @@
+from typing import Final
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import ChatPromptTemplate
+
+from foundation_models.client.asyncio import AsyncFoundationModelClient
+from foundation_models.client.models import Message
+from modules.shared_kernel.insrastructure.telemetry import Telemetry
+
+from ...application import Summarizer
+
+MAP_PROMPT: Final[str] = """Ты - профессиональный ассистент для суммаризации аудио транскрипций.
+Перед тобой фрагмент транскрипции длинной аудиозаписи (совещания, лекции, интервью).
+
+**ФРАГМЕНТ:**
+{text}
+
+Кратко изложи содержание фрагмента:
+ - ключевые темы и тезисы, кто из спикеров что сказал;
+ - принятые решения, поручения, сроки и конкретные факты;
+ - незавершённые мысли, которые могут продолжиться в следующем фрагменте.
+Игнорируй слова-паразиты, повторы и паузы. Не добавляй ничего, чего нет во фрагменте.
+"""
+
+REDUCE_PROMPT: Final[str] = """Ты - профессиональный ассистент для суммаризации аудио транскрипций.
+Ниже краткие содержания последовательных фрагментов одной аудиозаписи.
+
+**КРАТКИЕ СОДЕРЖАНИЯ:**
+{text}
+
+Составь по ним итоговое summary аудиозаписи:
+ - **Основная тема:** 1-2 предложения;
+ - **Ключевые моменты:** самые важные идеи;
+ - **Конкретные факты:** значимые детали, решения, поручения и сроки;
+ - **Выводы/рекомендации:** что следует запомнить или сделать.
+Объедини повторяющиеся между фрагментами мысли. Используй маркированные списки.
+**РЕЗУЛЬТАТ ДОЛЖЕН БЫТЬ ПОЛЕЗЕН ДЛЯ ТОГО, КТО НЕ СЛУШАЛ АУДИОЗАПИСЬ.**
+"""
+
+SUMMARIES_SEPARATOR: Final[str] = "\n\n---\n\n"
+
+
+class LLMSummarizer(Summarizer):
+    """Суммаризация транскрипций совместимой с LangChain чат моделью"""
+
+    def __init__(
+            self,
+            llm: BaseChatModel,
+            map_prompt: str = MAP_PROMPT,
+            reduce_prompt: str = REDUCE_PROMPT,
+    ) -> None:
+        self._map_chain = ChatPromptTemplate.from_template(map_prompt) | llm | StrOutputParser()
+        self._reduce_chain = (
+            ChatPromptTemplate.from_template(reduce_prompt) | llm | StrOutputParser()
+        )
+
+    async def summarize(self, text: str) -> str:
+        return await self._map_chain.ainvoke({"text": text})
+
+    async def combine(self, summaries: list[str]) -> str:
+        return await self._reduce_chain.ainvoke({"text": SUMMARIES_SEPARATOR.join(summaries)})
+
+
+class FoundationModelSummarizer(Summarizer):
+    """Суммаризация транскрипций моделью Foundation Models API.
+    Параллельность и частота вызовов ограничиваются клиентом.
+    """
+
+    def __init__(
+            self,
+            client: AsyncFoundationModelClient,
+            map_prompt: str = MAP_PROMPT,
+            reduce_prompt: str = REDUCE_PROMPT,
+    ) -> None:
+        self._client = client
+        self._map_prompt = map_prompt
+        self._reduce_prompt = reduce_prompt
+
+    async def _complete(self, prompt: str) -> str:
+        result = await self._client.completion([Message(role="user", text=prompt)])
+        return result.text
+
+    async def summarize(self, text: str) -> str:
+        return await self._complete(self._map_prompt.format(text=text))
+
+    async def combine(self, summaries: list[str]) -> str:
+        return await self._complete(
+            self._reduce_prompt.format(text=SUMMARIES_SEPARATOR.join(summaries))
+        )
+
+
+class TracedSummarizer(Summarizer):
+    """Спан и замер `stage_seconds{stage="llm"}` на каждый вызов модели"""
+
+    def __init__(self, summarizer: Summarizer, telemetry: Telemetry) -> None:
+        self._summarizer = summarizer
+        self._telemetry = telemetry
+
+    async def summarize(self, text: str) -> str:
+        with self._telemetry.stage("llm", operation="map", input_chars=len(text)):
+            return await self._summarizer.summarize(text)
+
+    async def combine(self, summaries: list[str]) -> str:
+        with self._telemetry.stage("llm", operation="reduce", summaries=len(summaries)):
+            return await self._summarizer.combine(summaries)
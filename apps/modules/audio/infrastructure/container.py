@@ -0,0 +1,16 @@
+from datetime import timedelta
+
+from dishka import Provider, Scope, provide
+
+from config.dev import settings
+
+from ..application import ProgressStore
+from .progress import RedisProgressStore
+
+
+class AudioProvider(Provider):
+    @provide(scope=Scope.APP)
+    def provide_progress_store(self) -> ProgressStore:  # noqa: PLR6301
+        return RedisProgressStore(
+            url=settings.redis.url, ttl=timedelta(hours=settings.progress.ttl_hours)
+        )
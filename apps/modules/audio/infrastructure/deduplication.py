@@ -0,0 +1,76 @@
+from datetime import timedelta
+
+from redis import RedisError
+from redis.asyncio import Redis
+
+from modules.shared_kernel.application.exceptions import CacheHitError, CacheSetError
+
+from ..application import RecordTranscriptStore, TranscribedSegment
+
+SPLIT_FIELD = "split"
+
+
+class RedisRecordTranscriptStore(RecordTranscriptStore):
+    """Транскрипции записей в Redis hash `<prefix>:<content_hash>`:
+    поле `<длительность>:<число сегментов>:<номер сегмента>` - JSON сегмента,
+    поле `split` - разбиение (`<длительность>:<число сегментов>`) последнего сохранения.
+
+    Длительность сегментов зависит от коллекции, поэтому одна и та же запись
+    в разных коллекциях разбивается по-разному: сегменты разных разбиений
+    (даже с одинаковым числом сегментов) хранятся под своими полями и не смешиваются.
+    """
+
+    def __init__(self, redis: Redis, ttl: timedelta, prefix: str = "record-transcript") -> None:
+        self.redis = redis
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def _build_key(self, content_hash: str) -> str:
+        return f"{self.prefix}:{content_hash}"
+
+    async def get(self, content_hash: str) -> list[TranscribedSegment] | None:
+        key = self._build_key(content_hash)
+        try:
+            async with self.redis.pipeline(transaction=False) as pipeline:
+                pipeline.hgetall(key)
+                (data,) = await pipeline.execute()
+        except RedisError as e:
+            raise CacheHitError(key=key, original_error=e) from e
+        split = data.pop(SPLIT_FIELD.encode(), None)
+        if split is None:
+            return None
+        split_prefix = split + b":"
+        segments = [
+            TranscribedSegment.model_validate_json(value)
+            for field, value in data.items()
+            if field.startswith(split_prefix)
+        ]
+        _, segments_count = split.split(b":")
+        if len(segments) < int(segments_count):
+            return None
+        return sorted(segments, key=lambda segment: segment.segment_id)
+
+    async def save(
+            self,
+            content_hash: str,
+            chunk_duration: int,
+            segments_count: int,
+            segment: TranscribedSegment,
+    ) -> None:
+        key = self._build_key(content_hash)
+        split = f"{chunk_duration}:{segments_count}"
+        try:
+            async with self.redis.pipeline(transaction=True) as pipeline:
+                pipeline.hset(
+                    key,
+                    mapping={
+                        SPLIT_FIELD: split,
+                        f"{split}:{segment.segment_id}": segment.model_dump_json(),
+                    },
+                )
+                pipeline.expire(key, self.ttl)
+                await pipeline.execute()
+        except RedisError as e:
+            raise CacheSetError(
+                key=key, value={"segment_id": segment.segment_id}, original_error=e
+            ) from e
@@ -15,7 +15,10 @@ import aiofiles
 from ...application import AudioSplitter
 from ...application.exceptions import AudioSplittingError
 from ...domain import AudioFormat, AudioSegment
-from ...utils.audio import get_audio_info
+from ...utils.audio import extract_audio_info
+from ...utils.resampling import ENHANCEMENT_PROFILE, AudioProfile
+from ...utils.segmentation import SegmentationPlanner
+from ...utils.vad import SilenceTrimmer, TimeMap
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +38,14 @@ class FFMpegAudioSplitter(AudioSplitter):
     - Поддержка перекрытия сегментов (overlap)
     - Очистка временных файлов после обработки
     - Асинхронная обработка для эффективной работы с I/O
+    - Обрезка тишины (`silence_trimmer`): длинные паузы сжимаются, сегменты
+      режутся в паузах, в метаданные сегмента пишется `time_map` для перевода
+      таймкодов транскрипции во время исходной записи (перекрытие не используется)
+    - Адаптивные границы (`segment_planner`): запись делится на сегменты
+      равной длины не длиннее `segment_duration`, границы сдвигаются в
+      ближайшие паузы, в метаданные сегмента пишется `time_map`
+      (перекрытие не используется). Вместе с `silence_trimmer` границы
+      планируются по записи со сжатыми паузами
 
     Example:
         >>> splitter = FFMpegAudioSplitter(
@@ -60,6 +71,9 @@ class FFMpegAudioSplitter(AudioSplitter):
             segment_format: AudioFormat = AudioFormat.WAV,
             temp_dir: Path | None = None,
             prefix: str | float | UUID = "",
+            silence_trimmer: SilenceTrimmer | None = None,
+            segment_planner: SegmentationPlanner | None = None,
+            profile: AudioProfile = ENHANCEMENT_PROFILE,
     ) -> None:
         """
         :param segment_duration: Продолжительность сегмента в секундах
@@ -67,6 +81,10 @@ class FFMpegAudioSplitter(AudioSplitter):
         :param segment_format: Формат сегмента
         :param temp_dir: Директория для временных файлов обработки, по умолчанию текущая
         :param prefix: Уникальный префикс для временных файлов
+        :param silence_trimmer: Обрезка тишины (сегменты всегда в WAV)
+        :param segment_planner: Планировщик границ сегментов по паузам (сегменты всегда
+        в WAV), вместе с `silence_trimmer` делит запись со сжатыми паузами
+        :param profile: Частота дискретизации и количество каналов сегментов
         """
 
         super().__init__(
@@ -76,12 +94,46 @@ class FFMpegAudioSplitter(AudioSplitter):
         )
         self._temp_dir = temp_dir
         self._prefix = prefix or uuid4()
+        self._silence_trimmer = silence_trimmer
+        self._segment_planner = segment_planner
+        self._profile = profile
 
     @property
     def _ffmpeg_output_pattern(self) -> str:
         """Паттерн для выходных сегментов FFMpeg"""
         return f"{self._prefix}_segment_%03d.{self._segment_format}"
 
+    @property
+    def _decoded_path(self) -> Path:
+        """Путь до декодированной записи для обрезки тишины и планирования границ"""
+        return Path(self._temp_dir or ".") / f"{self._prefix}_decoded.wav"
+
+    @property
+    def _trimmed_path(self) -> Path:
+        """Путь до записи со сжатыми паузами для планирования границ"""
+        return Path(self._temp_dir or ".") / f"{self._prefix}_trimmed.wav"
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        try:
+            os.unlink(path)
+            logger.debug("File %s unlinked successfully", path)
+        except OSError:
+            logger.exception("Error occurred while unlinking file %s", path)
+
+    def _output_args(self) -> list[str]:
+        if self._silence_trimmer is not None or self._segment_planner is not None:
+            return ["-f", "wav", f"{self._decoded_path}"]
+        return [
+            "-f",
+            "segment",
+            "-segment_time",
+            f"{self._segment_duration}",
+            "-reset_timestamps",
+            "1",
+            self._ffmpeg_output_pattern,
+        ]
+
     @asynccontextmanager
     async def _ffmpeg_pipe(self, input_path: Path):
         """Создание асинхронного процесса для потоковой работы с FFMpeg.
@@ -94,21 +146,15 @@ class FFMpegAudioSplitter(AudioSplitter):
             "-y",  # Перезапись выхода
             "-i",
             f"{input_path}",
-            "-f",
-            "segment",
-            "-segment_time",
-            f"{self._segment_duration}",
             "-c:a",
             "pcm_s16le",  # Кодирование в WAV (PCM 16-bit)
             "-ac",
-            "2",  # 2 канала (стерео)
+            f"{self._profile.channels}",
             "-ar",
-            "44100",  # Частота дискретизации 44.1 kHz
-            "-reset_timestamps",
-            "1",
+            f"{self._profile.samplerate}",
             "-map",
             "0:a",  # Только аудио
-            self._ffmpeg_output_pattern,
+            *self._output_args(),
         ]
         logger.info("FFmpeg launch command: %s", " ".join(ffmpeg_command))
         process = await asyncio.create_subprocess_exec(
@@ -158,7 +204,7 @@ class FFMpegAudioSplitter(AudioSplitter):
             ),
         )
         for index, filepath in enumerate(files):
-            audioinfo = get_audio_info(Path(filepath))
+            audioinfo = extract_audio_info(Path(filepath))
             async with aiofiles.open(filepath, mode="rb") as file:
                 content = await file.read()
             yield AudioSegment(
@@ -178,6 +224,75 @@ class FFMpegAudioSplitter(AudioSplitter):
             except OSError:
                 logger.exception("Error occurred while unlinking file %s", filepath)
 
+    async def _iter_trimmed_segments(
+            self, trimmer: SilenceTrimmer, metadata: dict[str, Any] | None = None
+    ) -> AsyncIterator[AudioSegment]:
+        metadata = metadata or {}
+        path = self._decoded_path
+        # Анализ и сборка сегментов - CPU работа, выполняется вне event loop
+        speech_map = await asyncio.to_thread(trimmer.analyze, path)
+        plans = trimmer.plan(speech_map, self._segment_duration)
+        if not plans:
+            logger.warning("No speech detected in %s", path)
+        for index, regions in enumerate(plans):
+            segment = await asyncio.to_thread(trimmer.render, path, speech_map, regions)
+            yield AudioSegment(
+                number=index + 1,
+                total_count=len(plans),
+                content=segment.content,
+                format=AudioFormat.WAV,
+                size=len(segment.content),
+                duration=max(1, round(segment.duration)),
+                samplerate=segment.samplerate,
+                channels=segment.channels,
+                metadata={**metadata, "time_map": segment.time_map.to_list()},
+            )
+        self._unlink(path)
+
+    async def _trim(self, trimmer: SilenceTrimmer) -> tuple[Path, TimeMap]:
+        """Сжатие пауз декодированной записи перед планированием границ"""
+
+        path = self._decoded_path
+        speech_map = await asyncio.to_thread(trimmer.analyze, path)
+        trimmed_path = self._trimmed_path
+        time_map = await asyncio.to_thread(trimmer.trim, path, trimmed_path, speech_map)
+        self._unlink(path)
+        return trimmed_path, time_map
+
+    async def _iter_planned_segments(
+            self,
+            planner: SegmentationPlanner,
+            metadata: dict[str, Any] | None = None,
+            trimmer: SilenceTrimmer | None = None,
+    ) -> AsyncIterator[AudioSegment]:
+        metadata = metadata or {}
+        path, trimmed_time_map = self._decoded_path, None
+        if trimmer is not None:
+            path, trimmed_time_map = await self._trim(trimmer)
+        intervals = await asyncio.to_thread(planner.plan, path, self._segment_duration)
+        if not intervals:
+            logger.warning("No audio to split in %s", path)
+        for index, (start, end) in enumerate(intervals):
+            segment = await asyncio.to_thread(planner.render, path, start, end)
+            # Время сегмента -> время записи со сжатыми паузами -> время исходной записи
+            time_map = (
+                segment.time_map
+                if trimmed_time_map is None
+                else trimmed_time_map.slice(segment.start, segment.start + segment.duration)
+            )
+            yield AudioSegment(
+                number=index + 1,
+                total_count=len(intervals),
+                content=segment.content,
+                format=AudioFormat.WAV,
+                size=len(segment.content),
+                duration=max(1, round(segment.duration)),
+                samplerate=segment.samplerate,
+                channels=segment.channels,
+                metadata={**metadata, "time_map": time_map.to_list()},
+            )
+        self._unlink(path)
+
     async def split_stream(
             self, stream: AsyncIterable[bytes], metadata: dict[str, Any] | None = None
     ) -> AsyncIterator[AudioSegment]:
@@ -195,7 +310,15 @@ class FFMpegAudioSplitter(AudioSplitter):
                 error_message = stderr.decode()
                 logger.error("FFmpeg process failed with error: %s", error_message)
                 raise AudioSplittingError(f"FFmpeg process failed with error: {error_message}")
-            async for segment in self._iter_segments(metadata):
+            if self._segment_planner is not None:
+                segments = self._iter_planned_segments(
+                    self._segment_planner, metadata, trimmer=self._silence_trimmer
+                )
+            elif self._silence_trimmer is not None:
+                segments = self._iter_trimmed_segments(self._silence_trimmer, metadata)
+            else:
+                segments = self._iter_segments(metadata)
+            async for segment in segments:
                 yield segment
         try:
             os.unlink(input_path)
@@ -0,0 +1,153 @@
+from typing import Any, Final
+
+import contextlib
+import json
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from faststream.rabbit import ExchangeType, RabbitExchange, RabbitQueue
+from redis import RedisError
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+
+from modules.chat.infrastructure.fastapi.connection_managers import InMemoryConnectionManager
+from modules.shared_kernel.application.exceptions import CacheHitError, CacheSetError
+from modules.shared_kernel.utils import current_datetime
+
+from ..application import PipelineStage, ProgressNotifier, ProgressStore, TaskProgress
+from ..domain import (
+    AudioSplitEvent,
+    AudioTranscribedEvent,
+    PipelineEvent,
+    SoundEnhancedEvent,
+)
+
+# Воркеры публикуют события конвейера в fanout exchange,
+# сервис прогресса читает их из собственной очереди не мешая основному потоку
+PROGRESS_EXCHANGE: Final[RabbitExchange] = RabbitExchange(
+    "pipeline_progress", type=ExchangeType.FANOUT, durable=True
+)
+PROGRESS_QUEUE: Final[RabbitQueue] = RabbitQueue("pipeline_progress", durable=True)
+# Счётчики сегментов в порядке полей `TaskProgress`
+COUNTERS: Final[tuple[str, ...]] = ("segments_enhanced", "segments_transcribed")
+
+
+def progress_channel(task_id: UUID) -> str:
+    return f"progress:{task_id}:updates"
+
+
+def _counter_for(event: SoundEnhancedEvent | AudioTranscribedEvent) -> str:
+    if isinstance(event, SoundEnhancedEvent):
+        return "segments_enhanced"
+    return "segments_transcribed"
+
+
+class RedisProgressStore(ProgressStore):
+    """Прогресс задачи в Redis hash `<prefix>:<task_id>` и множествах сегментов.
+    Счётчик сегмента - мощность множества `<prefix>:<task_id>:<counter>` обработанных
+    сегментов (нумерация сегментов своя у каждой записи, поэтому элемент включает
+    `record_id`): отметка события и увеличение счётчика - одна команда `SADD`,
+    повторная доставка из RabbitMQ не увеличивает счётчики даже после сбоя.
+    Общее количество сегментов коллекции берётся только из `AudioSplitEvent`,
+    в событиях сегментов `segments_count` - количество сегментов записи.
+    """
+
+    def __init__(self, url: str, ttl: timedelta, prefix: str = "progress") -> None:
+        self.redis = Redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def _build_key(self, task_id: UUID) -> str:
+        return f"{self.prefix}:{task_id}"
+
+    @staticmethod
+    def _to_progress(
+            task_id: UUID, data: dict[Any, Any], segments_enhanced: int, segments_transcribed: int
+    ) -> TaskProgress:
+        total = data.get(b"segments_total")
+        return TaskProgress(
+            task_id=task_id,
+            user_id=UUID(data[b"user_id"].decode()),
+            segments_total=int(total) if total is not None else None,
+            segments_enhanced=segments_enhanced,
+            segments_transcribed=segments_transcribed,
+            updated_at=datetime.fromisoformat(data[b"updated_at"].decode()),
+        )
+
+    def _queue_apply(self, pipeline: Pipeline, key: str, event: PipelineEvent) -> None:
+        """Команды транзакции учёта события, результат - состояние задачи и счётчики"""
+
+        pipeline.hsetnx(key, "user_id", str(event.user_id))
+        pipeline.hset(key, "updated_at", current_datetime().isoformat())
+        if isinstance(event, AudioSplitEvent):
+            pipeline.hset(key, "segments_total", event.segments_count)
+        else:
+            pipeline.sadd(f"{key}:{_counter_for(event)}", f"{event.record_id}:{event.segment_id}")
+        for name in (key, *(f"{key}:{counter}" for counter in COUNTERS)):
+            pipeline.expire(name, self.ttl)
+        self._queue_read(pipeline, key)
+
+    @staticmethod
+    def _queue_read(pipeline: Pipeline, key: str) -> None:
+        pipeline.hgetall(key)
+        for counter in COUNTERS:
+            pipeline.scard(f"{key}:{counter}")
+
+    async def apply(self, event: PipelineEvent) -> TaskProgress:
+        key = self._build_key(event.task_id)
+        try:
+            async with self.redis.pipeline(transaction=True) as pipeline:
+                self._queue_apply(pipeline, key, event)
+                *_, data, enhanced, transcribed = await pipeline.execute()
+        except RedisError as e:
+            raise CacheSetError(
+                key=key, value={"event": type(event).__name__}, original_error=e
+            ) from e
+        return self._to_progress(event.task_id, data, enhanced, transcribed)
+
+    async def get(self, task_id: UUID) -> TaskProgress | None:
+        key = self._build_key(task_id)
+        try:
+            async with self.redis.pipeline(transaction=True) as pipeline:
+                self._queue_read(pipeline, key)
+                data, enhanced, transcribed = await pipeline.execute()
+        except RedisError as e:
+            raise CacheHitError(key=key, original_error=e) from e
+        return self._to_progress(task_id, data, enhanced, transcribed) if data else None
+
+    async def updates(self, task_id: UUID) -> AsyncIterator[str]:
+        pubsub = self.redis.pubsub()
+        # Подписка до чтения состояния, чтобы не пропустить обновления между ними
+        await pubsub.subscribe(progress_channel(task_id))
+        try:
+            progress = await self.get(task_id)
+            if progress is not None:
+                yield json.dumps(progress.to_event(), default=str)
+                if progress.stage == PipelineStage.COMPLETED:
+                    return
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                data = message["data"].decode("utf-8")
+                yield data
+                if json.loads(data)["stage"] == PipelineStage.COMPLETED:
+                    return
+        finally:
+            with contextlib.suppress(RedisError):
+                await pubsub.aclose()
+
+
+class RedisProgressNotifier(ProgressNotifier):
+    """Доставка прогресса в WebSocket топик пользователя и в канал задачи для SSE"""
+
+    def __init__(self, redis: Redis, connection_manager: InMemoryConnectionManager) -> None:
+        self.redis = redis
+        self.connection_manager = connection_manager
+
+    async def notify(self, progress: TaskProgress) -> None:
+        event = progress.to_event()
+        await self.connection_manager.send_to_user(progress.user_id, event)
+        await self.redis.publish(
+            progress_channel(progress.task_id), json.dumps(event, default=str)
+        )
@@ -0,0 +1,141 @@
+from typing import Any
+
+from collections.abc import Sequence
+from datetime import timedelta
+from uuid import UUID
+
+from redis import RedisError
+from redis.asyncio import Redis
+
+from modules.shared_kernel.application.exceptions import CacheHitError, CacheSetError
+
+from ..application import PartialSummaryStore, SummaryCache
+from ..domain import AudioSplitEvent
+
+
+class RedisPartialSummaryStore(PartialSummaryStore):
+    """Саммари сегментов в Redis hash `<prefix>:<task_id>` (поле - `<record_id>:<segment_id>`),
+    разбиение коллекции - в ключе `<prefix>:<task_id>:split`.
+    Состояние общее для всех реплик воркера, reduce захватывается ключом
+    `<prefix>:<task_id>:reduce` с ограниченным временем жизни.
+    """
+
+    def __init__(
+            self,
+            url: str,
+            ttl: timedelta,
+            reduce_timeout: timedelta,
+            prefix: str = "summary",
+    ) -> None:
+        self.redis = Redis.from_url(url)
+        self.ttl = ttl
+        self.reduce_timeout = reduce_timeout
+        self.prefix = prefix
+
+    def _build_key(self, task_id: UUID) -> str:
+        return f"{self.prefix}:{task_id}"
+
+    @staticmethod
+    def _build_field(record_id: UUID, segment_id: int) -> str:
+        return f"{record_id}:{segment_id}"
+
+    async def contains(self, task_id: UUID, record_id: UUID, segment_id: int) -> bool:
+        key = self._build_key(task_id)
+        try:
+            return bool(await self.redis.hexists(key, self._build_field(record_id, segment_id)))
+        except RedisError as e:
+            raise CacheHitError(key=key, original_error=e) from e
+
+    async def save(self, task_id: UUID, record_id: UUID, segment_id: int, summary: str) -> int:
+        key = self._build_key(task_id)
+        try:
+            async with self.redis.pipeline(transaction=True) as pipeline:
+                pipeline.hsetnx(key, self._build_field(record_id, segment_id), summary)
+                pipeline.expire(key, self.ttl)
+                pipeline.hlen(key)
+                *_, mapped = await pipeline.execute()
+        except RedisError as e:
+            raise CacheSetError(
+                key=key, value={"record_id": record_id, "segment_id": segment_id}, original_error=e
+            ) from e
+        return mapped
+
+    async def count(self, task_id: UUID) -> int:
+        key = self._build_key(task_id)
+        try:
+            return await self.redis.hlen(key)
+        except RedisError as e:
+            raise CacheHitError(key=key, original_error=e) from e
+
+    async def get_all(self, task_id: UUID, record_ids: Sequence[UUID]) -> list[str]:
+        key = self._build_key(task_id)
+        try:
+            data: dict[Any, Any] = await self.redis.hgetall(key)
+        except RedisError as e:
+            raise CacheHitError(key=key, original_error=e) from e
+        positions = {f"{record_id}": position for position, record_id in enumerate(record_ids)}
+
+        def order(field: bytes) -> tuple[int, int]:
+            record_id, _, segment_id = field.decode().rpartition(":")
+            return positions.get(record_id, len(positions)), int(segment_id)
+
+        return [data[field].decode() for field in sorted(data, key=order)]
+
+    async def save_split(self, event: AudioSplitEvent) -> None:
+        key = f"{self._build_key(event.task_id)}:split"
+        try:
+            await self.redis.set(key, event.model_dump_json(), ex=self.ttl)
+        except RedisError as e:
+            raise CacheSetError(
+                key=key, value={"segments_count": event.segments_count}, original_error=e
+            ) from e
+
+    async def get_split(self, task_id: UUID) -> AudioSplitEvent | None:
+        key = f"{self._build_key(task_id)}:split"
+        try:
+            data = await self.redis.get(key)
+        except RedisError as e:
+            raise CacheHitError(key=key, original_error=e) from e
+        return AudioSplitEvent.model_validate_json(data) if data is not None else None
+
+    async def claim(self, task_id: UUID) -> bool:
+        key = f"{self._build_key(task_id)}:reduce"
+        try:
+            return bool(await self.redis.set(key, 1, nx=True, ex=self.reduce_timeout))
+        except RedisError as e:
+            raise CacheSetError(key=key, value={}, original_error=e) from e
+
+    async def release(self, task_id: UUID) -> None:
+        await self.redis.delete(f"{self._build_key(task_id)}:reduce")
+
+    async def clear(self, task_id: UUID) -> None:
+        # Захват reduce остаётся до истечения, чтобы повторная доставка не повторила reduce
+        key = self._build_key(task_id)
+        await self.redis.delete(key, f"{key}:split")
+
+
+class RedisSummaryCache(SummaryCache):
+    """Результаты вызовов модели в Redis (ключ `<prefix>:<stage>:<sha256>`).
+    Кэш общий для реплик воркера: повторная попытка задачи на другом узле
+    не повторяет уже выполненные вызовы.
+    """
+
+    def __init__(self, redis: Redis, ttl: timedelta, prefix: str = "summary-cache") -> None:
+        self.redis = redis
+        self.ttl = ttl
+        self.prefix = prefix
+
+    async def get(self, key: str) -> str | None:
+        key = f"{self.prefix}:{key}"
+        try:
+            summary = await self.redis.get(key)
+        except RedisError as e:
+            raise CacheHitError(key=key, original_error=e) from e
+        return summary.decode() if isinstance(summary, bytes) else summary
+
+    async def set(self, key: str, summary: str) -> None:
+        key = f"{self.prefix}:{key}"
+        try:
+            await self.redis.set(key, summary, ex=self.ttl)
+        except RedisError as e:
+            raise CacheSetError(key=key, value={"summary": summary}, original_error=e) from e
@@ -0,0 +1,69 @@
+from typing import Final, get_args
+
+import json
+import logging
+import zlib
+from datetime import timedelta
+
+from redis import RedisError
+from redis.asyncio import Redis
+
+from salute_speech.models import Emotion, RecognizedSpeech, RecognizedSpeechList
+
+from ..application import TranscriptionCache
+
+logger = logging.getLogger(__name__)
+
+EMOTIONS: Final[tuple[Emotion, ...]] = get_args(Emotion)
+
+
+def pack_speech(speech: RecognizedSpeechList) -> bytes:
+    """Компактное представление: сжатый JSON массив `[текст, спикер, индекс эмоции]`"""
+
+    rows = [
+        [
+            item.text,
+            item.speaker,
+            None if item.emotion is None else EMOTIONS.index(item.emotion),
+        ]
+        for item in speech
+    ]
+    return zlib.compress(json.dumps(rows, ensure_ascii=False, separators=(",", ":")).encode())
+
+
+def unpack_speech(data: bytes) -> RecognizedSpeechList:
+    return RecognizedSpeechList(
+        RecognizedSpeech(
+            text=text, speaker=speaker, emotion=None if emotion is None else EMOTIONS[emotion]
+        )
+        for text, speaker, emotion in json.loads(zlib.decompress(data))
+    )
+
+
+class RedisTranscriptionCache(TranscriptionCache):
+    """Результаты распознавания в Redis (ключ `<prefix>:<fingerprint>`).
+    При недоступности Redis чтение считается промахом: сегмент распознаётся заново,
+    а ошибка записи только логируется - распознанный результат не теряется.
+    """
+
+    def __init__(self, redis: Redis, ttl: timedelta, prefix: str = "stt-cache") -> None:
+        self.redis = redis
+        self.ttl = ttl
+        self.prefix = prefix
+
+    async def get(self, fingerprint: str) -> RecognizedSpeechList | None:
+        key = f"{self.prefix}:{fingerprint}"
+        try:
+            data = await self.redis.get(key)
+        except RedisError:
+            logger.warning("Transcription cache is unavailable, key %s", key, exc_info=True)
+            return None
+        # Клиент Redis без `decode_responses`: значение - сжатые байты
+        return unpack_speech(data) if isinstance(data, bytes) else None
+
+    async def set(self, fingerprint: str, speech: RecognizedSpeechList) -> None:
+        key = f"{self.prefix}:{fingerprint}"
+        try:
+            await self.redis.set(key, pack_speech(speech), ex=self.ttl)
+        except RedisError:
+            logger.warning("Failed to cache transcription, key %s", key, exc_info=True)
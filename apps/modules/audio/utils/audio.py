@@ -9,6 +9,7 @@ import soundfile as sf
 from pedalboard import Compressor, Gain, LowShelfFilter, NoiseGate, Pedalboard
 
 from ..domain import AudioFormat, UnsupportedAudioError
+from .resampling import AudioProfile, conform
 
 
 class AudioInfo(TypedDict):
@@ -41,16 +42,19 @@ def extract_audio_info(filepath: Path) -> AudioInfo:
     }
 
 
-def enhance_sound_quality(audio: bytes, output_format: AudioFormat = "wav") -> tuple[bytes, int]:
+def enhance_sound_quality(
+        audio: bytes, output_format: AudioFormat = "wav", profile: AudioProfile | None = None
+) -> tuple[bytes, AudioProfile]:
     """Улучшение качества звука используя технологии Spotify.
 
     :param audio: Байты аудио записи.
     :param output_format: Формат аудио на выходе, после обработки (по умолчанию WAV).
-    :returns: Байты обработанной аудио записи + частота дискретизации.
+    :param profile: Частота дискретизации и каналы на выходе (по умолчанию как на входе).
+    :returns: Байты обработанной аудио записи + её частота дискретизации и каналы.
     """
 
     with io.BytesIO(audio) as stream:
-        content, samplerate = sf.read(stream)
+        content, samplerate = sf.read(stream, dtype="float32", always_2d=True)
     board = Pedalboard([
         NoiseGate(threshold_db=-30, ratio=1.5, release_ms=250),
         Compressor(threshold_db=-16, ratio=4, attack_ms=5, release_ms=100),
@@ -58,7 +62,9 @@ def enhance_sound_quality(audio: bytes, output_format: AudioFormat = "wav") -> t
         Gain(gain_db=2)
     ])
     effected = board(content, samplerate)
-    with io.BytesIO(effected) as stream:
-        sf.write(stream, content, samplerate, format=output_format)
-        stream.seek(0)
-        return stream.read(), samplerate
+    if profile is not None:
+        effected = conform(effected, samplerate, profile)
+        samplerate = profile.samplerate
+    with io.BytesIO() as stream:
+        sf.write(stream, effected, samplerate, format=output_format)
+        return stream.getvalue(), AudioProfile(samplerate=samplerate, channels=effected.shape[1])
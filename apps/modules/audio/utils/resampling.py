@@ -0,0 +1,128 @@
+from typing import Final
+
+import io
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import numpy.typing as npt
+import soundfile as sf
+
+PCM_SAMPLE_WIDTH: Final[int] = 2  # Байт на сэмпл PCM 16-bit
+
+
+@dataclass(frozen=True, slots=True)
+class AudioProfile:
+    """Целевой формат аудио (PCM 16-bit) этапа конвейера.
+
+    Attributes:
+        samplerate: Частота дискретизации.
+        channels: Количество каналов.
+    """
+
+    samplerate: int
+    channels: int
+
+    @property
+    def bytes_per_second(self) -> int:
+        return self.samplerate * self.channels * PCM_SAMPLE_WIDTH
+
+
+# Улучшение звука работает с исходным качеством записи
+ENHANCEMENT_PROFILE: Final[AudioProfile] = AudioProfile(samplerate=44100, channels=2)
+# SaluteSpeech распознаёт речь в 16 kHz моно, всё сверх этого - лишний трафик
+RECOGNITION_PROFILE: Final[AudioProfile] = AudioProfile(samplerate=16000, channels=1)
+
+
+@lru_cache(maxsize=16)
+def _filter_bank(
+        up: int, down: int, half_taps: int, rolloff: float, beta: float
+) -> tuple[npt.NDArray[np.float32], npt.NDArray[np.int64], int]:
+    """Полифазный банк фильтров (windowed sinc с окном Кайзера) для `up/down`.
+
+    :returns: Банк формы (up, 2 * width), смещения фаз во входных сэмплах,
+    полуширина фильтра `width` во входных сэмплах.
+    """
+
+    cutoff = min(1, up / down) * rolloff  # Доля частоты Найквиста входного сигнала
+    width = math.ceil(half_taps / cutoff)
+    positions = np.arange(up) * down
+    offsets = positions // up
+    fractions = (positions % up) / up
+    # Расстояние от момента выходного сэмпла до входных сэмплов окна
+    distance = fractions[:, None] - np.arange(-width + 1, width + 1)[None, :]
+    window = np.i0(beta * np.sqrt(np.clip(1 - (distance / width) ** 2, 0, None))) / np.i0(beta)
+    bank = cutoff * np.sinc(cutoff * distance) * window
+    return bank.astype(np.float32), offsets.astype(np.int64), width
+
+
+def resample(
+        samples: npt.NDArray[np.floating],
+        source_rate: int,
+        target_rate: int,
+        half_taps: int = 16,
+        rolloff: float = 0.95,
+        beta: float = 8.6,
+) -> npt.NDArray[np.float32]:
+    """Передискретизация сигнала формы (n, channels) полифазным фильтром.
+
+    Коэффициент `target_rate / source_rate` сокращается до `up/down`,
+    выходные сэмплы одной фазы - свёртка прореженного окна входа с одним
+    фильтром банка (одно матричное умножение на фазу, без промежуточного
+    сигнала с частотой `source_rate * up`). Полоса пропускания -
+    `rolloff` от частоты Найквиста меньшей из частот.
+
+    :param half_taps: Количество нулей sinc с каждой стороны фильтра (качество/скорость).
+    """
+
+    samples = np.asarray(samples, dtype=np.float32)
+    if source_rate == target_rate or not len(samples):
+        return samples
+    divisor = math.gcd(source_rate, target_rate)
+    up, down = target_rate // divisor, source_rate // divisor
+    bank, offsets, width = _filter_bank(up, down, half_taps, rolloff, beta)
+    total = math.ceil(len(samples) * up / down)
+    padded = np.pad(samples, ((width, width + down), (0, 0)))
+    output = np.empty((total, samples.shape[1]), dtype=np.float32)
+    for channel in range(samples.shape[1]):
+        windows = np.lib.stride_tricks.sliding_window_view(padded[:, channel], 2 * width)
+        for phase in range(min(up, total)):
+            count = len(range(phase, total, up))
+            start = offsets[phase] + 1
+            output[phase::up, channel] = windows[start:start + count * down:down] @ bank[phase]
+    return output
+
+
+def remix(samples: npt.NDArray[np.floating], channels: int) -> npt.NDArray[np.floating]:
+    """Сведение сигнала формы (n, channels) к заданному количеству каналов"""
+
+    if samples.shape[1] == channels:
+        return samples
+    if channels == 1:
+        return samples.mean(axis=1, keepdims=True)
+    # Из моно (или другой раскладки) - одинаковый сигнал во всех каналах
+    return np.repeat(samples.mean(axis=1, keepdims=True), channels, axis=1)
+
+
+def conform(
+        samples: npt.NDArray[np.floating], samplerate: int, profile: AudioProfile
+) -> npt.NDArray[np.float32]:
+    """Приведение сигнала к профилю: сведение каналов до передискретизации
+    (фильтруется меньше каналов)
+    """
+
+    return resample(remix(samples, profile.channels), samplerate, profile.samplerate)
+
+
+def convert(content: bytes, profile: AudioProfile) -> bytes:
+    """Приведение аудио файла к профилю, результат - WAV (PCM 16-bit)"""
+
+    with io.BytesIO(content) as stream:
+        samples, samplerate = sf.read(stream, dtype="float32", always_2d=True)
+    with io.BytesIO() as stream:
+        sf.write(
+            stream, conform(samples, samplerate, profile), profile.samplerate,
+            format="WAV", subtype="PCM_16",
+        )
+        return stream.getvalue()
@@ -0,0 +1,205 @@
+import io
+import itertools
+import logging
+import math
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+import soundfile as sf
+
+from .vad import FRAMES_PER_BLOCK, TimeMap, frame_energy_db
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class Envelope:
+    """Огибающая энергии записи низкого разрешения.
+
+    Attributes:
+        samplerate: Частота дискретизации записи.
+        frame_length: Длина фрейма огибающей в сэмплах.
+        energy_db: Энергия (RMS, dBFS) фреймов.
+    """
+
+    samplerate: int
+    frame_length: int
+    energy_db: npt.NDArray[np.float32]
+
+    @property
+    def frame_duration(self) -> float:
+        return self.frame_length / self.samplerate
+
+    @property
+    def total_duration(self) -> float:
+        return len(self.energy_db) * self.frame_duration
+
+
+@dataclass(frozen=True, slots=True)
+class PlannedSegment:
+    """Сегмент записи по плану разбиения.
+
+    Attributes:
+        content: WAV (PCM 16-bit).
+        start: Начало сегмента в записи (в секундах).
+        duration: Продолжительность в секундах.
+        samplerate: Частота дискретизации.
+        channels: Количество каналов.
+    """
+
+    content: bytes
+    start: float
+    duration: float
+    samplerate: int
+    channels: int
+
+    @property
+    def time_map(self) -> TimeMap:
+        return TimeMap(
+            output_starts=np.zeros(1, dtype=np.float64),
+            source_starts=np.full(1, self.start, dtype=np.float64),
+        )
+
+
+def balanced_segment_duration(
+        total_duration: float,
+        record_count: int,
+        min_duration: int,
+        max_duration: int,
+        parallelism: int,
+) -> int:
+    """Целевая продолжительность сегмента для коллекции записей.
+
+    Коллекция делится примерно на `parallelism` сегментов (в пределах
+    `[min_duration, max_duration]`), затем длительность подгоняется так,
+    чтобы запись средней продолжительности делилась на равные сегменты
+    без короткого "хвоста".
+    """
+
+    if total_duration <= 0 or record_count <= 0:
+        return max_duration
+    duration = min(max(total_duration / parallelism, min_duration), max_duration)
+    record_duration = total_duration / record_count
+    segments_per_record = max(1, round(record_duration / duration))
+    return min(max(math.ceil(record_duration / segments_per_record), min_duration), max_duration)
+
+
+class SegmentationPlanner:
+    """Адаптивное разбиение записи на сегменты по паузам.
+
+    Огибающая энергии (фреймы `frame_ms`) считается векторно за один проход
+    по файлу и сглаживается окном `smoothing_ms`, чтобы рез приходился
+    на середину паузы, а не на тихий фрейм внутри слова. Запись делится на
+    минимальное количество сегментов равной длины (с запасом на окно поиска),
+    каждая граница ищется в окне `±search_window` секунд вокруг идеальной: выбирается самый
+    тихий фрейм со штрафом `distance_penalty_db` за удаление от идеальной
+    границы. Сегменты не длиннее `segment_duration`, перекрытие не требуется.
+    """
+
+    def __init__(
+            self,
+            frame_ms: int = 50,
+            smoothing_ms: int = 300,
+            search_window: float = 30,
+            distance_penalty_db: float = 6,
+    ) -> None:
+        self.frame_ms = frame_ms
+        self.smoothing_ms = smoothing_ms
+        self.search_window = search_window
+        self.distance_penalty_db = distance_penalty_db
+
+    def envelope(self, path: Path) -> Envelope:
+        """Огибающая энергии файла без загрузки целиком в память"""
+
+        info = sf.info(str(path))
+        frame_length = info.samplerate * self.frame_ms // 1000
+        energy = [
+            frame_energy_db(block.mean(axis=1), frame_length)
+            for block in sf.blocks(
+                str(path),
+                blocksize=frame_length * FRAMES_PER_BLOCK,
+                dtype="float32",
+                always_2d=True,
+            )
+        ]
+        return Envelope(
+            samplerate=info.samplerate,
+            frame_length=frame_length,
+            energy_db=np.concatenate(energy) if energy else np.empty(0, dtype=np.float32),
+        )
+
+    def _smooth(self, energy_db: npt.NDArray[np.float32]) -> npt.NDArray[np.float64]:
+        width = max(1, round(self.smoothing_ms / self.frame_ms))
+        if width == 1 or len(energy_db) < width:
+            return energy_db.astype(np.float64)
+        # Скользящее среднее через накопленную сумму, выравнивание по центру окна
+        cumsum = np.cumsum(np.pad(energy_db.astype(np.float64), (1, 0)))
+        smoothed = (cumsum[width:] - cumsum[:-width]) / width
+        pad = width - 1
+        return np.pad(smoothed, (pad // 2, pad - pad // 2), mode="edge")
+
+    def cut_points(self, envelope: Envelope, segment_duration: float) -> npt.NDArray[np.int64]:
+        """Границы сегментов в фреймах огибающей (без начала и конца записи)"""
+
+        total_frames = len(envelope.energy_db)
+        max_frames = max(1, math.floor(segment_duration / envelope.frame_duration))
+        search_window = min(self.search_window, segment_duration / 4)
+        window = max(1, round(search_window / envelope.frame_duration))
+        # Запас на окно поиска: граница может сдвинуться вперёд без превышения максимума
+        count = math.ceil(total_frames / max(1, max_frames - window))
+        if count <= 1:
+            return np.empty(0, dtype=np.int64)
+        energy = self._smooth(envelope.energy_db)
+        cuts: list[int] = []
+        previous = 0
+        for index in range(1, count):
+            remaining = count - index
+            ideal = previous + (total_frames - previous) / (remaining + 1)
+            # Сегмент не длиннее максимума, оставшаяся часть помещается в `remaining` сегментов
+            low = max(
+                previous + 1, math.floor(ideal - window), total_frames - remaining * max_frames
+            )
+            high = min(previous + max_frames, math.ceil(ideal + window), total_frames - 1)
+            if low > high:
+                low = high = min(previous + max_frames, total_frames - 1)
+            candidates = np.arange(low, high + 1)
+            penalty = self.distance_penalty_db * np.abs(candidates - ideal) / window
+            previous = int(candidates[np.argmin(energy[candidates] + penalty)])
+            cuts.append(previous)
+        return np.asarray(cuts, dtype=np.int64)
+
+    def plan(self, path: Path, segment_duration: float) -> list[tuple[float, float]]:
+        """Интервалы сегментов `(начало, конец)` в секундах"""
+
+        envelope = self.envelope(path)
+        cuts = self.cut_points(envelope, segment_duration)
+        frame_duration = envelope.frame_duration
+        bounds = [0.0, *(cuts * frame_duration).tolist(), envelope.total_duration]
+        intervals = [(start, end) for start, end in itertools.pairwise(bounds) if end > start]
+        logger.info(
+            "Planned %s segments for %.0f sec: %s", len(intervals), envelope.total_duration,
+            ", ".join(f"{end - start:.0f}" for start, end in intervals),
+        )
+        return intervals
+
+    @staticmethod
+    def render(path: Path, start: float, end: float) -> PlannedSegment:
+        """Чтение интервала записи в отдельный WAV"""
+
+        with sf.SoundFile(str(path)) as file:
+            samplerate, channels = file.samplerate, file.channels
+            first = round(start * samplerate)
+            file.seek(first)
+            audio = file.read(round(end * samplerate) - first, dtype="int16", always_2d=True)
+        with io.BytesIO() as buffer:
+            sf.write(buffer, audio, samplerate, format="WAV", subtype="PCM_16")
+            content = buffer.getvalue()
+        return PlannedSegment(
+            content=content,
+            start=first / samplerate,
+            duration=len(audio) / samplerate,
+            samplerate=samplerate,
+            channels=channels,
+        )
@@ -0,0 +1,335 @@
+from typing import Final, Self
+
+import io
+import itertools
+import logging
+import math
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+import soundfile as sf
+
+logger = logging.getLogger(__name__)
+
+SILENCE_FLOOR_DB: Final[float] = -100.0  # Энергия цифровой тишины (вместо -inf)
+FRAMES_PER_BLOCK: Final[int] = 2000  # Фреймов на блок чтения файла при анализе энергии
+
+
+@dataclass(frozen=True, slots=True)
+class TimeMap:
+    """Соответствие времени обрезанного аудио времени исходной записи.
+
+    Отрезок `i` обрезанного аудио начинается на `output_starts[i]` секунде
+    и соответствует записи с `source_starts[i]` секунды (время внутри отрезка
+    течёт одинаково, тишина между отрезками сжата).
+    """
+
+    output_starts: npt.NDArray[np.float64]
+    source_starts: npt.NDArray[np.float64]
+
+    def to_source(self, seconds: float | npt.ArrayLike) -> float | npt.NDArray[np.float64]:
+        """Перевод времени обрезанного аудио (например, таймкодов транскрипции) во время записи"""
+
+        times = np.asarray(seconds, dtype=np.float64)
+        index = np.clip(np.searchsorted(self.output_starts, times, side="right") - 1, 0, None)
+        source = self.source_starts[index] + (times - self.output_starts[index])
+        return float(source) if source.ndim == 0 else source
+
+    def slice(self, start: float, end: float) -> Self:
+        """Соответствие для отрезка `[start, end)` обрезанного аудио
+        (время отрезка отсчитывается от его начала)
+        """
+
+        inside = (self.output_starts > start) & (self.output_starts < end)
+        return type(self)(
+            output_starts=np.insert(self.output_starts[inside] - start, 0, 0.0),
+            source_starts=np.insert(self.source_starts[inside], 0, self.to_source(start)),
+        )
+
+    def to_list(self) -> list[list[float]]:
+        """Представление для передачи в метаданных сегмента"""
+
+        return np.column_stack((self.output_starts, self.source_starts)).round(3).tolist()
+
+    @classmethod
+    def from_list(cls, items: list[list[float]]) -> Self:
+        pairs = np.asarray(items, dtype=np.float64).reshape(-1, 2)
+        return cls(output_starts=pairs[:, 0], source_starts=pairs[:, 1])
+
+
+@dataclass(frozen=True, slots=True)
+class SpeechMap:
+    """Результат анализа записи.
+
+    Attributes:
+        samplerate: Частота дискретизации записи.
+        frame_length: Длина фрейма анализа в сэмплах.
+        energy_db: Энергия фреймов (dBFS).
+        threshold_db: Порог речи (dBFS).
+        regions: Интервалы речи `[начало, конец)` в фреймах, массив формы (n, 2).
+    """
+
+    samplerate: int
+    frame_length: int
+    energy_db: npt.NDArray[np.float32]
+    threshold_db: float
+    regions: npt.NDArray[np.int64]
+
+    @property
+    def frame_duration(self) -> float:
+        return self.frame_length / self.samplerate
+
+    @property
+    def total_duration(self) -> float:
+        return len(self.energy_db) * self.frame_duration
+
+    @property
+    def speech_duration(self) -> float:
+        return float(np.sum(self.regions[:, 1] - self.regions[:, 0])) * self.frame_duration
+
+
+@dataclass(frozen=True, slots=True)
+class TrimmedSegment:
+    """Сегмент обрезанного аудио.
+
+    Attributes:
+        content: WAV (PCM 16-bit) без длинных пауз.
+        duration: Продолжительность в секундах.
+        samplerate: Частота дискретизации.
+        channels: Количество каналов.
+        time_map: Соответствие времени сегмента времени исходной записи.
+    """
+
+    content: bytes
+    duration: float
+    samplerate: int
+    channels: int
+    time_map: TimeMap
+
+
+def frame_energy_db(
+        samples: npt.NDArray[np.floating], frame_length: int
+) -> npt.NDArray[np.float32]:
+    """Энергия (средний квадрат, dBFS) последовательных фреймов моно сигнала.
+    Неполный последний фрейм дополняется нулями.
+    """
+
+    padding = -len(samples) % frame_length
+    if padding:
+        samples = np.pad(samples, (0, padding))
+    frames = samples.reshape(-1, frame_length)
+    power = np.einsum("ij,ij->i", frames, frames, dtype=np.float64) / frame_length
+    with np.errstate(divide="ignore"):
+        energy = 10 * np.log10(power)
+    return np.maximum(energy, SILENCE_FLOOR_DB).astype(np.float32)
+
+
+def find_speech_regions(
+        mask: npt.NDArray[np.bool_],
+        min_speech_frames: int,
+        min_silence_frames: int,
+        padding_frames: int,
+) -> npt.NDArray[np.int64]:
+    """Интервалы речи по маске фреймов `[начало, конец)`, массив формы (n, 2).
+
+    Короткие всплески (щелчки) отбрасываются, интервалы расширяются на
+    `padding_frames`, паузы короче `min_silence_frames` не разрывают речь.
+    """
+
+    edges = np.flatnonzero(np.diff(mask.astype(np.int8), prepend=0, append=0))
+    starts, ends = edges[0::2], edges[1::2]
+    keep = ends - starts >= min_speech_frames
+    starts, ends = starts[keep], ends[keep]
+    if not len(starts):
+        return np.empty((0, 2), dtype=np.int64)
+    starts = np.maximum(starts - padding_frames, 0)
+    ends = np.minimum(ends + padding_frames, len(mask))
+    # Интервал начинается там, где пауза перед ним достаточно длинная
+    breaks = starts[1:] - ends[:-1] >= min_silence_frames
+    return np.column_stack((
+        np.concatenate(([starts[0]], starts[1:][breaks])),
+        np.concatenate((ends[:-1][breaks], [ends[-1]])),
+    )).astype(np.int64)
+
+
+class SilenceTrimmer:
+    """Обрезка тишины по энергии сигнала (energy-based VAD) перед транскрибацией.
+
+    Анализ - один проход по файлу блоками: энергия фреймов `frame_ms`
+    считается векторно, порог речи подбирается по уровню шума записи
+    (`noise_percentile` + `threshold_margin_db`), если не задан явно.
+    Паузы длиннее `min_silence_ms` сжимаются до `max_silence_ms`,
+    сегменты режутся в паузах, а не посреди фразы.
+    """
+
+    def __init__(
+            self,
+            frame_ms: int = 30,
+            threshold_db: float | None = None,
+            threshold_margin_db: float = 12,
+            noise_percentile: float = 10,
+            min_speech_ms: int = 120,
+            min_silence_ms: int = 600,
+            padding_ms: int = 150,
+            max_silence_ms: int = 300,
+    ) -> None:
+        if max_silence_ms > min_silence_ms:
+            raise ValueError("max_silence_ms must not exceed min_silence_ms")
+        self.frame_ms = frame_ms
+        self.threshold_db = threshold_db
+        self.threshold_margin_db = threshold_margin_db
+        self.noise_percentile = noise_percentile
+        self.min_speech_ms = min_speech_ms
+        self.min_silence_ms = min_silence_ms
+        self.padding_ms = padding_ms
+        self.max_silence_ms = max_silence_ms
+
+    def _frames(self, milliseconds: int) -> int:
+        return max(1, round(milliseconds / self.frame_ms))
+
+    def _threshold(self, energy_db: npt.NDArray[np.float32]) -> float:
+        if self.threshold_db is not None:
+            return self.threshold_db
+        noise_db, loud_db = np.percentile(energy_db, [self.noise_percentile, 95])
+        # Запись без пауз: порог не должен подниматься до уровня речи
+        return float(min(noise_db + self.threshold_margin_db, loud_db - self.threshold_margin_db))
+
+    def detect(self, energy_db: npt.NDArray[np.float32], samplerate: int) -> SpeechMap:
+        """Поиск речи по энергии фреймов"""
+
+        threshold_db = self._threshold(energy_db) if len(energy_db) else SILENCE_FLOOR_DB
+        regions = find_speech_regions(
+            energy_db > threshold_db,
+            min_speech_frames=self._frames(self.min_speech_ms),
+            min_silence_frames=self._frames(self.min_silence_ms),
+            padding_frames=self._frames(self.padding_ms),
+        )
+        return SpeechMap(
+            samplerate=samplerate,
+            frame_length=samplerate * self.frame_ms // 1000,
+            energy_db=energy_db,
+            threshold_db=threshold_db,
+            regions=regions,
+        )
+
+    def analyze(self, path: Path) -> SpeechMap:
+        """Анализ файла без загрузки целиком в память"""
+
+        info = sf.info(str(path))
+        frame_length = info.samplerate * self.frame_ms // 1000
+        energy = [
+            frame_energy_db(block.mean(axis=1), frame_length)
+            for block in sf.blocks(
+                str(path),
+                blocksize=frame_length * FRAMES_PER_BLOCK,
+                dtype="float32",
+                always_2d=True,
+            )
+        ]
+        energy_db = np.concatenate(energy) if energy else np.empty(0, dtype=np.float32)
+        speech_map = self.detect(energy_db, info.samplerate)
+        logger.info(
+            "Speech detected: %.0f of %.0f sec (threshold %.1f dBFS, %s regions)",
+            speech_map.speech_duration, speech_map.total_duration,
+            speech_map.threshold_db, len(speech_map.regions),
+        )
+        return speech_map
+
+    def plan(self, speech_map: SpeechMap, segment_duration: float) -> list[npt.NDArray[np.int64]]:
+        """Группировка интервалов речи в сегменты не длиннее `segment_duration`
+        (с учётом сжатых пауз). Сегмент режется в паузе между интервалами,
+        интервал речи длиннее сегмента режется на равные части.
+        """
+
+        frame_duration = speech_map.frame_duration
+        max_frames = max(1, math.floor(segment_duration / frame_duration))
+        gap_frames = self._frames(self.max_silence_ms)
+        regions: list[tuple[int, int]] = []
+        for start, end in speech_map.regions.tolist():
+            parts = math.ceil((end - start) / max_frames)
+            bounds = np.linspace(start, end, parts + 1).round().astype(int).tolist()
+            regions.extend(itertools.pairwise(bounds))
+
+        segments: list[npt.NDArray[np.int64]] = []
+        current: list[tuple[int, int]] = []
+        length = 0
+        for start, end in regions:
+            added = end - start + (gap_frames if current else 0)
+            if current and length + added > max_frames:
+                segments.append(np.asarray(current, dtype=np.int64))
+                current, length, added = [], 0, end - start
+            current.append((start, end))
+            length += added
+        if current:
+            segments.append(np.asarray(current, dtype=np.int64))
+        return segments
+
+    def trim(self, path: Path, output_path: Path, speech_map: SpeechMap) -> TimeMap:
+        """Запись всей речи файла со сжатыми паузами в `output_path` (WAV, PCM 16-bit)
+        по одному интервалу за раз, без загрузки файла целиком в память
+        """
+
+        samplerate = speech_map.samplerate
+        frame_length = speech_map.frame_length
+        gap = samplerate * self.max_silence_ms // 1000
+        output_starts: list[int] = []
+        source_starts: list[int] = []
+        position = 0
+        with sf.SoundFile(str(path)) as file, sf.SoundFile(
+                str(output_path), "w", samplerate, file.channels, "PCM_16", format="WAV"
+        ) as output:
+            for index, (start, end) in enumerate(speech_map.regions.tolist()):
+                if index:
+                    output.write(np.zeros((gap, file.channels), dtype=np.int16))
+                    position += gap
+                file.seek(start * frame_length)
+                piece = file.read((end - start) * frame_length, dtype="int16", always_2d=True)
+                output_starts.append(position)
+                source_starts.append(start * frame_length)
+                output.write(piece)
+                position += len(piece)
+        return TimeMap(
+            output_starts=np.asarray(output_starts, dtype=np.float64) / samplerate,
+            source_starts=np.asarray(source_starts, dtype=np.float64) / samplerate,
+        )
+
+    def render(
+            self, path: Path, speech_map: SpeechMap, regions: npt.NDArray[np.int64]
+    ) -> TrimmedSegment:
+        """Сборка сегмента из интервалов речи со сжатыми паузами между ними"""
+
+        samplerate = speech_map.samplerate
+        frame_length = speech_map.frame_length
+        gap = samplerate * self.max_silence_ms // 1000
+        with sf.SoundFile(str(path)) as file:
+            channels = file.channels
+            pieces: list[npt.NDArray[np.int16]] = []
+            output_starts: list[int] = []
+            source_starts: list[int] = []
+            position = 0
+            for index, (start, end) in enumerate(regions.tolist()):
+                if index:
+                    pieces.append(np.zeros((gap, channels), dtype=np.int16))
+                    position += gap
+                file.seek(start * frame_length)
+                piece = file.read((end - start) * frame_length, dtype="int16", always_2d=True)
+                output_starts.append(position)
+                source_starts.append(start * frame_length)
+                pieces.append(piece)
+                position += len(piece)
+        audio = np.concatenate(pieces) if pieces else np.zeros((0, channels), dtype=np.int16)
+        with io.BytesIO() as buffer:
+            sf.write(buffer, audio, samplerate, format="WAV", subtype="PCM_16")
+            content = buffer.getvalue()
+        return TrimmedSegment(
+            content=content,
+            duration=len(audio) / samplerate,
+            samplerate=samplerate,
+            channels=channels,
+            time_map=TimeMap(
+                output_starts=np.asarray(output_starts, dtype=np.float64) / samplerate,
+                source_starts=np.asarray(source_starts, dtype=np.float64) / samplerate,
+            ),
+        )
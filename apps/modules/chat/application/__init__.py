@@ -1,5 +1,9 @@
 __all__ = (
+    "ChatNotifier",
     "ChatRepository",
+    "SendMessageUseCase",
 )
 
+from .notifier import ChatNotifier
 from .repository import ChatRepository
+from .usecases import SendMessageUseCase
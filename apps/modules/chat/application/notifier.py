@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+from ..domain import Message
+
+
+class ChatNotifier(ABC):
+    """Доставка новых сообщений чата подключённым клиентам (WebSocket)"""
+
+    @abstractmethod
+    async def notify(self, message: Message) -> None: ...
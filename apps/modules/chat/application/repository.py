@@ -1,14 +1,15 @@
 from abc import abstractmethod
 from uuid import UUID
 
-from modules.shared_kernel.application import CRUDRepository
+from modules.shared_kernel.application import CRUDRepository, Pagination
 
 from ..domain import Chat, Message
 
 
 class ChatRepository(CRUDRepository[Chat]):
     @abstractmethod
-    async def get_by_user(self, user_id: UUID) -> list[Chat]: ...
+    async def get_by_user(self, user_id: UUID, pagination: Pagination) -> list[Chat]:
+        """Чаты пользователя от старых к новым (keyset пагинация по курсору)"""
 
     @abstractmethod
     async def add_messages(self, messages: list[Message]) -> None: ...
@@ -1,10 +1,39 @@
+from uuid import UUID
+
+from modules.shared_kernel.application import UnitOfWork
+from modules.shared_kernel.application.exceptions import NotFoundError
+
 from ..domain import Chat, Message
+from ..domain.commands import SendMessageCommand
+from .notifier import ChatNotifier
 from .repository import ChatRepository
 
 
 class SendMessageUseCase:
-    def __init__(self, chat_repository: ChatRepository) -> None:
+    def __init__(
+            self, uow: UnitOfWork, chat_repository: ChatRepository, notifier: ChatNotifier
+    ) -> None:
+        self._uow = uow
         self._chat_repository = chat_repository
+        self._notifier = notifier
 
-    async def execute(self, message: Message) -> ...:
-        ...
+    async def execute(self, user_id: UUID, command: SendMessageCommand) -> Message:
+        async with self._uow.transactional() as uow:
+            chat = await self._chat_repository.read(command.chat_id, conversation_length=0)
+            if chat is None or chat.user_id != user_id:
+                raise NotFoundError(
+                    f"Chat {command.chat_id} not found",
+                    entity_name=Chat.__name__,
+                    details={"chat_id": command.chat_id},
+                )
+            message = Message(
+                chat_id=chat.id,
+                role=command.role,
+                text=command.text,
+                attachments=command.attachments,
+            )
+            await self._chat_repository.add_messages([message])
+            await uow.commit()
+        # Рассылка после фиксации: клиенты не получат сообщение, которого нет в БД
+        await self._notifier.notify(message)
+        return message
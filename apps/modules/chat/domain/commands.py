@@ -1,5 +1,7 @@
 from uuid import UUID
 
+from pydantic import Field
+
 from modules.shared_kernel.domain import Command
 
 from .value_objects import MessageRole
@@ -11,4 +13,4 @@ class SendMessageCommand(Command):
     chat_id: UUID
     role: MessageRole = MessageRole.USER
     text: str
-    attachments: list[...]
+    attachments: list[UUID] = Field(default_factory=list)
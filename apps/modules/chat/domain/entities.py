@@ -2,7 +2,7 @@ from typing import Any, Self
 
 from uuid import UUID
 
-from pydantic import Field, PositiveInt, computed_field, model_validator
+from pydantic import Field, NonNegativeInt, computed_field, model_validator
 
 from modules.shared_kernel.domain import AggregateRoot, CustomListPrimitive, Entity
 
@@ -44,16 +44,16 @@ class Conversation(CustomListPrimitive[Message]):
 class Chat(AggregateRoot):
     user_id: UUID
     title: str
-    messages_count: PositiveInt
+    messages_count: NonNegativeInt
     conversation: Conversation = Field(default_factory=list)
 
     @computed_field(description="Количество сообщений в текущем диалоге")
-    def conversation_length(self) -> PositiveInt:
+    def conversation_length(self) -> NonNegativeInt:
         return len(self.conversation)
 
     @model_validator(mode="after")
     def _validate_invariant(self) -> Self:
-        ...
+        return self
 
     @classmethod
     def create(cls, user_id: UUID, title: str) -> Self: ...
@@ -0,0 +1,24 @@
+from dishka import Provider, Scope, provide
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from modules.shared_kernel.application import UnitOfWork
+
+from ..application import ChatNotifier, ChatRepository, SendMessageUseCase
+from .database import SQLAlchemyChatRepository
+from .fastapi import SocketChatNotifier, connection_manager
+
+
+class ChatProvider(Provider):
+    @provide(scope=Scope.REQUEST)
+    def provide_chat_repo(self, session: AsyncSession) -> ChatRepository:  # noqa: PLR6301
+        return SQLAlchemyChatRepository(session)
+
+    @provide(scope=Scope.APP)
+    def provide_chat_notifier(self) -> ChatNotifier:  # noqa: PLR6301
+        return SocketChatNotifier(connection_manager)
+
+    @provide(scope=Scope.REQUEST)
+    def provide_send_message_usecase(  # noqa: PLR6301
+            self, uow: UnitOfWork, chat_repo: ChatRepository, notifier: ChatNotifier
+    ) -> SendMessageUseCase:
+        return SendMessageUseCase(uow=uow, chat_repository=chat_repo, notifier=notifier)
@@ -0,0 +1,8 @@
+__all__ = (
+    "ChatModel",
+    "MessageModel",
+    "SQLAlchemyChatRepository",
+)
+
+from .models import ChatModel, MessageModel
+from .repository import SQLAlchemyChatRepository
@@ -1,7 +1,7 @@
 from uuid import UUID
 
-from sqlalchemy import ForeignKey
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import ForeignKey, Index, func, select
+from sqlalchemy.orm import Mapped, column_property, declared_attr, mapped_column, relationship
 
 from modules.shared_kernel.insrastructure.database import (
     Base,
@@ -19,10 +19,16 @@ class MessageModel(Base):
     role: Mapped[str]
     text: Mapped[TextNull]
     attachments: Mapped[UUIDArray]
-    metadata: Mapped[JsonField]
+    # `metadata` зарезервирован декларативным API SQLAlchemy
+    metadata_: Mapped[JsonField] = mapped_column("metadata")
 
     chat: Mapped["ChatModel"] = relationship(back_populates="messages")
 
+    __table_args__ = (
+        # Последние сообщения диалога и их количество в чате
+        Index("ix_messages_chat_id_created_at_id", "chat_id", "created_at", "id"),
+    )
+
 
 class ChatModel(Base):
     __tablename__ = "chats"
@@ -30,3 +36,16 @@ class ChatModel(Base):
     user_id: Mapped[UUIDField]
     title: Mapped[str]
     messages: Mapped[list["MessageModel"]] = relationship(back_populates="chat")
+
+    @declared_attr
+    def messages_count(cls) -> Mapped[int]:
+        return column_property(
+            select(func.count(MessageModel.id))
+            .where(MessageModel.chat_id == cls.id)
+            .correlate_except(MessageModel)
+            .scalar_subquery()
+        )
+
+    __table_args__ = (
+        Index("ix_chats_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
@@ -5,23 +5,120 @@ from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 
-from modules.shared_kernel.application.exceptions import ReadingError
-from modules.shared_kernel.insrastructure.database import SQLAlchemyRepository
+from modules.shared_kernel.application import Pagination
+from modules.shared_kernel.application.exceptions import CreationError, ReadingError
+from modules.shared_kernel.insrastructure.database import (
+    DataMapper,
+    SQLAlchemyRepository,
+    paginate,
+)
 
-from ...domain import Chat
-from .models import ChatModel
+from ...application import ChatRepository
+from ...domain import Chat, Message
+from ...domain.entities import Conversation
+from .models import ChatModel, MessageModel
 
+DEFAULT_CONVERSATION_LENGTH = 10  # Количество последних сообщений, загружаемых с чатом
 
-class SQLAlchemyChatRepository(SQLAlchemyRepository[..., ...], ...):
+
+class ChatDataMapper(DataMapper[Chat, ChatModel]):
+    @classmethod
+    def model_to_entity(cls, model: ChatModel) -> Chat:
+        return Chat.model_validate({
+            "id": model.id,
+            "user_id": model.user_id,
+            "title": model.title,
+            "messages_count": model.messages_count,
+            "created_at": model.created_at,
+        })
+
+    @classmethod
+    def entity_to_model(cls, entity: Chat) -> ChatModel:
+        return ChatModel(
+            id=entity.id,
+            user_id=entity.user_id,
+            title=entity.title,
+            created_at=entity.created_at,
+        )
+
+
+class MessageDataMapper(DataMapper[Message, MessageModel]):
+    @classmethod
+    def model_to_entity(cls, model: MessageModel) -> Message:
+        return Message.model_validate({
+            "id": model.id,
+            "chat_id": model.chat_id,
+            "role": model.role,
+            "text": model.text,
+            "attachments": model.attachments,
+            "metadata": model.metadata_,
+            "created_at": model.created_at,
+        })
+
+    @classmethod
+    def entity_to_model(cls, entity: Message) -> MessageModel:
+        return MessageModel(
+            id=entity.id,
+            chat_id=entity.chat_id,
+            role=entity.role,
+            text=entity.text,
+            attachments=entity.attachments,
+            metadata_=entity.metadata,
+            created_at=entity.created_at,
+        )
+
+
+class SQLAlchemyChatRepository(SQLAlchemyRepository[Chat, ChatModel], ChatRepository):
     entity = Chat
     model = ChatModel
+    data_mapper = ChatDataMapper
 
     @override
-    async def read(self, id: UUID, **kwargs) -> Chat:
-        conversation_length = kwargs.pop("conversation_length", 10)
+    async def read(self, id: UUID, **kwargs) -> Chat | None:
+        """Чат с последними `conversation_length` сообщениями текущего диалога"""
+
+        conversation_length = kwargs.pop("conversation_length", DEFAULT_CONVERSATION_LENGTH)
         try:
-            stmt = select(self.model).where(self.model.id == id)
+            model = await self.session.scalar(select(self.model).where(self.model.id == id))
+            if model is None:
+                return None
+            stmt = (
+                select(MessageModel)
+                .where(MessageModel.chat_id == id)
+                .order_by(MessageModel.created_at.desc(), MessageModel.id.desc())
+                .limit(conversation_length)
+            )
+            messages = (await self.session.scalars(stmt)).all()
         except SQLAlchemyError as e:
             raise ReadingError(
-                entity_name=self.entity.__class__.__name__, entity_id=id
+                entity_name=self.entity.__name__, entity_id=id, original_error=e
             ) from e
+        chat = self.data_mapper.model_to_entity(model)
+        chat.conversation = Conversation(
+            MessageDataMapper.models_to_entities(reversed(messages))
+        )
+        return chat
+
+    async def get_by_user(self, user_id: UUID, pagination: Pagination) -> list[Chat]:
+        try:
+            stmt = paginate(
+                select(self.model).where(self.model.user_id == user_id),
+                pagination,
+                self.model.created_at,
+                self.model.id,
+            )
+            results = await self.session.execute(stmt)
+            return self.data_mapper.models_to_entities(results.scalars().all())
+        except SQLAlchemyError as e:
+            raise ReadingError(
+                entity_name=self.entity.__name__, entity_id=user_id, original_error=e
+            ) from e
+
+    async def add_messages(self, messages: list[Message]) -> None:
+        try:
+            self.session.add_all(
+                MessageDataMapper.entity_to_model(message) for message in messages
+            )
+            await self.session.flush()
+        except SQLAlchemyError as e:
+            raise CreationError(entity_name=Message.__name__, original_error=e) from e
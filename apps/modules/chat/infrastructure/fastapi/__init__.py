@@ -0,0 +1,7 @@
+__all__ = (
+    "SocketChatNotifier",
+    "connection_manager",
+)
+
+from .dependencies import connection_manager
+from .notifier import SocketChatNotifier
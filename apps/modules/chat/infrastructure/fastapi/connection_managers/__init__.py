@@ -0,0 +1,17 @@
+__all__ = (
+    "ConnectionStats",
+    "InMemoryConnectionManager",
+    "RedisConnectionManager",
+    "SocketConnection",
+    "chat_topic",
+    "user_topic",
+)
+
+from .in_memory import (
+    ConnectionStats,
+    InMemoryConnectionManager,
+    SocketConnection,
+    chat_topic,
+    user_topic,
+)
+from .redis import RedisConnectionManager
@@ -0,0 +1,251 @@
+from typing import Any
+
+import asyncio
+import contextlib
+import json
+import logging
+from collections.abc import Collection, Iterable
+from dataclasses import dataclass
+from datetime import timedelta
+from uuid import UUID, uuid4
+
+from fastapi import WebSocket, WebSocketDisconnect, status
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+def user_topic(user_id: UUID) -> str:
+    return f"user:{user_id}"
+
+
+def chat_topic(chat_id: UUID) -> str:
+    return f"chat:{chat_id}"
+
+
+def serialize_event(event: BaseModel | dict[str, Any]) -> str:
+    """Сериализация события (выполняется один раз для всех получателей)"""
+
+    if isinstance(event, BaseModel):
+        return event.model_dump_json()
+    return json.dumps(event, default=str, ensure_ascii=False)
+
+
+class SocketConnection:
+    """Подключённый сокет с ограниченной исходящей очередью.
+    Отдельная задача отправляет накопленные события пачками: один кадр - JSON массив событий.
+    """
+
+    def __init__(
+            self,
+            websocket: WebSocket,
+            user_id: UUID,
+            queue_size: int,
+            batch_size: int,
+            send_timeout: timedelta,
+    ) -> None:
+        self.id = uuid4()
+        self.websocket = websocket
+        self.user_id = user_id
+        self.topics: set[str] = set()
+        self.batch_size = batch_size
+        self.send_timeout = send_timeout.total_seconds()
+        self.events_sent = 0
+        self.frames_sent = 0
+        self.closed = False
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
+        self._sender: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        self._sender = asyncio.create_task(self._send_loop())
+
+    def enqueue(self, payload: str) -> bool:
+        """Постановка события в очередь без ожидания.
+        `False` - очередь переполнена (медленный клиент) или сокет закрыт.
+        """
+
+        if self.closed:
+            return False
+        try:
+            self._queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def _send_batch(self) -> None:
+        """Отправка накопленных событий одним кадром"""
+
+        batch = [await self._queue.get()]
+        while len(batch) < self.batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        async with asyncio.timeout(self.send_timeout):
+            await self.websocket.send_text(f"[{','.join(batch)}]")
+        self.events_sent += len(batch)
+        self.frames_sent += 1
+
+    async def _send_loop(self) -> None:
+        try:
+            while True:
+                await self._send_batch()
+        except TimeoutError:
+            logger.warning("Socket %s send timed out, closing slow consumer", self.id)
+            await self.close(status.WS_1013_TRY_AGAIN_LATER)
+        except (WebSocketDisconnect, RuntimeError):
+            self.closed = True
+
+    async def close(self, code: int = status.WS_1000_NORMAL_CLOSURE) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        await self.shutdown(code)
+
+    async def shutdown(self, code: int) -> None:
+        """Остановка отправки и закрытие сокета (флаг `closed` выставляется вызывающим)"""
+
+        if self._sender is not None and self._sender is not asyncio.current_task():
+            self._sender.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._sender
+        with contextlib.suppress(WebSocketDisconnect, RuntimeError):
+            await self.websocket.close(code)
+
+
+@dataclass(slots=True)
+class ConnectionStats:
+    """Статистика менеджера соединений текущего узла.
+
+    Attributes:
+        connections: Открытые сокеты.
+        published: Опубликованные события.
+        delivered: События, поставленные в очередь локальных сокетов.
+        slow_consumers: Сокеты, закрытые из-за переполнения очереди.
+    """
+
+    connections: int = 0
+    published: int = 0
+    delivered: int = 0
+    slow_consumers: int = 0
+
+
+class InMemoryConnectionManager:
+    """Менеджер WebSocket соединений одного процесса.
+    Сокеты группируются по топикам (`user:<id>`, `chat:<id>`), событие сериализуется
+    один раз и ставится в очереди всех сокетов топика без ожидания отправки.
+    Сокет, не успевающий разбирать очередь, закрывается с кодом 1013 (backpressure).
+    """
+
+    def __init__(
+            self,
+            queue_size: int = 256,
+            batch_size: int = 64,
+            send_timeout: timedelta = timedelta(seconds=5),
+    ) -> None:
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.send_timeout = send_timeout
+        self.stats = ConnectionStats()
+        self._topics: dict[str, set[SocketConnection]] = {}
+        self._connections: set[SocketConnection] = set()
+        self._closing: set[asyncio.Task[None]] = set()
+
+    async def _on_topic_added(self, topic: str) -> None:
+        """Первый локальный подписчик топика"""
+
+    async def _on_topic_removed(self, topic: str) -> None:
+        """Последний локальный подписчик топика отключился"""
+
+    async def connect(
+            self, websocket: WebSocket, user_id: UUID, topics: Iterable[str] = ()
+    ) -> SocketConnection:
+        """Принятие сокета и подписка на события пользователя и топики `topics` (чаты).
+        Сокет регистрируется только после успешной подписки, иначе закрывается с кодом 1011.
+        """
+
+        await websocket.accept()
+        connection = SocketConnection(
+            websocket=websocket,
+            user_id=user_id,
+            queue_size=self.queue_size,
+            batch_size=self.batch_size,
+            send_timeout=self.send_timeout,
+        )
+        try:
+            for topic in (user_topic(user_id), *topics):
+                await self.subscribe(connection, topic)
+        except BaseException:
+            for topic in list(connection.topics):
+                await self.unsubscribe(connection, topic)
+            await connection.close(status.WS_1011_INTERNAL_ERROR)
+            raise
+        self._connections.add(connection)
+        self.stats.connections = len(self._connections)
+        connection.start()
+        return connection
+
+    async def disconnect(self, connection: SocketConnection) -> None:
+        if connection not in self._connections:
+            return
+        self._connections.discard(connection)
+        self.stats.connections = len(self._connections)
+        for topic in list(connection.topics):
+            await self.unsubscribe(connection, topic)
+        await connection.close()
+
+    async def subscribe(self, connection: SocketConnection, topic: str) -> None:
+        if topic not in self._topics:
+            # Топик регистрируется после подписки: при ошибке следующий подписчик повторит её
+            await self._on_topic_added(topic)
+        self._topics.setdefault(topic, set()).add(connection)
+        connection.topics.add(topic)
+
+    async def unsubscribe(self, connection: SocketConnection, topic: str) -> None:
+        connection.topics.discard(topic)
+        subscribers = self._topics.get(topic)
+        if subscribers is None:
+            return
+        subscribers.discard(connection)
+        if not subscribers:
+            del self._topics[topic]
+            await self._on_topic_removed(topic)
+
+    def _deliver_local(self, topic: str | None, payload: str) -> int:
+        """Постановка события в очереди локальных сокетов топика (`None` - всех сокетов)"""
+
+        subscribers: Collection[SocketConnection] = (
+            self._connections if topic is None else self._topics.get(topic, set())
+        )
+        delivered = 0
+        slow: list[SocketConnection] = []
+        for connection in subscribers:
+            if connection.enqueue(payload):
+                delivered += 1
+            elif not connection.closed:
+                slow.append(connection)
+        for connection in slow:
+            logger.warning("Socket %s send queue is full, closing slow consumer", connection.id)
+            self.stats.slow_consumers += 1
+            connection.closed = True
+            # Отписка выполнится в обработчике сокета после разрыва соединения
+            task = asyncio.create_task(connection.shutdown(status.WS_1013_TRY_AGAIN_LATER))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+        self.stats.delivered += delivered
+        return delivered
+
+    async def publish(self, topic: str, event: BaseModel | dict[str, Any]) -> None:
+        self.stats.published += 1
+        self._deliver_local(topic, serialize_event(event))
+
+    async def broadcast(self, event: BaseModel | dict[str, Any]) -> None:
+        self.stats.published += 1
+        self._deliver_local(None, serialize_event(event))
+
+    async def send_to_user(self, user_id: UUID, event: BaseModel | dict[str, Any]) -> None:
+        await self.publish(user_topic(user_id), event)
+
+    async def send_to_chat(self, chat_id: UUID, event: BaseModel | dict[str, Any]) -> None:
+        await self.publish(chat_topic(chat_id), event)
+
+    async def close(self) -> None:
+        for connection in list(self._connections):
+            await self.disconnect(connection)
@@ -0,0 +1,137 @@
+from typing import Any
+
+import asyncio
+import contextlib
+import logging
+from datetime import timedelta
+from uuid import uuid4
+
+from pydantic import BaseModel
+from redis import RedisError
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+
+from .in_memory import InMemoryConnectionManager, serialize_event
+
+logger = logging.getLogger(__name__)
+
+RECONNECT_DELAY = 1  # Задержка перед повторной подпиской на каналы (в секундах)
+
+
+class RedisConnectionManager(InMemoryConnectionManager):
+    """Менеджер WebSocket соединений для нескольких реплик API.
+
+    Сокеты хранятся локально, события рассылаются между узлами через Redis pub/sub:
+    узел подписан только на каналы топиков, у которых есть локальные подписчики,
+    и на общий канал широковещательных событий. Локальные сокеты получают событие
+    сразу, без обращения к Redis.
+    """
+
+    def __init__(
+            self,
+            url: str,
+            prefix: str = "ws",
+            queue_size: int = 256,
+            batch_size: int = 64,
+            send_timeout: timedelta = timedelta(seconds=5),
+    ) -> None:
+        super().__init__(queue_size=queue_size, batch_size=batch_size, send_timeout=send_timeout)
+        self.redis = Redis.from_url(url)
+        self.prefix = prefix
+        self._node_id = uuid4().hex
+        self._broadcast_channel = f"{prefix}:broadcast"
+        self._pubsub: PubSub | None = None
+        self._listener: asyncio.Task[None] | None = None
+        self._subscribe_lock = asyncio.Lock()
+
+    def _build_channel(self, topic: str) -> str:
+        return f"{self.prefix}:{topic}"
+
+    def _channels(self) -> list[str]:
+        return [self._broadcast_channel, *map(self._build_channel, self._topics)]
+
+    async def _ensure_listener(self) -> PubSub:
+        if self._pubsub is not None and self._listener is not None and not self._listener.done():
+            return self._pubsub
+        async with self._subscribe_lock:
+            if self._pubsub is None or self._listener is None or self._listener.done():
+                pubsub = self.redis.pubsub()
+                try:
+                    await pubsub.subscribe(*self._channels())
+                except RedisError:
+                    with contextlib.suppress(RedisError):
+                        await pubsub.aclose()
+                    raise
+                self._pubsub = pubsub
+                self._listener = asyncio.create_task(self._listen(pubsub))
+            return self._pubsub
+
+    async def _listen(self, pubsub: PubSub) -> None:
+        topic_offset = len(self.prefix) + 1
+        try:
+            while True:
+                try:
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        node_id, _, payload = message["data"].decode("utf-8").partition("|")
+                        if node_id == self._node_id:
+                            continue
+                        channel = message["channel"].decode("utf-8")
+                        topic = (
+                            None if channel == self._broadcast_channel
+                            else channel[topic_offset:]
+                        )
+                        self._deliver_local(topic, payload)
+                except RedisError:
+                    logger.exception("Fan-out channels of node %s disconnected", self._node_id)
+                    await asyncio.sleep(RECONNECT_DELAY)
+                    with contextlib.suppress(RedisError):
+                        await pubsub.subscribe(*self._channels())
+        finally:
+            with contextlib.suppress(RedisError):
+                await pubsub.aclose()
+
+    async def _on_topic_added(self, topic: str) -> None:
+        pubsub = await self._ensure_listener()
+        try:
+            await pubsub.subscribe(self._build_channel(topic))
+        except RedisError:
+            # Подписка восстановится вместе с переподключением слушателя
+            logger.exception("Failed to subscribe to topic %s", topic)
+
+    async def _on_topic_removed(self, topic: str) -> None:
+        if self._pubsub is None:
+            return
+        try:
+            await self._pubsub.unsubscribe(self._build_channel(topic))
+        except RedisError:
+            logger.exception("Failed to unsubscribe from topic %s", topic)
+
+    async def _fan_out(self, channel: str, payload: str) -> None:
+        try:
+            await self.redis.publish(channel, f"{self._node_id}|{payload}")
+        except RedisError:
+            logger.exception("Failed to fan out event to channel %s", channel)
+
+    async def publish(self, topic: str, event: BaseModel | dict[str, Any]) -> None:
+        self.stats.published += 1
+        payload = serialize_event(event)
+        self._deliver_local(topic, payload)
+        await self._fan_out(self._build_channel(topic), payload)
+
+    async def broadcast(self, event: BaseModel | dict[str, Any]) -> None:
+        self.stats.published += 1
+        payload = serialize_event(event)
+        self._deliver_local(None, payload)
+        await self._fan_out(self._broadcast_channel, payload)
+
+    async def close(self) -> None:
+        await super().close()
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        self._pubsub = None
+        await self.redis.aclose()
@@ -0,0 +1,25 @@
+from datetime import timedelta
+
+from config.dev import settings
+
+from .connection_managers import InMemoryConnectionManager, RedisConnectionManager
+
+
+def _create_connection_manager() -> InMemoryConnectionManager:
+    queue_size = settings.websocket.send_queue_size
+    batch_size = settings.websocket.batch_size
+    send_timeout = timedelta(seconds=settings.websocket.send_timeout)
+    if settings.websocket.backend == "redis":
+        return RedisConnectionManager(
+            url=settings.redis.url,
+            queue_size=queue_size,
+            batch_size=batch_size,
+            send_timeout=send_timeout,
+        )
+    return InMemoryConnectionManager(
+        queue_size=queue_size, batch_size=batch_size, send_timeout=send_timeout
+    )
+
+
+# Один экземпляр на процесс: хранит сокеты, подключённые к этой реплике
+connection_manager = _create_connection_manager()
@@ -0,0 +1,15 @@
+from ...application import ChatNotifier
+from ...domain import Message
+from .connection_managers import InMemoryConnectionManager
+
+
+class SocketChatNotifier(ChatNotifier):
+    """Рассылка сообщения в WebSocket топик чата (`RedisConnectionManager` - на все реплики)"""
+
+    def __init__(self, connection_manager: InMemoryConnectionManager) -> None:
+        self.connection_manager = connection_manager
+
+    async def notify(self, message: Message) -> None:
+        await self.connection_manager.send_to_chat(
+            message.chat_id, {"type": "chat_message", "message": message.model_dump(mode="json")}
+        )
@@ -1,6 +1,9 @@
 __all__ = (
+    "AccessTokenAuthenticator",
     "CredentialsAuthService",
     "GuestService",
+    "InMemoryRevokedTokens",
+    "RevokedTokens",
     "UserRepository",
     "VKAuthService",
     "verify_token",
@@ -8,3 +11,4 @@ __all__ = (
 
 from .repositories import UserRepository
 from .services import CredentialsAuthService, GuestService, VKAuthService, verify_token
+from .tokens import AccessTokenAuthenticator, InMemoryRevokedTokens, RevokedTokens
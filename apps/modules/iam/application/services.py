@@ -20,8 +20,9 @@ from ..domain import (
 )
 from ..domain.exceptions import InvalidTokenError, TokenExpiredError
 from ..infrastructure.oauth import vk_oauth_client
+from ..infrastructure.oauth.vk import Tokens
 from ..utils.common import expires_at
-from ..utils.security import decode_token, issue_token
+from ..utils.security import decode_token, issue_token, password_hasher
 from .dto import GuestToken, InitiatedOAuthFlow, PKCESession, VKCallback
 from .exceptions import (
     AlreadyRegisteredError,
@@ -69,7 +70,7 @@ def generate_access_token(payload: dict[str, Any]) -> Token:
     """
     expires_in = timedelta(days=settings.jwt.guest_access_token_expires_in_days)
     access_token = issue_token(
-        token_type=TokenType.ACCESS, payload=payload
+        token_type=TokenType.ACCESS, payload=payload, expires_in=expires_in
     )
     return Token(access_token=access_token, expires_at=expires_at(expires_in))
 
@@ -155,7 +156,8 @@ class CredentialsAuthService:
         async with self._uow.transactional() as uow:
             user = await self._repository.get_by_email(credentials.email)
             if user is None:
-                user = User.register_by_credentials(credentials)
+                password_hash = await password_hasher.hash(credentials.password)
+                user = User.register_by_credentials(credentials, password_hash)
                 await self._repository.create(user)
             elif user is not None and not user.is_registration_completed():
                 logger.info(
@@ -184,7 +186,10 @@ class CredentialsAuthService:
                 "Complete registration to continue",
                 details={"provider": "credentials", "email": credentials.email}
             )
-        authed_user = user.authenticate_by_credentials(credentials)
+        password_verified = user.password_hash is not None and await password_hasher.verify(
+            credentials.password, user.password_hash
+        )
+        authed_user = user.authenticate_by_credentials(password_verified)
         payload = authed_user.to_jwt_payload()
         token_pair = generate_token_pair(payload)
         logger.info(
@@ -224,12 +229,12 @@ class VKAuthService:
             authorization_url=auth_data["authorization_url"], pkce_session_id=pkce_session_id
         )
 
-    async def _handle_callback(self, pkce_session_id: str, callback: VKCallback) -> dict[str, Any]:
+    async def _handle_callback(self, pkce_session_id: str, callback: VKCallback) -> Tokens:
         """Обработка callback данных после авторизации пользователя через ВК.
 
         :param pkce_session_id: Идентификатор PKCE сессии.
         :param callback: Callback после авторизации.
-        :returns: Информация об ВК аккаунте пользователя.
+        :returns: Токены ВК аккаунта пользователя.
         :raises InvalidPKCEError - при несоответствии PKCE параметров.
         """
 
@@ -241,16 +246,16 @@ class VKAuthService:
         if pkce_session.state != callback.state:
             await self._cache.invalidate(pkce_session_id)
             raise InvalidPKCEError("Invalid state parameter!")
-        tokens = await vk_oauth_client.get_tokens(
+        return await vk_oauth_client.get_tokens(
             authorization_code=callback.authorization_code,
             code_verifier=pkce_session.code_verifier,
             state=callback.state,
             device_id=callback.device_id,
         )
-        return await vk_oauth_client.get_userinfo(tokens["access_token"])
 
     async def register(self, pkce_session_id: str, callback: VKCallback) -> User:
-        userinfo = await self._handle_callback(pkce_session_id, callback)
+        tokens = await self._handle_callback(pkce_session_id, callback)
+        userinfo = await vk_oauth_client.get_userinfo(tokens["access_token"])
         user_id = userinfo["user_id"]
         async with self._uow.transactional() as uow:
             user = await self._repository.get_by_social_account(AuthProvider.VK, user_id)
@@ -275,18 +280,21 @@ class VKAuthService:
 
     async def authenticate(self, pkce_session_id: str, callback: VKCallback) -> TokenPair:
         """Аутентифицирует пользователя.
+        Идентификатор пользователя ВК приходит вместе с токенами,
+        поэтому информация о пользователе для входа не запрашивается.
 
         :param pkce_session_id: Идентификатор PKCE сессии.
         :param callback: Callback после авторизации через ВК.
         :returns: Пара токенов access + refresh
         """
 
-        userinfo = await self._handle_callback(pkce_session_id, callback)
-        user = await self._repository.get_by_social_account(AuthProvider.VK, userinfo["user_id"])
+        tokens = await self._handle_callback(pkce_session_id, callback)
+        vk_user_id = tokens["user_id"]
+        user = await self._repository.get_by_social_account(AuthProvider.VK, vk_user_id)
         if user is None:
             raise RegistrationRequiredError(
                 "Complete registration to continue",
-                details={"provider": "VK", "user_id": userinfo["user_id"]}
+                details={"provider": "VK", "user_id": vk_user_id}
             )
         payload = user.to_jwt_payload()
         return generate_token_pair(payload)
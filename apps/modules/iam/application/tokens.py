@@ -0,0 +1,186 @@
+import hashlib
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from uuid import UUID
+
+from ..domain import TokenType
+from .dto import CurrentUser
+from .exceptions import UnauthorizedError
+from .services import verify_token
+
+logger = logging.getLogger(__name__)
+
+
+class RevokedTokens(ABC):
+    """Список отозванных токенов (по `jti`)"""
+
+    @abstractmethod
+    async def is_revoked(self, jti: UUID) -> bool:
+        """Был ли отозван токен"""
+
+    @abstractmethod
+    async def revoke(self, jti: UUID, expires_at: float) -> None:
+        """Отзыв токена до момента его истечения (unix timestamp)"""
+
+    async def close(self) -> None:  # noqa: B027
+        """Освобождение ресурсов (подписки, соединения)"""
+
+
+class InMemoryRevokedTokens(RevokedTokens):
+    """Отозванные токены в памяти процесса.
+    Истёкшие записи удаляются при отзыве новых и при проверке: проверяемая запись -
+    сразу, остальные - полным обходом не чаще раза в `PURGE_INTERVAL` секунд.
+    """
+
+    PURGE_INTERVAL = 60
+
+    def __init__(self) -> None:
+        self._revoked: dict[UUID, float] = {}
+        self._purged_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    def _purge_expired(self) -> None:
+        now = time.time()
+        self._purged_at = time.monotonic()
+        for jti in [jti for jti, expires_at in self._revoked.items() if expires_at <= now]:
+            del self._revoked[jti]
+
+    def add(self, jti: UUID, expires_at: float) -> None:
+        self._revoked[jti] = expires_at
+
+    async def is_revoked(self, jti: UUID) -> bool:
+        if time.monotonic() - self._purged_at >= self.PURGE_INTERVAL:
+            self._purge_expired()
+        expires_at = self._revoked.get(jti)
+        if expires_at is None:
+            return False
+        if expires_at <= time.time():
+            # Истёкший токен отклоняется проверкой `exp`, запись больше не нужна
+            del self._revoked[jti]
+            return False
+        return True
+
+    async def revoke(self, jti: UUID, expires_at: float) -> None:
+        self._purge_expired()
+        self.add(jti, expires_at)
+
+
+@dataclass(frozen=True, slots=True)
+class AuthenticatedToken:
+    """Результат проверки access токена"""
+
+    current_user: CurrentUser
+    jti: UUID | None
+    expires_at: float
+
+
+class VerifiedTokensCache:
+    """LRU кеш проверенных токенов.
+    Ключ - SHA-256 от токена (сам токен в памяти не хранится), запись живёт до `exp` токена.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, AuthenticatedToken] = OrderedDict()
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> AuthenticatedToken | None:
+        key = self._digest(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.expires_at <= time.time():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, token: str, entry: AuthenticatedToken) -> None:
+        key = self._digest(token)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def discard(self, token: str) -> None:
+        self._entries.pop(self._digest(token), None)
+
+
+class AccessTokenAuthenticator:
+    """Аутентификация запросов по access токену.
+    Подпись и claims проверяются один раз на токен, далее результат берётся из кеша,
+    на каждом запросе проверяется только отзыв токена по `jti`.
+    """
+
+    def __init__(self, revoked_tokens: RevokedTokens, cache_size: int = 10_000) -> None:
+        self.revoked_tokens = revoked_tokens
+        self.cache = VerifiedTokensCache(max_size=cache_size)
+
+    @staticmethod
+    def _verify(token: str) -> AuthenticatedToken:
+        claims = verify_token(token)
+        if not claims.active:
+            raise UnauthorizedError(
+                f"Token is not active by cause: {claims.cause}, please login again"
+            )
+        if claims.token_type != TokenType.ACCESS:
+            raise UnauthorizedError("Invalid token type!")
+        if claims.exp is None:
+            # Без `exp` токен нельзя ни закешировать, ни отозвать до истечения
+            raise UnauthorizedError("Token without expiration time!")
+        current_user = CurrentUser.model_validate({
+            "user_id": claims.sub,
+            "username": claims.username,
+            "email": claims.email,
+            "status": claims.status,
+            "role": claims.role,
+        })
+        return AuthenticatedToken(
+            current_user=current_user, jti=claims.jti, expires_at=float(claims.exp)
+        )
+
+    async def authenticate(self, token: str) -> CurrentUser:
+        """Получение текущего пользователя по access токену
+
+        :exception UnauthorizedError: Токен недействителен, истёк или отозван.
+        """
+
+        authenticated = self.cache.get(token)
+        if authenticated is None:
+            authenticated = self._verify(token)
+            self.cache.put(token, authenticated)
+        if authenticated.jti is not None and await self.revoked_tokens.is_revoked(
+            authenticated.jti
+        ):
+            self.cache.discard(token)
+            raise UnauthorizedError("Token revoked, please login again")
+        return authenticated.current_user
+
+    async def revoke(self, token: str) -> None:
+        """Отзыв access токена (выход из системы)
+
+        :exception UnauthorizedError: Токен недействителен или истёк.
+        """
+
+        authenticated = self.cache.get(token) or self._verify(token)
+        self.cache.discard(token)
+        if authenticated.jti is None:
+            logger.warning("Token without jti can't be revoked")
+            return
+        await self.revoked_tokens.revoke(authenticated.jti, authenticated.expires_at)
+
+    async def close(self) -> None:
+        await self.revoked_tokens.close()
@@ -10,7 +10,6 @@ from modules.shared_kernel.domain import Entity, InvariantViolationError
 from modules.shared_kernel.utils import current_datetime
 
 from ..utils.common import generate_guest_name
-from ..utils.security import hash_secret, verify_secret
 from .events import UserRegisteredEvent
 from .exceptions import InvalidCredentialsError, UserNotEnabledError
 from .value_objects import (
@@ -137,13 +136,19 @@ class User(BaseUser):
         )
 
     @classmethod
-    def register_by_credentials(cls, credentials: UserCredentials) -> Self:
+    def register_by_credentials(cls, credentials: UserCredentials, password_hash: str) -> Self:
+        """Регистрация по учётным данным.
+
+        :param credentials: Учётные данные пользователя.
+        :param password_hash: Хеш пароля (вычисляется вне event loop, см. `PasswordHasher`).
+        """
+
         user = cls(
             email=credentials.email,
             username=credentials.username,
             role=UserRole.GUEST,
             status=UserStatus.PENDING_EMAIL_VERIFICATION,
-            password_hash=hash_secret(credentials.password),
+            password_hash=password_hash,
             auth_methods={AuthMethod.CREDENTIALS}
         )
         cls._register_event(
@@ -170,13 +175,18 @@ class User(BaseUser):
         )
         return user
 
-    def authenticate_by_credentials(self, credentials: UserCredentials) -> Self:
+    def authenticate_by_credentials(self, password_verified: bool) -> Self:
+        """Аутентификация по учётным данным.
+
+        :param password_verified: Совпал ли пароль с `password_hash` (см. `PasswordHasher`).
+        """
+
         if self.status in {UserStatus.BANNED, UserStatus.DELETED}:
             raise UserNotEnabledError(
                 user_status=self.status,
                 details={"user_id": self.id, "email": self.email, "username": self.username}
             )
-        if not verify_secret(credentials.password, self.password_hash):
+        if not password_verified:
             raise InvalidCredentialsError(
                 "Invalid password!",
                 details={"user_id": self.id, "email": self.email, "username": self.username}
@@ -39,6 +39,18 @@ class UserNotEnabledError(AppError):
         )
 
 
+class PasswordHashingOverloadedError(AppError):
+    """Очередь хеширования паролей переполнена"""
+
+    def __init__(self, message: str, details: dict[str, Any] | None = None) -> None:
+        super().__init__(
+            message=message,
+            type=ErrorType.RATE_LIMITED,
+            code="PASSWORD_HASHING_OVERLOADED",
+            details=details,
+        )
+
+
 class TokenExpiredError(AppError):
     """Токен больше не действителен (протух)"""
 
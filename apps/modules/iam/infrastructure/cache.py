@@ -1,7 +1,139 @@
+import asyncio
+import contextlib
+import logging
+import math
+import time
+from itertools import batched
+from uuid import UUID
+
+from redis import RedisError
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+
+from modules.shared_kernel.application.exceptions import CacheSetError
 from modules.shared_kernel.insrastructure.cache import RedisKeyValueCache
 
+from ..application import InMemoryRevokedTokens
 from ..application.dto import PKCESession
 
+logger = logging.getLogger(__name__)
+
+RECONNECT_DELAY = 1  # Задержка перед повторной подпиской на канал (в секундах)
+
 
 class PKCESessionCache(RedisKeyValueCache[PKCESession]):
     model = PKCESession
+
+
+class RedisRevokedTokens(InMemoryRevokedTokens):
+    """Отозванные токены с синхронизацией между репликами через Redis.
+    Проверка выполняется по локальному множеству без обращения к Redis,
+    отзыв сохраняется в Redis (ключ живёт до истечения токена) и рассылается через pub/sub.
+
+    Если Redis недоступен при первой проверке, подписка не устанавливается, а проверка
+    продолжается по локальному множеству: в нём есть отзывы этой реплики и отзывы,
+    полученные до сбоя, но нет отзывов других реплик за время сбоя. Подписка
+    повторяется не чаще раза в `RECONNECT_DELAY` секунд.
+    """
+
+    SCAN_BATCH_SIZE = 500
+
+    def __init__(self, url: str, prefix: str = "revoked-tokens") -> None:
+        super().__init__()
+        self.redis = Redis.from_url(url)
+        self.prefix = prefix
+        self._channel = f"{prefix}:revoke"
+        self._listener: asyncio.Task[None] | None = None
+        self._subscribe_lock = asyncio.Lock()
+        self._subscribe_retry_at = 0.0
+
+    def _build_key(self, jti: UUID) -> str:
+        return f"{self.prefix}:{jti}"
+
+    async def _preload(self) -> None:
+        """Загрузка отозванных ранее токенов (после подписки, чтобы не пропустить новые)"""
+
+        keys = [
+            key async for key in self.redis.scan_iter(
+                match=f"{self.prefix}:*", count=self.SCAN_BATCH_SIZE
+            )
+        ]
+        for chunk in batched(keys, self.SCAN_BATCH_SIZE, strict=False):
+            values = await self.redis.mget(chunk)
+            for key, expires_at in zip(chunk, values, strict=True):
+                if expires_at is None:  # Ключ истёк между SCAN и MGET
+                    continue
+                _, _, jti = key.decode("utf-8").rpartition(":")
+                self.add(UUID(jti), float(expires_at))
+
+    async def _ensure_listener(self) -> None:
+        if self._listener is not None and not self._listener.done():
+            return
+        async with self._subscribe_lock:
+            if self._listener is not None and not self._listener.done():
+                return
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(self._channel)
+                await self._preload()
+            except RedisError:
+                with contextlib.suppress(RedisError):
+                    await pubsub.aclose()
+                raise
+            self._listener = asyncio.create_task(self._listen(pubsub))
+
+    async def _listen(self, pubsub: PubSub) -> None:
+        try:
+            while True:
+                try:
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        jti, _, expires_at = message["data"].decode("utf-8").partition("|")
+                        self.add(UUID(jti), float(expires_at))
+                except RedisError:
+                    logger.exception("Revocation channel %s disconnected", self._channel)
+                    await asyncio.sleep(RECONNECT_DELAY)
+                    with contextlib.suppress(RedisError):
+                        await pubsub.subscribe(self._channel)
+                        # Отзывы могли быть пропущены пока подписка отсутствовала
+                        await self._preload()
+        finally:
+            with contextlib.suppress(RedisError):
+                await pubsub.aclose()
+
+    async def is_revoked(self, jti: UUID) -> bool:
+        if time.monotonic() >= self._subscribe_retry_at:
+            try:
+                await self._ensure_listener()
+            except RedisError:
+                self._subscribe_retry_at = time.monotonic() + RECONNECT_DELAY
+                logger.warning(
+                    "Revocation channel %s is unavailable, checking local revocations only",
+                    self._channel, exc_info=True,
+                )
+        return await super().is_revoked(jti)
+
+    async def revoke(self, jti: UUID, expires_at: float) -> None:
+        await self._ensure_listener()
+        await super().revoke(jti, expires_at)
+        key = self._build_key(jti)
+        try:
+            async with self.redis.pipeline(transaction=False) as pipeline:
+                pipeline.set(key, expires_at, exat=math.ceil(expires_at))
+                pipeline.publish(self._channel, f"{jti}|{expires_at}")
+                await pipeline.execute()
+        except RedisError as e:
+            raise CacheSetError(
+                key=key, value={"expires_at": expires_at}, original_error=e
+            ) from e
+
+    async def close(self) -> None:
+        """Остановка подписки на канал отзыва"""
+
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        await self.redis.aclose()
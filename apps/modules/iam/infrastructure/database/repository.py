@@ -1,12 +1,18 @@
 from typing import TypeVar
 
+from collections.abc import Iterable
+
 from pydantic import EmailStr
 from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import joinedload
 
 from modules.shared_kernel.application.exceptions import ReadingError
-from modules.shared_kernel.insrastructure.database import DataMapper, SQLAlchemyRepository
+from modules.shared_kernel.insrastructure.database import (
+    DataMapper,
+    SQLAlchemyRepository,
+    generate_column_mapping,
+)
 
 from ...application import UserRepository
 from ...domain import AnyUser, AuthProvider, Guest, User
@@ -16,6 +22,25 @@ AnyUserModel = TypeVar("AnyUserModel", bound=UserModel | GuestModel)
 
 
 class UserDataMapper(DataMapper[AnyUser, AnyUserModel]):
+    """Полиморфный маппер: класс сущности выбирается по классу строки.
+    Быстрый путь строит `User` вместе с `social_accounts` из загруженного отношения.
+    """
+
+    entity_classes: dict[type[BaseUserModel], type[User | Guest]] = {  # noqa: RUF012
+        UserModel: User,
+        GuestModel: Guest,
+    }
+
+    @classmethod
+    def model_to_entity_trusted(cls, model: AnyUserModel) -> AnyUser:
+        model_class: type[BaseUserModel] = type(model)
+        mapping = generate_column_mapping(cls.entity_classes[model_class], model_class)
+        return cls.model_to_entity(model) if mapping is None else mapping.build(model)
+
+    @classmethod
+    def models_to_entities(cls, models: Iterable[AnyUserModel]) -> list[AnyUser]:
+        return [cls.model_to_entity_trusted(model) for model in models]
+
     @classmethod
     def model_to_entity(cls, model: AnyUserModel) -> AnyUser:
         if isinstance(model, UserModel):
@@ -1,7 +1,9 @@
 __all__ = (
+    "AccessTokenDep",
     "CurrentUserDep",
     "GuestMiddleware",
+    "authenticator",
 )
 
-from .dependencies import CurrentUserDep
+from .dependencies import AccessTokenDep, CurrentUserDep, authenticator
 from .middlewares import GuestMiddleware
@@ -3,35 +3,44 @@ from typing import Annotated
 from fastapi import Depends, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from ...application import verify_token
+from config.dev import settings
+
+from ...application import AccessTokenAuthenticator, InMemoryRevokedTokens, RevokedTokens
 from ...application.dto import CurrentUser
 from ...application.exceptions import UnauthorizedError
-from ...domain import TokenType
+from ..cache import RedisRevokedTokens
 
 
-def get_current_user(
-        request: Request,    # noqa: ARG001
+def _create_revoked_tokens() -> RevokedTokens:
+    if settings.jwt.revocation_backend == "redis":
+        return RedisRevokedTokens(url=settings.redis.url)
+    return InMemoryRevokedTokens()
+
+
+# Один экземпляр на процесс, чтобы кеш проверенных токенов переиспользовался между запросами
+authenticator = AccessTokenAuthenticator(
+    revoked_tokens=_create_revoked_tokens(), cache_size=settings.jwt.claims_cache_size
+)
+
+
+def get_access_token(
         credentials: HTTPAuthorizationCredentials | None = Depends(HTTPBearer(auto_error=False))
-) -> CurrentUser:
-    """Зависимость для получения текущего пользователя"""
+) -> str:
+    """Зависимость для получения access токена из заголовка Authorization"""
 
     if not credentials:
         raise UnauthorizedError("Authentication required, missing credentials!")
-    token = credentials.credentials
-    claims = verify_token(token)
-    if not claims.active:
-        raise UnauthorizedError(
-            f"Token is not active by cause: {claims.cause}, please login again"
-        )
-    if claims.token_type != TokenType.ACCESS:
-        raise UnauthorizedError("Invalid token type!")
-    return CurrentUser.model_validate({
-            "user_id": claims.sub,
-            "username": claims.username,
-            "email": claims.email,
-            "status": claims.status,
-            "role": claims.role,
-        })
+    return credentials.credentials
+
+
+async def get_current_user(
+        request: Request,    # noqa: ARG001
+        token: str = Depends(get_access_token),
+) -> CurrentUser:
+    """Зависимость для получения текущего пользователя"""
+
+    return await authenticator.authenticate(token)
 
 
+AccessTokenDep = Annotated[str, Depends(get_access_token)]
 CurrentUserDep = Annotated[CurrentUser, Depends(get_current_user)]
@@ -1,32 +1,140 @@
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.types import ASGIApp
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from datetime import timedelta
+from uuid import UUID
+
+from fastapi import Request
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from ...application import GuestService
+from ...application.dto import GuestToken
+from ...application.exceptions import NoLongerGuestError, UnauthorizedError
 from ...application.queries import GetGuestQuery
+from .dependencies import authenticator
+
+DEFAULT_EXCLUDE_PATHS: tuple[str, ...] = (
+    "/docs", "/redoc", "/openapi.json", "/health", "/metrics"
+)
+# Потоковые маршруты (загрузка/скачивание файлов) middleware не обрабатывает
+DEFAULT_STREAMING_PATHS: tuple[str, ...] = ("/api/v1/files",)
+
+
+class GuestMiddleware:
+    """ASGI middleware для автоматического создания/восстановления гостя.
 
+    Порядок обработки запроса:
+     1. Запрос с действующим access токеном пропускается без обращения к БД
+        (проверка через общий кеш проверенных токенов).
+     2. Для известного `X-Guest-ID` выдаётся ранее выпущенный токен из кеша процесса
+        (не дольше `cache_ttl`, чтобы смена статуса гостя учитывалась без перезапуска).
+     3. Иначе гость читается/создаётся через `GuestService` в отдельном REQUEST scope.
 
-class GuestMiddleware(BaseHTTPMiddleware):
-    """Middleware для автоматического создания/восстановления гостя"""
+    Тело запроса и ответа не оборачивается, поэтому потоковые ответы не буферизуются.
+    """
 
     def __init__(
-            self, app: ASGIApp, service: GuestService, exclude_paths: list[str] | None = None
+            self,
+            app: ASGIApp,
+            exclude_paths: Sequence[str] | None = None,
+            streaming_paths: Sequence[str] | None = None,
+            cache_size: int = 10_000,
+            refresh_before: timedelta = timedelta(minutes=5),
+            cache_ttl: timedelta = timedelta(minutes=1),
     ) -> None:
-        super().__init__(app)
-        self.service = service
-        self.exclude_paths = exclude_paths or [
-            "/docs", "/redoc", "/openapi.json", "/health", "/metrics"
-        ]
-
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        if any(request.url.path.startswith(path) for path in self.exclude_paths):
-            return await call_next(request)
+        """
+        :param app: Оборачиваемое ASGI приложение.
+        :param exclude_paths: Префиксы путей, для которых гость не нужен.
+        :param streaming_paths: Префиксы потоковых маршрутов, которые пропускаются.
+        :param cache_size: Максимальное количество гостевых токенов в кеше процесса.
+        :param refresh_before: За сколько до истечения токен из кеша перевыпускается.
+        :param cache_ttl: Сколько токен выдаётся из кеша без обращения к `GuestService`.
+        """
+
+        self.app = app
+        self.skip_paths = (
+            *(DEFAULT_EXCLUDE_PATHS if exclude_paths is None else exclude_paths),
+            *(DEFAULT_STREAMING_PATHS if streaming_paths is None else streaming_paths),
+        )
+        self.cache_size = cache_size
+        self.refresh_before = refresh_before.total_seconds()
+        self.cache_ttl = cache_ttl.total_seconds()
+        # Токен и момент, до которого он выдаётся из кеша
+        self._guest_tokens: OrderedDict[UUID, tuple[GuestToken, float]] = OrderedDict()
+
+    def get_cached_token(self, guest_id: UUID) -> GuestToken | None:
+        entry = self._guest_tokens.get(guest_id)
+        if entry is None:
+            return None
+        token, cached_until = entry
+        if min(cached_until, token.expires_at - self.refresh_before) <= time.time():
+            del self._guest_tokens[guest_id]
+            return None
+        self._guest_tokens.move_to_end(guest_id)
+        return token
+
+    def cache_token(self, token: GuestToken) -> None:
+        self._guest_tokens[token.guest_id] = (token, time.time() + self.cache_ttl)
+        self._guest_tokens.move_to_end(token.guest_id)
+        while len(self._guest_tokens) > self.cache_size:
+            self._guest_tokens.popitem(last=False)
+
+    @staticmethod
+    async def _has_valid_access_token(headers: Headers) -> bool:
+        scheme, _, token = headers.get("Authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return False
+        try:
+            await authenticator.authenticate(token)
+        except UnauthorizedError:
+            return False
+        return True
+
+    @staticmethod
+    async def _get_or_create(scope: Scope, query: GetGuestQuery) -> GuestToken:
+        """Получение гостя через `GuestService` из контейнера зависимостей приложения"""
+
+        request = Request(scope)
+        async with request.app.state.dishka_container({Request: request}) as container:
+            service = await container.get(GuestService)
+            return await service.get_or_create(query)
+
+    async def _resolve_guest(self, scope: Scope, headers: Headers) -> GuestToken | None:
         query = GetGuestQuery.model_validate({
-            "guest_id": request.headers.get("X-Guest-ID"),
-            "devise_id": request.headers.get("X-Device-ID"),
+            "guest_id": headers.get("X-Guest-ID"),
+            "device_id": headers.get("X-Device-ID"),
         })
-        token = await self.service.get_or_create(query)
-        response = await call_next(request)
-        response.headers["X-Guest-ID"] = str(token.guest_id)
-        response.headers["Authorization"] = f"Bearer {token.access_token}"
-        return response
+        if query.guest_id is not None:
+            token = self.get_cached_token(query.guest_id)
+            if token is not None:
+                return token
+        try:
+            token = await self._get_or_create(scope, query)
+        except NoLongerGuestError:
+            # Пользователь зарегистрирован, аутентификация выполняется маршрутом
+            return None
+        self.cache_token(token)
+        return token
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.skip_paths):
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        if await self._has_valid_access_token(headers):
+            await self.app(scope, receive, send)
+            return
+        token = await self._resolve_guest(scope, headers)
+        if token is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_guest_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                response_headers["X-Guest-ID"] = str(token.guest_id)
+                response_headers["Authorization"] = f"Bearer {token.access_token}"
+            await send(message)
+
+        await self.app(scope, receive, send_with_guest_headers)
@@ -9,5 +9,8 @@ from .vk import VKOAuthClient
 vk_oauth_client = VKOAuthClient(
     client_id=settings.vk.client_id,
     base_url=settings.vk.base_url,
-    redirect_uri=settings.vk.redirect_uri
+    redirect_uri=settings.vk.redirect_uri,
+    pool_size=settings.vk.pool_size,
+    timeout=settings.vk.timeout,
+    userinfo_ttl=settings.vk.userinfo_ttl,
 )
@@ -4,6 +4,10 @@ import base64
 import hashlib
 import logging
 import secrets
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 
 import aiohttp
 
@@ -42,7 +46,7 @@ class Tokens(TypedDict):
 class PublicInfo(TypedDict):
     """Публичная информация о пользователе"""
 
-    user_id: str | int
+    user_id: str
     first_name: str
     last_name: str
     phone: str
@@ -54,7 +58,8 @@ class UserInfo(TypedDict):
     """Персональная информация о пользователе
 
     Attributes:
-        user_id: Идентификатор пользователя в ВК, пример: '1234567890'
+        user_id: Идентификатор пользователя в ВК (ВК может вернуть число,
+            клиент приводит его к строке), пример: '1234567890'
         first_name: Имя пользователя, пример: 'Ivan'
         last_name: Фамилия пользователя, пример: 'Ivanov'
         avatar: Ссылка на фото профиля
@@ -65,7 +70,7 @@ class UserInfo(TypedDict):
         email: Адрес электронной почты (если запрошен через scope)
     """
 
-    user_id: str | int
+    user_id: str
     first_name: str
     last_name: str
     avatar: str
@@ -76,6 +81,42 @@ class UserInfo(TypedDict):
     email: NotRequired[str]
 
 
+@dataclass(slots=True)
+class OAuthCallTiming:
+    """Длительность исходящих вызовов одного метода OAuth API.
+
+    Attributes:
+        calls: Выполненные вызовы.
+        errors: Вызовы, завершившиеся ошибкой.
+        total_time: Суммарная длительность вызовов (в секундах).
+        max_time: Максимальная длительность вызова (в секундах).
+    """
+
+    calls: int = 0
+    errors: int = 0
+    total_time: float = 0
+    max_time: float = 0
+
+    @property
+    def avg_time(self) -> float:
+        return self.total_time / self.calls if self.calls else 0
+
+
+@dataclass(slots=True)
+class OAuthClientStats:
+    """Статистика OAuth клиента.
+
+    Attributes:
+        timings: Длительность вызовов по методам API.
+        userinfo_cache_hits: Информация о пользователе взята из кэша.
+        userinfo_cache_misses: Информация о пользователе запрошена у ВК.
+    """
+
+    timings: dict[str, OAuthCallTiming] = field(default_factory=dict)
+    userinfo_cache_hits: int = 0
+    userinfo_cache_misses: int = 0
+
+
 def generate_pkce_params() -> tuple[str, str]:
     """Генерация code_verifier и code_challenge"""
 
@@ -89,17 +130,102 @@ def generate_pkce_params() -> tuple[str, str]:
 
 
 class VKOAuthClient:
+    """Клиент VK ID OAuth 2.0.
+
+    Все вызовы идут через одну долгоживущую сессию с пулом соединений
+    (`pool_size`), создаваемую при первом запросе: TLS рукопожатие с ВК
+    не повторяется на каждый вход пользователя. Информация о пользователе
+    кэшируется на `userinfo_ttl` секунд по хэшу ACCESS токена.
+    """
+
     def __init__(
             self,
             client_id: str,
             base_url: str,
             redirect_uri: str,
             scope: str = "email phone",
+            pool_size: int = 100,
+            timeout: float = 10,
+            userinfo_ttl: float = 60,
+            userinfo_cache_size: int = 10_000,
     ) -> None:
         self._client_id = client_id
         self._base_url = base_url
         self._redirect_uri = redirect_uri
         self._scope = scope
+        self._pool_size = pool_size
+        self._timeout = timeout
+        self._userinfo_ttl = userinfo_ttl
+        self._userinfo_cache_size = userinfo_cache_size
+        self._userinfo_cache: dict[str, tuple[float, UserInfo]] = {}
+        self._session: aiohttp.ClientSession | None = None
+        self.stats = OAuthClientStats()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                base_url=self._base_url,
+                connector=aiohttp.TCPConnector(limit=self._pool_size, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=self._timeout),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Закрытие сессии и соединений пула"""
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @contextmanager
+    def _timed(self, operation: str) -> Generator[None]:
+        """Замер длительности исходящего вызова OAuth API"""
+
+        timing = self.stats.timings.setdefault(operation, OAuthCallTiming())
+        started_at = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            timing.errors += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started_at
+            timing.calls += 1
+            timing.total_time += elapsed
+            timing.max_time = max(timing.max_time, elapsed)
+            logger.debug(
+                "VK OAuth call %s took %.1f ms", operation, elapsed * 1000,
+                extra={"operation": operation, "duration": elapsed},
+            )
+
+    @staticmethod
+    def _userinfo_cache_key(access_token: str) -> str:
+        # Сам токен в памяти процесса как ключ не хранится
+        return hashlib.sha256(access_token.encode("utf-8")).hexdigest()
+
+    def _get_cached_userinfo(self, key: str) -> UserInfo | None:
+        cached = self._userinfo_cache.get(key)
+        if cached is None:
+            return None
+        expires_at, userinfo = cached
+        if expires_at <= time.monotonic():
+            del self._userinfo_cache[key]
+            return None
+        return userinfo
+
+    def _cache_userinfo(self, key: str, userinfo: UserInfo) -> None:
+        if len(self._userinfo_cache) >= self._userinfo_cache_size:
+            now = time.monotonic()
+            self._userinfo_cache = {
+                cached_key: cached
+                for cached_key, cached in self._userinfo_cache.items()
+                if cached[0] > now
+            }
+            if len(self._userinfo_cache) >= self._userinfo_cache_size:
+                # Вытеснение самой старой записи
+                del self._userinfo_cache[next(iter(self._userinfo_cache))]
+        self._userinfo_cache[key] = (time.monotonic() + self._userinfo_ttl, userinfo)
 
     async def generate_authorization_url(self) -> OAuthFlowInitiation:
         """Инициация ВК OAuth 2.0 authorization flow,
@@ -119,18 +245,14 @@ class VKOAuthClient:
             "scope": self._scope,
             "state": state,
         }
+        logger.debug("Initiate VK OAuth 2.0 authorization flow")
         try:
-            logger.debug("Initiate VK OAuth 2.0 authorization flow")
-            async with aiohttp.ClientSession(base_url=self._base_url) as session, session.get(
-                url="/authorize", params=params, allow_redirects=False
-            ) as response:
-                response.raise_for_status()
-                logger.debug("Authorization URL generated")
-                return {
-                    "authorization_url": f"{response.url}",
-                    "code_verifier": code_verifier,
-                    "state": state,
-                }
+            with self._timed("authorize"):
+                async with self.session.get(
+                    url="/authorize", params=params, allow_redirects=False
+                ) as response:
+                    response.raise_for_status()
+                    authorization_url = f"{response.url}"
         except aiohttp.ClientResponseError as e:
             error_message = (
                 "Error occurred while authorization URL generation, "
@@ -139,6 +261,12 @@ class VKOAuthClient:
             )
             logger.exception(error_message)
             raise OAuthError(error_message, code="VK_AUTHORIZATION_URL_GENERATION_FAILED") from e
+        logger.debug("Authorization URL generated")
+        return {
+            "authorization_url": authorization_url,
+            "code_verifier": code_verifier,
+            "state": state,
+        }
 
     async def get_tokens(
             self, authorization_code: str, code_verifier: str, state: str, device_id: str
@@ -155,16 +283,16 @@ class VKOAuthClient:
             "device_id": device_id,
             "state": state,
         }
+        logger.debug(
+            "Start exchange authorization code for tokens", extra={"device_id": device_id}
+        )
         try:
-            logger.debug(
-                "Start exchange authorization code for tokens", extra={"device_id": device_id}
-            )
-            async with aiohttp.ClientSession(base_url=self._base_url) as session, session.post(
-                url="oauth2/auth", headers=headers, data=payload
-            ) as response:
-                response.raise_for_status()
-                logger.info("Token exchange successful", extra={"device_id": device_id})
-                return await response.json()
+            with self._timed("get_tokens"):
+                async with self.session.post(
+                    url="oauth2/auth", headers=headers, data=payload
+                ) as response:
+                    response.raise_for_status()
+                    tokens = await response.json()
         except aiohttp.ClientResponseError as e:
             error_message = (
                 "Error occurred while receiving tokens, "
@@ -172,17 +300,20 @@ class VKOAuthClient:
             )
             logger.exception(error_message)
             raise OAuthError(error_message, code="VK_TOKEN_RECEIVING_FAILED") from e
+        logger.info("Token exchange successful", extra={"device_id": device_id})
+        tokens["user_id"] = f"{tokens['user_id']}"
+        return tokens
 
     async def get_public_info(self, id_token: str) -> PublicInfo:
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
         payload = {"client_id": self._client_id, "id_token": id_token}
         try:
-            async with aiohttp.ClientSession(base_url=self._base_url) as session, session.post(
-                url="oauth2/public_info", headers=headers, data=payload
-            ) as response:
-                response.raise_for_status()
-                data = await response.json()
-            return data["user"]
+            with self._timed("get_public_info"):
+                async with self.session.post(
+                    url="oauth2/public_info", headers=headers, data=payload
+                ) as response:
+                    response.raise_for_status()
+                    data = await response.json()
         except aiohttp.ClientResponseError as e:
             error_message = (
                 "Error occurred while receiving user public info, "
@@ -191,25 +322,33 @@ class VKOAuthClient:
             )
             logger.exception(error_message)
             raise OAuthError(error_message, code="VK_PUBLIC_INFO_RECEIVING_FAILED") from e
+        public_info: PublicInfo = data["user"]
+        public_info["user_id"] = f"{public_info['user_id']}"
+        return public_info
 
     async def get_userinfo(self, access_token: str) -> UserInfo:
-        """Получение информации о пользователе
+        """Получение информации о пользователе (кэшируется на `userinfo_ttl` секунд)
 
         :param access_token: ACCESS токен полученный методом `get_tokens`
         :returns: Запрашиваемая информация о пользователе
         """
 
+        cache_key = self._userinfo_cache_key(access_token)
+        userinfo = self._get_cached_userinfo(cache_key)
+        if userinfo is not None:
+            self.stats.userinfo_cache_hits += 1
+            return userinfo
+        self.stats.userinfo_cache_misses += 1
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
         payload = {"client_id": self._client_id, "access_token": access_token}
+        logger.debug("User info is requested")
         try:
-            logger.debug("User info is requested")
-            async with aiohttp.ClientSession(base_url=self._base_url) as session, session.post(
-                url="/user_info", headers=headers, data=payload
-            ) as response:
-                response.raise_for_status()
-                data = await response.json()
-                logger.info("User info received successfully", extra=data)
-                return data["user"]
+            with self._timed("get_userinfo"):
+                async with self.session.post(
+                    url="/user_info", headers=headers, data=payload
+                ) as response:
+                    response.raise_for_status()
+                    data = await response.json()
         except aiohttp.ClientResponseError as e:
             error_message = (
                 "Error occurred while receiving user personal info, "
@@ -218,3 +357,8 @@ class VKOAuthClient:
             )
             logger.exception(error_message)
             raise OAuthError(error_message, code="VK_USER_INFO_RECEIVING_FAILED") from e
+        logger.info("User info received successfully", extra=data)
+        userinfo = data["user"]
+        userinfo["user_id"] = f"{userinfo['user_id']}"
+        self._cache_userinfo(cache_key, userinfo)
+        return userinfo
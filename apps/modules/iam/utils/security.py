@@ -3,7 +3,12 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from ..domain import TokenType
 
+import asyncio
 import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import timedelta
 from uuid import uuid4
 
@@ -13,7 +18,11 @@ from passlib.context import CryptContext
 from config.dev import settings
 from modules.shared_kernel.utils import current_datetime
 
-from ..domain.exceptions import InvalidTokenError, TokenExpiredError
+from ..domain.exceptions import (
+    InvalidTokenError,
+    PasswordHashingOverloadedError,
+    TokenExpiredError,
+)
 
 # Хеширование паролей
 MEMORY_COST = 100  # Размер выделяемой памяти в mb
@@ -46,6 +55,100 @@ def verify_secret(plain_secret: str, hashed_secret: str) -> bool:
     return pwd_context.verify(plain_secret, hashed_secret)
 
 
+@dataclass(slots=True)
+class PasswordHashingMetrics:
+    """Метрики пула хеширования паролей.
+
+    Attributes:
+        in_flight: Задачи в очереди и в работе.
+        queue_depth: Задачи, ожидающие свободный поток.
+        max_queue_depth: Максимальная глубина очереди за время работы.
+        completed: Завершённые задачи.
+        rejected: Отклонённые из-за переполнения задачи.
+        total_wait_time: Суммарное время ожидания свободного потока (в секундах).
+    """
+
+    in_flight: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    completed: int = 0
+    rejected: int = 0
+    total_wait_time: float = 0.0
+
+    @property
+    def avg_wait_time(self) -> float:
+        return self.total_wait_time / self.completed if self.completed else 0.0
+
+
+class PasswordHasher:
+    """Хеширование паролей в выделенном пуле потоков ограниченного размера.
+    Argon2 освобождает GIL, поэтому хеширование не блокирует event loop,
+    а размер пула ограничивает нагрузку на CPU при всплеске входов.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int) -> None:
+        """
+        :param max_workers: Количество потоков для хеширования.
+        :param max_pending: Максимальное количество задач в очереди и в работе.
+        """
+
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.metrics = PasswordHashingMetrics()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hasher"
+        )
+
+    def _update_queue_depth(self) -> None:
+        self.metrics.queue_depth = max(0, self.metrics.in_flight - self.max_workers)
+        self.metrics.max_queue_depth = max(self.metrics.max_queue_depth, self.metrics.queue_depth)
+
+    async def _run[R](self, func: Callable[..., R], *args: str) -> R:
+        """
+        :exception PasswordHashingOverloadedError: Очередь хеширования переполнена.
+        """
+
+        if self.metrics.in_flight >= self.max_pending:
+            self.metrics.rejected += 1
+            raise PasswordHashingOverloadedError(
+                "Too many authentication attempts, please try again later",
+                details={"in_flight": self.metrics.in_flight, "max_pending": self.max_pending},
+            )
+        submitted_at = time.perf_counter()
+
+        def run_timed() -> R:
+            self.metrics.total_wait_time += time.perf_counter() - submitted_at
+            return func(*args)
+
+        self.metrics.in_flight += 1
+        self._update_queue_depth()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, run_timed)
+        finally:
+            self.metrics.in_flight -= 1
+            self.metrics.completed += 1
+            self._update_queue_depth()
+
+    async def hash(self, secret: str) -> str:
+        """Асинхронный аналог `hash_secret`"""
+
+        return await self._run(hash_secret, secret)
+
+    async def verify(self, plain_secret: str, hashed_secret: str) -> bool:
+        """Асинхронный аналог `verify_secret`"""
+
+        return await self._run(verify_secret, plain_secret, hashed_secret)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.password_hashing.max_workers,
+    max_pending=settings.password_hashing.max_pending,
+)
+
+
 def issue_token(
         token_type: "TokenType",
         payload: dict[str, Any],
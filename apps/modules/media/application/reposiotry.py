@@ -9,3 +9,7 @@ class FileMetaRepository(CRUDRepository[FileMetadata]):
     @abstractmethod
     async def get_by_filepath(self, filepath: Filepath) -> FileMetadata | None:
         """Получение мета-данных по уникальному системному пути"""
+
+    @abstractmethod
+    async def get_by_content_hash(self, content_hash: str) -> FileMetadata | None:
+        """Получение мета-данных самого раннего файла с заданным хэшем содержимого"""
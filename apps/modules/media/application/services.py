@@ -1,4 +1,8 @@
+from typing import Protocol
+
 import asyncio
+import hashlib
+import logging
 from collections.abc import AsyncIterable, AsyncIterator
 from uuid import UUID
 
@@ -12,6 +16,14 @@ from .queries import DownloadFileQuery
 from .reposiotry import FileMetaRepository
 from .storage import Storage
 
+logger = logging.getLogger(__name__)
+
+
+class Hasher(Protocol):
+    """Инкрементальный хэш (объекты `hashlib`)"""
+
+    def update(self, data: bytes, /) -> None: ...
+
 
 async def download_from_presigned_url(presigned_url: str, chunk_size: int) -> AsyncIterable[bytes]:
     """Скачивание файла используя пред-подписанный URL.
@@ -28,6 +40,16 @@ async def download_from_presigned_url(presigned_url: str, chunk_size: int) -> As
             await asyncio.sleep(0)
 
 
+async def hash_stream(
+        stream: AsyncIterable[bytes], hasher: Hasher
+) -> AsyncIterator[bytes]:
+    """Пропускает поток байтов без изменений, инкрементально обновляя хэш содержимого"""
+
+    async for chunk in stream:
+        hasher.update(chunk)
+        yield chunk
+
+
 class MediaService:
     def __init__(
             self, uow: UnitOfWork, repository: FileMetaRepository, storage: Storage
@@ -39,13 +61,48 @@ class MediaService:
     async def upload_file(
             self, command: UploadFileCommand, file_stream: AsyncIterable[bytes]
     ) -> FileMetadata:
+        """Потоковая загрузка файла в хранилище.
+        SHA-256 содержимого считается по ходу загрузки, без повторного чтения файла.
+        Повторно загруженный файл получает в контексте ссылку `duplicate_of`
+        на ранее загруженный, по ней конвейер обработки переиспользует результаты.
+        Хэш известен только после загрузки, поэтому метаданные создаются после неё,
+        а при ошибке их сохранения загруженный объект удаляется из хранилища.
+        """
+
         file_metadata = FileMetadata.create(command)
+        hasher = hashlib.sha256()
         async with self._uow.transactional() as uow:
-            created_file_metadata = await self._repository.create(file_metadata)
-            await self._storage.upload_multipart(file_metadata.generate_file_parts(file_stream))
-            await uow.commit()
+            await self._storage.upload_multipart(
+                file_metadata.generate_file_parts(hash_stream(file_stream, hasher))
+            )
+            try:
+                created_file_metadata = await self._save_metadata(
+                    file_metadata, content_hash=hasher.hexdigest()
+                )
+                await uow.commit()
+            except Exception:
+                await self._remove_orphan(file_metadata)
+                raise
         return created_file_metadata
 
+    async def _save_metadata(
+            self, file_metadata: FileMetadata, content_hash: str
+    ) -> FileMetadata:
+        file_metadata.content_hash = content_hash
+        original = await self._repository.get_by_content_hash(content_hash)
+        if original is not None:
+            file_metadata.context["duplicate_of"] = original.id
+            logger.info("File %s is a duplicate of file %s", file_metadata.id, original.id)
+        return await self._repository.create(file_metadata)
+
+    async def _remove_orphan(self, file_metadata: FileMetadata) -> None:
+        """Удаление объекта, метаданные которого не удалось сохранить"""
+
+        try:
+            await self._storage.remove(file_metadata.filepath)
+        except Exception:
+            logger.exception("Failed to remove orphaned object %s", file_metadata.filepath)
+
     async def get_file_metadata(self, file_id: UUID) -> FileMetadata:
         file_metadata = await self._repository.read(file_id)
         if file_metadata is None:
@@ -55,7 +112,7 @@ class MediaService:
         return file_metadata
 
     async def download_file(self, query: DownloadFileQuery) -> AsyncIterator[FilePart]:
-        file_metadata = self.get_file_metadata(query.file_id)
+        file_metadata = await self.get_file_metadata(query.file_id)
         async for file_part in self._storage.download_multipart(
             filepath=file_metadata.filepath, part_size=query.chunk_size
         ):
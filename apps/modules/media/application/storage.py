@@ -26,7 +26,7 @@ class Storage(ABC):
         """
 
     @abstractmethod
-    async def download_multipart(
+    def download_multipart(
             self, filepath: Filepath, part_size: int
     ) -> AsyncIterator[FilePart]:
         """Скачивание файла по частым их хранилища
@@ -5,7 +5,7 @@ from collections.abc import AsyncIterable
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from pydantic import Field, NonPositiveInt, PositiveInt
+from pydantic import Field, PositiveInt
 
 from modules.shared_kernel.domain import Entity
 from modules.shared_kernel.utils import current_datetime
@@ -42,7 +42,7 @@ class FilePart(File):
         total_parts: Общее количество частей.
     """
 
-    number: NonPositiveInt
+    number: PositiveInt
     total_size: PositiveInt
     total_parts: PositiveInt
 
@@ -74,6 +74,7 @@ class FileMetadata(Entity):
         extension: Расширение файла, пример: txt, mp3, pdf, ...
         type: Тип файла, например: image, document, video, audio, ...
         uploaded_at: Дата и время загрузки файла
+        content_hash: SHA-256 содержимого файла (hex), вычисляется во время загрузки.
     """
 
     status: FileStatus
@@ -85,6 +86,7 @@ class FileMetadata(Entity):
     type: FileType
     uploaded_at: datetime = Field(default_factory=current_datetime)
     context: FileContext = Field(default_factory=dict)
+    content_hash: str | None = None
 
     @staticmethod
     def _build_filepath(
@@ -152,12 +154,12 @@ class FileMetadata(Entity):
 
         total_parts = math.ceil(self.filesize / min_part_size)
         part_number = 1
-        buffer = b""
+        buffer = bytearray()
         async for chunk in file_stream:
             buffer += chunk
             while len(buffer) >= min_part_size:
-                content_part = buffer[:min_part_size]
-                buffer = buffer[min_part_size:]
+                content_part = bytes(buffer[:min_part_size])
+                del buffer[:min_part_size]
                 yield FilePart(
                     number=part_number,
                     total_size=self.filesize,
@@ -168,7 +170,7 @@ class FileMetadata(Entity):
                     content=content_part,
                     uploaded_at=self.uploaded_at,
                 )
-            part_number += 1
+                part_number += 1
         # Отправка оставшихся данных (последняя часть может быть меньше min_part_size)
         if buffer:
             yield FilePart(
@@ -176,8 +178,8 @@ class FileMetadata(Entity):
                 total_size=self.filesize,
                 total_parts=total_parts,
                 path=self.filepath,
-                size=self.filesize,
+                size=len(buffer),
                 mime_type=self.mime_type,
-                content=buffer,
+                content=bytes(buffer),
                 uploaded_at=self.uploaded_at,
             )
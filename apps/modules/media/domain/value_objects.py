@@ -38,3 +38,4 @@ class FileContext(TypedDict):
     tenant: str
     entity_type: str
     entity_id: str
+    duplicate_of: NotRequired[UUID]  # Ранее загруженный файл с тем же содержимым
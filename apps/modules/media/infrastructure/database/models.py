@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime
+from sqlalchemy import DateTime, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from modules.shared_kernel.insrastructure.database import Base, JsonField, StrUnique
@@ -9,10 +9,14 @@ from modules.shared_kernel.insrastructure.database import Base, JsonField, StrUn
 class FileMetadataModel(Base):
     __tablename__ = "file_metadata"
 
+    status: Mapped[str]
     filename: Mapped[str]
     filepath: Mapped[StrUnique]
     filesize: Mapped[int]
     mime_type: Mapped[str]
+    extension: Mapped[str]
     type: Mapped[str]
     uploaded_at: Mapped[datetime] = mapped_column(DateTime)
     context: Mapped[JsonField]
+    # SHA-256 содержимого, индекс для поиска повторно загруженных файлов
+    content_hash: Mapped[str | None] = mapped_column(String(64), index=True)
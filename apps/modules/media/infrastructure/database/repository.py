@@ -13,9 +13,25 @@ class FileMetaDataMapper(DataMapper[FileMetadata, FileMetadataModel]):
     entity_class = FileMetadata
     model_class = FileMetadataModel
 
+    @classmethod
     def entity_to_model(cls, entity: FileMetadata) -> FileMetadataModel:
-        return FileMetadataModel(**entity.model_dump())
+        return FileMetadataModel(
+            id=entity.id,
+            status=entity.status,
+            filename=entity.filename,
+            filepath=entity.filepath,
+            filesize=entity.filesize,
+            mime_type=entity.mime_type,
+            extension=entity.extension,
+            type=entity.type,
+            uploaded_at=entity.uploaded_at,
+            # JSONB: идентификаторы в контексте (`created_by`, `duplicate_of`) - строками
+            context=entity.model_dump(mode="json", include={"context"})["context"],
+            content_hash=entity.content_hash,
+            created_at=entity.created_at,
+        )
 
+    @classmethod
     def model_to_entity(cls, model: FileMetadataModel) -> FileMetadata:
         return FileMetadata.model_validate(model)
 
@@ -37,3 +53,19 @@ class SQLAlchemyFileMetaRepository(
             raise ReadingError(
                 entity_name=FileMetadata.__class__.__name__, entity_id=filepath
             ) from e
+
+    async def get_by_content_hash(self, content_hash: str) -> FileMetadata | None:
+        try:
+            stmt = (
+                select(self.model)
+                .where(self.model.content_hash == content_hash)
+                .order_by(self.model.uploaded_at)
+                .limit(1)
+            )
+            result = await self.session.execute(stmt)
+            model = result.scalar_one_or_none()
+            return None if model is None else self.data_mapper.model_to_entity(model)
+        except SQLAlchemyError as e:
+            raise ReadingError(
+                entity_name=FileMetadata.__class__.__name__, entity_id=content_hash
+            ) from e
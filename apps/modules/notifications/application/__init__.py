@@ -1,7 +1,12 @@
 __all__ = (
+    "EmailNotificationService",
     "EmailSender",
     "EmailSendingError",
+    "EmailTemplateNotFoundError",
+    "EmailTemplateRenderer",
+    "RenderedEmail",
 )
 
 from .email_sender import EmailSender
-from .exceptions import EmailSendingError
+from .exceptions import EmailSendingError, EmailTemplateNotFoundError
+from .templates import EmailNotificationService, EmailTemplateRenderer, RenderedEmail
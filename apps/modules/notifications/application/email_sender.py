@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from ..domain import EmailLetter
+from .exceptions import EmailSendingError
 
 
 class EmailSender(ABC):
@@ -8,3 +10,19 @@ class EmailSender(ABC):
 
     @abstractmethod
     async def send(self, letter: EmailLetter) -> None: ...
+
+    async def send_many(self, letters: Sequence[EmailLetter]) -> list[EmailSendingError | None]:
+        """Отправка пачки писем, ошибка одного письма не прерывает отправку остальных.
+
+        :returns: Ошибки отправки в порядке писем (`None` - письмо отправлено).
+        """
+
+        errors: list[EmailSendingError | None] = []
+        for letter in letters:
+            try:
+                await self.send(letter)
+            except EmailSendingError as e:
+                errors.append(e)
+            else:
+                errors.append(None)
+        return errors
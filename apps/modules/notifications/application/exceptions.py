@@ -1,5 +1,6 @@
 from typing import Any
 
+from modules.shared_kernel.application.exceptions import NotFoundError
 from modules.shared_kernel.domain import AppError, ErrorType
 
 
@@ -11,3 +12,12 @@ class EmailSendingError(AppError):
             type=ErrorType.EXTERNAL_DEPENDENCY_ERROR,
             details=details
         )
+
+
+class EmailTemplateNotFoundError(NotFoundError):
+    def __init__(self, template_name: str) -> None:
+        super().__init__(
+            message=f"Email template {template_name} not found!",
+            entity_name="EmailTemplate",
+            details={"template_name": template_name},
+        )
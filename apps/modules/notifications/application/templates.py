@@ -0,0 +1,86 @@
+from typing import Any
+
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+
+from pydantic import EmailStr
+
+from modules.shared_kernel.application import DTO
+
+from ..domain import EmailLetter, LetterAttachment
+from .email_sender import EmailSender
+from .exceptions import EmailSendingError
+
+
+class RenderedEmail(DTO):
+    """Отрисованный шаблон письма"""
+
+    subject: str
+    body_markup: str
+
+
+class EmailTemplateRenderer(ABC):
+    """Отрисовка шаблонов писем (шаблоны компилируются один раз при создании)"""
+
+    @abstractmethod
+    def render(self, template_name: str, context: Mapping[str, Any]) -> RenderedEmail: ...
+
+    def render_many(
+            self, template_name: str, contexts: Sequence[Mapping[str, Any]]
+    ) -> list[RenderedEmail]:
+        """Отрисовка одного шаблона для пачки писем"""
+
+        return [self.render(template_name, context) for context in contexts]
+
+
+class EmailNotificationService:
+    """Отправка уведомлений по шаблонам писем"""
+
+    def __init__(
+            self, renderer: EmailTemplateRenderer, sender: EmailSender, sender_email: EmailStr
+    ) -> None:
+        self._renderer = renderer
+        self._sender = sender
+        self._sender_email = sender_email
+
+    def _build_letter(
+            self,
+            recipient: EmailStr,
+            rendered: RenderedEmail,
+            attachments: Sequence[LetterAttachment],
+    ) -> EmailLetter:
+        return EmailLetter(
+            subject=rendered.subject,
+            sender_email=self._sender_email,
+            recipient_emails=[recipient],
+            body_markup=rendered.body_markup,
+            attachments=list(attachments),
+        )
+
+    async def notify(
+            self,
+            template_name: str,
+            recipient: EmailStr,
+            context: Mapping[str, Any],
+            attachments: Sequence[LetterAttachment] = (),
+    ) -> None:
+        rendered = self._renderer.render(template_name, context)
+        await self._sender.send(self._build_letter(recipient, rendered, attachments))
+
+    async def notify_many(
+            self,
+            template_name: str,
+            recipients: Sequence[tuple[EmailStr, Mapping[str, Any]]],
+            attachments: Sequence[LetterAttachment] = (),
+    ) -> list[EmailSendingError | None]:
+        """Рассылка по одному шаблону, каждому получателю - свой контекст.
+
+        :returns: Ошибки отправки в порядке получателей (`None` - письмо отправлено).
+        """
+
+        contexts = [context for _, context in recipients]
+        rendered = self._renderer.render_many(template_name, contexts)
+        return await self._sender.send_many([
+            self._build_letter(recipient, email, attachments)
+            for (recipient, _), email in zip(recipients, rendered, strict=True)
+        ])
@@ -0,0 +1,34 @@
+from collections.abc import AsyncIterator
+
+from dishka import Provider, Scope, provide
+
+from config.dev import settings
+
+from ..application import EmailNotificationService, EmailSender, EmailTemplateRenderer
+from .email import JinjaEmailTemplateRenderer, SMTPEmailSender
+
+
+class NotificationsProvider(Provider):
+    @provide(scope=Scope.APP)
+    def provide_email_template_renderer(self) -> EmailTemplateRenderer:  # noqa: PLR6301
+        return JinjaEmailTemplateRenderer()
+
+    @provide(scope=Scope.APP)
+    async def provide_email_sender(self) -> AsyncIterator[EmailSender]:  # noqa: PLR6301
+        sender = SMTPEmailSender(
+            host=settings.mailru.host,
+            port=settings.mailru.port,
+            username=settings.mailru.username,
+            password=settings.mailru.password,
+            pool_size=settings.mailru.pool_size,
+        )
+        yield sender
+        await sender.close()
+
+    @provide(scope=Scope.APP)
+    def provide_email_notification_service(  # noqa: PLR6301
+            self, renderer: EmailTemplateRenderer, sender: EmailSender
+    ) -> EmailNotificationService:
+        return EmailNotificationService(
+            renderer=renderer, sender=sender, sender_email=settings.mailru.username
+        )
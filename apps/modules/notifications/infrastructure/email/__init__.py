@@ -1,6 +1,7 @@
 __all__ = (
+    "JinjaEmailTemplateRenderer",
     "SMTPEmailSender",
-
 )
 
 from .smtp import SMTPEmailSender
+from .templates import JinjaEmailTemplateRenderer
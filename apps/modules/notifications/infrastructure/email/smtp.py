@@ -1,10 +1,19 @@
+from typing import Any
+
+import asyncio
+import contextlib
 import logging
+import time
+from collections.abc import AsyncGenerator, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from email import encoders
 from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
 import aiosmtplib
+from aiosmtplib.email import extract_recipients, extract_sender, flatten_message
 
 from ...application import EmailSender, EmailSendingError
 from ...domain import EmailLetter
@@ -12,7 +21,129 @@ from ...domain import EmailLetter
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class SMTPPoolStats:
+    """Статистика пула SMTP соединений.
+
+    Attributes:
+        connects: Открытые соединения (рукопожатие + `login`).
+        reuses: Отправки через уже открытое соединение.
+        reconnects: Повторные отправки после разрыва соединения сервером.
+    """
+
+    connects: int = 0
+    reuses: int = 0
+    reconnects: int = 0
+
+
+@dataclass(slots=True, frozen=True)
+class _EncodedMessage:
+    sender: str
+    recipients: list[str]
+    content: bytes
+    mail_options: list[str]
+
+
+@dataclass(slots=True)
+class _IdleConnection:
+    smtp: aiosmtplib.SMTP
+    released_at: float
+
+
+class SMTPConnectionPool:
+    """Пул аутентифицированных SMTP соединений.
+
+    Держит не более `size` соединений, свободное соединение переиспользуется
+    без повторного TLS рукопожатия и `login`. Соединение, простаивавшее дольше
+    `idle_timeout` (сервер мог закрыть его по таймауту), открывается заново.
+    """
+
+    def __init__(
+            self,
+            smtp_config: dict[str, Any],
+            username: str,
+            password: str,
+            size: int = 4,
+            idle_timeout: float = 60,
+    ) -> None:
+        self._smtp_config = smtp_config
+        self._username = username
+        self._password = password
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.stats = SMTPPoolStats()
+        self._idle: list[_IdleConnection] = []
+        self._semaphore = asyncio.Semaphore(size)
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        smtp = aiosmtplib.SMTP(**self._smtp_config)
+        await smtp.connect()
+        try:
+            await smtp.login(self._username, self._password)
+        except aiosmtplib.SMTPException:
+            smtp.close()
+            raise
+        self.stats.connects += 1
+        return smtp
+
+    async def _checkout(self) -> aiosmtplib.SMTP:
+        while self._idle:
+            # Последнее освобождённое соединение - самое "свежее"
+            connection = self._idle.pop()
+            idle_time = time.monotonic() - connection.released_at
+            if connection.smtp.is_connected and idle_time < self.idle_timeout:
+                self.stats.reuses += 1
+                return connection.smtp
+            await self._quit(connection.smtp)
+        return await self._connect()
+
+    @staticmethod
+    async def _quit(smtp: aiosmtplib.SMTP) -> None:
+        if smtp.is_connected:
+            with contextlib.suppress(aiosmtplib.SMTPException, OSError):
+                await smtp.quit()
+        smtp.close()
+
+    def _release(self, smtp: aiosmtplib.SMTP) -> None:
+        self._idle.append(_IdleConnection(smtp=smtp, released_at=time.monotonic()))
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncGenerator[aiosmtplib.SMTP]:
+        """Соединение из пула.
+        После разрыва, таймаута или отмены посреди команды состояние соединения неизвестно,
+        и оно закрывается. Отказ сервера в отправителе, получателях или письме
+        (`SMTPRecipientsRefused`, `SMTPResponseException`) сбрасывает только транзакцию
+        (aiosmtplib отправляет RSET), такое соединение возвращается в пул.
+        """
+
+        async with self._semaphore:
+            smtp = await self._checkout()
+            try:
+                yield smtp
+            except Exception as e:
+                if isinstance(e, OSError):
+                    smtp.close()
+                else:
+                    self._release(smtp)
+                raise
+            except BaseException:
+                smtp.close()
+                raise
+            self._release(smtp)
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            await self._quit(connection.smtp)
+
+
 class SMTPEmailSender(EmailSender):
+    """Отправка писем через пул SMTP соединений (не более `pool_size` одновременно).
+
+    Письма с вложениями от `offload_threshold` байт собираются и кодируются
+    (base64, сериализация MIME) в отдельном потоке, не блокируя event loop.
+    """
+
     def __init__(
         self,
         host: str,
@@ -21,15 +152,28 @@ class SMTPEmailSender(EmailSender):
         password: str,
         use_tls: bool = True,
         timeout: int = 30,
+        pool_size: int = 4,
+        idle_timeout: float = 60,
+        offload_threshold: int = 256 * 1024,
     ) -> None:
-        self._username = username
-        self._password = password
+        self._offload_threshold = offload_threshold
         self._smtp_config = {
             "hostname": host,
             "port": port,
             "use_tls": use_tls,
             "timeout": timeout,
         }
+        self._pool = SMTPConnectionPool(
+            smtp_config=self._smtp_config,
+            username=username,
+            password=password,
+            size=pool_size,
+            idle_timeout=idle_timeout,
+        )
+
+    @property
+    def stats(self) -> SMTPPoolStats:
+        return self._pool.stats
 
     @staticmethod
     def _build_message(letter: EmailLetter) -> MIMEMultipart:
@@ -63,20 +207,77 @@ class SMTPEmailSender(EmailSender):
             message.attach(part)
         return message
 
+    @classmethod
+    def _encode_message(cls, letter: EmailLetter) -> _EncodedMessage:
+        message = cls._build_message(letter)
+        sender = extract_sender(message)
+        if sender is None:
+            raise ValueError("Email letter has no sender")
+        recipients = extract_recipients(message)
+        # Без 8BITMIME: тело и вложения уже в base64, сервер примет письмо как есть
+        return _EncodedMessage(
+            sender=sender,
+            recipients=recipients,
+            content=flatten_message(message, cte_type="7bit"),
+            mail_options=[] if f"{sender}{''.join(recipients)}".isascii() else ["SMTPUTF8"],
+        )
+
+    async def _encode(self, letter: EmailLetter) -> _EncodedMessage:
+        attachments_size = sum(len(attachment.content) for attachment in letter.attachments)
+        if attachments_size < self._offload_threshold:
+            return self._encode_message(letter)
+        return await asyncio.to_thread(self._encode_message, letter)
+
+    async def _deliver(self, message: _EncodedMessage) -> None:
+        async with self._pool.connection() as server:
+            await server.sendmail(
+                message.sender,
+                message.recipients,
+                message.content,
+                mail_options=message.mail_options,
+            )
+
+    async def _send_message(self, message: _EncodedMessage) -> None:
+        try:
+            await self._deliver(message)
+        except aiosmtplib.SMTPServerDisconnected:
+            # Сервер закрыл соединение раньше `idle_timeout`, повтор через новое соединение
+            self._pool.stats.reconnects += 1
+            await self._deliver(message)
+
     async def send(self, letter: EmailLetter) -> None:
         try:
             logger.info(
                 "Start sending email letter to %s, subject %s",
                 ", ".join(letter.recipient_emails), letter.subject,
             )
-            async with aiosmtplib.SMTP(**self._smtp_config) as server:
-                await server.login(self._username, self._password)
-                message = self._build_message(letter)
-                await server.send_message(message)
-                logger.info(
-                    "Email successfully sent to %s", ", ".join(letter.recipient_emails)
-                )
+            await self._send_message(await self._encode(letter))
+            logger.info(
+                "Email successfully sent to %s", ", ".join(letter.recipient_emails)
+            )
         except aiosmtplib.SMTPException as e:
             error_message = f"Error occurred while sending email: {e}"
             logger.exception(error_message)
             raise EmailSendingError(error_message) from e
+
+    async def send_many(self, letters: Sequence[EmailLetter]) -> list[EmailSendingError | None]:
+        """Параллельная отправка пачки писем через соединения пула"""
+
+        async def send_letter(letter: EmailLetter) -> EmailSendingError | None:
+            try:
+                await self.send(letter)
+            except EmailSendingError as e:
+                return e
+            return None
+
+        errors = await asyncio.gather(*map(send_letter, letters))
+        logger.info(
+            "Sent %s of %s email letters",
+            sum(error is None for error in errors), len(letters),
+        )
+        return list(errors)
+
+    async def close(self) -> None:
+        """Закрытие соединений пула"""
+
+        await self._pool.close()
@@ -0,0 +1,57 @@
+from typing import Any, Final
+
+import logging
+from collections.abc import Mapping
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader, StrictUndefined, Template, select_autoescape
+from markupsafe import Markup
+
+from ...application import EmailTemplateNotFoundError, EmailTemplateRenderer, RenderedEmail
+
+logger = logging.getLogger(__name__)
+
+TEMPLATES_DIR: Final[Path] = Path(__file__).resolve().parent / "templates"
+TEMPLATE_SUFFIX: Final[str] = ".html"
+
+
+class JinjaEmailTemplateRenderer(EmailTemplateRenderer):
+    """Отрисовка писем Jinja2 шаблонами.
+
+    Все шаблоны каталога (кроме начинающихся с `_` - базовых и частичных)
+    компилируются один раз при создании, отрисовка не обращается к диску
+    и не разбирает шаблон повторно. Тема письма задаётся в шаблоне блоком
+    `{% set subject %}...{% endset %}`, тело - результат отрисовки шаблона.
+    """
+
+    def __init__(self, templates_dir: Path = TEMPLATES_DIR) -> None:
+        self._environment = Environment(
+            loader=FileSystemLoader(templates_dir),
+            autoescape=select_autoescape(default=True),
+            undefined=StrictUndefined,
+            trim_blocks=True,
+            lstrip_blocks=True,
+            auto_reload=False,
+            cache_size=-1,
+        )
+        self._templates: dict[str, Template] = {
+            path.stem: self._environment.get_template(path.name)
+            for path in sorted(templates_dir.glob(f"*{TEMPLATE_SUFFIX}"))
+            if not path.name.startswith("_")
+        }
+        logger.info("Compiled %s email templates", len(self._templates))
+
+    @property
+    def template_names(self) -> list[str]:
+        return list(self._templates)
+
+    def render(self, template_name: str, context: Mapping[str, Any]) -> RenderedEmail:
+        template = self._templates.get(template_name)
+        if template is None:
+            raise EmailTemplateNotFoundError(template_name)
+        module = template.make_module(dict(context))
+        # Тема - заголовок письма, а не HTML: экранирование снимается
+        subject = getattr(module, "subject", "")
+        if isinstance(subject, Markup):
+            subject = subject.unescape()
+        return RenderedEmail(subject=str(subject).strip(), body_markup=str(module))
@@ -2,12 +2,14 @@ __all__ = (
     "DTO",
     "AnyMessage",
     "CRUDRepository",
+    "Cursor",
     "KeyValueCache",
     "MessageBus",
     "OutboxMessage",
     "OutboxRepository",
     "OutboxStatus",
     "OutboxWorker",
+    "Page",
     "Pagination",
     "ReadableRepository",
     "UnitOfWork",
@@ -15,7 +17,7 @@ __all__ = (
 )
 
 from .cache import KeyValueCache
-from .dto import DTO, Pagination
+from .dto import DTO, Cursor, Page, Pagination
 from .message_bus import AnyMessage, MessageBus
 from .outbox import OutboxMessage, OutboxRepository, OutboxStatus
 from .repositories import CRUDRepository, ReadableRepository, WritableRepository
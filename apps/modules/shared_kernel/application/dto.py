@@ -1,6 +1,13 @@
+from typing import Self
+
+import base64
 from abc import ABC
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, NonNegativeInt, PositiveInt
 
-from pydantic import BaseModel, ConfigDict, NonNegativeInt
+from ..domain import Entity
 
 
 class DTO(BaseModel, ABC):
@@ -12,12 +19,66 @@ class DTO(BaseModel, ABC):
     model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
+class Cursor(DTO):
+    """Позиция последней полученной записи для keyset пагинации.
+
+    Attributes:
+        timestamp: Значение колонки сортировки (`created_at` или аналог).
+        id: Идентификатор записи, разрешает совпадения по времени.
+    """
+
+    timestamp: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        """Непрозрачный токен для передачи клиенту"""
+
+        raw = f"{self.timestamp.isoformat()}|{self.id}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> Self:
+        """Восстановление курсора из токена
+
+        :exception ValueError: Некорректный токен.
+        """
+
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+            timestamp, id = raw.split("|")  # noqa: A001
+            return cls(timestamp=datetime.fromisoformat(timestamp), id=UUID(id))
+        except (UnicodeDecodeError, ValueError) as e:
+            raise ValueError(f"Invalid cursor `{token}`") from e
+
+
 class Pagination(DTO):
-    """Пагинация"""
+    """Пагинация.
+    При наличии `cursor` используется keyset пагинация (страница после курсора),
+    иначе - `OFFSET` по номеру страницы.
+    """
 
-    page: NonNegativeInt
+    page: PositiveInt = 1
     limit: NonNegativeInt
+    cursor: Cursor | None = None
 
     @property
     def offset(self) -> int:
         return (self.page - 1) * self.limit
+
+
+class Page[T: Entity](DTO):
+    """Страница результатов с курсором на следующую страницу"""
+
+    items: list[T]
+    next_cursor: str | None = None
+
+    @classmethod
+    def from_items(cls, items: list[T], limit: int) -> Self:
+        """Формирование страницы, курсор строится по последнему элементу полной страницы"""
+
+        if not items or len(items) < limit:
+            return cls(items=items)
+        last = items[-1]
+        return cls(
+            items=items, next_cursor=Cursor(timestamp=last.created_at, id=last.id).encode()
+        )
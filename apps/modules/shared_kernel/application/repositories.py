@@ -1,6 +1,7 @@
 from typing import TypeVar
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from uuid import UUID
 
 from ..domain import Entity
@@ -21,6 +22,20 @@ class WritableRepository[EntityT: Entity](ABC):
     @abstractmethod
     async def delete(self, id: UUID) -> bool: pass  # noqa: A002
 
+    @abstractmethod
+    async def create_many(self, entities: Sequence[EntityT]) -> list[EntityT]:
+        """Пакетное создание сущностей"""
+
+    @abstractmethod
+    async def update_many(self, ids: Sequence[UUID], **kwargs) -> list[EntityT]:
+        """Пакетное обновление сущностей одинаковыми значениями"""
+
+    @abstractmethod
+    async def upsert_many(
+            self, entities: Sequence[EntityT], conflict_keys: Sequence[str] = ("id",)
+    ) -> list[EntityT]:
+        """Пакетное создание или обновление сущностей"""
+
 
 class ReadableRepository[EntityT: Entity](ABC):
     """Репозиторий для чтения данных"""
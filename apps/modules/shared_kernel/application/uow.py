@@ -1,10 +1,15 @@
 from typing import Self
 
+import logging
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
-from contextlib import asynccontextmanager
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
 from types import TracebackType
 
+logger = logging.getLogger(__name__)
+
+type CommitHook = Callable[[], Awaitable[None]]
+
 
 class UnitOfWork(ABC):
     """Абстрактный класс для имплементации паттерна `UnitOfWork`,
@@ -12,6 +17,30 @@ class UnitOfWork(ABC):
     Использовать для операций на запись и обновление объектов.
     """
 
+    def __init__(self) -> None:
+        self._commit_hooks: list[CommitHook] = []
+
+    def on_commit(self, hook: CommitHook) -> None:
+        """Регистрация действия, выполняемого после успешной фиксации транзакции.
+        Используется для побочных эффектов, которые не должны опережать данные в БД
+        (например, инвалидации кеша). При откате зарегистрированные действия отбрасываются.
+        """
+
+        self._commit_hooks.append(hook)
+
+    async def _run_commit_hooks(self) -> None:
+        """Выполнение действий после фиксации, ошибки действий не отменяют фиксацию"""
+
+        hooks, self._commit_hooks = self._commit_hooks, []
+        for hook in hooks:
+            try:
+                await hook()
+            except Exception:
+                logger.exception("Commit hook %r failed", hook)
+
+    def _discard_commit_hooks(self) -> None:
+        self._commit_hooks.clear()
+
     @abstractmethod
     async def __aenter__(self) -> Self:
         """Начало транзакции"""
@@ -29,8 +58,7 @@ class UnitOfWork(ABC):
             await self.commit()
 
     @abstractmethod
-    @asynccontextmanager
-    async def transactional(self) -> Iterator[Self]:
+    def transactional(self) -> AbstractAsyncContextManager[Self]:
         """Начало транзакции"""
 
     @abstractmethod
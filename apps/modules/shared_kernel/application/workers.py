@@ -40,6 +40,8 @@ class OutboxWorker:
                     )
                     for message in messages:
                         await self._process_message(message)
+                    # Итоговые статусы сохраняются одним пакетным запросом
+                    await self._repository.upsert_many(messages)
                     await uow.commit()
                     if len(messages) < self.MIN_MESSAGES:
                         await asyncio.sleep(5)
@@ -53,14 +55,11 @@ class OutboxWorker:
             error = f"No handler for message type {message.message_type}"
             logger.warning(error)
             message.mark_failed(error)
-            await self._repository.update(message.id, **message.model_dump())
             return
         message.mark_processing()
-        await self._repository.update(message.id, **message.model_dump())
         try:
             await handler.handle(message)
             message.mark_processed()
         except Exception as e:
             logger.exception("Error processing message %s: {e}", message.id)
             message.mark_failed(str(e))
-        await self._repository.update(message.id, **message.model_dump())
@@ -1,7 +1,13 @@
 __all__ = (
+    "CacheSerializer",
+    "CacheStats",
     "InMemoryKeyValueCache",
+    "NearKeyValueCache",
+    "PydanticJsonSerializer",
     "RedisKeyValueCache",
 )
 
 from .in_memory import InMemoryKeyValueCache
+from .near import CacheStats, NearKeyValueCache
 from .redis import RedisKeyValueCache
+from .serializers import CacheSerializer, PydanticJsonSerializer
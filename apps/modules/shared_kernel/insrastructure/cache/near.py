@@ -0,0 +1,300 @@
+from typing import Final
+
+import asyncio
+import contextlib
+import json
+import logging
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import timedelta
+from uuid import uuid4
+
+from pydantic import BaseModel
+from redis import RedisError
+from redis.asyncio.client import PubSub
+
+from ...application import KeyValueCache
+from .redis import RedisKeyValueCache
+
+logger = logging.getLogger(__name__)
+
+# Типы сообщений канала инвалидации
+INVALIDATE_KEYS: Final[str] = "keys"  # Удаление перечисленных ключей
+INVALIDATE_ALL: Final[str] = "all"  # Отчистка всего локального кеша
+RECONNECT_DELAY = 1  # Задержка между попытками переподключения к каналу инвалидации (сек)
+
+
+@dataclass
+class CacheStats:
+    """Метрики двухуровневого кеша"""
+
+    local_hits: int = 0
+    remote_hits: int = 0
+    misses: int = 0
+    loads: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Доля запросов обслуженных из кеша (локального или удалённого)"""
+
+        hits = self.local_hits + self.remote_hits
+        total = hits + self.misses
+        return hits / total if total else 0.0
+
+    @property
+    def local_hit_ratio(self) -> float:
+        """Доля запросов обслуженных без сетевого запроса"""
+
+        total = self.local_hits + self.remote_hits + self.misses
+        return self.local_hits / total if total else 0.0
+
+
+class NearKeyValueCache[T: BaseModel](KeyValueCache):
+    """Двухуровневый кеш: локальный LRU в памяти процесса перед `RedisKeyValueCache`.
+
+    - Локальные значения живут не дольше `local_ttl` и вытесняются по LRU при `max_size`.
+    - Изменения рассылаются остальным репликам через Redis pub/sub канал `<prefix>:invalidate`.
+    - Параллельные промахи по одному ключу выполняют только одну загрузку (single-flight).
+    - Значение, загруженное до пришедшей во время загрузки инвалидации,
+      возвращается вызывающему, но не сохраняется в локальном кеше.
+
+    Example:
+        >>> cache = NearKeyValueCache(remote=WorkspaceCache(...), max_size=10_000)
+        >>> workspace = await cache.get_or_load(key, loader=lambda: repository.read(id))
+    """
+
+    def __init__(
+            self,
+            remote: RedisKeyValueCache[T],
+            max_size: int = 1024,
+            local_ttl: timedelta = timedelta(seconds=30),
+    ) -> None:
+        """
+        :param remote: Удалённый (разделяемый) кеш.
+        :param max_size: Максимальное количество значений в локальном кеше.
+        :param local_ttl: Время жизни значения в локальном кеше.
+        """
+
+        self.remote = remote
+        self.max_size = max_size
+        self.local_ttl = local_ttl.total_seconds()
+        self.stats = CacheStats()
+        self._local: OrderedDict[str, tuple[float, T]] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Future[T | None]] = {}
+        # Ключи, загружаемые из удалённого кеша, и те из них, что были изменены во время загрузки
+        self._loading: Counter[str] = Counter()
+        self._stale: set[str] = set()
+        self._node_id = uuid4().hex
+        self._channel = f"{remote.prefix}:invalidate"
+        self._listener: asyncio.Task[None] | None = None
+        self._subscribe_lock = asyncio.Lock()
+
+    # -- Локальный уровень --
+
+    def _get_local(self, key: str) -> T | None:
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._local[key]
+            return None
+        self._local.move_to_end(key)
+        return value
+
+    def _set_local(self, key: str, value: T) -> None:
+        self._local[key] = (time.monotonic() + self.local_ttl, value)
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_size:
+            self._local.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _mark_stale(self, keys: Iterable[str]) -> None:
+        """Загружаемые сейчас значения этих ключей не попадут в локальный кеш"""
+
+        self._stale.update(key for key in keys if key in self._loading)
+
+    def _evict_local(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._local.pop(key, None)
+            self._mark_stale((key,))
+            self.stats.invalidations += 1
+
+    def _clear_local(self) -> None:
+        self._local.clear()
+        self._stale.update(self._loading)
+        self.stats.invalidations += 1
+
+    def _begin_load(self, keys: Iterable[str]) -> None:
+        self._loading.update(keys)
+
+    def _end_load(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._loading[key] -= 1
+            if self._loading[key] <= 0:
+                del self._loading[key]
+                self._stale.discard(key)
+
+    def _fill_local(self, key: str, value: T) -> None:
+        """Сохранение загруженного значения, если ключ не изменился за время загрузки"""
+
+        if key not in self._stale:
+            self._set_local(key, value)
+
+    # -- Рассылка инвалидаций --
+
+    async def _ensure_listener(self) -> None:
+        """Ленивая подписка на канал инвалидации.
+        Подписка устанавливается до заполнения локального кеша, чтобы не пропустить инвалидации.
+        """
+
+        if self._listener is not None and not self._listener.done():
+            return
+        async with self._subscribe_lock:
+            if self._listener is not None and not self._listener.done():
+                return
+            pubsub = self.remote.redis.pubsub()
+            await pubsub.subscribe(self._channel)
+            self._listener = asyncio.create_task(self._listen(pubsub))
+
+    async def _listen(self, pubsub: PubSub) -> None:
+        try:
+            while True:
+                try:
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        self._handle_invalidation(message["data"])
+                except RedisError:
+                    logger.exception("Invalidation channel %s disconnected", self._channel)
+                    await asyncio.sleep(RECONNECT_DELAY)
+                    with contextlib.suppress(RedisError):
+                        await pubsub.subscribe(self._channel)
+                    # Сообщения могли быть потеряны пока подписка отсутствовала
+                    self._clear_local()
+        finally:
+            with contextlib.suppress(RedisError):
+                await pubsub.aclose()
+
+    def _handle_invalidation(self, data: bytes) -> None:
+        try:
+            message = json.loads(data)
+            node_id, message_type, keys = message["node_id"], message["type"], message["keys"]
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Malformed message in %s, clearing local cache", self._channel)
+            self._clear_local()
+            return
+        if node_id == self._node_id:
+            return
+        if message_type == INVALIDATE_ALL:
+            self._clear_local()
+        else:
+            self._evict_local(keys)
+
+    async def _broadcast(self, keys: Sequence[str] = (), *, clear: bool = False) -> None:
+        """Рассылка одного сообщения об инвалидации ключей (или всего кеша) репликам"""
+
+        message = {
+            "node_id": self._node_id,
+            "type": INVALIDATE_ALL if clear else INVALIDATE_KEYS,
+            "keys": list(keys),
+        }
+        try:
+            await self.remote.redis.publish(self._channel, json.dumps(message))
+        except RedisError:
+            logger.exception("Failed to broadcast invalidation for %s keys", len(keys))
+
+    async def close(self) -> None:
+        """Остановка подписки на канал инвалидации"""
+
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+
+    # -- KeyValueCache --
+
+    async def get(self, key: str) -> T | None:
+        return await self.get_or_load(key)
+
+    async def get_or_load(
+            self, key: str, loader: Callable[[], Awaitable[T | None]] | None = None
+    ) -> T | None:
+        """Получение значения с загрузкой из источника при промахе.
+        Одновременные запросы одного ключа дожидаются единственной загрузки.
+
+        :param key: Ключ значения.
+        :param loader: Загрузчик значения из первоисточника (например, из БД).
+        """
+
+        await self._ensure_listener()
+        value = self._get_local(key)
+        if value is not None:
+            self.stats.local_hits += 1
+            return value
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            return await asyncio.shield(in_flight)
+        future: asyncio.Future[T | None] = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        self._begin_load((key,))
+        try:
+            value = await self._load(key, loader)
+        except BaseException as e:
+            future.set_exception(e)
+            # Исключение уже передано ожидающим, иначе оно останется "не полученным"
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            self._in_flight.pop(key, None)
+            self._end_load((key,))
+
+    async def _load(
+            self, key: str, loader: Callable[[], Awaitable[T | None]] | None
+    ) -> T | None:
+        value = await self.remote.get(key)
+        if value is not None:
+            self.stats.remote_hits += 1
+        elif loader is not None:
+            self.stats.misses += 1
+            self.stats.loads += 1
+            value = await loader()
+            if value is not None:
+                await self.remote.set(key, value)
+        else:
+            self.stats.misses += 1
+        if value is not None:
+            self._fill_local(key, value)
+        return value
+
+    async def set(self, key: str, value: T, ttl: timedelta | None = None) -> None:
+        await self._ensure_listener()
+        await self.remote.set(key, value, ttl)
+        self._mark_stale((key,))
+        self._set_local(key, value)
+        await self._broadcast((key,))
+
+    async def invalidate(self, key: str) -> bool:
+        self._local.pop(key, None)
+        self._mark_stale((key,))
+        deleted = await self.remote.invalidate(key)
+        await self._broadcast((key,))
+        return deleted
+
+    async def exists(self, key: str) -> bool:
+        if self._get_local(key) is not None:
+            return True
+        return await self.remote.exists(key)
+
+    async def clear(self) -> None:
+        self._clear_local()
+        await self.remote.clear()
+        await self._broadcast(clear=True)
@@ -7,6 +7,7 @@ from redis.asyncio import Redis
 
 from ...application import KeyValueCache
 from ...application.exceptions import CacheHitError, CacheInvalidationError, CacheSetError
+from .serializers import CacheSerializer, PydanticJsonSerializer
 
 logger = logging.getLogger(__name__)
 
@@ -19,16 +20,26 @@ class RedisKeyValueCache[T: BaseModel](KeyValueCache):
 
     model: type[T]
 
-    def __init__(self, url: str, prefix: str, ttl: timedelta) -> None:
+    SCAN_BATCH_SIZE = 500  # Количество ключей удаляемых за одну итерацию при отчистке
+
+    def __init__(
+            self,
+            url: str,
+            prefix: str,
+            ttl: timedelta,
+            serializer: CacheSerializer[T] | None = None,
+    ) -> None:
         """
         :param url: URL для подключения к Redis.
         :param prefix: Осмысленный префикс для уникального ключа (для избежания коллизий).
         :param ttl: Время жизни значения в кеше (обязателен для production).
+        :param serializer: Сериализатор значений, по умолчанию JSON через Pydantic.
         """
 
         self.redis = Redis.from_url(url)
         self.prefix = prefix
         self.ttl = ttl
+        self.serializer = serializer or PydanticJsonSerializer(self.model)
 
     def _build_key(self, key: str) -> str:
         return f"{self.prefix}:{key}"
@@ -41,7 +52,7 @@ class RedisKeyValueCache[T: BaseModel](KeyValueCache):
                 logger.debug("Cache miss", extra={"key": built_key})
                 return None
             logger.debug("Cache hit", extra={"key": built_key})
-            return self.model.model_validate_json(data.decode("utf-8"))
+            return self.serializer.loads(data)
         except RedisError as e:
             raise CacheHitError(key=built_key, original_error=e) from e
 
@@ -49,12 +60,8 @@ class RedisKeyValueCache[T: BaseModel](KeyValueCache):
         actual_ttl = ttl or self.ttl
         built_key = self._build_key(key)
         try:
-            await self.redis.set(built_key, value.model_dump_json())
-            await self.redis.expire(built_key, actual_ttl)
-            logger.info(
-                "Cache set successfully",
-                extra={"key": built_key, "value": value.model_dump_json()}
-            )
+            await self.redis.set(built_key, self.serializer.dumps(value), ex=actual_ttl)
+            logger.debug("Cache set successfully", extra={"key": built_key})
         except RedisError as e:
             raise CacheSetError(key=built_key, value=value, original_error=e) from e
 
@@ -73,11 +80,21 @@ class RedisKeyValueCache[T: BaseModel](KeyValueCache):
         return await self.redis.exists(built_key)
 
     async def clear(self) -> None:
-        """Отчистка кеша по префиксу"""
+        """Отчистка кеша по префиксу.
+        Использует `SCAN` вместо блокирующего `KEYS` и удаляет ключи пачками через `UNLINK`.
+        """
 
         pattern = f"{self.prefix}:*"
-        keys = await self.redis.keys(pattern)
-        if keys:
-            await self.redis.delete(*keys)
-            logger.info("Cleared %s keys with prefix %s", len(keys), self.prefix)
-        logger.info("Cache cleared successfully!")
+        cleared_count = 0
+        batch: list[bytes] = []
+        try:
+            async for key in self.redis.scan_iter(match=pattern, count=self.SCAN_BATCH_SIZE):
+                batch.append(key)
+                if len(batch) >= self.SCAN_BATCH_SIZE:
+                    cleared_count += await self.redis.unlink(*batch)
+                    batch.clear()
+            if batch:
+                cleared_count += await self.redis.unlink(*batch)
+        except RedisError as e:
+            raise CacheInvalidationError(key=pattern, original_error=e) from e
+        logger.info("Cleared %s keys with prefix %s", cleared_count, self.prefix)
@@ -0,0 +1,24 @@
+from typing import Protocol
+
+from pydantic import BaseModel
+
+
+class CacheSerializer[T: BaseModel](Protocol):
+    """Сериализатор кешируемых объектов (модель <-> байты)"""
+
+    def dumps(self, value: T) -> bytes: ...
+
+    def loads(self, data: bytes) -> T: ...
+
+
+class PydanticJsonSerializer[T: BaseModel]:
+    """Сериализация через встроенный JSON Pydantic (используется по умолчанию)"""
+
+    def __init__(self, model: type[T]) -> None:
+        self.model = model
+
+    def dumps(self, value: T) -> bytes:  # noqa: PLR6301
+        return value.model_dump_json().encode("utf-8")
+
+    def loads(self, data: bytes) -> T:
+        return self.model.model_validate_json(data)
@@ -4,6 +4,7 @@ __all__ = (
     "DateTimeNull",
     "JsonField",
     "JsonFieldNull",
+    "PoolMetrics",
     "SQLAlchemyRepository",
     "SQLAlchemyUnitOfWork",
     "StrArray",
@@ -15,10 +16,17 @@ __all__ = (
     "UUIDArray",
     "UUIDField",
     "UUIDFieldNull",
+    "create_engine",
+    "generate_column_mapping",
+    "get_instrumented_pool",
+    "get_pool_metrics",
+    "paginate",
     "sessionmaker",
 )
 
 from .base import Base, sessionmaker
+from .engine import PoolMetrics, create_engine, get_instrumented_pool, get_pool_metrics
+from .mapping import generate_column_mapping
 from .primitives import (
     DateTimeNull,
     JsonField,
@@ -33,5 +41,5 @@ from .primitives import (
     UUIDField,
     UUIDFieldNull,
 )
-from .repository import DataMapper, SQLAlchemyRepository
+from .repository import DataMapper, SQLAlchemyRepository, paginate
 from .uow import SQLAlchemyUnitOfWork
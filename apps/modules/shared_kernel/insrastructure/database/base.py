@@ -1,24 +1,23 @@
-from typing import Final
+from typing import Any, Final
 
 from collections.abc import AsyncIterator
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, Index, func
 from sqlalchemy.ext.asyncio import (
     AsyncAttrs,
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
-    create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 from config.dev import settings
 
-engine: Final[AsyncEngine] = create_async_engine(
-    url=settings.postgres.sqlalchemy_url, echo=True
-)
+from .engine import create_engine
+
+engine: Final[AsyncEngine] = create_engine(settings.postgres)
 sessionmaker: Final[async_sessionmaker[AsyncSession]] = async_sessionmaker(
     engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
 )
@@ -39,6 +38,13 @@ class Base(AsyncAttrs, DeclarativeBase):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Составной индекс для keyset пагинации по (created_at, id)
+        table = cls.__dict__.get("__table__")
+        if table is not None:
+            Index(f"ix_{table.name}_created_at_id", table.c.created_at, table.c.id)
+
 
 async def session_factory() -> AsyncIterator[AsyncSession]:
     async with sessionmaker() as session:
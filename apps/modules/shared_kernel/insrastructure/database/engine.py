@@ -0,0 +1,210 @@
+from typing import Any
+
+import logging
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, PoolProxiedConnection
+
+from config.dev import PostgresSettings
+
+logger = logging.getLogger(__name__)
+
+QUERY_STARTED_AT_KEY = "query_started_at"  # Стек времени начала запросов в `Connection.info`
+WAIT_SAMPLES_LIMIT = 10_000  # Количество последних замеров ожидания для расчёта перцентилей
+STATEMENT_LOG_LIMIT = 500  # Максимальная длина SQL выражения в логе медленного запроса
+
+
+@dataclass
+class PoolMetrics:
+    """Метрики пула соединений"""
+
+    connects: int = 0
+    checkouts: int = 0
+    checkins: int = 0
+    timeouts: int = 0
+    waits: int = 0
+    wait_time_total: float = 0
+    wait_time_max: float = 0
+    connect_time_total: float = 0
+    connect_time_max: float = 0
+    slow_queries: int = 0
+    wait_times: deque[float] = field(
+        default_factory=lambda: deque(maxlen=WAIT_SAMPLES_LIMIT), repr=False
+    )
+
+    @property
+    def wait_time_avg(self) -> float:
+        return self.wait_time_total / self.waits if self.waits else 0.0
+
+    @property
+    def connect_time_avg(self) -> float:
+        return self.connect_time_total / self.connects if self.connects else 0.0
+
+    def observe_wait(self, elapsed: float) -> None:
+        self.waits += 1
+        self.wait_time_total += elapsed
+        self.wait_time_max = max(self.wait_time_max, elapsed)
+        self.wait_times.append(elapsed)
+
+    def observe_connect(self, elapsed: float) -> None:
+        self.connect_time_total += elapsed
+        self.connect_time_max = max(self.connect_time_max, elapsed)
+
+
+@dataclass
+class _Checkout:
+    """Получение соединения из пула текущей задачей"""
+
+    connect_time: float = 0
+
+
+# Выполняемое получение соединения, `_do_get` вызывает себя рекурсивно,
+# а при создании overflow соединения подключается к БД внутри ожидания
+_current_checkout: ContextVar[_Checkout | None] = ContextVar("current_checkout", default=None)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Пул соединений с замером времени ожидания свободного соединения.
+    Время установки нового соединения считается отдельно и в ожидание не входит.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        if _current_checkout.get() is not None:
+            return super()._do_get()
+        checkout = _Checkout()
+        token = _current_checkout.set(checkout)
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started_at
+            _current_checkout.reset(token)
+            self.metrics.observe_wait(max(0.0, elapsed - checkout.connect_time))
+
+    def _create_connection(self) -> ConnectionPoolEntry:
+        started_at = time.perf_counter()
+        try:
+            return super()._create_connection()
+        finally:
+            elapsed = time.perf_counter() - started_at
+            self.metrics.observe_connect(elapsed)
+            if (checkout := _current_checkout.get()) is not None:
+                checkout.connect_time += elapsed
+
+
+def get_instrumented_pool(engine: AsyncEngine) -> InstrumentedQueuePool:
+    """Пул соединений движка, созданного через `create_engine`"""
+
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, InstrumentedQueuePool):
+        raise TypeError(f"Engine pool {type(pool).__name__} is not instrumented")
+    return pool
+
+
+def _instrument_pool(pool: InstrumentedQueuePool) -> None:
+    metrics = pool.metrics
+
+    @event.listens_for(pool, "connect")
+    def on_connect(*_: Any) -> None:
+        metrics.connects += 1
+
+    @event.listens_for(pool, "checkout")
+    def on_checkout(
+            dbapi_connection: Any,  # noqa: ARG001
+            connection_record: ConnectionPoolEntry,  # noqa: ARG001
+            connection_proxy: PoolProxiedConnection,  # noqa: ARG001
+    ) -> None:
+        metrics.checkouts += 1
+
+    @event.listens_for(pool, "checkin")
+    def on_checkin(*_: Any) -> None:
+        metrics.checkins += 1
+
+
+def _instrument_slow_queries(
+        engine: AsyncEngine, threshold_ms: float, metrics: PoolMetrics
+) -> None:
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn: Connection, *_: Any) -> None:
+        conn.info.setdefault(QUERY_STARTED_AT_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(
+            conn: Connection,
+            cursor: Any,  # noqa: ARG001
+            statement: str,
+            parameters: Any,  # noqa: ARG001
+            context: ExecutionContext,  # noqa: ARG001
+            executemany: bool,
+    ) -> None:
+        elapsed_ms = (time.perf_counter() - conn.info[QUERY_STARTED_AT_KEY].pop()) * 1000
+        if elapsed_ms >= threshold_ms:
+            metrics.slow_queries += 1
+            logger.warning(
+                "Slow query took %.1f ms: %s",
+                elapsed_ms,
+                statement[:STATEMENT_LOG_LIMIT],
+                extra={"elapsed_ms": elapsed_ms, "executemany": executemany},
+            )
+
+
+def create_engine(postgres_settings: PostgresSettings) -> AsyncEngine:
+    """Создание асинхронного движка с настройками пула из конфигурации.
+    Метрики пула доступны через `get_pool_metrics(engine)`.
+    """
+
+    engine = create_async_engine(
+        url=postgres_settings.sqlalchemy_url,
+        echo=postgres_settings.echo,
+        poolclass=InstrumentedQueuePool,
+        pool_size=postgres_settings.pool_size,
+        max_overflow=postgres_settings.max_overflow,
+        pool_timeout=postgres_settings.pool_timeout,
+        pool_recycle=postgres_settings.pool_recycle,
+        pool_pre_ping=postgres_settings.pool_pre_ping,
+        connect_args={
+            "statement_cache_size": postgres_settings.statement_cache_size,
+            "prepared_statement_cache_size": postgres_settings.statement_cache_size,
+        },
+    )
+    pool = get_instrumented_pool(engine)
+    _instrument_pool(pool)
+    _instrument_slow_queries(engine, postgres_settings.slow_query_threshold_ms, pool.metrics)
+    return engine
+
+
+def get_pool_metrics(engine: AsyncEngine) -> dict[str, Any]:
+    """Снимок метрик пула соединений (для логирования или экспорта в мониторинг)"""
+
+    pool = get_instrumented_pool(engine)
+    metrics = pool.metrics
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "connects": metrics.connects,
+        "checkouts": metrics.checkouts,
+        "checkins": metrics.checkins,
+        "timeouts": metrics.timeouts,
+        "wait_time_avg_ms": metrics.wait_time_avg * 1000,
+        "wait_time_max_ms": metrics.wait_time_max * 1000,
+        "connect_time_avg_ms": metrics.connect_time_avg * 1000,
+        "connect_time_max_ms": metrics.connect_time_max * 1000,
+        "slow_queries": metrics.slow_queries,
+    }
@@ -0,0 +1,203 @@
+from typing import Any, Union, cast, get_args, get_origin, is_typeddict
+
+import types
+from collections.abc import Callable
+from copy import deepcopy
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+from functools import cache, partial
+from uuid import UUID
+
+from pydantic import BaseModel, EmailStr
+from pydantic.fields import FieldInfo, ModelPrivateAttr
+from pydantic_core import PydanticUndefined
+from sqlalchemy import Uuid, inspect
+from sqlalchemy.orm import Mapper
+
+from ...domain import Entity
+
+type Converter = Callable[[Any], Any]
+
+# Типы, значения которых из БД передаются в сущность без преобразования
+PLAIN_TYPES: tuple[type, ...] = (str, int, float, bool, bytes, datetime, date, dict)
+
+_object_setattr = object.__setattr__
+
+
+class UnsafeFieldError(TypeError):
+    """Поле сущности нельзя построить из колонки без валидации"""
+
+
+def _convert_uuid(value: Any) -> UUID:
+    return value if isinstance(value, UUID) else UUID(value)
+
+
+def _build_enum_converter(enum_class: type[Enum]) -> Converter:
+    members = enum_class._value2member_map_
+
+    def convert(value: Any) -> Enum:
+        member = members.get(value)
+        return member if member is not None else enum_class(value)
+
+    return convert
+
+
+def _build_collection_converter(collection_type: type, item_annotation: Any) -> Converter | None:
+    item_converter = build_converter(item_annotation)
+    if item_converter is None and collection_type is list:
+        return None
+    convert_item = item_converter or (lambda item: item)
+    return lambda values: collection_type(convert_item(value) for value in values)
+
+
+def build_converter(annotation: Any) -> Converter | None:
+    """Преобразование значения колонки в тип поля сущности без полной валидации.
+    `None` - значение передаётся как есть.
+
+    :exception UnsafeFieldError: Тип требует валидации (вложенные модели и т.п.).
+    """
+
+    origin = get_origin(annotation)
+    if origin in {Union, types.UnionType}:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            raise UnsafeFieldError(annotation)
+        return build_converter(args[0])
+    if origin in {list, set, frozenset, tuple}:
+        return _build_collection_converter(origin, get_args(annotation)[0])
+    if origin is dict or annotation in {Any, EmailStr}:
+        return None
+    if isinstance(annotation, type):
+        if issubclass(annotation, Enum):
+            return _build_enum_converter(annotation)
+        if issubclass(annotation, UUID):
+            return _convert_uuid
+        if issubclass(annotation, BaseModel):
+            raise UnsafeFieldError(annotation)
+        if issubclass(annotation, PLAIN_TYPES) or is_typeddict(annotation):
+            return None
+    raise UnsafeFieldError(annotation)
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnMapping[EntityT: Entity]:
+    """Сгенерированное отображение колонок ORM модели на поля сущности.
+
+    Attributes:
+        entity_class: Класс сущности.
+        fields: Поля в порядке объявления: (имя, конвертер, `FieldInfo` если значение
+            берётся по умолчанию, а не из колонки).
+        private_attributes: Фабрики значений приватных атрибутов сущности (например, `_events`).
+    """
+
+    entity_class: type[EntityT]
+    fields: tuple[tuple[str, Converter | None, FieldInfo | None], ...]
+    private_attributes: tuple[tuple[str, Callable[[], Any]], ...]
+
+    def build(self, model: Any) -> EntityT:
+        """Построение сущности в обход валидации, аналог `model_construct` без его накладных
+        расходов. Загруженные значения читаются напрямую из `__dict__` ORM объекта.
+        """
+
+        source = model.__dict__
+        values: dict[str, Any] = {}
+        for name, converter, default in self.fields:
+            if default is not None:
+                values[name] = default.get_default(
+                    call_default_factory=True, validated_data=values
+                )
+                continue
+            value = source[name] if name in source else getattr(model, name)
+            values[name] = value if converter is None or value is None else converter(value)
+        entity = self.entity_class.__new__(self.entity_class)
+        _object_setattr(entity, "__dict__", values)
+        _object_setattr(entity, "__pydantic_fields_set__", set(values))
+        _object_setattr(entity, "__pydantic_extra__", None)
+        private = (
+            {name: factory() for name, factory in self.private_attributes}
+            if self.private_attributes
+            else None
+        )
+        _object_setattr(entity, "__pydantic_private__", private)
+        return entity
+
+
+def _private_attribute_factory(attribute: ModelPrivateAttr) -> Callable[[], Any] | None:
+    """Фабрика значения приватного атрибута, `None` - атрибут без значения по умолчанию"""
+
+    # Фабрика вызывается явно: поведение `get_default` различается между версиями pydantic
+    if attribute.default_factory is not None:
+        return cast(Callable[[], Any], attribute.default_factory)
+    if attribute.default is PydanticUndefined:
+        return None
+    return partial(deepcopy, attribute.default)
+
+
+def _build_relationship_converter(annotation: Any, model_class: type) -> Converter | None:
+    """Конвертер списка связанных строк в список вложенных сущностей"""
+
+    if get_origin(annotation) is not list:
+        return None
+    item_class = get_args(annotation)[0]
+    if not isinstance(item_class, type) or not issubclass(item_class, Entity):
+        return None
+    mapping = generate_column_mapping(item_class, model_class)
+    if mapping is None:
+        return None
+    return lambda values: [mapping.build(value) for value in values]
+
+
+@cache
+def get_column_keys(model_class: type) -> frozenset[str]:
+    """Имена атрибутов-колонок ORM модели"""
+
+    mapper: Mapper[Any] = inspect(model_class)
+    return frozenset(attribute.key for attribute in mapper.column_attrs)
+
+
+@cache
+def generate_column_mapping[EntityT: Entity](
+        entity_class: type[EntityT], model_class: type
+) -> ColumnMapping[EntityT] | None:
+    """Генерация отображения для пары классов (выполняется один раз).
+    Возвращает `None` если сущность нельзя безопасно построить без валидации:
+    обязательное поле отсутствует среди колонок или имеет сложный тип.
+    Списки вложенных сущностей строятся из отношений (`relationship`) по их
+    собственному отображению.
+    """
+
+    mapper: Mapper[Any] = inspect(model_class)
+    columns = {attribute.key: attribute.columns[0] for attribute in mapper.column_attrs}
+    fields: list[tuple[str, Converter | None, FieldInfo | None]] = []
+    for name, field in entity_class.model_fields.items():
+        column = columns.get(name)
+        if column is None and name in mapper.relationships:
+            converter = _build_relationship_converter(
+                field.annotation, mapper.relationships[name].mapper.class_
+            )
+            if converter is None:
+                return None
+            fields.append((name, converter, None))
+            continue
+        if column is None:
+            if field.is_required():
+                return None
+            fields.append((name, None, field))
+            continue
+        try:
+            converter = build_converter(field.annotation)
+        except UnsafeFieldError:
+            return None
+        if converter is _convert_uuid and isinstance(column.type, Uuid):
+            converter = None  # Драйвер уже возвращает UUID
+        fields.append((name, converter, None))
+    return ColumnMapping(
+        entity_class=entity_class,
+        fields=tuple(fields),
+        private_attributes=tuple(
+            (name, factory)
+            for name, attribute in entity_class.__private_attributes__.items()
+            if (factory := _private_attribute_factory(attribute)) is not None
+        ),
+    )
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, UniqueConstraint, select
+from sqlalchemy import DateTime, Index, UniqueConstraint, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -8,7 +8,7 @@ from ...application import OutboxMessage, OutboxRepository, OutboxStatus, Pagina
 from ...application.exceptions import ReadingError
 from .base import Base
 from .primitives import DateTimeNull, JsonField, StrNull, UUIDField
-from .repository import DataMapper, SQLAlchemyRepository
+from .repository import DataMapper, SQLAlchemyRepository, paginate
 
 
 class OutboxMessageModel(Base):
@@ -27,17 +27,21 @@ class OutboxMessageModel(Base):
 
     __table_args__ = (
         UniqueConstraint("entity_id", "entity_type", "payload", name="outbox_uq"),
+        Index("ix_outbox_messages_status_occurred_on_id", "status", "occurred_on", "id"),
     )
 
 
 class OutboxDataMapper(DataMapper[OutboxMessage, OutboxMessageModel]):
+    entity_class = OutboxMessage
+    model_class = OutboxMessageModel
+
     @classmethod
     def model_to_entity(cls, model: OutboxMessageModel) -> OutboxMessage:
         return OutboxMessage.model_validate(model)
 
     @classmethod
     def entity_to_model(cls, entity: OutboxMessage) -> OutboxMessageModel:
-        return OutboxMessageModel(**entity.model_dump())
+        return OutboxMessageModel(**cls.entity_to_values(entity))
 
 
 class SQLAlchemyOutboxRepository(
@@ -55,17 +59,14 @@ class SQLAlchemyOutboxRepository(
                 (self.model.status == status) &
                 (self.model.attempts <= self.model.max_attempts)
             )
-            stmt = (
-                select(self.model)
-                .where(conditions)
-                .order_by(self.model.occurred_on.asc())
-                .offset(pagination.offset)
-                .limit(pagination.limit)
-                .with_for_update(skip_locked=True)
-            )
+            stmt = paginate(
+                select(self.model).where(conditions),
+                pagination,
+                self.model.occurred_on,
+                self.model.id,
+            ).with_for_update(skip_locked=True)
             results = await self.session.execute(stmt)
-            models = results.scalars().all()
-            return [self.data_mapper.model_to_entity(model) for model in models]
+            return self.data_mapper.models_to_entities(results.scalars().all())
         except SQLAlchemyError as e:
             raise ReadingError(
                 entity_name=self.entity.__class__.__name__,
@@ -1,11 +1,16 @@
 from typing import Any
 
 from abc import abstractmethod
+from collections.abc import Iterable, Sequence
+from itertools import batched
 from uuid import UUID
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import Select, delete, func, inspect, literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.dml import ReturningInsert
 
 from ...application import Pagination
 from ...application.exceptions import (
@@ -17,9 +22,19 @@ from ...application.exceptions import (
 )
 from ...domain import Entity
 from .base import Base
+from .mapping import ColumnMapping, generate_column_mapping, get_column_keys
 
 
-class DataMapper[EntityT: Entity, ModelT: Any]:
+class DataMapper[EntityT: Entity, ModelT: Base]:
+    """Преобразование ORM модели <-> доменной сущности.
+
+    Помимо явных `model_to_entity` / `entity_to_model` поддерживает быстрый путь
+    для строк из собственной БД (`model_to_entity_trusted`), при котором сущность
+    строится без валидации по сгенерированному отображению колонок.
+    Быстрый путь доступен при заданных `entity_class` и `model_class`, если все поля
+    сущности - простые типы, перечисления или UUID, иначе используется `model_to_entity`.
+    """
+
     entity_class: type[EntityT]
     model_class: type[ModelT]
 
@@ -31,12 +46,133 @@ class DataMapper[EntityT: Entity, ModelT: Any]:
     @abstractmethod
     def entity_to_model(cls, entity: EntityT) -> ModelT: ...
 
+    @classmethod
+    def column_mapping(cls) -> ColumnMapping[EntityT] | None:
+        """Сгенерированное отображение колонок или `None` если быстрый путь недоступен"""
+
+        if not hasattr(cls, "entity_class") or not hasattr(cls, "model_class"):
+            return None
+        return generate_column_mapping(cls.entity_class, cls.model_class)
+
+    @classmethod
+    def model_to_entity_trusted(cls, model: ModelT) -> EntityT:
+        """Построение сущности без валидации (только для строк из собственной БД)"""
+
+        mapping = cls.column_mapping()
+        return cls.model_to_entity(model) if mapping is None else mapping.build(model)
+
+    @classmethod
+    def models_to_entities(cls, models: Iterable[ModelT]) -> list[EntityT]:
+        """Пакетное преобразование строк из собственной БД в сущности"""
+
+        mapping = cls.column_mapping()
+        if mapping is None:
+            return [cls.model_to_entity(model) for model in models]
+        return [mapping.build(model) for model in models]
+
+    @classmethod
+    def entity_to_values(cls, entity: EntityT) -> dict[str, Any]:
+        """Значения колонок сущности без `model_dump` (для `entity_to_model`)"""
+
+        columns = get_column_keys(cls.model_class)
+        return {
+            name: getattr(entity, name)
+            for name in type(entity).model_fields
+            if name in columns
+        }
+
+
+# Колонки, которые не перезаписываются при upsert
+UPSERT_IMMUTABLE_COLUMNS: frozenset[str] = frozenset({"id", "created_at"})
+
+
+def model_to_row(model: Base) -> dict[str, Any]:
+    """Значения колонок ORM модели для bulk операций.
+    Пустые значения колонок со значением по умолчанию пропускаются, чтобы отработал default.
+    Связи (relationship) не включаются.
+    """
+
+    row: dict[str, Any] = {}
+    for attribute in inspect(type(model)).column_attrs:
+        value = getattr(model, attribute.key)
+        column = attribute.columns[0]
+        if value is None and (column.default is not None or column.server_default is not None):
+            continue
+        row[attribute.key] = value
+    return row
+
+
+type RowGroups[ModelT: Base] = dict[
+    tuple[type[ModelT], frozenset[str]], list[tuple[int, dict[str, Any]]]
+]
+
+
+def group_rows[ModelT: Base](models: Iterable[ModelT]) -> RowGroups[ModelT]:
+    """Группировка строк по классу модели и набору колонок с позицией строки во входных данных.
+
+    Строки одного bulk запроса должны содержать одинаковые колонки: в многострочном
+    `INSERT` недостающая колонка получила бы NULL, а при upsert - перезаписала бы
+    существующее значение через `excluded`.
+    """
+
+    groups: RowGroups[ModelT] = {}
+    for position, model in enumerate(models):
+        row = model_to_row(model)
+        groups.setdefault((type(model), frozenset(row)), []).append((position, row))
+    return groups
+
+
+def paginate[SelectT: Select](
+        stmt: SelectT,
+        pagination: Pagination,
+        sort_column: InstrumentedAttribute[Any],
+        id_column: InstrumentedAttribute[Any],
+) -> SelectT:
+    """Пагинация запроса в порядке (sort_column, id_column).
+    С курсором применяется keyset условие `(sort_column, id) > (cursor.timestamp, cursor.id)`,
+    которое использует составной индекс и не зависит от глубины страницы.
+    """
+
+    if pagination.cursor is not None:
+        stmt = stmt.where(
+            tuple_(sort_column, id_column)
+            > tuple_(literal(pagination.cursor.timestamp), literal(pagination.cursor.id))
+        )
+    else:
+        stmt = stmt.offset(pagination.offset)
+    return stmt.order_by(sort_column, id_column).limit(pagination.limit)
+
+
+def build_upsert_statement[ModelT: Base](
+        model_class: type[ModelT], rows: Sequence[dict[str, Any]], conflict_keys: Sequence[str]
+) -> ReturningInsert[Any]:
+    """`INSERT ... ON CONFLICT DO UPDATE RETURNING` обновляющий все переданные колонки.
+    Все строки должны содержать одинаковый набор колонок (см. `group_rows`).
+    """
+
+    columns = rows[0].keys() if rows else set()
+    if any(row.keys() != columns for row in rows):
+        raise ValueError("All upserted rows must have the same columns")
+    stmt = insert(model_class)
+    updatable_columns = [
+        key for key in columns if key not in UPSERT_IMMUTABLE_COLUMNS and key not in conflict_keys
+    ]
+    return stmt.on_conflict_do_update(
+        index_elements=conflict_keys,
+        set_={
+            **{key: stmt.excluded[key] for key in updatable_columns},
+            "updated_at": func.now(),
+        },
+    ).returning(model_class, sort_by_parameter_order=True)
+
 
 class SQLAlchemyRepository[EntityT: Entity, ModelT: Base]:
     entity: type[EntityT]
     model: type[ModelT]
     data_mapper: type[DataMapper[EntityT, ModelT]]
 
+    bulk_chunk_size: int = 1000  # Количество строк в одном bulk запросе
+
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
@@ -52,12 +188,67 @@ class SQLAlchemyRepository[EntityT: Entity, ModelT: Base]:
         except SQLAlchemyError as e:
             raise CreationError(entity_name=self.entity.__name__, original_error=e) from e
 
+    async def create_many(self, entities: Sequence[EntityT]) -> list[EntityT]:
+        """Пакетное создание сущностей через многострочный `INSERT ... RETURNING`.
+        Один запрос на каждые `bulk_chunk_size` строк, порядок результата совпадает с входным.
+        Связанные сущности (relationship) не сохраняются.
+        """
+
+        created: list[EntityT | None] = [None] * len(entities)
+        try:
+            models = [self.data_mapper.entity_to_model(entity) for entity in entities]
+            for (model_class, _), rows in group_rows(models).items():
+                for chunk in batched(rows, self.bulk_chunk_size, strict=False):
+                    positions, values = zip(*chunk, strict=True)
+                    stmt = insert(model_class).returning(
+                        model_class, sort_by_parameter_order=True
+                    )
+                    results = await self.session.scalars(stmt, list(values))
+                    for position, entity in zip(
+                            positions, self.data_mapper.models_to_entities(results), strict=True
+                    ):
+                        created[position] = entity
+        except IntegrityError as e:
+            raise ConflictError(entity_name=self.entity.__name__, original_error=e) from e
+        except SQLAlchemyError as e:
+            raise CreationError(entity_name=self.entity.__name__, original_error=e) from e
+        else:
+            return [entity for entity in created if entity is not None]
+
+    async def upsert_many(
+            self, entities: Sequence[EntityT], conflict_keys: Sequence[str] = ("id",)
+    ) -> list[EntityT]:
+        """Пакетная вставка или обновление через `INSERT ... ON CONFLICT DO UPDATE RETURNING`.
+
+        :param entities: Сущности для сохранения.
+        :param conflict_keys: Колонки уникального индекса, по которым определяется конфликт.
+        """
+
+        saved: list[EntityT | None] = [None] * len(entities)
+        try:
+            models = [self.data_mapper.entity_to_model(entity) for entity in entities]
+            for (model_class, _), rows in group_rows(models).items():
+                for chunk in batched(rows, self.bulk_chunk_size, strict=False):
+                    positions, values = zip(*chunk, strict=True)
+                    stmt = build_upsert_statement(model_class, values, conflict_keys)
+                    results = await self.session.scalars(stmt, list(values))
+                    for position, entity in zip(
+                            positions, self.data_mapper.models_to_entities(results), strict=True
+                    ):
+                        saved[position] = entity
+        except IntegrityError as e:
+            raise ConflictError(entity_name=self.entity.__name__, original_error=e) from e
+        except SQLAlchemyError as e:
+            raise CreationError(entity_name=self.entity.__name__, original_error=e) from e
+        else:
+            return [entity for entity in saved if entity is not None]
+
     async def read(self, id: UUID) -> EntityT | None:  # noqa: A002
         try:
             stmt = select(self.model).where(self.model.id == id)
             result = await self.session.execute(stmt)
             model = result.scalar_one_or_none()
-            return self.data_mapper.model_to_entity(model) if model else None
+            return self.data_mapper.model_to_entity_trusted(model) if model else None
         except SQLAlchemyError as e:
             raise ReadingError(
                 entity_id=id, entity_name=self.entity.__name__, original_error=e
@@ -65,15 +256,11 @@ class SQLAlchemyRepository[EntityT: Entity, ModelT: Base]:
 
     async def read_all(self, pagination: Pagination) -> list[EntityT]:
         try:
-            stmt = (
-                select(self.model)
-                .order_by(self.model.created_at)
-                .offset(pagination.offset)
-                .limit(pagination.limit)
+            stmt = paginate(
+                select(self.model), pagination, self.model.created_at, self.model.id
             )
             results = await self.session.execute(stmt)
-            models = results.scalars().all()
-            return [self.data_mapper.model_to_entity(model) for model in models]
+            return self.data_mapper.models_to_entities(results.scalars().all())
         except SQLAlchemyError as e:
             raise ReadingError(
                 entity_name=self.entity.__name__,
@@ -99,6 +286,31 @@ class SQLAlchemyRepository[EntityT: Entity, ModelT: Base]:
                 entity_id=id, entity_name=self.entity.__name__, original_error=e
             ) from e
 
+    async def update_many(self, ids: Sequence[UUID], **kwargs) -> list[EntityT]:
+        """Пакетное обновление одинаковыми значениями через `UPDATE ... WHERE id IN (...)`"""
+
+        updated: list[EntityT] = []
+        try:
+            for chunk in batched(ids, self.bulk_chunk_size, strict=False):
+                stmt = (
+                    update(self.model)
+                    .where(self.model.id.in_(chunk))
+                    .values(**kwargs)
+                    .returning(self.model)
+                )
+                results = await self.session.scalars(stmt)
+                updated.extend(self.data_mapper.models_to_entities(results))
+        except IntegrityError as e:
+            raise ConflictError(entity_name=self.entity.__name__, original_error=e) from e
+        except SQLAlchemyError as e:
+            raise UpdateError(
+                entity_id=", ".join(str(entity_id) for entity_id in ids),
+                entity_name=self.entity.__name__,
+                original_error=e,
+            ) from e
+        else:
+            return updated
+
     async def delete(self, id: UUID) -> bool:  # noqa: A002
         try:
             stmt = delete(self.model).where(self.model.id == id)
@@ -1,6 +1,6 @@
 from typing import Self
 
-from collections.abc import Iterator
+from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,18 +10,27 @@ from ...application import UnitOfWork
 
 class SQLAlchemyUnitOfWork(UnitOfWork):
     def __init__(self, session: AsyncSession) -> None:
+        super().__init__()
         self.session = session
 
     async def __aenter__(self) -> Self:
         return self
 
     @asynccontextmanager
-    async def transactional(self) -> Iterator[Self]:
-        async with self.session.begin():
-            yield self
+    async def transactional(self) -> AsyncGenerator[Self]:
+        try:
+            async with self.session.begin():
+                yield self
+        except BaseException:
+            self._discard_commit_hooks()
+            raise
+        # Транзакция могла быть зафиксирована при выходе из блока без явного `commit`
+        await self._run_commit_hooks()
 
     async def commit(self) -> None:
         await self.session.commit()
+        await self._run_commit_hooks()
 
     async def rollback(self) -> None:
+        self._discard_commit_hooks()
         await self.session.rollback()
@@ -0,0 +1,42 @@
+__all__ = (
+    "CORRELATION_ID_HEADER",
+    "PUBLISHED_AT_HEADER",
+    "TRACEPARENT_HEADER",
+    "Counter",
+    "Histogram",
+    "JsonLinesSpanExporter",
+    "LoggingSpanExporter",
+    "MetricsRegistry",
+    "MetricsServer",
+    "Span",
+    "SpanContext",
+    "SpanExporter",
+    "Telemetry",
+    "TelemetryMiddleware",
+    "Tracer",
+    "bind_correlation_id",
+    "create_telemetry",
+    "current_correlation_id",
+    "current_span",
+    "extract",
+    "inject",
+)
+
+from .instrumentation import Telemetry, TelemetryMiddleware, create_telemetry
+from .metrics import Counter, Histogram, MetricsRegistry, MetricsServer
+from .tracing import (
+    CORRELATION_ID_HEADER,
+    PUBLISHED_AT_HEADER,
+    TRACEPARENT_HEADER,
+    JsonLinesSpanExporter,
+    LoggingSpanExporter,
+    Span,
+    SpanContext,
+    SpanExporter,
+    Tracer,
+    bind_correlation_id,
+    current_correlation_id,
+    current_span,
+    extract,
+    inject,
+)
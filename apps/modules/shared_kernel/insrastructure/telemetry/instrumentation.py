@@ -0,0 +1,174 @@
+from typing import Any
+
+import logging
+import time
+from collections.abc import Awaitable, Callable, Generator
+from contextlib import contextmanager
+from functools import partial
+
+from faststream import BaseMiddleware
+from faststream.message import StreamMessage
+from faststream.response import PublishCommand
+
+from config.dev import TelemetrySettings
+
+from .metrics import BYTES_BUCKETS, MetricsRegistry, MetricsServer
+from .tracing import (
+    CORRELATION_ID_HEADER,
+    PUBLISHED_AT_HEADER,
+    JsonLinesSpanExporter,
+    LoggingSpanExporter,
+    Span,
+    SpanContext,
+    SpanExporter,
+    Tracer,
+    current_span,
+    extract,
+    inject,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Telemetry:
+    """Трассировка и метрики воркера.
+
+    Спан на обработку каждого сообщения (`TelemetryMiddleware`) и на этапы
+    внутри обработчика (`stage`). Время в очереди и время в обработчике
+    считаются раздельно, чтобы было видно, какой этап конвейера не успевает
+    разбирать свою очередь.
+    """
+
+    def __init__(
+            self,
+            service: str,
+            exporter: SpanExporter,
+            metrics_server_address: tuple[str, int] | None = None,
+    ) -> None:
+        self.tracer = Tracer(service, exporter)
+        self.registry = MetricsRegistry()
+        self.messages = self.registry.counter(
+            "broker_messages_total", "Processed messages", ("queue", "status")
+        )
+        self.queue_wait = self.registry.histogram(
+            "broker_queue_wait_seconds", "Time from publish to handler start", ("queue",)
+        )
+        self.handler_time = self.registry.histogram(
+            "broker_handler_seconds", "Message handler duration", ("queue",)
+        )
+        self.message_size = self.registry.histogram(
+            "broker_message_size_bytes", "Consumed message body size", ("queue",), BYTES_BUCKETS
+        )
+        self.stage_time = self.registry.histogram(
+            "stage_seconds", "Duration of handler stages (dsp, stt, llm, ...)", ("stage",)
+        )
+        self._metrics_server = (
+            MetricsServer(self.registry, *metrics_server_address)
+            if metrics_server_address is not None
+            else None
+        )
+
+    @property
+    def middleware(self) -> Callable[..., "TelemetryMiddleware"]:
+        """Фабрика middleware для `RabbitBroker(middlewares=[...])`"""
+
+        return partial(TelemetryMiddleware, telemetry=self)
+
+    @contextmanager
+    def stage(self, name: str, **attributes: Any) -> Generator[Span]:
+        """Спан этапа обработки с замером в гистограмме `stage_seconds`"""
+
+        started_at = time.perf_counter()
+        try:
+            with self.tracer.start_span(name, **attributes) as span:
+                yield span
+        finally:
+            self.stage_time.observe(time.perf_counter() - started_at, stage=name)
+
+    async def start(self) -> None:
+        if self._metrics_server is not None:
+            await self._metrics_server.start()
+
+    async def stop(self) -> None:
+        if self._metrics_server is not None:
+            await self._metrics_server.stop()
+        self.tracer.exporter.close()
+
+
+class TelemetryMiddleware(BaseMiddleware):
+    """Спан обработки сообщения и передача контекста трассировки через заголовки.
+
+    При публикации из обработчика в заголовки пишутся `traceparent`,
+    `x-correlation-id` и время публикации, при получении - восстанавливается
+    родительский спан и считается время ожидания в очереди (между хостами
+    включает расхождение часов).
+    """
+
+    def __init__(self, msg: Any, /, *, telemetry: Telemetry, **kwargs: Any) -> None:
+        super().__init__(msg, **kwargs)
+        self._telemetry = telemetry
+        # Результат обработчика (`@broker.publisher`) публикуется после выхода из
+        # `consume_scope` через `publish_scope` этого же экземпляра
+        self._span_context: SpanContext | None = None
+
+    async def consume_scope(
+            self,
+            call_next: Callable[[StreamMessage[Any]], Awaitable[Any]],
+            msg: StreamMessage[Any],
+    ) -> Any:
+        telemetry = self._telemetry
+        headers = msg.headers
+        queue = getattr(msg.raw_message, "routing_key", None) or "unknown"
+        size = len(msg.body)
+        telemetry.message_size.observe(size, queue=queue)
+        with telemetry.tracer.start_span(
+                f"consume {queue}",
+                parent=extract(headers),
+                correlation_id=headers.get(CORRELATION_ID_HEADER) or msg.correlation_id,
+                queue=queue,
+                message_id=msg.message_id,
+                message_size=size,
+        ) as span:
+            self._span_context = span.context
+            if (published_at := headers.get(PUBLISHED_AT_HEADER)) is not None:
+                queue_wait = max(0.0, time.time() - float(published_at))
+                span.set_attribute("queue_wait", queue_wait)
+                telemetry.queue_wait.observe(queue_wait, queue=queue)
+            started_at = time.perf_counter()
+            status = "error"
+            try:
+                result = await call_next(msg)
+                status = "ok"
+                return result
+            finally:
+                handler_time = time.perf_counter() - started_at
+                span.set_attribute("handler_time", handler_time)
+                telemetry.handler_time.observe(handler_time, queue=queue)
+                telemetry.messages.inc(queue=queue, status=status)
+
+    async def publish_scope(
+            self, call_next: Callable[[PublishCommand], Awaitable[Any]], cmd: PublishCommand
+    ) -> Any:
+        span = current_span()
+        span_context = span.context if span is not None else self._span_context
+        if span_context is not None:
+            inject(span_context, cmd.headers)
+            cmd.correlation_id = span_context.correlation_id
+        cmd.headers[PUBLISHED_AT_HEADER] = f"{time.time():.6f}"
+        return await call_next(cmd)
+
+
+def create_telemetry(service: str, telemetry_settings: TelemetrySettings) -> Telemetry:
+    """Телеметрия воркера из конфигурации"""
+
+    exporter = (
+        JsonLinesSpanExporter(telemetry_settings.spans_path)
+        if telemetry_settings.spans_path is not None
+        else LoggingSpanExporter()
+    )
+    metrics_server_address = (
+        (telemetry_settings.metrics_host, telemetry_settings.metrics_port)
+        if telemetry_settings.metrics_port is not None
+        else None
+    )
+    return Telemetry(service, exporter, metrics_server_address)
@@ -0,0 +1,209 @@
+from typing import Any, Final, Literal, TextIO
+
+import json
+import logging
+import secrets
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from ...utils import generate_correlation_id
+
+logger = logging.getLogger(__name__)
+
+# Заголовки сообщений брокера, в которых передаётся контекст трассировки
+TRACEPARENT_HEADER: Final[str] = "traceparent"  # W3C Trace Context, совместим с OpenTelemetry
+CORRELATION_ID_HEADER: Final[str] = "x-correlation-id"
+PUBLISHED_AT_HEADER: Final[str] = "x-published-at"  # Unix time публикации (для ожидания в очереди)
+
+
+@dataclass(slots=True)
+class SpanContext:
+    """Контекст трассировки, передаваемый между сервисами.
+
+    Attributes:
+        trace_id: Идентификатор трассы (32 hex символа).
+        span_id: Идентификатор спана (16 hex символов).
+        correlation_id: Сквозной идентификатор задачи (`Event.correlation_id`).
+    """
+
+    trace_id: str
+    span_id: str
+    correlation_id: str
+
+    def to_traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+
+@dataclass(slots=True)
+class Span:
+    """Единица работы сервиса (обработка сообщения, вызов модели, DSP, ...).
+
+    Attributes:
+        name: Название операции.
+        service: Сервис (воркер), выполнивший операцию.
+        context: Контекст трассировки спана.
+        parent_id: Идентификатор родительского спана (в том числе из другого сервиса).
+        start_time: Unix time начала.
+        duration: Продолжительность в секундах.
+        status: Результат выполнения.
+        attributes: Дополнительные атрибуты.
+    """
+
+    name: str
+    service: str
+    context: SpanContext
+    parent_id: str | None
+    start_time: float
+    duration: float = 0
+    status: Literal["ok", "error"] = "ok"
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data.update(data.pop("context"))
+        return data
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
+
+
+def current_correlation_id() -> str:
+    """Correlation id текущей обработки, вне обработки - новый"""
+
+    span = _current_span.get()
+    return span.context.correlation_id if span is not None else generate_correlation_id()
+
+
+def bind_correlation_id(correlation_id: str) -> None:
+    """Привязка текущего спана к correlation id события: дочерние спаны
+    и публикуемые сообщения получат его в контексте
+    """
+
+    span = _current_span.get()
+    if span is not None:
+        span.context.correlation_id = correlation_id
+
+
+def inject(span_context: SpanContext, headers: dict[str, Any]) -> None:
+    """Запись контекста трассировки в заголовки сообщения"""
+
+    headers[TRACEPARENT_HEADER] = span_context.to_traceparent()
+    headers[CORRELATION_ID_HEADER] = span_context.correlation_id
+
+
+def extract(headers: dict[str, Any]) -> SpanContext | None:
+    """Чтение контекста трассировки из заголовков сообщения"""
+
+    traceparent = headers.get(TRACEPARENT_HEADER)
+    if not isinstance(traceparent, str):
+        return None
+    parts = traceparent.split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:  # noqa: PLR2004
+        return None
+    return SpanContext(
+        trace_id=parts[1],
+        span_id=parts[2],
+        correlation_id=str(headers.get(CORRELATION_ID_HEADER) or generate_correlation_id()),
+    )
+
+
+class SpanExporter(ABC):
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        """Экспорт завершённого спана"""
+
+    def close(self) -> None:  # noqa: B027
+        """Освобождение ресурсов экспортёра"""
+
+
+class LoggingSpanExporter(SpanExporter):
+    """Экспорт спанов в лог (уровень DEBUG)"""
+
+    def export(self, span: Span) -> None:  # noqa: PLR6301
+        logger.debug(
+            "Span %s [%s] %.3f sec, correlation_id=%s, %s",
+            span.name, span.status, span.duration, span.context.correlation_id, span.attributes,
+        )
+
+
+class JsonLinesSpanExporter(SpanExporter):
+    """Экспорт спанов в локальный файл JSON Lines (спан на строку).
+
+    Файл читается построчно (`jq`, pandas) или отправляется в коллектор
+    OpenTelemetry через filelog receiver.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: TextIO = path.open("a", encoding="utf-8", buffering=1)
+
+    def export(self, span: Span) -> None:
+        self._file.write(json.dumps(span.to_dict(), ensure_ascii=False, default=str) + "\n")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class Tracer:
+    def __init__(self, service: str, exporter: SpanExporter) -> None:
+        self.service = service
+        self.exporter = exporter
+
+    @contextmanager
+    def start_span(
+            self,
+            name: str,
+            parent: SpanContext | None = None,
+            correlation_id: str | None = None,
+            **attributes: Any,
+    ) -> Generator[Span]:
+        """Спан операции, дочерний для `parent` или текущего спана.
+
+        Без родителя начинается новая трасса, `correlation_id` по умолчанию
+        наследуется от родителя.
+        """
+
+        if parent is None and (span := _current_span.get()) is not None:
+            parent = span.context
+        span = Span(
+            name=name,
+            service=self.service,
+            context=SpanContext(
+                trace_id=parent.trace_id if parent is not None else secrets.token_hex(16),
+                span_id=secrets.token_hex(8),
+                correlation_id=(
+                    correlation_id
+                    or (parent.correlation_id if parent is not None else generate_correlation_id())
+                ),
+            ),
+            parent_id=parent.span_id if parent is not None else None,
+            start_time=time.time(),
+            attributes=attributes,
+        )
+        token = _current_span.set(span)
+        started_at = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.status = "error"
+            span.set_attribute("error.type", type(e).__name__)
+            raise
+        finally:
+            span.duration = time.perf_counter() - started_at
+            _current_span.reset(token)
+            try:
+                self.exporter.export(span)
+            except Exception:
+                logger.exception("Failed to export span %s", span.name)
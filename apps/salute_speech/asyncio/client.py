@@ -4,7 +4,13 @@ from uuid import UUID
 
 import aiohttp
 
-from ..constants import AUDIO_ENCODING_CONFIG, SALUTE_SPEECH_BASE_URL, AudioEncoding, Language
+from ..constants import (
+    AUDIO_ENCODING_CONFIG,
+    SALUTE_SPEECH_BASE_URL,
+    SBER_DEVICES_BASE_URL,
+    AudioEncoding,
+    Language,
+)
 from ..exceptions import DownloadingFileError, TaskFailedError, UploadingFileError
 from ..models import RecognizedSpeech, RecognizedSpeechList, Task
 from .oauth import AsyncOAuthSberDevicesClient
@@ -21,13 +27,21 @@ class AsyncSaluteSpeechClient:
             profanity_check: bool = False,
             base_url: str = SALUTE_SPEECH_BASE_URL,
             use_ssl: bool = False,
+            client_id: str = "",
+            client_secret: str = "",
+            oauth_base_url: str = SBER_DEVICES_BASE_URL,
     ) -> None:
         self._model = model
         self._profanity_check = profanity_check
         self._base_url = base_url
         self._use_ssl = use_ssl
         self._oauth_client = AsyncOAuthSberDevicesClient(
-            apikey=apikey, scope=scope, use_ssl=use_ssl
+            apikey=apikey,
+            scope=scope,
+            client_id=client_id,
+            client_secret=client_secret,
+            use_ssl=use_ssl,
+            base_url=oauth_base_url,
         )
 
     async def upload_file(
@@ -134,7 +148,7 @@ class AsyncSaluteSpeechClient:
                 }
             },
             # Убираем insight_models для одноканального аудио
-            "request_file_id": request_file_id,
+            "request_file_id": f"{request_file_id}",
         }
         if words:
             payload["hints"] = {
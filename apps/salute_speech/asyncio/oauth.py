@@ -38,7 +38,7 @@ class AsyncOAuthSberDevicesClient:
             "Authorization": f"Bearer {self._build_apikey()}",
             "Content-Type": "application/x-www-form-urlencoded",
             "Accept": "application/json",
-            "RqUID": self._rq_uid,
+            "RqUID": str(self._rq_uid),
         }
         payload = {"scope": self._scope}
         try:
@@ -4,7 +4,13 @@ from uuid import UUID
 
 import requests
 
-from .constants import AUDIO_ENCODING_CONFIG, SALUTE_SPEECH_BASE_URL, AudioEncoding, Language
+from .constants import (
+    AUDIO_ENCODING_CONFIG,
+    SALUTE_SPEECH_BASE_URL,
+    SBER_DEVICES_BASE_URL,
+    AudioEncoding,
+    Language,
+)
 from .exceptions import DownloadingFileError, TaskFailedError, UploadingFileError
 from .models import RecognizedSpeech, RecognizedSpeechList, Task
 from .oauth import OAuthSberDevicesClient
@@ -21,12 +27,22 @@ class SaluteSpeechClient:
             profanity_check: bool = False,
             base_url: str = SALUTE_SPEECH_BASE_URL,
             use_ssl: bool = False,
+            client_id: str = "",
+            client_secret: str = "",
+            oauth_base_url: str = SBER_DEVICES_BASE_URL,
     ) -> None:
         self._model = model
         self._profanity_check = profanity_check
         self._base_url = base_url
         self._use_ssl = use_ssl
-        self._oauth_client = OAuthSberDevicesClient(apikey=apikey, scope=scope, use_ssl=use_ssl)
+        self._oauth_client = OAuthSberDevicesClient(
+            apikey=apikey,
+            scope=scope,
+            client_id=client_id,
+            client_secret=client_secret,
+            use_ssl=use_ssl,
+            base_url=oauth_base_url,
+        )
 
     def upload_file(
             self,
@@ -130,7 +146,7 @@ class SaluteSpeechClient:
                 }
             },
             # Убираем insight_models для одноканального аудио
-            "request_file_id": request_file_id,
+            "request_file_id": f"{request_file_id}",
         }
         if words:
             payload["hints"] = {
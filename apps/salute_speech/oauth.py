@@ -39,7 +39,7 @@ class OAuthSberDevicesClient:
             "Authorization": f"Bearer {self._build_apikey()}",
             "Content-Type": "application/x-www-form-urlencoded",
             "Accept": "application/json",
-            "RqUID": self._rq_uid,
+            "RqUID": str(self._rq_uid),
         }
         payload = {"scope": self._scope}
         try:
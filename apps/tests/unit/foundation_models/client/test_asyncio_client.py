@@ -0,0 +1,111 @@
+from typing import Any
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import aclosing
+
+import pytest
+
+from benchmarks.foundation_models_stub import StubFoundationModelServer
+from foundation_models.client.asyncio import AsyncFoundationModelClient
+from foundation_models.client.exceptions import CompletionError
+from foundation_models.client.models import Message
+
+TEXT = "one two three four five six"
+
+type Scenario = Callable[[StubFoundationModelServer, AsyncFoundationModelClient], Awaitable[None]]
+
+
+def run_with_stub(scenario: Scenario, server: dict[str, Any], client: dict[str, Any]) -> None:
+    async def run() -> None:
+        async with (
+            StubFoundationModelServer(**{"latency": 0.01, **server}) as stub,
+            AsyncFoundationModelClient(
+                api_key="key",
+                iam_token="",
+                folder_id="folder",
+                model_name="yandexgpt",
+                base_url=stub.url,
+                **{"backoff_factor": 0, **client},
+            ) as model,
+        ):
+            await scenario(stub, model)
+
+    asyncio.run(run())
+
+
+def messages() -> list[Message]:
+    return [Message(role="user", text=TEXT)]
+
+
+def test_rejected_requests_are_retried() -> None:
+    async def scenario(stub: StubFoundationModelServer, model: AsyncFoundationModelClient) -> None:
+        result = await model.completion(messages())
+
+        assert result.text == TEXT
+        # 429, затем 503, затем успешный ответ
+        assert stub.stats.rejected == 2  # noqa: PLR2004
+        assert model.stats.requests == 3  # noqa: PLR2004
+        assert model.stats.retries == 2  # noqa: PLR2004
+        assert model.stats.rate_limited == 1
+
+    run_with_stub(scenario, server={"fail_first": 2}, client={"max_retries": 3})
+
+
+def test_exhausted_retries_raise_last_error() -> None:
+    async def scenario(stub: StubFoundationModelServer, model: AsyncFoundationModelClient) -> None:
+        with pytest.raises(CompletionError) as error:
+            await model.completion(messages())
+
+        assert error.value.status == 503  # noqa: PLR2004
+        assert stub.stats.requests == 2  # noqa: PLR2004
+        assert model.stats.failed == 1
+
+    run_with_stub(scenario, server={"error_rate": 1}, client={"max_retries": 1})
+
+
+def test_stream_yields_only_new_text() -> None:
+    async def scenario(_: StubFoundationModelServer, model: AsyncFoundationModelClient) -> None:
+        deltas = [delta async for delta in model.stream(messages())]
+
+        # Сервер присылает накопленный текст: "one two", "one two three four", ...
+        assert deltas == ["one two", " three four", " five six"]
+
+    run_with_stub(scenario, server={"stream_chunks": 3}, client={})
+
+
+def test_closed_stream_releases_concurrency_slot() -> None:
+    async def scenario(_: StubFoundationModelServer, model: AsyncFoundationModelClient) -> None:
+        async with aclosing(model.stream(messages())) as stream:
+            async for _delta in stream:
+                break
+
+        # С единственным слотом запрос выполнится, только если поток его вернул
+        result = await asyncio.wait_for(model.completion(messages()), timeout=1)
+        assert result.text == TEXT
+
+    run_with_stub(scenario, server={"stream_chunks": 3}, client={"max_concurrency": 1})
+
+
+def test_retry_waits_for_retry_after() -> None:
+    async def scenario(_: StubFoundationModelServer, model: AsyncFoundationModelClient) -> None:
+        started_at = time.monotonic()
+        await model.completion(messages())
+
+        assert time.monotonic() - started_at >= 0.2  # noqa: PLR2004
+        assert model.stats.retries == 1
+
+    run_with_stub(scenario, server={"fail_first": 1, "retry_after": 0.2}, client={})
+
+
+def test_rate_limiter_spaces_requests_after_burst() -> None:
+    async def scenario(stub: StubFoundationModelServer, model: AsyncFoundationModelClient) -> None:
+        started_at = time.monotonic()
+        await asyncio.gather(*(model.completion(messages()) for _ in range(7)))
+
+        # Всплеск в 5 запросов, ещё два - с интервалом 1 / 5 секунды
+        assert time.monotonic() - started_at >= 0.35  # noqa: PLR2004
+        assert stub.stats.requests == 7  # noqa: PLR2004
+
+    run_with_stub(scenario, server={"latency": 0}, client={"requests_per_second": 5})
@@ -0,0 +1,119 @@
+from typing import Any
+
+import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from uuid import uuid4
+
+import pytest
+
+from modules.admin.domain import (
+    CreateWorkspaceCommand,
+    Member,
+    OrganizationType,
+    Workspace,
+    WorkspaceType,
+)
+from modules.admin.infrastructure.cache import CachedWorkspaceRepository
+from modules.shared_kernel.insrastructure.database import SQLAlchemyUnitOfWork
+
+
+class Session:
+    """Сессия БД, фиксирующая только факт коммита"""
+
+    def __init__(self) -> None:
+        self.committed = False
+
+    @staticmethod
+    @asynccontextmanager
+    async def begin() -> AsyncGenerator[None]:
+        yield
+
+    async def commit(self) -> None:
+        self.committed = True
+
+    async def rollback(self) -> None: ...
+
+
+class WorkspaceStore:
+    """Репозиторий рабочих областей в памяти"""
+
+    def __init__(self) -> None:
+        self.workspaces: dict[Any, Workspace] = {}
+
+    async def create(self, entity: Workspace) -> Workspace:
+        self.workspaces[entity.id] = entity
+        return entity
+
+    @staticmethod
+    async def add_member(member: Member) -> Member:
+        return member
+
+    async def read(self, id: Any, **_: Any) -> Workspace | None:  # noqa: A002
+        return self.workspaces.get(id)
+
+
+class InvalidationLog:
+    """Ключи, сброшенные в кеше, с отметкой о фиксации транзакции на момент сброса"""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+        self.invalidated: list[tuple[str, bool]] = []
+
+    async def invalidate(self, key: str) -> bool:
+        self.invalidated.append((key, self._session.committed))
+        return True
+
+
+def make_repository() -> tuple[CachedWorkspaceRepository, SQLAlchemyUnitOfWork, InvalidationLog]:
+    session: Any = Session()
+    uow = SQLAlchemyUnitOfWork(session)
+    cache: Any = InvalidationLog(session)
+    store: Any = WorkspaceStore()
+    return CachedWorkspaceRepository(store, cache, uow), uow, cache
+
+
+def make_workspace() -> tuple[Workspace, Member]:
+    return Workspace.create(CreateWorkspaceCommand(
+        user_id=uuid4(),
+        space_type=WorkspaceType.PRIVATE,
+        name="Workspace",
+        slug="workspace",
+        organization_type=next(iter(OrganizationType)),
+    ))
+
+
+def test_owned_workspaces_are_invalidated_after_commit() -> None:
+    async def run() -> None:
+        repository, uow, cache = make_repository()
+        workspace, owner = make_workspace()
+
+        async with uow.transactional():
+            await repository.create(workspace)
+            await repository.add_member(owner)
+            assert cache.invalidated == []
+            await uow.commit()
+
+        assert cache.invalidated
+        assert set(cache.invalidated) == {(f"{workspace.owner_id}", True)}
+
+    asyncio.run(run())
+
+
+def test_rolled_back_changes_do_not_invalidate() -> None:
+    async def run() -> None:
+        repository, uow, cache = make_repository()
+        workspace, _ = make_workspace()
+
+        async def create() -> None:
+            async with uow.transactional():
+                await repository.create(workspace)
+                raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            await create()
+        await uow.commit()
+
+        assert cache.invalidated == []
+
+    asyncio.run(run())
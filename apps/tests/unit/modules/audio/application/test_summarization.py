@@ -0,0 +1,123 @@
+import asyncio
+from uuid import UUID, uuid4
+
+import pytest
+
+from modules.audio.application import (
+    IncrementalSummarizationService,
+    InMemoryPartialSummaryStore,
+    InMemorySummaryCache,
+    MapReduceSummarizationEngine,
+    Summarizer,
+)
+from modules.audio.application.exceptions import SummarizationError
+from modules.audio.domain import (
+    AudioSplitEvent,
+    AudioTranscribedEvent,
+    TranscriptionSummarizedEvent,
+)
+
+
+class EchoSummarizer(Summarizer):
+    """Модель, сохраняющая тексты: по итоговому саммари виден порядок сегментов"""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def summarize(self, text: str) -> str:
+        self.calls += 1
+        return text
+
+    async def combine(self, summaries: list[str]) -> str:
+        self.calls += 1
+        return " ".join(summaries)
+
+
+TASK_IDS = {"task_id": uuid4(), "user_id": uuid4(), "collection_id": uuid4()}
+
+
+def transcribed(record_id: UUID, segment_id: int, segments_count: int) -> AudioTranscribedEvent:
+    return AudioTranscribedEvent(
+        task_id=TASK_IDS["task_id"],
+        user_id=TASK_IDS["user_id"],
+        collection_id=TASK_IDS["collection_id"],
+        record_id=record_id,
+        segment_id=segment_id,
+        segment_duration=30,
+        segments_count=segments_count,
+        is_last=segment_id == segments_count,
+        text=f"{record_id}-{segment_id}",
+    )
+
+
+def split(record_ids: list[UUID], segments_count: int) -> AudioSplitEvent:
+    return AudioSplitEvent(
+        task_id=TASK_IDS["task_id"],
+        user_id=TASK_IDS["user_id"],
+        collection_id=TASK_IDS["collection_id"],
+        segments_count=segments_count,
+        record_ids=record_ids,
+    )
+
+
+def handle_all(
+        events: list[AudioSplitEvent | AudioTranscribedEvent], summarizer: Summarizer
+) -> list[TranscriptionSummarizedEvent | None]:
+    service = IncrementalSummarizationService(
+        engine=MapReduceSummarizationEngine(summarizer=summarizer, cache=InMemorySummaryCache()),
+        store=InMemoryPartialSummaryStore(),
+    )
+
+    async def handle() -> list[TranscriptionSummarizedEvent | None]:
+        return [await service.handle(event) for event in events]
+
+    return asyncio.run(handle())
+
+
+def test_segments_with_same_numbers_in_different_records_are_all_summarized() -> None:
+    first, second = uuid4(), uuid4()
+    events: list[AudioSplitEvent | AudioTranscribedEvent] = [
+        transcribed(second, 1, 2),
+        transcribed(first, 2, 2),
+        transcribed(first, 1, 2),
+        transcribed(second, 1, 2),  # Повторная доставка
+        transcribed(second, 2, 2),
+        split([first, second], 4),
+    ]
+
+    results = handle_all(events, EchoSummarizer())
+
+    assert results[:-1] == [None] * (len(events) - 1)
+    summarized = results[-1]
+    assert summarized is not None
+    assert summarized.segments_count == 4  # noqa: PLR2004
+    assert summarized.summary == f"{first}-1 {first}-2 {second}-1 {second}-2"
+
+
+def test_reduce_waits_for_collection_total_not_record_total() -> None:
+    first, second = uuid4(), uuid4()
+    summarizer = EchoSummarizer()
+    events: list[AudioSplitEvent | AudioTranscribedEvent] = [
+        split([first, second], 3),
+        transcribed(first, 1, 2),
+        transcribed(first, 2, 2),
+        transcribed(second, 1, 1),
+        transcribed(second, 1, 1),  # Повторная доставка после reduce
+    ]
+
+    results = handle_all(events, summarizer)
+
+    assert [result is not None for result in results] == [False, False, False, True, False]
+    assert summarizer.calls == 4  # noqa: PLR2004
+
+
+def test_reduce_fails_when_model_does_not_shrink_summaries() -> None:
+    engine = MapReduceSummarizationEngine(
+        summarizer=EchoSummarizer(),
+        cache=InMemorySummaryCache(),
+        context_window=120,
+        reserved_tokens=20,
+    )
+
+    with pytest.raises(SummarizationError):
+        asyncio.run(engine.reduce(["слово " * 40] * 8))
@@ -0,0 +1,14 @@
+from modules.audio.application.transcription import RecognitionOptions
+
+
+def test_fingerprint_depends_on_audio_format() -> None:
+    options, content = RecognitionOptions(), b"\x00\x01" * 8
+
+    fingerprints = {
+        options.fingerprint(content, channels=1, samplerate=16000),
+        options.fingerprint(content, channels=2, samplerate=16000),
+        options.fingerprint(content, channels=1, samplerate=8000),
+    }
+
+    assert len(fingerprints) == 3  # noqa: PLR2004
+    assert options.fingerprint(content, 1, 16000) in fingerprints
@@ -0,0 +1,97 @@
+from typing import Any, Self
+
+import asyncio
+from collections import defaultdict
+from datetime import timedelta
+
+from modules.audio.application import TranscribedSegment
+from modules.audio.infrastructure.deduplication import RedisRecordTranscriptStore
+
+
+class HashPipeline:
+    def __init__(self, hashes: dict[str, dict[bytes, bytes]]) -> None:
+        self._hashes = hashes
+        self._results: list[Any] = []
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *_: object) -> None: ...
+
+    def hset(self, key: str, mapping: dict[str, Any]) -> None:
+        self._hashes[key].update({
+            field.encode(): f"{value}".encode() for field, value in mapping.items()
+        })
+        self._results.append(len(mapping))
+
+    def expire(self, *_: Any) -> None:
+        self._results.append(True)
+
+    def hgetall(self, key: str) -> None:
+        self._results.append(dict(self._hashes[key]))
+
+    async def execute(self) -> list[Any]:
+        results, self._results = self._results, []
+        return results
+
+
+class HashRedis:
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[bytes, bytes]] = defaultdict(dict)
+
+    def pipeline(self, **_: Any) -> HashPipeline:
+        return HashPipeline(self.hashes)
+
+
+def make_store() -> RedisRecordTranscriptStore:
+    redis: Any = HashRedis()
+    return RedisRecordTranscriptStore(redis=redis, ttl=timedelta(days=1))
+
+
+def save_split(store: RedisRecordTranscriptStore, segments_count: int, duration: int) -> None:
+    async def save() -> None:
+        for segment_id in range(1, segments_count + 1):
+            await store.save(
+                "hash",
+                duration,
+                segments_count,
+                TranscribedSegment(
+                    segment_id=segment_id, duration=duration, text=f"{duration}:{segment_id}"
+                ),
+            )
+
+    asyncio.run(save())
+
+
+def test_segments_of_different_splits_are_not_mixed() -> None:
+    store = make_store()
+
+    save_split(store, segments_count=4, duration=30)
+    save_split(store, segments_count=2, duration=60)
+    segments = asyncio.run(store.get("hash"))
+
+    assert segments is not None
+    assert [segment.text for segment in segments] == ["60:1", "60:2"]
+
+
+def test_incomplete_split_is_not_reused() -> None:
+    store = make_store()
+
+    save_split(store, segments_count=2, duration=60)
+    asyncio.run(store.save(
+        "hash", 40, 3, TranscribedSegment(segment_id=1, duration=40, text="40:1")
+    ))
+
+    assert asyncio.run(store.get("hash")) is None
+
+
+def test_splits_with_same_segments_count_are_not_mixed() -> None:
+    # Запись в коллекции с другой длительностью сегментов: тоже 2 сегмента, сохранён первый
+    store = make_store()
+
+    save_split(store, segments_count=2, duration=60)
+    asyncio.run(store.save(
+        "hash", 45, 2, TranscribedSegment(segment_id=1, duration=45, text="45:1")
+    ))
+
+    assert asyncio.run(store.get("hash")) is None
@@ -0,0 +1,149 @@
+from typing import Any, Self
+
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import timedelta
+from uuid import UUID, uuid4
+
+from modules.audio.application import PipelineStage, TaskProgress
+from modules.audio.domain import (
+    AudioSplitEvent,
+    AudioTranscribedEvent,
+    PipelineEvent,
+    SoundEnhancedEvent,
+)
+from modules.audio.infrastructure.progress import RedisProgressStore
+
+
+class RecordingPipeline:
+    """Транзакция Redis: команды выполняются по `execute`"""
+
+    def __init__(self, redis: "HashRedis") -> None:
+        self._redis = redis
+        self._commands: list[tuple[str, tuple[Any, ...]]] = []
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        self._commands.clear()
+
+    def __getattr__(self, name: str) -> Any:
+        return lambda *args, **_: self._commands.append((name, args))
+
+    async def execute(self) -> list[Any]:
+        return [getattr(self._redis, name)(*args) for name, args in self._commands]
+
+
+class HashRedis:
+    """Подмножество команд Redis (hash и set), используемое хранилищем прогресса"""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[bytes, bytes]] = defaultdict(dict)
+        self.sets: dict[str, set[str]] = defaultdict(set)
+
+    def sadd(self, key: str, member: str) -> int:
+        is_new = member not in self.sets[key]
+        self.sets[key].add(member)
+        return int(is_new)
+
+    def scard(self, key: str) -> int:
+        return len(self.sets[key])
+
+    def pipeline(self, **_: Any) -> RecordingPipeline:
+        return RecordingPipeline(self)
+
+    def hsetnx(self, key: str, field: str, value: Any) -> None:
+        self.hashes[key].setdefault(field.encode(), f"{value}".encode())
+
+    def hset(self, key: str, field: str, value: Any) -> None:
+        self.hashes[key][field.encode()] = f"{value}".encode()
+
+    def expire(self, key: str, ttl: timedelta) -> None: ...
+
+    def hgetall(self, key: str) -> dict[bytes, bytes]:
+        return dict(self.hashes[key])
+
+
+def make_store() -> RedisProgressStore:
+    store = RedisProgressStore(url="redis://localhost:6379/0", ttl=timedelta(hours=1))
+    store.redis = HashRedis()  # type: ignore[assignment]
+    return store
+
+
+def apply_all(store: RedisProgressStore, events: list[PipelineEvent]) -> TaskProgress:
+    async def apply() -> TaskProgress:
+        progress = None
+        for event in events:
+            progress = await store.apply(event)
+        assert progress is not None
+        return progress
+
+    return asyncio.run(apply())
+
+
+@dataclass(frozen=True)
+class Task:
+    task_id: UUID = field(default_factory=uuid4)
+    user_id: UUID = field(default_factory=uuid4)
+    collection_id: UUID = field(default_factory=uuid4)
+
+    def split(self, segments_count: int) -> AudioSplitEvent:
+        return AudioSplitEvent(
+            task_id=self.task_id,
+            user_id=self.user_id,
+            collection_id=self.collection_id,
+            segments_count=segments_count,
+            record_ids=[],
+        )
+
+    def record_events(self, segments_count: int) -> list[PipelineEvent]:
+        """События улучшения и транскрибации сегментов одной записи"""
+
+        record_id = uuid4()
+        events: list[PipelineEvent] = []
+        for segment_id in range(1, segments_count + 1):
+            events.extend((
+                SoundEnhancedEvent(
+                    task_id=self.task_id,
+                    user_id=self.user_id,
+                    collection_id=self.collection_id,
+                    record_id=record_id,
+                    segment_id=segment_id,
+                    segments_count=segments_count,
+                ),
+                AudioTranscribedEvent(
+                    task_id=self.task_id,
+                    user_id=self.user_id,
+                    collection_id=self.collection_id,
+                    record_id=record_id,
+                    segment_id=segment_id,
+                    segment_duration=30,
+                    segments_count=segments_count,
+                    is_last=segment_id == segments_count,
+                    text="text",
+                ),
+            ))
+        return events
+
+
+def test_segments_of_different_records_are_counted_separately() -> None:
+    task, store = Task(), make_store()
+    first, second = task.record_events(2), task.record_events(1)
+
+    progress = apply_all(store, [*first, *second, *first])
+
+    assert progress.segments_enhanced == progress.segments_transcribed == 3  # noqa: PLR2004
+    assert progress.segments_total is None
+    assert progress.stage == PipelineStage.SPLITTING
+
+
+def test_total_is_taken_from_split_event_only() -> None:
+    task, store = Task(), make_store()
+    split = task.split(3)
+
+    progress = apply_all(store, [*task.record_events(2), split, *task.record_events(1)])
+
+    assert progress.segments_total == split.segments_count
+    assert progress.stage == PipelineStage.COMPLETED
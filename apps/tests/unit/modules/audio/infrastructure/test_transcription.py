@@ -0,0 +1,34 @@
+from typing import Any
+
+import asyncio
+from datetime import timedelta
+
+from redis import RedisError
+
+from modules.audio.infrastructure.transcription import RedisTranscriptionCache
+from salute_speech.models import RecognizedSpeech, RecognizedSpeechList
+
+
+class UnavailableRedis:
+    """Redis, на любую команду отвечающий ошибкой соединения"""
+
+    @staticmethod
+    async def get(*_: Any, **__: Any) -> None:
+        raise RedisError
+
+    @staticmethod
+    async def set(*_: Any, **__: Any) -> None:
+        raise RedisError
+
+
+def test_unavailable_cache_does_not_fail_recognition() -> None:
+    async def run() -> None:
+        redis: Any = UnavailableRedis()
+        cache = RedisTranscriptionCache(redis=redis, ttl=timedelta(days=1))
+        speech = RecognizedSpeechList([RecognizedSpeech(text="hello", speaker=1, emotion=None)])
+
+        await cache.set("fingerprint", speech)
+
+        assert await cache.get("fingerprint") is None
+
+    asyncio.run(run())
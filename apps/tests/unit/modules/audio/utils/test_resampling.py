@@ -0,0 +1,65 @@
+import io
+
+import numpy as np
+import numpy.typing as npt
+import soundfile as sf
+
+from modules.audio.utils.resampling import (
+    ENHANCEMENT_PROFILE,
+    RECOGNITION_PROFILE,
+    convert,
+    remix,
+    resample,
+)
+
+
+def tone(frequency: float, samplerate: int, seconds: float = 1) -> npt.NDArray[np.float64]:
+    """Синусоида формы (n, 1)"""
+
+    time = np.arange(round(samplerate * seconds)) / samplerate
+    return np.sin(2 * np.pi * frequency * time)[:, None] * 0.5
+
+
+def test_resampled_tone_matches_tone_at_target_rate() -> None:
+    resampled = resample(tone(1000, 44100), 44100, 16000)
+    expected = tone(1000, 16000)
+
+    assert resampled.shape == expected.shape
+    # Края сигнала искажены окном фильтра
+    error = np.abs(resampled[100:-100] - expected[100:-100]).max()
+    assert error < 1e-3  # noqa: PLR2004
+
+
+def test_frequencies_above_target_nyquist_are_filtered() -> None:
+    resampled = resample(tone(12000, 44100), 44100, 16000)
+
+    # Без фильтра тон 12 kHz отразился бы в 4 kHz с той же амплитудой
+    attenuation_db = 20 * np.log10(np.abs(resampled[100:-100]).max() / 0.5)
+    assert attenuation_db < -40  # noqa: PLR2004
+
+
+def test_same_rate_returns_samples_unchanged() -> None:
+    samples = tone(440, 16000)
+
+    np.testing.assert_allclose(resample(samples, 16000, 16000), samples, atol=1e-7)
+
+
+def test_remix_averages_channels_to_mono() -> None:
+    stereo = np.column_stack((np.full(10, 0.2), np.full(10, 0.6)))
+
+    np.testing.assert_allclose(remix(stereo, 1), np.full((10, 1), 0.4))
+
+
+def test_convert_writes_recognition_profile_wav() -> None:
+    stereo = np.repeat(tone(1000, ENHANCEMENT_PROFILE.samplerate, seconds=2), 2, axis=1)
+    with io.BytesIO() as stream:
+        sf.write(stream, stereo, ENHANCEMENT_PROFILE.samplerate, format="WAV", subtype="PCM_16")
+        content = stream.getvalue()
+
+    converted = convert(content, RECOGNITION_PROFILE)
+
+    info = sf.info(io.BytesIO(converted))
+    assert (info.samplerate, info.channels) == (16000, 1)
+    assert info.frames == 2 * 16000
+    # Заголовок WAV - 44 байта, остальное - PCM 16-bit
+    assert len(converted) - 44 == 2 * RECOGNITION_PROFILE.bytes_per_second
@@ -0,0 +1,79 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from modules.audio.utils.segmentation import (
+    Envelope,
+    SegmentationPlanner,
+    balanced_segment_duration,
+)
+from modules.audio.utils.vad import SilenceTrimmer
+
+SAMPLERATE = 16000
+SPEECH_DB, PAUSE_DB = -20.0, -80.0
+
+
+def make_envelope(pauses: list[tuple[float, float]], duration: float) -> Envelope:
+    """Огибающая записи `duration` секунд с паузами `[начало, конец)` (фреймы по 50 мс)"""
+
+    frame_length = SAMPLERATE // 20
+    energy_db = np.full(round(duration * 20), SPEECH_DB, dtype=np.float32)
+    for start, end in pauses:
+        energy_db[round(start * 20):round(end * 20)] = PAUSE_DB
+    return Envelope(samplerate=SAMPLERATE, frame_length=frame_length, energy_db=energy_db)
+
+
+def test_boundaries_move_into_nearby_pauses() -> None:
+    # 4 сегмента по 75 сек (с запасом на окно поиска), паузы - рядом с идеальными границами
+    pauses = [(80.0, 81.0), (140.0, 141.0), (230.0, 231.0)]
+    envelope = make_envelope(pauses, duration=300)
+
+    cuts = SegmentationPlanner().cut_points(envelope, segment_duration=120) * 0.05
+
+    assert len(cuts) == len(pauses)
+    for cut, (start, end) in zip(cuts.tolist(), pauses, strict=True):
+        assert start <= cut < end
+
+
+def test_segments_never_exceed_segment_duration() -> None:
+    # Пауз нет: границы ставятся по длине, а не по энергии
+    envelope = make_envelope([], duration=1000)
+
+    cuts = SegmentationPlanner().cut_points(envelope, segment_duration=120)
+    bounds = np.concatenate(([0], cuts, [len(envelope.energy_db)])) * 0.05
+
+    assert np.diff(bounds).max() <= 120  # noqa: PLR2004
+    assert np.diff(bounds).min() > 0
+
+
+def test_balanced_duration_splits_average_record_evenly() -> None:
+    duration = balanced_segment_duration(
+        total_duration=3 * 3600, record_count=3, min_duration=300, max_duration=1200, parallelism=8
+    )
+
+    assert duration <= 1200  # noqa: PLR2004
+    assert 3600 % duration == 0
+
+
+def test_planned_trimmed_segment_maps_back_to_source(tmp_path: Path) -> None:
+    rng = np.random.default_rng(0)
+    speech, pause = rng.normal(0, 0.3, 10 * SAMPLERATE), np.zeros(20 * SAMPLERATE)
+    path, trimmed_path = tmp_path / "decoded.wav", tmp_path / "trimmed.wav"
+    sf.write(path, np.concatenate((speech, pause, speech, pause, speech)), SAMPLERATE)
+    trimmer = SilenceTrimmer()
+
+    time_map = trimmer.trim(path, trimmed_path, trimmer.analyze(path))
+    planner = SegmentationPlanner()
+    (first_start, first_end), (second_start, _) = planner.plan(trimmed_path, 40)
+    second = time_map.slice(second_start, second_start + 5)
+
+    # Паузы по 20 сек сжаты: запись из 3 фраз по 10 сек делится на 2 сегмента
+    assert sf.info(str(trimmed_path)).duration < 32  # noqa: PLR2004
+    assert first_start == 0
+    assert second_start == first_end
+    # Рез - в сжатой паузе: второй сегмент начинается в исходной записи
+    # не раньше второй фразы (30 сек минус отступ вокруг речи)
+    assert float(second.to_source(0.0)) >= 29.8  # noqa: PLR2004
+    assert float(second.to_source(0.0)) == pytest.approx(time_map.to_source(second_start))
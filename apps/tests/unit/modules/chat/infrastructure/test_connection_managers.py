@@ -0,0 +1,133 @@
+from typing import Any
+
+import asyncio
+import json
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+from fastapi import status
+
+from modules.chat.infrastructure.fastapi.connection_managers import (
+    InMemoryConnectionManager,
+    chat_topic,
+)
+
+
+class Socket:
+    """WebSocket, записывающий отправленные кадры; `blocked` - клиент не читает сокет"""
+
+    def __init__(self, *, blocked: bool = False) -> None:
+        self.frames: list[list[Any]] = []
+        self.close_code: int | None = None
+        self._unblocked = asyncio.Event()
+        if not blocked:
+            self._unblocked.set()
+
+    async def accept(self) -> None: ...
+
+    async def send_text(self, data: str) -> None:
+        await self._unblocked.wait()
+        self.frames.append(json.loads(data))
+
+    async def close(self, code: int) -> None:
+        self.close_code = code
+
+
+class FailingManager(InMemoryConnectionManager):
+    """Менеджер, не способный подписаться на топики чатов"""
+
+    async def _on_topic_added(self, topic: str) -> None:  # noqa: PLR6301
+        if topic.startswith("chat:"):
+            raise ConnectionError(topic)
+
+
+async def settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_queued_events_are_sent_in_batches() -> None:
+    async def run() -> None:
+        manager, socket, user_id = InMemoryConnectionManager(batch_size=2), Socket(), uuid4()
+        await manager.connect(socket, user_id)  # type: ignore[arg-type]
+
+        for number in range(5):
+            await manager.send_to_user(user_id, {"number": number})
+        await settle()
+
+        assert [[event["number"] for event in frame] for frame in socket.frames] == [
+            [0, 1], [2, 3], [4]
+        ]
+        await manager.close()
+
+    asyncio.run(run())
+
+
+def test_slow_consumer_is_closed_when_queue_overflows() -> None:
+    async def run() -> None:
+        manager, user_id = InMemoryConnectionManager(queue_size=2), uuid4()
+        slow, fast = Socket(blocked=True), Socket()
+        await manager.connect(slow, user_id)  # type: ignore[arg-type]
+        await manager.connect(fast, user_id)  # type: ignore[arg-type]
+
+        # Первое событие забирает отправка, следующие два заполняют очередь
+        for number in range(4):
+            await manager.send_to_user(user_id, {"number": number})
+            await settle()
+
+        assert slow.close_code == status.WS_1013_TRY_AGAIN_LATER
+        assert manager.stats.slow_consumers == 1
+        assert sum(len(frame) for frame in fast.frames) == 4  # noqa: PLR2004
+        await manager.close()
+
+    asyncio.run(run())
+
+
+def test_stalled_send_closes_socket_after_timeout() -> None:
+    async def run() -> None:
+        manager = InMemoryConnectionManager(send_timeout=timedelta(milliseconds=10))
+        socket, user_id = Socket(blocked=True), uuid4()
+        connection = await manager.connect(socket, user_id)  # type: ignore[arg-type]
+
+        await manager.send_to_user(user_id, {"number": 0})
+        await asyncio.sleep(0.05)
+
+        assert connection.closed
+        assert socket.close_code == status.WS_1013_TRY_AGAIN_LATER
+        await manager.close()
+
+    asyncio.run(run())
+
+
+def test_chat_messages_reach_only_chat_subscribers() -> None:
+    async def run() -> None:
+        manager, chat_id = InMemoryConnectionManager(), uuid4()
+        member, stranger = Socket(), Socket()
+        await manager.connect(member, uuid4(), [chat_topic(chat_id)])  # type: ignore[arg-type]
+        await manager.connect(stranger, uuid4(), [chat_topic(uuid4())])  # type: ignore[arg-type]
+
+        await manager.send_to_chat(chat_id, {"text": "hello"})
+        await settle()
+
+        assert member.frames == [[{"text": "hello"}]]
+        assert stranger.frames == []
+        await manager.close()
+
+    asyncio.run(run())
+
+
+def test_failed_subscription_closes_socket_without_registering() -> None:
+    async def run() -> None:
+        manager, socket, user_id = FailingManager(), Socket(), uuid4()
+
+        with pytest.raises(ConnectionError):
+            await manager.connect(socket, user_id, [chat_topic(uuid4())])  # type: ignore[arg-type]
+
+        assert socket.close_code == status.WS_1011_INTERNAL_ERROR
+        assert manager.stats.connections == 0
+        # Подписка на топик пользователя снята вместе с сокетом
+        await manager.send_to_user(user_id, {"text": "hello"})
+        assert manager.stats.delivered == 0
+
+    asyncio.run(run())
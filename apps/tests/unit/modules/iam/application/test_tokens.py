@@ -0,0 +1,23 @@
+import asyncio
+import time
+from uuid import uuid4
+
+from modules.iam.application import InMemoryRevokedTokens
+
+
+def test_expired_revocations_are_purged_on_read() -> None:
+    async def run() -> None:
+        tokens, active, expired = InMemoryRevokedTokens(), uuid4(), uuid4()
+        tokens.add(active, time.time() + 60)
+        tokens.add(expired, time.time() - 1)
+        tokens.add(uuid4(), time.time() - 1)
+
+        assert await tokens.is_revoked(active)
+        assert not await tokens.is_revoked(expired)
+        # Проверяемая запись удаляется сразу, остальные - полным обходом по интервалу
+        assert len(tokens) == 2  # noqa: PLR2004
+        tokens.PURGE_INTERVAL = 0
+        assert await tokens.is_revoked(active)
+        assert len(tokens) == 1
+
+    asyncio.run(run())
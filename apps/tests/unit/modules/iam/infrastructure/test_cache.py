@@ -0,0 +1,43 @@
+import asyncio
+import time
+from uuid import uuid4
+
+from redis import RedisError
+
+from modules.iam.infrastructure.cache import RedisRevokedTokens
+
+
+class PubSub:
+    """Подписка, не способная подключиться к Redis"""
+
+    def __init__(self, redis: "UnavailableRedis") -> None:
+        self._redis = redis
+
+    async def subscribe(self, _: str) -> None:
+        self._redis.subscribe_attempts += 1
+        raise RedisError
+
+    async def aclose(self) -> None: ...
+
+
+class UnavailableRedis:
+    def __init__(self) -> None:
+        self.subscribe_attempts = 0
+
+    def pubsub(self) -> PubSub:
+        return PubSub(self)
+
+
+def test_revocations_are_checked_locally_when_redis_is_unavailable() -> None:
+    async def run() -> None:
+        tokens, redis, revoked = RedisRevokedTokens(url="redis://"), UnavailableRedis(), uuid4()
+        tokens.redis = redis  # type: ignore[assignment]
+        # Отзыв, полученный до сбоя
+        tokens.add(revoked, time.time() + 60)
+
+        assert await tokens.is_revoked(revoked)
+        assert not await tokens.is_revoked(uuid4())
+        # Подписка повторяется не на каждую проверку
+        assert redis.subscribe_attempts == 1
+
+    asyncio.run(run())
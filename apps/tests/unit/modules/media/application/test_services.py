@@ -0,0 +1,112 @@
+from typing import Any
+
+import asyncio
+import hashlib
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator
+from contextlib import asynccontextmanager
+
+import pytest
+
+from modules.media.application.services import MediaService
+from modules.media.domain import FileMetadata, Filename, FilePart, MimeType, UploadFileCommand
+from modules.shared_kernel.insrastructure.database import SQLAlchemyUnitOfWork
+
+CONTENT = b"content"
+
+
+class Session:
+    """Сессия БД, фиксирующая только факт коммита"""
+
+    def __init__(self) -> None:
+        self.committed = False
+
+    @staticmethod
+    @asynccontextmanager
+    async def begin() -> AsyncGenerator[None]:
+        yield
+
+    async def commit(self) -> None:
+        self.committed = True
+
+    async def rollback(self) -> None: ...
+
+
+class Storage:
+    """Хранилище объектов в памяти"""
+
+    def __init__(self) -> None:
+        self.objects: dict[str, bytes] = {}
+
+    async def upload_multipart(self, file_parts: AsyncIterable[FilePart]) -> None:
+        async for file_part in file_parts:
+            content = self.objects.get(file_part.path, b"")
+            self.objects[file_part.path] = content + file_part.content
+
+    async def remove(self, filepath: str) -> bool:
+        return self.objects.pop(filepath, None) is not None
+
+
+class FileStore:
+    """Репозиторий метаданных в памяти; `broken` - сохранение завершается ошибкой"""
+
+    def __init__(self, *, broken: bool = False) -> None:
+        self.files: list[FileMetadata] = []
+        self._broken = broken
+
+    async def get_by_content_hash(self, content_hash: str) -> FileMetadata | None:
+        return next((file for file in self.files if file.content_hash == content_hash), None)
+
+    async def create(self, entity: FileMetadata) -> FileMetadata:
+        if self._broken:
+            raise ConnectionError
+        self.files.append(entity)
+        return entity
+
+
+async def stream() -> AsyncIterator[bytes]:
+    await asyncio.sleep(0)
+    yield CONTENT
+
+
+def make_service(store: FileStore) -> tuple[MediaService, Storage]:
+    session: Any = Session()
+    storage: Any = Storage()
+    repository: Any = store
+    return MediaService(SQLAlchemyUnitOfWork(session), repository, storage), storage
+
+
+def make_command() -> UploadFileCommand:
+    return UploadFileCommand(
+        filename=Filename("record.mp3"),
+        mime_type=MimeType("audio/mpeg"),
+        filesize=len(CONTENT),
+        tenant="tenant",
+        entity_type="user",
+        entity_id="1",
+    )
+
+
+def test_duplicate_upload_references_original() -> None:
+    async def run() -> None:
+        service, storage = make_service(FileStore())
+
+        original = await service.upload_file(make_command(), stream())
+        duplicate = await service.upload_file(make_command(), stream())
+
+        assert original.content_hash == hashlib.sha256(CONTENT).hexdigest()
+        assert duplicate.context.get("duplicate_of") == original.id
+        assert set(storage.objects) == {original.filepath, duplicate.filepath}
+
+    asyncio.run(run())
+
+
+def test_object_is_removed_when_metadata_is_not_saved() -> None:
+    async def run() -> None:
+        service, storage = make_service(FileStore(broken=True))
+
+        with pytest.raises(ConnectionError):
+            await service.upload_file(make_command(), stream())
+
+        assert storage.objects == {}
+
+    asyncio.run(run())
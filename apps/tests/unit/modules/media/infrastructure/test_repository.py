@@ -0,0 +1,21 @@
+from uuid import uuid4
+
+from modules.media.domain import FileMetadata, Filename, MimeType, UploadFileCommand
+from modules.media.infrastructure.database.repository import FileMetaDataMapper
+
+
+def test_mapper_round_trip_keeps_all_fields() -> None:
+    file_metadata = FileMetadata.create(UploadFileCommand(
+        filename=Filename("record.mp3"),
+        mime_type=MimeType("audio/mpeg"),
+        filesize=1024,
+        tenant="tenant",
+        entity_type="user",
+        entity_id="1",
+    ))
+    file_metadata.content_hash = "0" * 64
+    file_metadata.context["duplicate_of"] = uuid4()
+
+    model = FileMetaDataMapper.entity_to_model(file_metadata)
+
+    assert FileMetaDataMapper.model_to_entity(model) == file_metadata
@@ -0,0 +1,10 @@
+import pytest
+
+from benchmarks.smtp_stub import StubSMTPServer
+
+
+@pytest.fixture
+def smtp_server() -> StubSMTPServer:
+    """SMTP сервер-заглушка, запускается тестом в его event loop (`async with`)"""
+
+    return StubSMTPServer()
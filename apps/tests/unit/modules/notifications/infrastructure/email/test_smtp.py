@@ -0,0 +1,80 @@
+import asyncio
+
+from benchmarks.smtp_stub import StubSMTPServer
+from modules.notifications.application import EmailSendingError
+from modules.notifications.domain import EmailLetter
+from modules.notifications.infrastructure.email import SMTPEmailSender
+
+REFUSED_RECIPIENT = "refused@example.com"
+
+
+def make_sender(server: StubSMTPServer, idle_timeout: float = 60) -> SMTPEmailSender:
+    return SMTPEmailSender(
+        host="127.0.0.1",
+        port=server.port,
+        username="user",
+        password="password",  # noqa: S106
+        use_tls=False,
+        pool_size=1,
+        idle_timeout=idle_timeout,
+    )
+
+
+def make_letter(recipient: str = "member@example.com") -> EmailLetter:
+    return EmailLetter(
+        subject="Invitation",
+        sender_email="noreply@example.com",
+        recipient_emails=[recipient],
+        body_markup="<p>Invitation</p>",
+    )
+
+
+def test_idle_connection_is_reopened(smtp_server: StubSMTPServer) -> None:
+    async def run() -> None:
+        async with smtp_server:
+            sender = make_sender(smtp_server, idle_timeout=0.05)
+            await sender.send(make_letter())
+            await sender.send(make_letter())
+            await asyncio.sleep(0.1)
+            await sender.send(make_letter())
+            await sender.close()
+
+        assert (sender.stats.connects, sender.stats.reuses) == (2, 1)
+        assert smtp_server.delivered == 3  # noqa: PLR2004
+
+    asyncio.run(run())
+
+
+def test_disconnected_send_is_retried_on_new_connection(smtp_server: StubSMTPServer) -> None:
+    async def run() -> None:
+        async with smtp_server:
+            sender = make_sender(smtp_server)
+            await sender.send(make_letter())
+            smtp_server.disconnect_next = 1
+            await sender.send(make_letter())
+            await sender.send(make_letter())
+            await sender.close()
+
+        # Оборванное соединение не вернулось в пул: повтор и следующее письмо - через новое
+        assert sender.stats.reconnects == 1
+        assert (sender.stats.connects, sender.stats.reuses) == (2, 2)
+        assert smtp_server.delivered == 3  # noqa: PLR2004
+
+    asyncio.run(run())
+
+
+def test_refused_recipient_keeps_connection(smtp_server: StubSMTPServer) -> None:
+    async def run() -> None:
+        smtp_server.refused_recipients = frozenset({REFUSED_RECIPIENT})
+        async with smtp_server:
+            sender = make_sender(smtp_server)
+            errors = await sender.send_many([
+                make_letter(), make_letter(REFUSED_RECIPIENT), make_letter()
+            ])
+            await sender.close()
+
+        assert [type(error) for error in errors] == [type(None), EmailSendingError, type(None)]
+        assert smtp_server.delivered == 2  # noqa: PLR2004
+        assert sender.stats.connects == 1
+
+    asyncio.run(run())
@@ -0,0 +1,52 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from modules.chat.domain import Chat
+from modules.shared_kernel.application import Cursor, Page
+
+
+def make_chats(count: int) -> list[Chat]:
+    created_at = datetime(2026, 1, 1, tzinfo=UTC)
+    return [
+        Chat(
+            user_id=uuid4(),
+            title=f"chat {i}",
+            messages_count=1,
+            created_at=created_at + timedelta(seconds=i),
+        )
+        for i in range(count)
+    ]
+
+
+def test_cursor_round_trip() -> None:
+    cursor = Cursor(timestamp=datetime(2026, 1, 1, 12, 30, tzinfo=UTC), id=uuid4())
+
+    token = cursor.encode()
+
+    assert "=" not in token
+    assert Cursor.decode(token) == cursor
+
+
+@pytest.mark.parametrize("token", ["", "not-a-cursor", "bm90LWEtY3Vyc29y"])
+def test_cursor_decode_rejects_invalid_token(token: str) -> None:
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        Cursor.decode(token)
+
+
+def test_page_of_full_limit_points_to_last_item() -> None:
+    chats = make_chats(3)
+
+    page = Page[Chat].from_items(chats, limit=3)
+
+    assert page.next_cursor is not None
+    cursor = Cursor.decode(page.next_cursor)
+    assert (cursor.timestamp, cursor.id) == (chats[-1].created_at, chats[-1].id)
+
+
+@pytest.mark.parametrize("count", [0, 2])
+def test_last_page_has_no_cursor(count: int) -> None:
+    page = Page[Chat].from_items(make_chats(count), limit=3)
+
+    assert page.next_cursor is None
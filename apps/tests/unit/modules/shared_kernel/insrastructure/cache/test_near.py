@@ -0,0 +1,139 @@
+from typing import Any
+
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import timedelta
+
+from pydantic import BaseModel
+
+from modules.shared_kernel.insrastructure.cache import NearKeyValueCache, RedisKeyValueCache
+
+
+class Value(BaseModel):
+    name: str
+
+
+class ValueCache(RedisKeyValueCache[Value]):
+    model = Value
+
+
+class PubSub:
+    """Подписка на каналы `ChannelRedis`"""
+
+    def __init__(self, redis: "ChannelRedis") -> None:
+        self._redis = redis
+        self._messages: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+    async def subscribe(self, channel: str) -> None:
+        self._redis.subscribers.setdefault(channel, []).append(self._messages)
+
+    async def listen(self) -> AsyncIterator[dict[str, Any]]:
+        while True:
+            yield await self._messages.get()
+
+    async def aclose(self) -> None: ...
+
+
+class ChannelRedis:
+    """Подмножество команд Redis (строки и pub/sub), разделяемое репликами кеша"""
+
+    def __init__(self) -> None:
+        self.values: dict[str, bytes] = {}
+        self.subscribers: dict[str, list[asyncio.Queue[dict[str, Any]]]] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: bytes, **_: Any) -> None:
+        self.values[key] = value
+
+    async def delete(self, key: str) -> int:
+        return int(self.values.pop(key, None) is not None)
+
+    async def publish(self, channel: str, message: str) -> None:
+        for queue in self.subscribers.get(channel, []):
+            queue.put_nowait({"type": "message", "data": message.encode()})
+
+    def pubsub(self) -> PubSub:
+        return PubSub(self)
+
+
+def make_cache(redis: ChannelRedis) -> NearKeyValueCache[Value]:
+    remote = ValueCache(url="redis://localhost:6379/0", prefix="values", ttl=timedelta(minutes=1))
+    remote.redis = redis  # type: ignore[assignment]
+    return NearKeyValueCache(remote=remote)
+
+
+async def deliver() -> None:
+    """Передача управления слушателям канала инвалидации"""
+
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+def test_concurrent_misses_share_single_load() -> None:
+    async def run() -> None:
+        cache, loads = make_cache(ChannelRedis()), 0
+
+        async def load() -> Value:
+            nonlocal loads
+            loads += 1
+            await asyncio.sleep(0.01)
+            return Value(name="loaded")
+
+        values = await asyncio.gather(*(cache.get_or_load("key", load) for _ in range(10)))
+
+        assert loads == 1
+        assert {value.name for value in values if value is not None} == {"loaded"}
+        assert await cache.get_or_load("key", load) == Value(name="loaded")
+        assert cache.stats.local_hits == 1
+        await cache.close()
+
+    asyncio.run(run())
+
+
+def test_value_invalidated_during_load_is_not_cached_locally() -> None:
+    async def run() -> None:
+        redis = ChannelRedis()
+        cache, replica = make_cache(redis), make_cache(redis)
+        await replica.get("key")  # Подписка реплики на канал инвалидации
+        release = asyncio.Event()
+
+        async def load() -> Value:
+            await release.wait()
+            return Value(name="stale")
+
+        loading = asyncio.create_task(cache.get_or_load("key", load))
+        await deliver()
+        await replica.invalidate("key")
+        await deliver()
+        release.set()
+
+        # Загрузившему значение возвращается, но в локальный кеш оно не попадает
+        assert await loading == Value(name="stale")
+        await cache.get("key")
+        assert cache.stats.local_hits == 0
+        await cache.close()
+        await replica.close()
+
+    asyncio.run(run())
+
+
+def test_change_on_replica_evicts_local_value() -> None:
+    async def run() -> None:
+        redis = ChannelRedis()
+        cache, replica = make_cache(redis), make_cache(redis)
+
+        await cache.set("key", Value(name="old"))
+        assert await cache.get("key") == Value(name="old")
+        await replica.set("key", Value(name="new"))
+        await deliver()
+
+        assert await cache.get("key") == Value(name="new")
+        assert cache.stats.invalidations == 1
+        # Собственные сообщения реплика игнорирует
+        assert replica.stats.invalidations == 0
+        await cache.close()
+        await replica.close()
+
+    asyncio.run(run())
@@ -0,0 +1,104 @@
+from typing import Any
+
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from modules.admin.domain import Member
+from modules.admin.infrastructure.database.models import MemberModel
+from modules.admin.infrastructure.database.repositories import MemberDataMapper
+from modules.iam.domain import Guest, User
+from modules.iam.infrastructure.database.models import (
+    GuestModel,
+    SocialAccountModel,
+    UserModel,
+)
+from modules.iam.infrastructure.database.repository import UserDataMapper
+from modules.shared_kernel.domain import Entity
+
+
+def snapshot(entity: Entity) -> dict[str, Any]:
+    """Все значения сущности, включая типы (сравнение сущностей идёт только по `id`)"""
+
+    return {
+        "type": type(entity),
+        "fields": {name: (type(value), value) for name, value in entity.__dict__.items()},
+        "private": entity.__pydantic_private__,
+    }
+
+
+def make_member_model() -> MemberModel:
+    return MemberModel(
+        id=uuid4(),
+        workspace_id=uuid4(),
+        user_id=uuid4(),
+        role="admin",
+        status="active",
+        invited_by=f"{uuid4()}",
+        created_at=datetime.now(UTC),
+    )
+
+
+def test_trusted_member_matches_validated() -> None:
+    model = make_member_model()
+
+    trusted = MemberDataMapper.model_to_entity_trusted(model)
+
+    assert snapshot(trusted) == snapshot(Member.model_validate(model))
+    assert trusted.__pydantic_fields_set__ >= set(Member.model_fields)
+
+
+def test_trusted_entities_do_not_share_private_attributes() -> None:
+    first, second = MemberDataMapper.models_to_entities([make_member_model(), make_member_model()])
+
+    assert first._events == []  # noqa: SLF001
+    assert first._events is not second._events  # noqa: SLF001
+
+
+def test_trusted_user_builds_social_accounts_from_relationship() -> None:
+    user_id = uuid4()
+    model = UserModel(
+        id=user_id,
+        username="user",
+        email="user@example.com",
+        password_hash="hash",  # noqa: S106
+        status="email_verified",
+        role="user",
+        auth_methods=["credentials", "oauth2"],
+        created_at=datetime.now(UTC),
+        social_accounts=[
+            SocialAccountModel(
+                id=uuid4(),
+                user_id=user_id,
+                provider="VK",
+                social_user_id="42",
+                profile_info={"user_id": "42"},
+                created_at=datetime.now(UTC),
+            )
+        ],
+    )
+
+    trusted: User | Guest = UserDataMapper.model_to_entity_trusted(model)
+    validated = User.model_validate(UserDataMapper.model_to_entity(model))
+
+    assert isinstance(trusted, User)
+    assert trusted.model_dump() == validated.model_dump()
+    assert snapshot(trusted.social_accounts[0]) == snapshot(validated.social_accounts[0])
+    assert trusted.auth_methods == validated.auth_methods
+
+
+def test_trusted_user_mapper_dispatches_by_row_class() -> None:
+    guest_model = GuestModel(
+        id=uuid4(),
+        device_id="device",
+        expires_at=datetime.now(UTC) + timedelta(days=1),
+        username="guest",
+        status="anonymous",
+        role="guest",
+        created_at=datetime.now(UTC),
+    )
+
+    guest: User | Guest
+    (guest,) = UserDataMapper.models_to_entities([guest_model])
+
+    assert isinstance(guest, Guest)
+    assert snapshot(guest) == snapshot(UserDataMapper.model_to_entity(guest_model))
@@ -0,0 +1,33 @@
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from modules.admin.infrastructure.database.models import MemberModel
+from modules.shared_kernel.application import Cursor, Pagination
+from modules.shared_kernel.insrastructure.database import paginate
+
+
+def compile_sql(pagination: Pagination) -> str:
+    stmt = paginate(select(MemberModel), pagination, MemberModel.created_at, MemberModel.id)
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_paginate_with_cursor_uses_keyset_condition() -> None:
+    cursor = Cursor(timestamp=datetime(2026, 1, 1, tzinfo=UTC), id=uuid4())
+
+    sql = compile_sql(Pagination(page=5, limit=20, cursor=cursor))
+
+    assert "(members.created_at, members.id) > (" in sql
+    assert "ORDER BY members.created_at, members.id" in sql
+    assert "LIMIT" in sql
+    assert "OFFSET" not in sql
+
+
+def test_paginate_without_cursor_uses_offset() -> None:
+    sql = compile_sql(Pagination(page=3, limit=20))
+
+    assert "OFFSET" in sql
+    assert "members.created_at, members.id) >" not in sql
+    assert "ORDER BY members.created_at, members.id" in sql
@@ -0,0 +1,53 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from modules.admin.infrastructure.database.models import MemberModel
+from modules.shared_kernel.insrastructure.database.repository import (
+    build_upsert_statement,
+    group_rows,
+)
+
+
+def make_member(**kwargs: object) -> MemberModel:
+    return MemberModel(
+        workspace_id=uuid4(), user_id=uuid4(), role="member", status="active", **kwargs
+    )
+
+
+def compile_sql(statement: object) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))  # type: ignore[attr-defined]
+
+
+def test_group_rows_splits_rows_by_columns_and_keeps_positions() -> None:
+    with_id = make_member(id=uuid4())
+    without_id = make_member()
+    groups = group_rows([with_id, without_id, make_member(id=uuid4())])
+
+    assert sorted("id" in columns for _, columns in groups) == [False, True]
+    by_columns = {columns: rows for (_, columns), rows in groups.items()}
+    with_id_rows = next(rows for columns, rows in by_columns.items() if "id" in columns)
+    without_id_rows = next(rows for columns, rows in by_columns.items() if "id" not in columns)
+    assert [position for position, _ in with_id_rows] == [0, 2]
+    assert [position for position, _ in without_id_rows] == [1]
+    assert with_id_rows[0][1]["id"] == with_id.id
+
+
+def test_build_upsert_statement_updates_only_row_columns() -> None:
+    rows = [{"id": uuid4(), "workspace_id": uuid4(), "user_id": uuid4(), "role": "member"}]
+    sql = compile_sql(build_upsert_statement(MemberModel, rows, ("workspace_id", "user_id")))
+
+    assert "ON CONFLICT (workspace_id, user_id) DO UPDATE" in sql
+    _, _, set_clause = sql.partition("DO UPDATE SET")
+    assert "role = excluded.role" in set_clause
+    assert "updated_at = now()" in set_clause
+    for column in ("id", "status", "invited_by", "created_at", "workspace_id", "user_id"):
+        assert f" {column} = " not in set_clause
+
+
+def test_build_upsert_statement_rejects_rows_with_different_columns() -> None:
+    rows = [{"id": uuid4(), "role": "member"}, {"id": uuid4(), "status": "active"}]
+
+    with pytest.raises(ValueError, match="same columns"):
+        build_upsert_statement(MemberModel, rows, ("id",))
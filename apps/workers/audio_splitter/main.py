@@ -1,30 +1,80 @@
 from collections.abc import AsyncIterable
+from datetime import timedelta
 
 from faststream import FastStream, Logger
 from faststream.rabbit import RabbitBroker
+from redis.asyncio import Redis
 
 from client.v1 import ClientV1
 from config.dev import settings as dev_settings
-from modules.shared_kernel.audio import AudioFormat, AudioSegment
-from modules.summarization.domain import AudioSplitEvent, SummarizationTaskCreatedEvent
-
-from .splitter import AudioSplitter
+from modules.audio.application import TranscriptReuseService
+from modules.audio.domain import (
+    AudioFormat,
+    AudioSegment,
+    AudioSplitEvent,
+    SummarizationTaskCreatedEvent,
+)
+from modules.audio.infrastructure.deduplication import RedisRecordTranscriptStore
+from modules.audio.infrastructure.ffmpeg import FFMpegAudioSplitter
+from modules.audio.infrastructure.progress import PROGRESS_EXCHANGE
+from modules.audio.utils.resampling import AudioProfile
+from modules.audio.utils.segmentation import SegmentationPlanner, balanced_segment_duration
+from modules.audio.utils.vad import SilenceTrimmer
+from modules.shared_kernel.insrastructure.telemetry import bind_correlation_id, create_telemetry
 
 CHUNK_SIZE = 8192  # Размер чанка для скачивания аудио записей
+MIN_CHUNK_DURATION = 5 * 60  # Минимальная продолжительность сегмента (в секундах)
+MAX_CHUNK_DURATION = 20 * 60  # Максимальная продолжительность сегмента (в секундах)
+CHUNKING_PARALLELISM = 8  # Желаемое количество сегментов коллекции для параллельной обработки
+
+telemetry = create_telemetry("audio_splitter", dev_settings.telemetry)
 
-broker = RabbitBroker(url=dev_settings.rabbitmq.url)
+broker = RabbitBroker(url=dev_settings.rabbitmq.url, middlewares=[telemetry.middleware])
 
 app = FastStream(broker)
 
 client = ClientV1(base_url=dev_settings.app.url)
 
+redis = Redis.from_url(dev_settings.redis.url)
+
+transcripts = TranscriptReuseService(
+    RedisRecordTranscriptStore(
+        redis=redis, ttl=timedelta(days=dev_settings.transcription.reuse_ttl_days)
+    )
+)
+
+segment_planner = SegmentationPlanner()
+# Границы сегментов планируются по записи со сжатыми паузами
+silence_trimmer = (
+    SilenceTrimmer(max_silence_ms=dev_settings.audio_splitting.max_silence_ms)
+    if dev_settings.audio_splitting.trim_silence
+    else None
+)
+
+enhancement_profile = AudioProfile(
+    samplerate=dev_settings.audio_profile.enhancement_samplerate,
+    channels=dev_settings.audio_profile.enhancement_channels,
+)
+
 
 def should_chunking(total_duration: int) -> bool:
-    return total_duration > ...
+    return total_duration > MIN_CHUNK_DURATION
 
 
 def calculate_chunk_duration(total_duration: int, record_count: int) -> int:
-    ...
+    """Продолжительность сегмента, при которой коллекция делится на сравнимые
+    по длине сегменты (запись разбивается без короткого остатка)
+    """
+
+    if not should_chunking(total_duration):
+        return MAX_CHUNK_DURATION
+    return balanced_segment_duration(
+        total_duration,
+        record_count,
+        min_duration=MIN_CHUNK_DURATION,
+        max_duration=MAX_CHUNK_DURATION,
+        parallelism=CHUNKING_PARALLELISM,
+    )
 
 
 @broker.subscriber("audio_splitting")
@@ -33,25 +83,76 @@ async def handle_summarization_task_created_event(
         event: SummarizationTaskCreatedEvent, logger: Logger
 ) -> AsyncIterable[AudioSegment]:
     logger.debug("Start audio processing for collection with id %s", event.collection_id)
+    # Все сообщения конвейера по задаче трассируются под correlation id события
+    bind_correlation_id(event.correlation_id)
     collection = await client.collections.get(event.collection_id)
     chunk_duration = calculate_chunk_duration(collection.total_duration, collection.record_count)
-    splitter = AudioSplitter(
-        chunk_duration=chunk_duration, chunk_format=AudioFormat.WAV, prefix=collection.id,
+    splitter = FFMpegAudioSplitter(
+        segment_duration=chunk_duration,
+        segment_overlap=0,
+        segment_format=AudioFormat.WAV,
+        prefix=collection.id,
+        silence_trimmer=silence_trimmer,
+        segment_planner=segment_planner,
+        profile=enhancement_profile,
     )
     segments_count = 0
     for record in collection.records:
+        content_hash = record.metadata.content_hash
+        # Запись уже обрабатывалась: разбиение, улучшение звука и транскрибация пропускаются
+        segments = await transcripts.find(content_hash)
+        if segments is not None:
+            for enhanced_event, transcribed_event in transcripts.replay(
+                segments,
+                task_id=event.task_id,
+                user_id=event.user_id,
+                collection_id=collection.id,
+                record_id=record.id,
+            ):
+                await broker.publish(enhanced_event, exchange=PROGRESS_EXCHANGE)
+                await broker.publish(transcribed_event, exchange=PROGRESS_EXCHANGE)
+                await broker.publish(transcribed_event, "summarizing")
+            segments_count += len(segments)
+            continue
         stream = client.collections.download_record(record.id, chunk_size=CHUNK_SIZE)
         async for audio_segment in splitter.split_stream(
                 stream,
                 metadata={
                     "task_id": event.task_id,
+                    "user_id": event.user_id,
                     "collection_id": collection.id,
-                    "record_id": record.id
+                    "record_id": record.id,
+                    "content_hash": content_hash,
+                    # Разбиение записи в хранилище транскрипций: длительность и число сегментов
+                    "chunk_duration": chunk_duration,
+                    "correlation_id": event.correlation_id,
                 }
         ):
             yield audio_segment
             segments_count += 1
-    event = AudioSplitEvent(
-        task_id=event.task_id, collection_id=collection.id, segments_count=segments_count
+    split_event = AudioSplitEvent(
+        correlation_id=event.correlation_id,
+        task_id=event.task_id,
+        user_id=event.user_id,
+        collection_id=collection.id,
+        segments_count=segments_count,
+        record_ids=[record.id for record in collection.records],
     )
-    await broker.publish(event, queue="audio_splitting")
+    await broker.publish(split_event, exchange=PROGRESS_EXCHANGE)
+    # Суммаризация ждёт общее количество сегментов коллекции перед reduce
+    await broker.publish(split_event, "summarizing")
+
+
+@app.after_startup
+async def start_telemetry() -> None:
+    await telemetry.start()
+
+
+@app.after_shutdown
+async def close_redis() -> None:
+    await redis.aclose()
+
+
+@app.after_shutdown
+async def stop_telemetry() -> None:
+    await telemetry.stop()
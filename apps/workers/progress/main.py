@@ -0,0 +1,61 @@
+from datetime import timedelta
+
+from faststream import FastStream, Logger
+from faststream.rabbit import RabbitBroker
+
+from config.dev import settings as dev_settings
+from modules.audio.application import ProgressAggregationService, ProgressCoalescer
+from modules.audio.domain import AudioSplitEvent, AudioTranscribedEvent, SoundEnhancedEvent
+from modules.audio.infrastructure.progress import (
+    PROGRESS_EXCHANGE,
+    PROGRESS_QUEUE,
+    RedisProgressNotifier,
+    RedisProgressStore,
+)
+from modules.chat.infrastructure.fastapi.connection_managers import RedisConnectionManager
+from modules.shared_kernel.insrastructure.telemetry import create_telemetry
+
+if dev_settings.websocket.backend != "redis":
+    # Воркер рассылает события через Redis, реплики с `memory` их не получат
+    raise RuntimeError("Progress worker requires WEBSOCKET_BACKEND=redis")
+
+telemetry = create_telemetry("progress", dev_settings.telemetry)
+
+broker = RabbitBroker(url=dev_settings.rabbitmq.url, middlewares=[telemetry.middleware])
+
+app = FastStream(broker)
+
+store = RedisProgressStore(
+    url=dev_settings.redis.url, ttl=timedelta(hours=dev_settings.progress.ttl_hours)
+)
+# Сокетов у воркера нет, менеджер используется только для рассылки по репликам API
+connection_manager = RedisConnectionManager(url=dev_settings.redis.url)
+coalescer = ProgressCoalescer(
+    notifier=RedisProgressNotifier(redis=store.redis, connection_manager=connection_manager),
+    max_rate=dev_settings.progress.max_updates_per_second,
+)
+service = ProgressAggregationService(store=store, coalescer=coalescer)
+
+
+@broker.subscriber(PROGRESS_QUEUE, PROGRESS_EXCHANGE)
+async def handle_pipeline_event(
+        event: AudioSplitEvent | SoundEnhancedEvent | AudioTranscribedEvent, logger: Logger
+) -> None:
+    logger.debug("Pipeline event %s for task %s", event.event_type, event.task_id)
+    await service.handle(event)
+
+
+@app.after_startup
+async def start_telemetry() -> None:
+    await telemetry.start()
+
+
+@app.after_shutdown
+async def flush_progress() -> None:
+    await coalescer.close()
+    await connection_manager.close()
+
+
+@app.after_shutdown
+async def stop_telemetry() -> None:
+    await telemetry.stop()
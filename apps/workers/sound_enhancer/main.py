@@ -1,66 +1,76 @@
-import io
+import asyncio
 import logging
 
-import soundfile as sf
 from faststream import FastStream, Logger
 from faststream.rabbit import RabbitBroker
-from pedalboard import Compressor, Gain, LowShelfFilter, NoiseGate, Pedalboard
 
 from config.dev import settings as dev_settings
-from modules.shared_kernel.audio import AudioFormat, AudioSegment
-from modules.summarization.domain import SoundEnhancedEvent
+from modules.audio.domain import AudioFormat, AudioSegment, SoundEnhancedEvent
+from modules.audio.infrastructure.progress import PROGRESS_EXCHANGE
+from modules.audio.utils.audio import enhance_sound_quality
+from modules.audio.utils.resampling import AudioProfile
+from modules.shared_kernel.insrastructure.telemetry import create_telemetry, current_correlation_id
 
 logger = logging.getLogger(__name__)
 
-broker = RabbitBroker(url=dev_settings.rabbitmq.url)
-
-app = FastStream(broker)
+telemetry = create_telemetry("sound_enhancer", dev_settings.telemetry)
 
+broker = RabbitBroker(url=dev_settings.rabbitmq.url, middlewares=[telemetry.middleware])
 
-def enhance_sound_quality(audio: bytes, output_format: AudioFormat = "wav") -> tuple[bytes, int]:
-    """Улучшение качества звука используя технологии Spotify.
+app = FastStream(broker)
 
-    :param audio: Байты аудио записи.
-    :param output_format: Формат аудио на выходе, после обработки (по умолчанию WAV).
-    :returns: Байты обработанной аудио записи + частота дискретизации.
-    """
-    with io.BytesIO(audio) as stream:
-        content, samplerate = sf.read(stream)
-    board = Pedalboard([
-        NoiseGate(threshold_db=-30, ratio=1.5, release_ms=250),
-        Compressor(threshold_db=-16, ratio=4, attack_ms=5, release_ms=100),
-        LowShelfFilter(cutoff_frequency_hz=400, gain_db=8, q=1),
-        Gain(gain_db=2)
-    ])
-    effected = board(content, samplerate)
-    with io.BytesIO(effected) as stream:
-        sf.write(stream, content, samplerate, format=output_format)
-        stream.seek(0)
-        return stream.read(), samplerate
+# Сегменты приводятся к профилю распознавания до отправки в очередь транскрибации
+recognition_profile = AudioProfile(
+    samplerate=dev_settings.audio_profile.recognition_samplerate,
+    channels=dev_settings.audio_profile.recognition_channels,
+)
 
 
 @broker.subscriber("sound_enhancement")
-@broker.publisher("sound_enhancement")
+@broker.publisher("transcribing")
 async def handle_sound_quality_enhancement(
         audio_segment: AudioSegment, logger: Logger
 ) -> AudioSegment:
     logger.info(
         "Start sound quality enhancement for audio segment %s/%s with duration %s sec",
-        audio_segment.id, audio_segment.total_count, audio_segment.duration,
+        audio_segment.number, audio_segment.total_count, audio_segment.duration,
         extra=audio_segment.metadata
     )
-    effected, samplerate = enhance_sound_quality(audio_segment.content)
+    with telemetry.stage("dsp", segment_size=audio_segment.size, duration=audio_segment.duration):
+        effected, profile = await asyncio.to_thread(
+            enhance_sound_quality, audio_segment.content, profile=recognition_profile
+        )
     logger.info(
-        "Finished sound quality enhancement for audio segment %s/%s with duration %s sec",
-        audio_segment.id, audio_segment.total_count, audio_segment.duration,
+        "Finished sound quality enhancement for audio segment %s/%s with duration %s sec, "
+        "size %s -> %s bytes",
+        audio_segment.number, audio_segment.total_count, audio_segment.duration,
+        audio_segment.size, len(effected),
         extra=audio_segment.metadata
     )
-    if audio_segment.is_last:
-        event = SoundEnhancedEvent(collection_id=audio_segment.metadata["collection_id"])
-        await broker.publish(event, queue="sound_enhancement")
-    return audio_segment.rewrite(
-        content=effected,
-        size=len(effected),
-        format=AudioFormat.WAV,
-        samplerate=samplerate
+    event = SoundEnhancedEvent(
+        correlation_id=current_correlation_id(),
+        task_id=audio_segment.metadata["task_id"],
+        user_id=audio_segment.metadata["user_id"],
+        collection_id=audio_segment.metadata["collection_id"],
+        record_id=audio_segment.metadata["record_id"],
+        segment_id=audio_segment.number,
+        segments_count=audio_segment.total_count,
     )
+    await broker.publish(event, exchange=PROGRESS_EXCHANGE)
+    return audio_segment.model_copy(update={
+        "content": effected,
+        "size": len(effected),
+        "format": AudioFormat.WAV,
+        "samplerate": profile.samplerate,
+        "channels": profile.channels,
+    })
+
+
+@app.after_startup
+async def start_telemetry() -> None:
+    await telemetry.start()
+
+
+@app.after_shutdown
+async def stop_telemetry() -> None:
+    await telemetry.stop()
@@ -1,19 +1,115 @@
+from datetime import timedelta
+
 from faststream import FastStream, Logger
 from faststream.rabbit import RabbitBroker
+from langchain.chat_models import init_chat_model
 
 from config.dev import settings as dev_settings
-from modules.summarization.domain import (
-    SummarizeTranscriptionCommand,
-    TranscriptionSummarizedEvent,
+from foundation_models.client.asyncio import AsyncFoundationModelClient
+from modules.audio.application import (
+    IncrementalSummarizationService,
+    MapReduceSummarizationEngine,
+    Summarizer,
+)
+from modules.audio.domain import AudioSplitEvent, AudioTranscribedEvent
+from modules.audio.infrastructure.ai.summary_compiler import (
+    FoundationModelSummarizer,
+    LLMSummarizer,
+    TracedSummarizer,
+)
+from modules.audio.infrastructure.summarization import (
+    RedisPartialSummaryStore,
+    RedisSummaryCache,
 )
+from modules.shared_kernel.insrastructure.telemetry import create_telemetry
 
-broker = RabbitBroker(url=dev_settings.rabbitmq.url)
+telemetry = create_telemetry("summarizer", dev_settings.telemetry)
+
+broker = RabbitBroker(url=dev_settings.rabbitmq.url, middlewares=[telemetry.middleware])
 
 app = FastStream(broker)
 
 
+def create_foundation_models_client() -> AsyncFoundationModelClient:
+    foundation_models = dev_settings.foundation_models
+    return AsyncFoundationModelClient(
+        api_key=foundation_models.api_key,
+        iam_token=foundation_models.iam_token,
+        folder_id=foundation_models.folder_id,
+        model_name=foundation_models.model_name,
+        base_url=foundation_models.base_url,
+        temperature=dev_settings.summarization.temperature,
+        max_concurrency=foundation_models.max_concurrency,
+        requests_per_second=foundation_models.requests_per_second,
+        max_retries=foundation_models.max_retries,
+    )
+
+
+# Сессия клиента закрывается при остановке воркера
+foundation_models_client = (
+    create_foundation_models_client()
+    if dev_settings.summarization.backend == "foundation_models"
+    else None
+)
+
+
+def create_summarizer() -> Summarizer:
+    if foundation_models_client is not None:
+        return FoundationModelSummarizer(foundation_models_client)
+    llm = init_chat_model(
+        dev_settings.summarization.model,
+        base_url=dev_settings.summarization.base_url,
+        temperature=dev_settings.summarization.temperature,
+    )
+    return LLMSummarizer(llm)
+
+
+store = RedisPartialSummaryStore(
+    url=dev_settings.redis.url,
+    ttl=timedelta(hours=dev_settings.summarization.ttl_hours),
+    reduce_timeout=timedelta(seconds=dev_settings.summarization.reduce_timeout),
+)
+engine = MapReduceSummarizationEngine(
+    summarizer=TracedSummarizer(create_summarizer(), telemetry),
+    cache=RedisSummaryCache(redis=store.redis, ttl=store.ttl),
+    context_window=dev_settings.summarization.context_window,
+    reserved_tokens=dev_settings.summarization.reserved_tokens,
+    max_concurrency=dev_settings.summarization.max_concurrency,
+)
+service = IncrementalSummarizationService(engine=engine, store=store)
+
+
 @broker.subscriber("summarizing")
-@broker.publisher("summarizing")
-async def handle_summarize_transcription_command(
-        command: SummarizeTranscriptionCommand, logger: Logger
-) -> TranscriptionSummarizedEvent: ...
+async def handle_audio_transcribed(
+        event: AudioSplitEvent | AudioTranscribedEvent, logger: Logger
+) -> None:
+    # Итоговое событие публикуется только после события, завершившего коллекцию
+    summarized_event = await service.handle(event)
+    if summarized_event is None:
+        return
+    logger.info(
+        "Transcription of task %s summarized (%s segments)",
+        event.task_id, summarized_event.segments_count,
+    )
+    await broker.publish(summarized_event, "summarized")
+
+
+@app.after_startup
+async def start_telemetry() -> None:
+    await telemetry.start()
+
+
+@app.after_shutdown
+async def close_store() -> None:
+    await store.redis.aclose()
+
+
+@app.after_shutdown
+async def close_foundation_models_client() -> None:
+    if foundation_models_client is not None:
+        await foundation_models_client.close()
+
+
+@app.after_shutdown
+async def stop_telemetry() -> None:
+    await telemetry.stop()
@@ -1,59 +1,103 @@
-import asyncio
+from datetime import timedelta
 
 from faststream import FastStream, Logger
 from faststream.rabbit import RabbitBroker
+from redis.asyncio import Redis
 
 from config.dev import settings as dev_settings
-from modules.shared_kernel.audio import AudioSegment
-from modules.summarization.domain import AudioTranscribedEvent
+from modules.audio.application import (
+    RecognitionOptions,
+    SegmentTranscriptionService,
+    TranscriptReuseService,
+)
+from modules.audio.domain import AudioSegment, AudioTranscribedEvent
+from modules.audio.infrastructure.deduplication import RedisRecordTranscriptStore
+from modules.audio.infrastructure.progress import PROGRESS_EXCHANGE
+from modules.audio.infrastructure.transcription import RedisTranscriptionCache
+from modules.shared_kernel.insrastructure.telemetry import create_telemetry, current_correlation_id
 from salute_speech.asyncio import AsyncSaluteSpeechClient
 
-broker = RabbitBroker(url=dev_settings.rabbitmq.url)
+telemetry = create_telemetry("transcriber", dev_settings.telemetry)
+
+broker = RabbitBroker(url=dev_settings.rabbitmq.url, middlewares=[telemetry.middleware])
 
 app = FastStream(broker)
 
 salute_speech_client = AsyncSaluteSpeechClient(
     apikey=dev_settings.salute_speech.apikey,
     scope=dev_settings.salute_speech.scope,
+    client_id=dev_settings.salute_speech.client_id,
+    client_secret=dev_settings.salute_speech.client_secret,
 )
 
+redis = Redis.from_url(dev_settings.redis.url)
 
-async def transcribe_audio(audio_segment: AudioSegment) -> str:
-    """Асинхронная трансрибация аудио сегмента.
-
-    :param audio_segment: Аудио сегмент для трансрибации.
-    :returns: Трансрибация + диаризация в формате Markdown.
-    """
-    request_file_id = await salute_speech_client.upload_file(
-        file=audio_segment.content, audio_encoding="PCM_S16LE"
-    )
-    task = await salute_speech_client.async_recognize(
-        request_file_id, channels=audio_segment.channels, max_speakers_count=10
+transcripts = TranscriptReuseService(
+    RedisRecordTranscriptStore(
+        redis=redis, ttl=timedelta(days=dev_settings.transcription.reuse_ttl_days)
     )
-    while task.status != "DONE":
-        await asyncio.sleep(1)
-        task = await salute_speech_client.get_task_status(task.id)
-    recognized_speech_list = await salute_speech_client.download_file(task.response_file_id)
-    return recognized_speech_list.to_markdown()
+)
+
+transcription = SegmentTranscriptionService(
+    client=salute_speech_client,
+    cache=RedisTranscriptionCache(
+        redis=redis, ttl=timedelta(days=dev_settings.transcription.cache_ttl_days)
+    ),
+    options=RecognitionOptions(
+        language=dev_settings.transcription.language,
+        diarization=dev_settings.transcription.diarization,
+        max_speakers_count=dev_settings.transcription.max_speakers_count,
+    ),
+    poll_interval=dev_settings.transcription.poll_interval,
+)
 
 
 @broker.subscriber("transcribing")
-@broker.publisher("transcribing")
+@broker.publisher("summarizing")
 async def handle_audio_segment(
         audio_segment: AudioSegment, logger: Logger
 ) -> AudioTranscribedEvent:
-    text = await transcribe_audio(audio_segment)
+    with telemetry.stage("stt", segment_size=audio_segment.size, duration=audio_segment.duration):
+        text = await transcription.transcribe(audio_segment)
     logger.info(
         "Audio transcribing successfully for segment %s/%s",
-        audio_segment.id, audio_segment.total_count
+        audio_segment.number, audio_segment.total_count
     )
-    return AudioTranscribedEvent(
+    event = AudioTranscribedEvent(
+        correlation_id=current_correlation_id(),
         task_id=audio_segment.metadata["task_id"],
+        user_id=audio_segment.metadata["user_id"],
         collection_id=audio_segment.metadata["collection_id"],
         record_id=audio_segment.metadata["record_id"],
-        segment_id=audio_segment.id,
+        segment_id=audio_segment.number,
         segment_duration=audio_segment.duration,
         segments_count=audio_segment.total_count,
         is_last=audio_segment.is_last,
         text=text,
     )
+    # Транскрипция записи переиспользуется при повторной загрузке того же файла
+    await transcripts.remember(
+        audio_segment.metadata.get("content_hash"),
+        chunk_duration=audio_segment.metadata.get("chunk_duration"),
+        segments_count=audio_segment.total_count,
+        segment_id=audio_segment.number,
+        duration=audio_segment.duration,
+        text=text,
+    )
+    await broker.publish(event, exchange=PROGRESS_EXCHANGE)
+    return event
+
+
+@app.after_startup
+async def start_telemetry() -> None:
+    await telemetry.start()
+
+
+@app.after_shutdown
+async def close_redis() -> None:
+    await redis.aclose()
+
+
+@app.after_shutdown
+async def stop_telemetry() -> None:
+    await telemetry.stop()